@@ -0,0 +1,47 @@
+"""Add user_streak_summaries for incremental streak maintenance.
+
+Revision ID: 20261016000001
+Revises: 20260820000002
+Create Date: 2026-10-16
+
+The table starts empty: a summary is built from the meal history on the first
+streak read after deploy (or by scripts/backfill_streak_summaries.py)
+and maintained by meal writes from then on. Writes bump the row version,
+which rebuilds compare before storing, so no user row is locked to order a
+rebuild against concurrent meal writes.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261016000001"
+down_revision: str | None = "20260820000002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_streak_summaries",
+        sa.Column(
+            "user_id",
+            sa.String(length=36),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("timezone", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_logged_date", sa.Date(), nullable=True),
+        sa.Column("current_run_start", sa.Date(), nullable=True),
+        sa.Column("best_run_length", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("best_run_end", sa.Date(), nullable=True),
+        sa.Column("scan_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_streak_summaries")
@@ -0,0 +1,58 @@
+"""Add daily_nutrition_rollups for O(days) dashboard and weekly budget reads.
+
+Revision ID: 20261016000002
+Revises: 20261016000001
+Create Date: 2026-10-16
+
+The table starts empty: missing days are summed from meals, hydration and
+movement entries on the first read that needs them (or by
+scripts/backfill_daily_nutrition_rollups.py). Writes mark the days they
+touch stale and bump their version, which rebuilds compare before storing,
+so a stored row is never older than its sources.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261016000002"
+down_revision: str | None = "20261016000001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_nutrition_rollups",
+        sa.Column(
+            "user_id",
+            sa.String(length=36),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("local_date", sa.Date(), primary_key=True),
+        sa.Column("timezone", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("meal_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "hydration_entry_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column("calories", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("protein", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("carbs", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("fat", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("fiber", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("ready_calories", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("ready_protein", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("ready_carbs", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("ready_fat", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("hydration_ml", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("movement_kcal", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_nutrition_rollups")
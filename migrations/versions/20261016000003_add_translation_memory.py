@@ -0,0 +1,38 @@
+"""Add translation_memory, the durable tier of the segment translation memory.
+
+Revision ID: 20261016000003
+Revises: 20261016000002
+Create Date: 2026-10-16
+
+Rows are written only for complete model translations and are keyed by the
+prompt version, so a prompt or model change starts a fresh keyspace instead
+of replaying old output. Redis holds the hot copy of each segment.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261016000003"
+down_revision: str | None = "20261016000002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "translation_memory",
+        sa.Column("segment_key", sa.String(length=64), primary_key=True),
+        sa.Column("prompt_version", sa.String(length=128), nullable=False),
+        sa.Column("source_language", sa.String(length=16), nullable=False),
+        sa.Column("target_language", sa.String(length=16), nullable=False),
+        sa.Column("source_text", sa.Text(), nullable=False),
+        sa.Column("translated_text", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("translation_memory")
@@ -0,0 +1,126 @@
+"""Backfill or repair daily_nutrition_rollups for a trailing window of days.
+
+Rollups are also built lazily by the first dashboard or weekly budget read
+that needs a day, so this only moves those source scans off the request path.
+With ``--all`` it doubles as a repair job: every day in the window is
+recomputed from meals, hydration and movement entries and overwritten. Each
+user is rebuilt in its own short transaction; re-running is safe.
+
+Usage:
+  python scripts/backfill_daily_nutrition_rollups.py --dry-run
+  python scripts/backfill_daily_nutrition_rollups.py --days 60 --limit 10000
+  python scripts/backfill_daily_nutrition_rollups.py --all   # also repair existing rows
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from src.domain.utils.timezone_utils import get_zone_info
+from src.infra.database.models.nutrition.daily_nutrition_rollup import (
+    DailyNutritionRollupORM,
+)
+from src.infra.database.models.user.user import User
+from src.infra.database.uow_async import AsyncUnitOfWork
+from src.infra.repositories.daily_nutrition_rollup_repository_async import (
+    STALE_TIMEZONE,
+)
+
+
+async def _next_batch(
+    after_id: str, batch_size: int, include_existing: bool
+) -> list[tuple[str, str]]:
+    async with AsyncUnitOfWork() as uow:
+        stmt = (
+            select(User.id, User.timezone)
+            .where(User.is_active.is_(True), User.id > after_id)
+            .order_by(User.id)
+            .limit(batch_size)
+        )
+        if not include_existing:
+            has_rollups = (
+                select(DailyNutritionRollupORM.user_id)
+                .where(
+                    DailyNutritionRollupORM.user_id == User.id,
+                    DailyNutritionRollupORM.timezone != STALE_TIMEZONE,
+                )
+                .exists()
+            )
+            stmt = stmt.where(~has_rollups)
+        rows = (await uow.session.execute(stmt)).all()
+    return [(row.id, row.timezone or "UTC") for row in rows]
+
+
+async def backfill(
+    *,
+    days: int,
+    batch_size: int,
+    include_existing: bool,
+    dry_run: bool,
+    limit: int | None,
+) -> int:
+    rebuilt = 0
+    after_id = ""
+    while limit is None or rebuilt < limit:
+        size = batch_size if limit is None else min(batch_size, limit - rebuilt)
+        batch = await _next_batch(after_id, size, include_existing)
+        if not batch:
+            break
+        for user_id, timezone in batch:
+            rebuilt += 1
+            if dry_run:
+                continue
+            end = datetime.now(get_zone_info(timezone)).date()
+            start = end - timedelta(days=days - 1)
+            async with AsyncUnitOfWork() as uow:
+                rollups = await uow.daily_nutrition_rollups.rebuild(
+                    user_id, start, end, timezone
+                )
+            logged = sum(1 for rollup in rollups.values() if rollup.entry_count)
+            print(f"{user_id}: {start}..{end} logged_days={logged}")
+        after_id = batch[-1][0]
+    return rebuilt
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=60,
+        help="trailing local days to rebuild, ending today",
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="rebuild users that already have rollups too",
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.batch_size <= 0:
+        raise SystemExit("--batch-size must be greater than 0")
+    if args.days <= 0:
+        raise SystemExit("--days must be greater than 0")
+
+    count = asyncio.run(
+        backfill(
+            days=args.days,
+            batch_size=args.batch_size,
+            include_existing=args.all,
+            dry_run=args.dry_run,
+            limit=args.limit,
+        )
+    )
+    action = "would rebuild" if args.dry_run else "rebuilt"
+    print(f"{action} rollups for {count} user{'' if count == 1 else 's'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Backfill user_streak_summaries from meal history.
+
+Summaries are also built lazily on the first streak read, so this only moves
+that one-off full scan off the request path. Each user is rebuilt in its own
+short transaction; re-running is safe.
+
+Usage:
+  python scripts/backfill_streak_summaries.py --dry-run
+  python scripts/backfill_streak_summaries.py --batch-size 500 --limit 10000
+  python scripts/backfill_streak_summaries.py --all   # also refresh existing rows
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from sqlalchemy import and_, select
+
+from src.infra.database.models.meal.user_streak_summary import UserStreakSummaryORM
+from src.infra.database.models.user.user import User
+from src.infra.database.uow_async import AsyncUnitOfWork
+from src.infra.repositories.streak_summary_repository_async import STALE_TIMEZONE
+
+
+async def _next_batch(
+    after_id: str, batch_size: int, include_existing: bool
+) -> list[tuple[str, str]]:
+    async with AsyncUnitOfWork() as uow:
+        stmt = (
+            select(User.id, User.timezone)
+            .where(User.is_active.is_(True), User.id > after_id)
+            .order_by(User.id)
+            .limit(batch_size)
+        )
+        if not include_existing:
+            stmt = stmt.outerjoin(
+                UserStreakSummaryORM,
+                and_(
+                    UserStreakSummaryORM.user_id == User.id,
+                    UserStreakSummaryORM.timezone != STALE_TIMEZONE,
+                ),
+            ).where(UserStreakSummaryORM.user_id.is_(None))
+        rows = (await uow.session.execute(stmt)).all()
+    return [(row.id, row.timezone or "UTC") for row in rows]
+
+
+async def backfill(
+    *,
+    batch_size: int,
+    include_existing: bool,
+    dry_run: bool,
+    limit: int | None,
+) -> int:
+    rebuilt = 0
+    after_id = ""
+    while limit is None or rebuilt < limit:
+        size = batch_size if limit is None else min(batch_size, limit - rebuilt)
+        batch = await _next_batch(after_id, size, include_existing)
+        if not batch:
+            break
+        for user_id, timezone in batch:
+            rebuilt += 1
+            if dry_run:
+                continue
+            async with AsyncUnitOfWork() as uow:
+                summary = await uow.meals.rebuild_streak_summary(user_id, timezone)
+            print(
+                f"{user_id}: last={summary.last_logged_date} "
+                f"best={summary.best_run_length} scans={summary.scan_count}"
+            )
+        after_id = batch[-1][0]
+    return rebuilt
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="rebuild users that already have a summary too",
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.batch_size <= 0:
+        raise SystemExit("--batch-size must be greater than 0")
+
+    count = asyncio.run(
+        backfill(
+            batch_size=args.batch_size,
+            include_existing=args.all,
+            dry_run=args.dry_run,
+            limit=args.limit,
+        )
+    )
+    action = "would rebuild" if args.dry_run else "rebuilt"
+    print(f"{action} {count} streak summar{'y' if count == 1 else 'ies'}")
+
+
+if __name__ == "__main__":
+    main()
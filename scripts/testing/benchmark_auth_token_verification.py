@@ -0,0 +1,210 @@
+"""Per-request Firebase auth overhead: SDK thread hop vs local verify vs cache.
+
+Self-contained: signs RS256 tokens with a throwaway key and serves the matching
+certificate from memory, so no Firebase project or network is needed.
+
+Modes, each driven at the requested concurrency on one event loop:
+
+- ``sdk_thread``: ``google.oauth2.id_token.verify_token`` (what
+  ``firebase_auth.verify_id_token`` runs) inside ``asyncio.to_thread``.
+- ``local_verify``: ``FirebaseIdTokenVerifier`` with a fresh token per request
+  (cache miss, RS256 verify on the loop).
+- ``local_cached``: the same verifier replaying one bearer (cache hit).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from time import perf_counter_ns
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import google.oauth2.id_token
+import jwt
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+from src.infra.services.firebase_token_verifier import (
+    ID_TOKEN_CERT_URL,
+    ID_TOKEN_ISSUER_PREFIX,
+    FirebaseIdTokenVerifier,
+    GooglePublicKeySet,
+)
+
+PROJECT_ID = "auth-benchmark"
+KID = "bench-kid"
+DEFAULT_REQUESTS = 2_000
+DEFAULT_CONCURRENCY = 64
+
+
+@dataclass(frozen=True)
+class AuthStats:
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    requests_per_second: float
+    requests: int
+
+
+class _CertResponse:
+    status = 200
+    headers = {"cache-control": "public, max-age=3600"}
+
+    def __init__(self, body: bytes):
+        self.data = body
+
+
+class _InMemoryCertRequest:
+    """google.auth transport stand-in that serves the benchmark certificate."""
+
+    def __init__(self, certs: dict[str, str]):
+        self._body = json.dumps(certs).encode()
+
+    def __call__(self, url, method="GET", **_kwargs):
+        return _CertResponse(self._body)
+
+
+def main() -> None:
+    args = _parse_args()
+    report = asyncio.run(_run(args.requests, args.concurrency))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+async def _run(requests: int, concurrency: int) -> dict:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    certs = {KID: _self_signed_cert(key)}
+    transport = _InMemoryCertRequest(certs)
+    key_set = GooglePublicKeySet()
+    key_set.load(certs, max_age=3600)
+
+    fresh_tokens = [_token(key, index) for index in range(requests)]
+    replayed = fresh_tokens[0]
+
+    async def sdk_thread(index: int) -> None:
+        await asyncio.to_thread(
+            google.oauth2.id_token.verify_token,
+            fresh_tokens[index],
+            request=transport,
+            audience=PROJECT_ID,
+            certs_url=ID_TOKEN_CERT_URL,
+        )
+
+    uncached = FirebaseIdTokenVerifier(PROJECT_ID, key_set)
+
+    async def local_verify(index: int) -> None:
+        await uncached.verify(fresh_tokens[index])
+
+    cached = FirebaseIdTokenVerifier(PROJECT_ID, key_set)
+    await cached.verify(replayed)
+
+    async def local_cached(_index: int) -> None:
+        await cached.verify(replayed)
+
+    results = {}
+    for name, operation in (
+        ("sdk_thread", sdk_thread),
+        ("local_verify", local_verify),
+        ("local_cached", local_cached),
+    ):
+        results[name] = asdict(await _measure(operation, requests, concurrency))
+    return {
+        "schema_version": "auth_token_verification_benchmark_v1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "runner": _runner_metadata(),
+        "parameters": {"requests": requests, "concurrency": concurrency},
+        "results": results,
+    }
+
+
+async def _measure(operation, requests: int, concurrency: int) -> AuthStats:
+    semaphore = asyncio.Semaphore(concurrency)
+    durations: list[float] = []
+
+    async def one(index: int) -> None:
+        async with semaphore:
+            started = perf_counter_ns()
+            await operation(index)
+            durations.append((perf_counter_ns() - started) / 1_000)
+
+    wall_started = perf_counter_ns()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    wall_seconds = (perf_counter_ns() - wall_started) / 1_000_000_000
+    ordered = sorted(durations)
+    return AuthStats(
+        p50_us=round(statistics.median(ordered), 1),
+        p95_us=round(_percentile(ordered, 0.95), 1),
+        p99_us=round(_percentile(ordered, 0.99), 1),
+        requests_per_second=round(requests / wall_seconds, 1),
+        requests=requests,
+    )
+
+
+def _token(key, index: int) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": ID_TOKEN_ISSUER_PREFIX + PROJECT_ID,
+        "aud": PROJECT_ID,
+        "sub": f"bench-user-{index}",
+        "iat": now - 5,
+        "exp": now + 3600,
+    }
+    return jwt.encode(claims, key, algorithm="RS256", headers={"kid": KID})
+
+
+def _self_signed_cert(key) -> str:
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken")])
+    now = datetime.now(UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(1)
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    return cert.public_bytes(serialization.Encoding.PEM).decode()
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    index = int(round((len(values) - 1) * percentile))
+    return values[index]
+
+
+def _runner_metadata() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("plans/reports/auth-token-verification-benchmark.json"),
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
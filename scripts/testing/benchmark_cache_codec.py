@@ -0,0 +1,169 @@
+"""Cache payload codec microbenchmark: legacy JSON vs the versioned codec.
+
+CPU-only; no Redis needed. Encodes and decodes representative read-model
+payloads (a 60-day nutrition_bulk response, a food search result page and a
+small TDEE profile) with each codec and reports per-operation latency and
+stored size. The legacy decode always runs the datetime-repair regex; the
+versioned codec only runs it for untagged entries.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+from dataclasses import asdict, dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from time import perf_counter_ns
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.app.handlers.query_handlers.get_nutrition_bulk_query_handler import (
+    GetNutritionBulkQueryHandler,
+)
+from src.infra.cache.codec import LegacyJsonCodec, TaggedJsonCodec, orjson
+
+DEFAULT_SAMPLES = 2_000
+
+
+@dataclass(frozen=True)
+class CodecStats:
+    payload_bytes: int
+    encode_p50_us: float
+    encode_p95_us: float
+    decode_p50_us: float
+    decode_p95_us: float
+
+
+def main() -> None:
+    args = _parse_args()
+    codecs = {
+        "legacy_json": LegacyJsonCodec(),
+        "versioned_json": TaggedJsonCodec(compress_min_bytes=0),
+        "versioned_json_zlib": TaggedJsonCodec(
+            compress_min_bytes=args.compress_min_bytes
+        ),
+    }
+    results = {}
+    for payload_name, payload in _payloads().items():
+        results[payload_name] = {
+            codec_name: asdict(_measure(codec, payload, args.samples))
+            for codec_name, codec in codecs.items()
+        }
+    report = {
+        "schema_version": "cache_codec_benchmark_v1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "runner": _runner_metadata(),
+        "parameters": {
+            "samples": args.samples,
+            "compress_min_bytes": args.compress_min_bytes,
+            "orjson": orjson is not None,
+        },
+        "results": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def _payloads() -> dict[str, object]:
+    handler = GetNutritionBulkQueryHandler()
+    targets = {"protein": 150.0, "carbs": 220.0, "fat": 70.0}
+    start = date(2026, 4, 1)
+    dates = {
+        (start + timedelta(days=offset)).isoformat(): handler._build_date_summary(
+            [], 2200.0, targets, movement_kcal=float(offset % 7) * 45.5
+        )
+        for offset in range(60)
+    }
+    nutrition_bulk = {
+        "dates": dates,
+        "weekly_budget": {"target": 15400.0, "consumed": 9120.5, "remaining": 6279.5},
+        "version": "v1-0123abcd",
+        "generated_at": datetime(2026, 6, 1, 8, 30, tzinfo=UTC),
+    }
+    food_search = [
+        {
+            "fdc_id": 100000 + index,
+            "description": f"Chicken breast, roasted, variant {index}",
+            "brand_owner": None if index % 3 else "Generic",
+            "serving_size": 100.0,
+            "serving_unit": "g",
+            "nutrients": {
+                "calories": 165.0,
+                "protein": 31.0,
+                "carbs": 0.0,
+                "fat": 3.6,
+                "fiber": 0.0,
+            },
+            "updated_at": datetime(2026, 5, 1, 12, 0, tzinfo=UTC),
+        }
+        for index in range(25)
+    ]
+    profile = {
+        "bmr": 1700.0,
+        "tdee": 2450.0,
+        "target_calories": 2200.0,
+        "macros": targets,
+        "goal": "cut",
+        "profile_target_revision": 7,
+        "updated_at": datetime(2026, 6, 1, 8, 30),
+    }
+    return {
+        "nutrition_bulk_60d": nutrition_bulk,
+        "food_search_25": food_search,
+        "user_tdee": profile,
+    }
+
+
+def _measure(codec, payload: object, samples: int) -> CodecStats:
+    encoded = codec.encode(payload)
+    encode_us = []
+    decode_us = []
+    for _ in range(samples):
+        started = perf_counter_ns()
+        codec.encode(payload)
+        encode_us.append((perf_counter_ns() - started) / 1_000)
+        started = perf_counter_ns()
+        codec.decode(encoded)
+        decode_us.append((perf_counter_ns() - started) / 1_000)
+    return CodecStats(
+        payload_bytes=len(encoded.encode("utf-8")),
+        encode_p50_us=round(statistics.median(encode_us), 2),
+        encode_p95_us=round(_percentile(sorted(encode_us), 0.95), 2),
+        decode_p50_us=round(statistics.median(decode_us), 2),
+        decode_p95_us=round(_percentile(sorted(decode_us), 0.95), 2),
+    )
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    index = int(round((len(values) - 1) * percentile))
+    return values[index]
+
+
+def _runner_metadata() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--compress-min-bytes", type=int, default=4096)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("plans/reports/cache-codec-benchmark.json"),
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Write-path cache invalidation benchmark: SCAN pattern deletes vs tagged keys.
+
+Runs against a disposable Redis only. The script fills the keyspace with
+synthetic filler keys, then times `CacheInvalidationService.after_meal_write`
+for one user in both invalidation modes as the keyspace grows. SCAN cost tracks
+total Redis size; the tagged mode should stay flat.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import UTC, date, datetime
+from pathlib import Path
+from time import perf_counter_ns
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.app.services.cache_invalidation_service import CacheInvalidationService
+from src.domain.cache.cache_keys import CacheKeys
+from src.infra.cache.cache_service import CacheService
+from src.infra.cache.redis_client import RedisClient
+
+DEFAULT_KEYSPACE_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_SAMPLES = 30
+FILLER_TTL_SECONDS = 900
+FILL_BATCH = 1_000
+
+
+@dataclass(frozen=True)
+class BenchmarkStats:
+    p50_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+    samples: int
+
+
+def main() -> None:
+    args = _parse_args()
+    if not args.confirm_disposable_redis:
+        raise SystemExit(
+            "Refusing to run: pass --confirm-disposable-redis; this writes and SCANs keys."
+        )
+    sizes = tuple(int(item.strip()) for item in args.keyspace_sizes.split(",") if item)
+    report = asyncio.run(_run(args.redis_url, sizes, args.samples))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+async def _run(redis_url: str, sizes: tuple[int, ...], samples: int) -> dict:
+    redis_client = RedisClient(redis_url=redis_url)
+    await redis_client.connect()
+    run_id = uuid.uuid4().hex[:8]
+    filler_prefix = f"cachebench:{run_id}:filler"
+    user_id = f"cachebench-{run_id}"
+    results = []
+    filled = 0
+    try:
+        for size in sorted(sizes):
+            filled = await _fill_keyspace(redis_client, filler_prefix, filled, size)
+            results.append(
+                {
+                    "keyspace_size": size,
+                    "scan_pattern": asdict(
+                        await _measure(redis_client, user_id, samples, tagged=False)
+                    ),
+                    "tagged_generation": asdict(
+                        await _measure(redis_client, user_id, samples, tagged=True)
+                    ),
+                }
+            )
+    finally:
+        await redis_client.delete_pattern(f"cachebench:{run_id}:*")
+        await redis_client.delete_pattern(f"user:{user_id}:*")
+        await redis_client.delete_pattern(f"gen:user:{user_id}:*")
+        await redis_client.disconnect()
+
+    return {
+        "schema_version": "cache_invalidation_benchmark_v1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "runner": _runner_metadata(),
+        "parameters": {"keyspace_sizes": sizes, "samples": samples},
+        "results": results,
+    }
+
+
+async def _fill_keyspace(
+    redis_client: RedisClient, prefix: str, start: int, target: int
+) -> int:
+    await redis_client.connect()
+    assert redis_client.client is not None
+    for offset in range(start, target, FILL_BATCH):
+        async with redis_client.client.pipeline(transaction=False) as pipe:
+            for index in range(offset, min(offset + FILL_BATCH, target)):
+                pipe.set(f"{prefix}:{index}", "x", ex=FILLER_TTL_SECONDS)
+            await pipe.execute()
+    return target
+
+
+async def _measure(
+    redis_client: RedisClient, user_id: str, samples: int, *, tagged: bool
+) -> BenchmarkStats:
+    cache = CacheService(redis_client, tagged_keys=tagged)
+    invalidation = CacheInvalidationService(cache)
+    meal_date = date(2026, 6, 2)
+    durations = []
+    for _ in range(samples):
+        # Representative per-user read-model footprint before each write.
+        for day in range(1, 8):
+            key, ttl = CacheKeys.nutrition_bulk(
+                user_id, date(2026, 6, day), date(2026, 6, day + 7)
+            )
+            await cache.set_json(key, {"dates": {}}, ttl)
+        key, ttl = CacheKeys.daily_activities(user_id, meal_date)
+        await cache.set_json(key, [], ttl)
+
+        started = perf_counter_ns()
+        await invalidation.after_meal_write(user_id, meal_date)
+        durations.append((perf_counter_ns() - started) / 1_000_000)
+    return _stats(durations)
+
+
+def _stats(values: list[float]) -> BenchmarkStats:
+    sorted_values = sorted(values)
+    return BenchmarkStats(
+        p50_ms=round(statistics.median(sorted_values), 4),
+        p95_ms=round(_percentile(sorted_values, 0.95), 4),
+        min_ms=round(sorted_values[0], 4),
+        max_ms=round(sorted_values[-1], 4),
+        samples=len(sorted_values),
+    )
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    index = int(round((len(values) - 1) * percentile))
+    return values[index]
+
+
+def _runner_metadata() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument(
+        "--keyspace-sizes", default=",".join(map(str, DEFAULT_KEYSPACE_SIZES))
+    )
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--confirm-disposable-redis", action="store_true")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("plans/reports/cache-invalidation-benchmark.json"),
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
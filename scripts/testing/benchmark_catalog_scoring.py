@@ -0,0 +1,258 @@
+"""Catalog scoring benchmark: per-meal Python cosine vs the snapshot CSR index.
+
+Self-contained: a synthetic catalog with a skewed ingredient distribution is
+built in memory, and each sample ranks every meal type for a fresh synthetic
+affinity profile. Both paths must return identical ``(meal id, score)`` lists;
+the script exits non-zero if they ever differ.
+
+Modes:
+
+- ``python``: ``RecipeScoringService.rank`` without an index, one
+  ``_ingredient_cosine`` loop per meal.
+- ``indexed``: the shipped path, ranking against the ``CatalogScoringIndex``
+  built once per catalog snapshot (build time is reported separately), with
+  one ingredient fit shared by the three meal types.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+from time import perf_counter_ns
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.domain.model.meal_recommendation import CatalogMeal, CatalogMealIngredient
+from src.domain.services.meal_recommendation.catalog_ingredient_statistics_service import (
+    CatalogIngredientStatisticsService,
+)
+from src.domain.services.meal_recommendation.catalog_scoring_index import (
+    CatalogScoringIndex,
+)
+from src.domain.services.meal_recommendation.ingredient_affinity_service import (
+    IngredientAffinityProfile,
+)
+from src.domain.services.meal_recommendation.recipe_scoring_service import (
+    RecipeScoringService,
+)
+
+DEFAULT_CATALOG_SIZES = (5_000, 50_000)
+DEFAULT_INGREDIENT_POOL = 2_000
+DEFAULT_AFFINITY_SIZE = 40
+DEFAULT_SAMPLES = 20
+MEAL_TYPES = ("breakfast", "lunch", "dinner")
+TARGETS = {"breakfast": 500, "lunch": 750, "dinner": 750}
+
+
+@dataclass(frozen=True)
+class ScoringStats:
+    p50_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+    samples: int
+
+
+def main() -> None:
+    args = _parse_args()
+    sizes = tuple(int(item.strip()) for item in args.catalog_sizes.split(",") if item)
+    report = {
+        "schema_version": "catalog_scoring_benchmark_v1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "runner": _runner_metadata(),
+        "parameters": {
+            "catalog_sizes": sizes,
+            "ingredient_pool": args.ingredient_pool,
+            "affinity_size": args.affinity_size,
+            "samples": args.samples,
+            "seed": args.seed,
+        },
+        "results": [
+            _benchmark_catalog_size(
+                size,
+                ingredient_pool=args.ingredient_pool,
+                affinity_size=args.affinity_size,
+                samples=args.samples,
+                seed=args.seed,
+            )
+            for size in sizes
+        ],
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def _benchmark_catalog_size(
+    catalog_size: int,
+    *,
+    ingredient_pool: int,
+    affinity_size: int,
+    samples: int,
+    seed: int,
+) -> dict:
+    rng = random.Random(seed + catalog_size)
+    catalog = _catalog(catalog_size, ingredient_pool, rng)
+    ingredient_statistics = CatalogIngredientStatisticsService().build(catalog)
+
+    started = perf_counter_ns()
+    index = CatalogScoringIndex.build(catalog, ingredient_statistics)
+    build_ms = _elapsed_ms(started)
+
+    scoring = RecipeScoringService()
+    python_durations = []
+    indexed_durations = []
+    for _ in range(samples):
+        affinity = _affinity(rng, ingredient_pool, affinity_size)
+        started = perf_counter_ns()
+        expected = _rank_all(scoring, catalog, affinity, ingredient_statistics, None)
+        python_durations.append(_elapsed_ms(started))
+
+        started = perf_counter_ns()
+        actual = _rank_all(scoring, catalog, affinity, ingredient_statistics, index)
+        indexed_durations.append(_elapsed_ms(started))
+
+        if actual != expected:
+            raise SystemExit(f"ranking mismatch at catalog_size={catalog_size}")
+
+    python_stats = _stats(python_durations)
+    indexed_stats = _stats(indexed_durations)
+    return {
+        "catalog_size": catalog_size,
+        "stored_entries": len(index.data),
+        "index_build_ms": round(build_ms, 4),
+        "rankings_identical": True,
+        "python": asdict(python_stats),
+        "indexed": asdict(indexed_stats),
+        "p50_speedup": round(python_stats.p50_ms / indexed_stats.p50_ms, 2),
+    }
+
+
+def _rank_all(scoring, catalog, affinity, ingredient_statistics, index):
+    # Like the plan optimizer, compute the ingredient fit once per request.
+    ingredient_fits = index.ingredient_fit(affinity) if index is not None else None
+    return {
+        meal_type: [
+            (score.catalog_meal.id, score.score)
+            for score in scoring.rank(
+                catalog,
+                meal_type=meal_type,
+                target_calories=TARGETS[meal_type],
+                affinity=affinity,
+                ingredient_statistics=ingredient_statistics,
+                scoring_index=index,
+                ingredient_fits=ingredient_fits,
+            )
+        ]
+        for meal_type in MEAL_TYPES
+    }
+
+
+def _catalog(size: int, ingredient_pool: int, rng: random.Random) -> list[CatalogMeal]:
+    # Zipf-like draw so a few staples appear in most meals, as in the real catalog.
+    weights = [1 / (rank + 1) for rank in range(ingredient_pool)]
+    food_ids = list(range(1, ingredient_pool + 1))
+    catalog = []
+    for index in range(size):
+        meal_types = tuple(
+            meal_type for meal_type in MEAL_TYPES if rng.random() < 0.5
+        ) or (MEAL_TYPES[index % len(MEAL_TYPES)],)
+        calories = rng.randint(250, 1000)
+        catalog.append(
+            CatalogMeal(
+                id=f"meal-{index:06d}",
+                catalog_key=f"key-{index:06d}",
+                content_hash=f"{index:064d}"[:64],
+                name=f"Recipe {index:06d}",
+                cuisine="vietnamese",
+                description="Synthetic benchmark recipe",
+                image_url=None,
+                protein_g=Decimal(str(calories / 4)),
+                carbs_g=Decimal("0"),
+                fat_g=Decimal("0"),
+                fiber_g=Decimal("0"),
+                meal_types=meal_types,
+                ingredients=tuple(
+                    CatalogMealIngredient(
+                        food_reference_id=food_id,
+                        display_name="Synthetic ingredient",
+                        quantity=Decimal("100"),
+                        unit="g",
+                    )
+                    for food_id in rng.choices(
+                        food_ids, weights=weights, k=rng.randint(3, 12)
+                    )
+                ),
+            )
+        )
+    return catalog
+
+
+def _affinity(
+    rng: random.Random, ingredient_pool: int, affinity_size: int
+) -> IngredientAffinityProfile:
+    food_ids = rng.sample(range(1, ingredient_pool + 1), affinity_size)
+    raw = {food_id: rng.random() for food_id in food_ids}
+    total = sum(raw.values())
+    return IngredientAffinityProfile(
+        weights={food_id: value / total for food_id, value in raw.items()},
+        confidence=rng.uniform(0.2, 1.0),
+    )
+
+
+def _stats(values: list[float]) -> ScoringStats:
+    sorted_values = sorted(values)
+    return ScoringStats(
+        p50_ms=round(statistics.median(sorted_values), 4),
+        p95_ms=round(_percentile(sorted_values, 0.95), 4),
+        min_ms=round(sorted_values[0], 4),
+        max_ms=round(sorted_values[-1], 4),
+        samples=len(sorted_values),
+    )
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    index = int(round((len(values) - 1) * percentile))
+    return values[index]
+
+
+def _elapsed_ms(started_ns: int) -> float:
+    return (perf_counter_ns() - started_ns) / 1_000_000
+
+
+def _runner_metadata() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--catalog-sizes", default=",".join(map(str, DEFAULT_CATALOG_SIZES))
+    )
+    parser.add_argument("--ingredient-pool", type=int, default=DEFAULT_INGREDIENT_POOL)
+    parser.add_argument("--affinity-size", type=int, default=DEFAULT_AFFINITY_SIZE)
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--seed", type=int, default=20261016)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("plans/reports/catalog-scoring-benchmark.json"),
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
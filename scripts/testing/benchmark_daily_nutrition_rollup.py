@@ -0,0 +1,383 @@
+"""Dashboard read benchmark: meal hydration and summing vs daily nutrition rollups.
+
+Self-contained: a meal, hydration and movement history is synthesized in
+memory and the database is a fake that counts round trips and rows returned.
+The Python work of each path is timed for real; database time is modeled from
+those counts with a fixed cost per round trip and per row.
+
+The two read shapes mirror the locustfile endpoints that sum nutrition:
+
+- ``weekly``: ``/v1/meals/weekly/budget``. Before, every weekly consumed sum
+  loaded the week's meals with the ``FULL`` projection (meal plus image join,
+  nutrition, food items and instruction steps) and summed them in Python;
+  the handler does this ``--weekly-scans`` times per request.
+- ``bulk``: the nutrition bulk range read. Before, it loaded ``--bulk-days`` of
+  meals (``MACROS_ONLY``), hydration entries and movement rows and bucketed
+  them per local day.
+
+After, both read one primary-key range of ``daily_nutrition_rollups``.
+``rollup_write_invalidation`` is the cost moved onto writes (one stale-marking
+upsert) and ``rollup_rebuild`` the cost of a cold range after invalidation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+from dataclasses import asdict, dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+from time import perf_counter_ns
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.domain.model.meal import DailyNutritionRollup, MealStatus
+from src.domain.services.weekly_budget_service import WeeklyBudgetService
+
+DEFAULT_MEALS_PER_DAY = 4
+DEFAULT_FOOD_ITEMS_PER_MEAL = 5
+DEFAULT_STEPS_PER_MEAL = 0
+DEFAULT_HYDRATION_PER_DAY = 3
+DEFAULT_MOVEMENTS_PER_DAY = 1
+DEFAULT_BULK_DAYS = 60
+DEFAULT_WEEKLY_SCANS = 3
+DEFAULT_REQUESTS = 500
+DEFAULT_ROUND_TRIP_MS = 1.0
+DEFAULT_ROW_US = 2.0
+TODAY = date(2026, 10, 16)
+TIMEZONE = "UTC"
+
+
+@dataclass(frozen=True)
+class RollupStats:
+    operations: int
+    round_trips: int
+    rows_read: int
+    python_ms: float
+    modeled_db_ms: float
+    modeled_ms_per_operation: float
+
+
+class _FakeDatabase:
+    """Counts round trips and rows; every query adds one of the former."""
+
+    def __init__(self):
+        self.round_trips = 0
+        self.rows_read = 0
+
+    def charge(self, rows: int, round_trips: int = 1) -> None:
+        self.round_trips += round_trips
+        self.rows_read += rows
+
+
+class _History:
+    def __init__(self, days: int, args, rng: random.Random):
+        self.meals_by_day: dict[date, list] = {}
+        self.entries_by_day: dict[date, list] = {}
+        self.movements_by_day: dict[date, list] = {}
+        for offset in range(days):
+            day = TODAY - timedelta(days=offset)
+            self.meals_by_day[day] = [
+                _meal(day, index, rng) for index in range(args.meals_per_day)
+            ]
+            self.entries_by_day[day] = [
+                _hydration_entry(day, index, rng)
+                for index in range(args.hydration_per_day)
+            ]
+            self.movements_by_day[day] = [
+                (_at(day, 18), rng.uniform(50, 400))
+                for _ in range(args.movements_per_day)
+            ]
+        self.food_items_per_meal = args.food_items_per_meal
+        self.steps_per_meal = args.steps_per_meal
+
+    def meals(self, db: _FakeDatabase, start: date, end: date, *, full: bool):
+        meals = [
+            meal for day in _days(start, end) for meal in self.meals_by_day.get(day, ())
+        ]
+        # Main query (image joined in for FULL), then selectin nutrition,
+        # food items and instruction steps.
+        db.charge(len(meals) * (2 if full else 1))
+        db.charge(len(meals))
+        db.charge(len(meals) * self.food_items_per_meal)
+        db.charge(len(meals) * self.steps_per_meal)
+        return meals
+
+    def hydration_entries(self, db: _FakeDatabase, start: date, end: date):
+        entries = [
+            e for day in _days(start, end) for e in self.entries_by_day.get(day, ())
+        ]
+        db.charge(len(entries))
+        return entries
+
+    def movements(self, db: _FakeDatabase, start: date, end: date):
+        rows = [
+            m for day in _days(start, end) for m in self.movements_by_day.get(day, ())
+        ]
+        db.charge(len(rows))
+        return rows
+
+
+def main() -> None:
+    args = _parse_args()
+    rng = random.Random(args.seed)
+    history = _History(max(args.bulk_days, 7), args, rng)
+    costs = (args.round_trip_ms, args.row_us)
+    week_start = TODAY - timedelta(days=TODAY.weekday())
+    week_end = week_start + timedelta(days=6)
+    bulk_start = TODAY - timedelta(days=args.bulk_days - 1)
+
+    report = {
+        "schema_version": "daily_nutrition_rollup_benchmark_v1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "runner": _runner_metadata(),
+        "parameters": {
+            "meals_per_day": args.meals_per_day,
+            "food_items_per_meal": args.food_items_per_meal,
+            "steps_per_meal": args.steps_per_meal,
+            "hydration_per_day": args.hydration_per_day,
+            "movements_per_day": args.movements_per_day,
+            "bulk_days": args.bulk_days,
+            "weekly_scans": args.weekly_scans,
+            "requests": args.requests,
+            "round_trip_ms": args.round_trip_ms,
+            "row_us": args.row_us,
+            "seed": args.seed,
+        },
+        "results": {
+            "weekly_meal_scan": asdict(
+                _measure_weekly_scan(
+                    history, week_start, TODAY, args.weekly_scans, args.requests, costs
+                )
+            ),
+            "weekly_rollup_read": asdict(
+                _measure_rollup_read(
+                    history, week_start, week_end, args.requests, costs, weekly=True
+                )
+            ),
+            "bulk_source_scan": asdict(
+                _measure_bulk_scan(history, bulk_start, TODAY, args.requests, costs)
+            ),
+            "bulk_rollup_read": asdict(
+                _measure_rollup_read(
+                    history, bulk_start, TODAY, args.requests, costs, weekly=False
+                )
+            ),
+            "rollup_write_invalidation": asdict(
+                _measure_invalidation(args.requests, costs)
+            ),
+            "rollup_rebuild": asdict(
+                _measure_rebuild(history, week_start, week_end, args.requests, costs)
+            ),
+        },
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def _measure_weekly_scan(
+    history: _History,
+    week_start: date,
+    end: date,
+    scans: int,
+    requests: int,
+    costs,
+) -> RollupStats:
+    db = _FakeDatabase()
+    started = perf_counter_ns()
+    for _ in range(requests):
+        for _ in range(scans):
+            meals = history.meals(db, week_start, end, full=True)
+            _legacy_weekly_consumed(meals)
+    return _stats(db, requests, started, costs)
+
+
+def _measure_bulk_scan(
+    history: _History, start: date, end: date, requests: int, costs
+) -> RollupStats:
+    db = _FakeDatabase()
+    started = perf_counter_ns()
+    for _ in range(requests):
+        DailyNutritionRollup.build_range(
+            "u1",
+            TIMEZONE,
+            start,
+            end,
+            meals=history.meals(db, start, end, full=False),
+            hydration_entries=history.hydration_entries(db, start, end),
+            movements=history.movements(db, start, end),
+        )
+    return _stats(db, requests, started, costs)
+
+
+def _measure_rollup_read(
+    history: _History,
+    start: date,
+    end: date,
+    requests: int,
+    costs,
+    *,
+    weekly: bool,
+) -> RollupStats:
+    stored = _build(history, _FakeDatabase(), start, end)
+    db = _FakeDatabase()
+    started = perf_counter_ns()
+    for _ in range(requests):
+        db.charge(len(stored))  # primary-key range read of the rollup table
+        rollups = dict(stored)
+        if weekly:
+            WeeklyBudgetService.aggregate_weekly_consumed_from_rollups(
+                rollups, week_start=start, end_date=TODAY
+            )
+        else:
+            sum(rollup.net_calories for rollup in rollups.values())
+    return _stats(db, requests, started, costs)
+
+
+def _measure_invalidation(writes: int, costs) -> RollupStats:
+    db = _FakeDatabase()
+    started = perf_counter_ns()
+    for _ in range(writes):
+        db.charge(0)  # UPSERT marking the touched local day stale
+    return _stats(db, writes, started, costs)
+
+
+def _measure_rebuild(
+    history: _History, start: date, end: date, rebuilds: int, costs
+) -> RollupStats:
+    db = _FakeDatabase()
+    started = perf_counter_ns()
+    for _ in range(rebuilds):
+        db.charge(0)  # primary-key range read finding the invalidated day
+        db.charge(end.toordinal() - start.toordinal() + 1)  # stored versions
+        _build(history, db, start, end)
+        db.charge(0)  # version-guarded UPSERT of the rebuilt days
+    return _stats(db, rebuilds, started, costs)
+
+
+def _build(history: _History, db: _FakeDatabase, start: date, end: date):
+    return DailyNutritionRollup.build_range(
+        "u1",
+        TIMEZONE,
+        start,
+        end,
+        meals=history.meals(db, start, end, full=False),
+        hydration_entries=history.hydration_entries(db, start, end),
+        movements=history.movements(db, start, end),
+    )
+
+
+def _legacy_weekly_consumed(meals: list) -> dict[str, float]:
+    """The pre-rollup weekly sum over READY meals, kept for comparison."""
+    from src.domain.services.meal_calorie_service import effective_meal_calories
+
+    totals = {"calories": 0.0, "protein": 0.0, "carbs": 0.0, "fat": 0.0}
+    for meal in meals:
+        if meal.status != MealStatus.READY or not meal.nutrition:
+            continue
+        totals["calories"] += effective_meal_calories(meal)
+        totals["protein"] += meal.nutrition.macros.protein
+        totals["carbs"] += meal.nutrition.macros.carbs
+        totals["fat"] += meal.nutrition.macros.fat
+    return totals
+
+
+def _meal(day: date, index: int, rng: random.Random):
+    return SimpleNamespace(
+        meal_id=f"{day.isoformat()}-{index}",
+        status=MealStatus.READY,
+        created_at=_at(day, 8 + index * 3),
+        meal_type=None,
+        quantity=None,
+        source="scanner",
+        food_label_metadata=None,
+        nutrition=SimpleNamespace(
+            macros=SimpleNamespace(
+                protein=rng.uniform(10, 50),
+                carbs=rng.uniform(20, 90),
+                fat=rng.uniform(5, 30),
+                fiber=rng.uniform(0, 10),
+            ),
+            nutrition_override=None,
+            food_items=[],
+        ),
+    )
+
+
+def _hydration_entry(day: date, index: int, rng: random.Random):
+    return SimpleNamespace(
+        credited_ml=rng.choice((250, 330, 500)),
+        legacy_meal_id=None,
+        logged_at=_at(day, 7 + index * 4),
+        protein_g=0.0,
+        carbs_g=rng.choice((0.0, 10.0)),
+        fat_g=0.0,
+        fiber_g=0.0,
+    )
+
+
+def _at(day: date, hour: int) -> datetime:
+    return datetime.combine(day, time(hour=min(hour, 23)), tzinfo=UTC)
+
+
+def _days(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=n) for n in range((end - start).days + 1)]
+
+
+def _stats(db: _FakeDatabase, operations: int, started: int, costs) -> RollupStats:
+    python_ms = (perf_counter_ns() - started) / 1_000_000
+    round_trip_ms, row_us = costs
+    db_ms = db.round_trips * round_trip_ms + db.rows_read * row_us / 1000
+    return RollupStats(
+        operations=operations,
+        round_trips=db.round_trips,
+        rows_read=db.rows_read,
+        python_ms=round(python_ms, 1),
+        modeled_db_ms=round(db_ms, 1),
+        modeled_ms_per_operation=round((python_ms + db_ms) / operations, 4),
+    )
+
+
+def _runner_metadata() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--meals-per-day", type=int, default=DEFAULT_MEALS_PER_DAY)
+    parser.add_argument(
+        "--food-items-per-meal", type=int, default=DEFAULT_FOOD_ITEMS_PER_MEAL
+    )
+    parser.add_argument("--steps-per-meal", type=int, default=DEFAULT_STEPS_PER_MEAL)
+    parser.add_argument(
+        "--hydration-per-day", type=int, default=DEFAULT_HYDRATION_PER_DAY
+    )
+    parser.add_argument(
+        "--movements-per-day", type=int, default=DEFAULT_MOVEMENTS_PER_DAY
+    )
+    parser.add_argument("--bulk-days", type=int, default=DEFAULT_BULK_DAYS)
+    parser.add_argument("--weekly-scans", type=int, default=DEFAULT_WEEKLY_SCANS)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--round-trip-ms", type=float, default=DEFAULT_ROUND_TRIP_MS)
+    parser.add_argument("--row-us", type=float, default=DEFAULT_ROW_US)
+    parser.add_argument("--seed", type=int, default=20261016)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("plans/reports/daily-nutrition-rollup-benchmark.json"),
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Diversity rerank benchmark: repeated shortlist reranking vs incremental MMR.
+
+Self-contained: a synthetic catalog and ranked pool are built in memory. Both
+paths must select the same reranked shortlist and leave the same remainder;
+the script exits non-zero if they ever differ.
+
+Modes:
+
+- ``repeated``: the previous ``diversity_rank``. Every pick reranks the top of
+  the remaining pool against all earlier picks, recomputing each meal's
+  ingredient set and every overlap, then rebuilds the remaining list.
+- ``incremental``: ``PlanDiversityRerankingService.select_shortlist`` with a
+  ``DiversityOverlapCache`` over the snapshot's scoring index. Each candidate
+  keeps a running max overlap and only compares against new picks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+from time import perf_counter_ns
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.domain.model.meal_recommendation import CatalogMeal, CatalogMealIngredient
+from src.domain.services.meal_recommendation.catalog_ingredient_statistics_service import (
+    CatalogIngredientStatisticsService,
+)
+from src.domain.services.meal_recommendation.catalog_scoring_index import (
+    CatalogScoringIndex,
+)
+from src.domain.services.meal_recommendation.plan_diversity_reranking_service import (
+    SHORTLIST_LIMIT,
+    DiversityOverlapCache,
+    PlanDiversityRerankingService,
+)
+from src.domain.services.meal_recommendation.recipe_scoring_service import RecipeScore
+
+DEFAULT_POOL_SIZES = (1_000, 5_000, 20_000)
+DEFAULT_INGREDIENT_POOL = 600
+DEFAULT_SAMPLES = 20
+
+
+@dataclass(frozen=True)
+class RerankStats:
+    p50_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+    samples: int
+
+
+def main() -> None:
+    args = _parse_args()
+    sizes = tuple(int(item.strip()) for item in args.pool_sizes.split(",") if item)
+    report = {
+        "schema_version": "diversity_rerank_benchmark_v1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "runner": _runner_metadata(),
+        "parameters": {
+            "pool_sizes": sizes,
+            "ingredient_pool": args.ingredient_pool,
+            "shortlist_limit": SHORTLIST_LIMIT,
+            "samples": args.samples,
+            "seed": args.seed,
+        },
+        "results": [
+            _benchmark_pool_size(
+                size,
+                ingredient_pool=args.ingredient_pool,
+                samples=args.samples,
+                seed=args.seed,
+            )
+            for size in sizes
+        ],
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def _benchmark_pool_size(
+    pool_size: int, *, ingredient_pool: int, samples: int, seed: int
+) -> dict:
+    rng = random.Random(seed + pool_size)
+    meals = _catalog(pool_size, ingredient_pool, rng)
+    ingredient_statistics = CatalogIngredientStatisticsService().build(meals)
+    index = CatalogScoringIndex.build(meals, ingredient_statistics)
+    service = PlanDiversityRerankingService()
+
+    repeated_durations = []
+    incremental_durations = []
+    for _ in range(samples):
+        ranked = _ranked_pool(meals, rng)
+        started = perf_counter_ns()
+        expected = _repeated_rerank(service, ranked, ingredient_statistics)
+        repeated_durations.append(_elapsed_ms(started))
+
+        started = perf_counter_ns()
+        actual = service.select_shortlist(
+            ranked,
+            ingredient_statistics=ingredient_statistics,
+            overlaps=DiversityOverlapCache(ingredient_statistics, index),
+        )
+        incremental_durations.append(_elapsed_ms(started))
+
+        if actual != expected:
+            raise SystemExit(f"shortlist mismatch at pool_size={pool_size}")
+
+    repeated = _stats(repeated_durations)
+    incremental = _stats(incremental_durations)
+    return {
+        "pool_size": pool_size,
+        "outputs_identical": True,
+        "repeated": asdict(repeated),
+        "incremental": asdict(incremental),
+        "p50_speedup": round(repeated.p50_ms / incremental.p50_ms, 2),
+    }
+
+
+def _repeated_rerank(service, ranked, ingredient_statistics):
+    """The pre-incremental ``diversity_rank`` loop, kept verbatim for comparison."""
+    selected: list[RecipeScore] = []
+    remaining = ranked[:]
+    while remaining and len(selected) < SHORTLIST_LIMIT:
+        reranked = service.rerank_shortlist(
+            remaining,
+            comparison_meals=tuple(item.catalog_meal for item in selected),
+            ingredient_statistics=ingredient_statistics,
+        )
+        winner = reranked[0]
+        selected.append(winner)
+        remaining = [
+            item for item in remaining if item.catalog_meal.id != winner.catalog_meal.id
+        ]
+    return selected, remaining
+
+
+def _ranked_pool(meals: list[CatalogMeal], rng: random.Random) -> list[RecipeScore]:
+    confidence = rng.uniform(0.2, 1.0)
+    ingredient_weight = 0.35 * confidence
+    scores = [
+        RecipeScore(
+            catalog_meal=meal,
+            score=0.0,
+            calorie_fit=rng.random(),
+            ingredient_fit=rng.random(),
+            calorie_weight=0.90 - ingredient_weight,
+            ingredient_weight=ingredient_weight,
+            diversity_weight=0.10,
+        )
+        for meal in meals
+    ]
+    return sorted(
+        scores,
+        key=lambda item: (
+            -item.contextual_score(diversity_fit=0.0),
+            item.catalog_meal.id,
+        ),
+    )
+
+
+def _catalog(size: int, ingredient_pool: int, rng: random.Random) -> list[CatalogMeal]:
+    weights = [1 / (rank + 1) for rank in range(ingredient_pool)]
+    food_ids = list(range(1, ingredient_pool + 1))
+    return [
+        CatalogMeal(
+            id=f"meal-{index:06d}",
+            catalog_key=f"key-{index:06d}",
+            content_hash=f"{index:064d}"[:64],
+            name=f"Recipe {index:06d}",
+            cuisine="vietnamese",
+            description="Synthetic benchmark recipe",
+            image_url=None,
+            protein_g=Decimal("30"),
+            carbs_g=Decimal("60"),
+            fat_g=Decimal("15"),
+            fiber_g=Decimal("5"),
+            meal_types=("lunch",),
+            ingredients=tuple(
+                CatalogMealIngredient(
+                    food_reference_id=food_id,
+                    display_name="Synthetic ingredient",
+                    quantity=Decimal("100"),
+                    unit="g",
+                )
+                for food_id in rng.choices(
+                    food_ids, weights=weights, k=rng.randint(3, 12)
+                )
+            ),
+        )
+        for index in range(size)
+    ]
+
+
+def _stats(values: list[float]) -> RerankStats:
+    sorted_values = sorted(values)
+    return RerankStats(
+        p50_ms=round(statistics.median(sorted_values), 4),
+        p95_ms=round(_percentile(sorted_values, 0.95), 4),
+        min_ms=round(sorted_values[0], 4),
+        max_ms=round(sorted_values[-1], 4),
+        samples=len(sorted_values),
+    )
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    index = int(round((len(values) - 1) * percentile))
+    return values[index]
+
+
+def _elapsed_ms(started_ns: int) -> float:
+    return (perf_counter_ns() - started_ns) / 1_000_000
+
+
+def _runner_metadata() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pool-sizes", default=",".join(map(str, DEFAULT_POOL_SIZES)))
+    parser.add_argument("--ingredient-pool", type=int, default=DEFAULT_INGREDIENT_POOL)
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--seed", type=int, default=20261016)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("plans/reports/diversity-rerank-benchmark.json"),
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Image preprocessing benchmark: inline compression vs the off-loop pool.
+
+Self-contained: synthetic camera-sized photos are generated in memory and
+``--concurrency`` scans are preprocessed at once while a ticker coroutine
+measures how late the event loop wakes it (loop stall).
+
+Modes:
+
+- ``inline``: the previous path, ``compress_image`` called directly on the
+  event loop for every scan.
+- ``pooled``: ``compress_image_async`` on a bounded pool sized like the API's
+  preprocessing pool. The second pass over each rendition is also timed to
+  show it is skipped.
+
+CPU time per scan is process CPU time (``time.process_time``) divided by the
+number of scans, so it includes decode, resize and encode on every thread.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from io import BytesIO
+from pathlib import Path
+from time import perf_counter_ns
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from PIL import Image
+
+from src.domain.utils.image_compression import (
+    compress_image,
+    compress_image_async,
+    is_analysis_rendition,
+)
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_SAMPLES = 5
+DEFAULT_WIDTH = 4032
+DEFAULT_HEIGHT = 3024
+# Same size as base_dependencies' image preprocessing pool.
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+TICK_INTERVAL_S = 0.001
+
+
+@dataclass(frozen=True)
+class PreprocessStats:
+    p50_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+    samples: int
+
+
+def main() -> None:
+    args = _parse_args()
+    images = _photos(args.concurrency, args.width, args.height, args.seed)
+    inline = asyncio.run(_benchmark(images, samples=args.samples, executor=None))
+    with ThreadPoolExecutor(
+        max_workers=args.workers, thread_name_prefix="image-preprocess"
+    ) as executor:
+        pooled = asyncio.run(
+            _benchmark(images, samples=args.samples, executor=executor)
+        )
+    report = {
+        "schema_version": "image_preprocessing_benchmark_v1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "runner": {**_runner_metadata(), "preprocess_workers": args.workers},
+        "parameters": {
+            "concurrency": args.concurrency,
+            "samples": args.samples,
+            "width": args.width,
+            "height": args.height,
+            "seed": args.seed,
+        },
+        "inline": inline,
+        "pooled": pooled,
+        "p50_wall_speedup": round(
+            inline["wall"]["p50_ms"] / pooled["wall"]["p50_ms"], 2
+        ),
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+async def _benchmark(
+    images: list[bytes], *, samples: int, executor: ThreadPoolExecutor | None
+) -> dict:
+    wall_durations = []
+    max_stalls = []
+    cpu_per_scan = []
+    second_pass_durations = []
+    for _ in range(samples):
+        stop = asyncio.Event()
+        stalls: list[float] = []
+        ticker = asyncio.create_task(_tick(stop, stalls))
+        await asyncio.sleep(TICK_INTERVAL_S)
+
+        cpu_started = time.process_time()
+        started = perf_counter_ns()
+        if executor is not None:
+            renditions = await asyncio.gather(
+                *(
+                    compress_image_async(image, compress_image, executor)
+                    for image in images
+                )
+            )
+        else:
+            renditions = await asyncio.gather(*(_inline(image) for image in images))
+        wall_durations.append(_elapsed_ms(started))
+        cpu_per_scan.append((time.process_time() - cpu_started) * 1000 / len(images))
+
+        stop.set()
+        await ticker
+        max_stalls.append(max(stalls, default=0.0))
+        if not all(is_analysis_rendition(item) for item in renditions):
+            raise SystemExit("preprocessing did not produce tagged renditions")
+
+        started = perf_counter_ns()
+        again = [compress_image(item) for item in renditions]
+        second_pass_durations.append(_elapsed_ms(started))
+        if again != renditions:
+            raise SystemExit("rendition was recompressed on the second pass")
+
+    return {
+        "wall": asdict(_stats(wall_durations)),
+        "max_loop_stall": asdict(_stats(max_stalls)),
+        "cpu_per_scan": asdict(_stats(cpu_per_scan)),
+        "second_pass": asdict(_stats(second_pass_durations)),
+    }
+
+
+async def _inline(image: bytes) -> bytes:
+    return compress_image(image)
+
+
+async def _tick(stop: asyncio.Event, stalls: list[float]) -> None:
+    while not stop.is_set():
+        started = perf_counter_ns()
+        await asyncio.sleep(TICK_INTERVAL_S)
+        stalls.append(_elapsed_ms(started) - TICK_INTERVAL_S * 1000)
+
+
+def _photos(count: int, width: int, height: int, seed: int) -> list[bytes]:
+    # Noise keeps the encoder honest; flat fills compress to almost nothing.
+    rng = random.Random(seed)
+    photos = []
+    for _ in range(count):
+        tile = Image.frombytes("RGB", (256, 256), rng.randbytes(256 * 256 * 3))
+        img = tile.resize((width, height), Image.BILINEAR)
+        buf = BytesIO()
+        img.save(buf, format="JPEG", quality=92)
+        photos.append(buf.getvalue())
+    return photos
+
+
+def _stats(values: list[float]) -> PreprocessStats:
+    sorted_values = sorted(values)
+    return PreprocessStats(
+        p50_ms=round(statistics.median(sorted_values), 4),
+        p95_ms=round(_percentile(sorted_values, 0.95), 4),
+        min_ms=round(sorted_values[0], 4),
+        max_ms=round(sorted_values[-1], 4),
+        samples=len(sorted_values),
+    )
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    index = int(round((len(values) - 1) * percentile))
+    return values[index]
+
+
+def _elapsed_ms(started_ns: int) -> float:
+    return (perf_counter_ns() - started_ns) / 1_000_000
+
+
+def _runner_metadata() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH)
+    parser.add_argument("--height", type=int, default=DEFAULT_HEIGHT)
+    parser.add_argument("--seed", type=int, default=20261016)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("plans/reports/image-preprocessing-benchmark.json"),
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
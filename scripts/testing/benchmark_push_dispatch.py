@@ -0,0 +1,268 @@
+"""Push cron phase 3 load test: sequential blocking FCM vs concurrent async.
+
+Self-contained: due rows are synthesized in memory, FCM is a fake transport
+that charges a fixed latency per multicast call, and the status UPDATE is a
+fake that charges a fixed latency per bulk statement. No database or Firebase
+project is needed.
+
+Modes:
+
+- ``sequential_blocking``: the previous dispatch loop. Every 500-token chunk
+  calls the synchronous ``send_multicast`` on the event loop, one at a time,
+  and all rows are marked in one UPDATE at the end.
+- ``concurrent_async``: ``CronNotificationDispatchService`` as shipped, with
+  ``send_multicast_async`` and bulk marking as groups finish.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter_ns
+from types import SimpleNamespace
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.infra.services import cron_notification_dispatch_service as dispatch_module
+from src.infra.services.cron_notification_dispatch_service import (
+    CronNotificationDispatchService,
+)
+
+DEFAULT_ROWS = 20_000
+DEFAULT_TOKENS_PER_ROW = 2
+DEFAULT_FCM_LATENCY_MS = 120.0
+DEFAULT_MARK_LATENCY_MS = 15.0
+DEFAULT_CONCURRENCY = CronNotificationDispatchService.DISPATCH_CONCURRENCY
+_LANGUAGES = ("en", "vi", "es", "fr", "de", "ja", "zh")
+_TYPES = ("meal_reminder_breakfast", "daily_summary", "trial_expiry_2d")
+
+
+@dataclass(frozen=True)
+class DispatchStats:
+    rows: int
+    fcm_calls: int
+    mark_statements: int
+    wall_seconds: float
+    rows_per_second: float
+    max_loop_stall_ms: float
+
+
+class _FakeFcm:
+    """Fake FCM transport: fixed latency per multicast call, all tokens accepted."""
+
+    def __init__(self, latency_seconds: float):
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+
+    def send_multicast(self, tokens, title, body, notification_type, data):
+        self.calls += 1
+        time.sleep(self.latency_seconds)
+        return {"success": True, "sent": len(tokens), "failed_tokens": []}
+
+    async def send_multicast_async(self, tokens, title, body, notification_type, data):
+        self.calls += 1
+        await asyncio.sleep(self.latency_seconds)
+        return {"success": True, "sent": len(tokens), "failed_tokens": []}
+
+
+def main() -> None:
+    args = _parse_args()
+    report = asyncio.run(
+        _run(
+            rows=args.rows,
+            tokens_per_row=args.tokens_per_row,
+            fcm_latency_ms=args.fcm_latency_ms,
+            mark_latency_ms=args.mark_latency_ms,
+            concurrency=args.concurrency,
+        )
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+async def _run(
+    rows: int,
+    tokens_per_row: int,
+    fcm_latency_ms: float,
+    mark_latency_ms: float,
+    concurrency: int,
+) -> dict:
+    due = _due_rows(rows, tokens_per_row)
+    results = {}
+    for name in ("sequential_blocking", "concurrent_async"):
+        results[name] = asdict(
+            await _measure(
+                name, due, fcm_latency_ms / 1000, mark_latency_ms / 1000, concurrency
+            )
+        )
+    return {
+        "schema_version": "push_dispatch_benchmark_v1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "runner": _runner_metadata(),
+        "parameters": {
+            "rows": rows,
+            "tokens_per_row": tokens_per_row,
+            "fcm_latency_ms": fcm_latency_ms,
+            "mark_latency_ms": mark_latency_ms,
+            "concurrency": concurrency,
+        },
+        "results": results,
+    }
+
+
+async def _measure(
+    mode: str,
+    due: list,
+    fcm_latency: float,
+    mark_latency: float,
+    concurrency: int,
+) -> DispatchStats:
+    fcm = _FakeFcm(fcm_latency)
+    service = CronNotificationDispatchService(fcm, dispatch_concurrency=concurrency)
+    marked = {"statements": 0, "rows": 0}
+
+    async def mark(sent_ids, failed_ids, retry_ids=None):
+        marked["statements"] += 1
+        marked["rows"] += len(sent_ids) + len(failed_ids) + len(retry_ids or [])
+        await asyncio.sleep(mark_latency)
+
+    async def noop(*_args, **_kwargs):
+        return None
+
+    service._recover_stale_processing = noop
+    service._claim_due_notifications = lambda _now: _claimed(due)
+    service._mark_notifications = mark
+    if mode == "sequential_blocking":
+        service._dispatch_groups = _sequential_dispatch(service)
+
+    stall = _LoopStallProbe()
+    probe = asyncio.create_task(stall.run())
+    await asyncio.sleep(0.005)  # let the probe take its first tick
+    started = perf_counter_ns()
+    with (
+        patch.object(
+            dispatch_module,
+            "_fetch_regular_notification_user_ids",
+            _all_users_regular,
+        ),
+        patch.object(dispatch_module, "_fetch_calories_consumed_batch", _no_calories),
+    ):
+        await service._send_due_notifications(datetime.now(UTC))
+    wall = (perf_counter_ns() - started) / 1_000_000_000
+    probe.cancel()
+
+    if marked["rows"] != len(due):
+        raise RuntimeError(f"{mode}: marked {marked['rows']} of {len(due)} rows")
+    return DispatchStats(
+        rows=len(due),
+        fcm_calls=fcm.calls,
+        mark_statements=marked["statements"],
+        wall_seconds=round(wall, 3),
+        rows_per_second=round(len(due) / wall, 1),
+        max_loop_stall_ms=round(stall.max_stall_ms, 1),
+    )
+
+
+def _sequential_dispatch(service: CronNotificationDispatchService):
+    """The pre-pipeline loop: blocking chunks in order, one UPDATE at the end."""
+
+    async def dispatch(groups, sent_ids, failed_ids, retry_ids):
+        for (notif_type, title, body), group in groups.items():
+            delivered = True
+            for chunk in dispatch_module._chunked(group["tokens"], 500):
+                result = service._firebase.send_multicast(
+                    tokens=chunk,
+                    title=title,
+                    body=body,
+                    notification_type=notif_type,
+                    data={"notification_count": str(len(group["ids"]))},
+                )
+                delivered = delivered and bool(result.get("success"))
+            (sent_ids if delivered else retry_ids).extend(group["row_ids"])
+        await service._mark_notifications(sent_ids, failed_ids, retry_ids)
+
+    return dispatch
+
+
+class _LoopStallProbe:
+    """Measures the longest gap between 1 ms ticks on the event loop."""
+
+    def __init__(self):
+        self.max_stall_ms = 0.0
+
+    async def run(self) -> None:
+        last = perf_counter_ns()
+        while True:
+            await asyncio.sleep(0.001)
+            now = perf_counter_ns()
+            self.max_stall_ms = max(self.max_stall_ms, (now - last) / 1_000_000)
+            last = now
+
+
+async def _claimed(due: list) -> list:
+    return due
+
+
+async def _all_users_regular(user_ids, _now):
+    return set(user_ids)
+
+
+async def _no_calories(user_ids, _now):
+    return {}
+
+
+def _due_rows(rows: int, tokens_per_row: int) -> list:
+    return [
+        SimpleNamespace(
+            id=f"notif-{index}",
+            user_id=f"user-{index}",
+            notification_type=_TYPES[index % len(_TYPES)],
+            context={
+                "fcm_tokens": [f"token-{index}-{t}" for t in range(tokens_per_row)],
+                "calorie_goal": 2000,
+                "calories_consumed": 0,
+                "gender": "male" if index % 2 else "female",
+                "language_code": _LANGUAGES[index % len(_LANGUAGES)],
+            },
+        )
+        for index in range(rows)
+    ]
+
+
+def _runner_metadata() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--tokens-per-row", type=int, default=DEFAULT_TOKENS_PER_ROW)
+    parser.add_argument("--fcm-latency-ms", type=float, default=DEFAULT_FCM_LATENCY_MS)
+    parser.add_argument(
+        "--mark-latency-ms", type=float, default=DEFAULT_MARK_LATENCY_MS
+    )
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("plans/reports/push-dispatch-benchmark.json"),
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""Streak read benchmark: full-history date scan vs persisted streak summary.
+
+Self-contained: a 3-year meal history is synthesized in memory and the
+database is a fake that counts round trips and rows returned. The Python work
+of each path is timed for real; database time is modeled from those counts
+with a fixed cost per round trip and per row.
+
+Modes:
+
+- ``full_scan``: the previous ``GetStreakQueryHandler._compute``. Every cache
+  miss loads every distinct logged date, counts scanner meals, and walks the
+  dates for the current and best streak.
+- ``summary``: the shipped path. A cache miss reads one ``StreakSummary`` row;
+  meal writes pay the incremental maintenance (bounded window scans, and a
+  full rebuild only when a delete breaks the best run).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+from dataclasses import asdict, dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from time import perf_counter_ns
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.domain.model.meal import StreakSummary
+
+DEFAULT_HISTORY_DAYS = 3 * 365
+DEFAULT_LOGGED_RATIO = 0.85
+DEFAULT_READS = 2_000
+DEFAULT_WRITES = 2_000
+DEFAULT_DELETE_RATIO = 0.2
+DEFAULT_BACKDATED_RATIO = 0.1
+DEFAULT_ROUND_TRIP_MS = 1.0
+DEFAULT_ROW_US = 2.0
+TODAY = date(2026, 10, 16)
+
+
+@dataclass(frozen=True)
+class StreakStats:
+    operations: int
+    round_trips: int
+    rows_read: int
+    python_ms: float
+    modeled_db_ms: float
+    modeled_ms_per_operation: float
+
+
+class _FakeMealDates:
+    """In-memory meal dates; every query adds one round trip and its rows."""
+
+    def __init__(self, dates: set[date]):
+        self.dates = set(dates)
+        self.round_trips = 0
+        self.rows_read = 0
+
+    def dates_between(self, start: date | None = None, end: date | None = None):
+        rows = [
+            d
+            for d in self.dates
+            if (start is None or d >= start) and (end is None or d <= end)
+        ]
+        self._charge(len(rows))
+        return sorted(rows, reverse=True)
+
+    def latest_before(self, before: date) -> date | None:
+        self._charge(1)
+        earlier = [d for d in self.dates if d < before]
+        return max(earlier) if earlier else None
+
+    def charge_row(self) -> None:
+        self._charge(1)
+
+    def _charge(self, rows: int) -> None:
+        self.round_trips += 1
+        self.rows_read += rows
+
+
+def main() -> None:
+    args = _parse_args()
+    report = _run(
+        history_days=args.history_days,
+        logged_ratio=args.logged_ratio,
+        reads=args.reads,
+        writes=args.writes,
+        delete_ratio=args.delete_ratio,
+        backdated_ratio=args.backdated_ratio,
+        round_trip_ms=args.round_trip_ms,
+        row_us=args.row_us,
+        seed=args.seed,
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def _run(
+    history_days: int,
+    logged_ratio: float,
+    reads: int,
+    writes: int,
+    delete_ratio: float,
+    backdated_ratio: float,
+    round_trip_ms: float,
+    row_us: float,
+    seed: int,
+) -> dict:
+    rng = random.Random(seed)
+    history = {
+        TODAY - timedelta(days=offset)
+        for offset in range(history_days)
+        if offset < 30 or rng.random() < logged_ratio
+    }
+    costs = (round_trip_ms, row_us)
+    full_reads = _measure_full_scan_reads(history, reads, costs)
+    summary_reads = _measure_summary_reads(history, reads, costs)
+    summary_writes = _measure_summary_writes(
+        history, writes, delete_ratio, backdated_ratio, history_days, costs, rng
+    )
+    return {
+        "schema_version": "streak_summary_benchmark_v1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "runner": _runner_metadata(),
+        "parameters": {
+            "history_days": history_days,
+            "logged_days": len(history),
+            "reads": reads,
+            "writes": writes,
+            "delete_ratio": delete_ratio,
+            "backdated_ratio": backdated_ratio,
+            "round_trip_ms": round_trip_ms,
+            "row_us": row_us,
+            "seed": seed,
+        },
+        "results": {
+            "full_scan_read": asdict(full_reads),
+            "summary_read": asdict(summary_reads),
+            "summary_write_maintenance": asdict(summary_writes),
+        },
+    }
+
+
+def _measure_full_scan_reads(history: set[date], reads: int, costs) -> StreakStats:
+    db = _FakeMealDates(history)
+    started = perf_counter_ns()
+    for _ in range(reads):
+        dates = db.dates_between()
+        db.charge_row()  # count_by_source
+        _legacy_streaks(dates, TODAY)
+    return _stats(db, reads, started, costs)
+
+
+def _measure_summary_reads(history: set[date], reads: int, costs) -> StreakStats:
+    db = _FakeMealDates(history)
+    stored = StreakSummary.from_logged_dates("u1", "UTC", history)
+    started = perf_counter_ns()
+    for _ in range(reads):
+        db.charge_row()  # primary-key read of user_streak_summaries
+        stored.to_response(stored.current_streak(TODAY))
+    return _stats(db, reads, started, costs)
+
+
+def _measure_summary_writes(
+    history: set[date],
+    writes: int,
+    delete_ratio: float,
+    backdated_ratio: float,
+    history_days: int,
+    costs,
+    rng: random.Random,
+) -> StreakStats:
+    db = _FakeMealDates(history)
+    summary = StreakSummary.from_logged_dates("u1", "UTC", history)
+    started = perf_counter_ns()
+    for _ in range(writes):
+        db.charge_row()  # SELECT ... FOR UPDATE on the summary row
+        if rng.random() < delete_ratio:
+            day = TODAY - timedelta(days=rng.randrange(history_days))
+            summary = _apply_delete(db, summary, day)
+        else:
+            backdated = rng.random() < backdated_ratio
+            day = TODAY - timedelta(
+                days=rng.randrange(1, history_days) if backdated else 0
+            )
+            db.dates.add(day)
+            window = summary.scan_window_for_added_day(day)
+            nearby = db.dates_between(*window) if window else []
+            summary = summary.with_added_day(day, nearby)
+        db.charge_row()  # UPSERT of the summary row
+    return _stats(db, writes, started, costs)
+
+
+def _apply_delete(db: _FakeMealDates, summary: StreakSummary, day: date):
+    db.dates.discard(day)
+    if db.dates_between(day, day):
+        return summary
+    previous: list[date] = []
+    if summary.empties_current_run(day):
+        latest = db.latest_before(day)
+        if latest is not None:
+            previous = db.dates_between(
+                latest - timedelta(days=summary.best_run_length), latest
+            )
+    repaired = summary.with_removed_day(day, previous)
+    if repaired is None:
+        # Dropped summary: the next read pays one full rebuild.
+        return StreakSummary.from_logged_dates("u1", "UTC", db.dates_between())
+    return repaired
+
+
+def _legacy_streaks(dates: list[date], today: date) -> tuple[int, int]:
+    """The pre-summary handler walk, kept verbatim for comparison."""
+    if not dates:
+        return 0, 0
+    cursor = today if today in dates else today - timedelta(days=1)
+    date_set = set(dates)
+    current = 0
+    if cursor in dates:
+        while cursor in date_set:
+            current += 1
+            cursor -= timedelta(days=1)
+    best = 0
+    for d in date_set:
+        if (d - timedelta(days=1)) not in date_set:
+            length = 0
+            cursor = d
+            while cursor in date_set:
+                length += 1
+                cursor += timedelta(days=1)
+            best = max(best, length)
+    return current, best
+
+
+def _stats(db: _FakeMealDates, operations: int, started: int, costs) -> StreakStats:
+    python_ms = (perf_counter_ns() - started) / 1_000_000
+    round_trip_ms, row_us = costs
+    db_ms = db.round_trips * round_trip_ms + db.rows_read * row_us / 1000
+    return StreakStats(
+        operations=operations,
+        round_trips=db.round_trips,
+        rows_read=db.rows_read,
+        python_ms=round(python_ms, 1),
+        modeled_db_ms=round(db_ms, 1),
+        modeled_ms_per_operation=round((python_ms + db_ms) / operations, 4),
+    )
+
+
+def _runner_metadata() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--history-days", type=int, default=DEFAULT_HISTORY_DAYS)
+    parser.add_argument("--logged-ratio", type=float, default=DEFAULT_LOGGED_RATIO)
+    parser.add_argument("--reads", type=int, default=DEFAULT_READS)
+    parser.add_argument("--writes", type=int, default=DEFAULT_WRITES)
+    parser.add_argument("--delete-ratio", type=float, default=DEFAULT_DELETE_RATIO)
+    parser.add_argument(
+        "--backdated-ratio", type=float, default=DEFAULT_BACKDATED_RATIO
+    )
+    parser.add_argument("--round-trip-ms", type=float, default=DEFAULT_ROUND_TRIP_MS)
+    parser.add_argument("--row-us", type=float, default=DEFAULT_ROW_US)
+    parser.add_argument("--seed", type=int, default=20261016)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("plans/reports/streak-summary-benchmark.json"),
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""Meal suggestion benchmark: recipe model call per dish vs the recipe cache.
+
+Self-contained: ``ParallelRecipeGenerator.generate`` (the ``/meal-suggestions``
+path) runs against a fake generation service that sleeps a modeled latency,
+a fake nutrition lookup and an in-memory cache port with a modeled Redis
+round trip. ``--requests`` sessions arrive ``--concurrency`` at a time; each
+names dishes drawn from a Zipf-weighted catalog of ``--dishes`` and carries a
+calorie target and allergy profile drawn from small sets, as real traffic does.
+
+Modes:
+
+- ``uncached``: the previous path, every dish is a recipe model call.
+- ``cached``: ``RecipeResultCache`` in front of the model; hits are still
+  rescaled to each session's calorie target.
+
+Sleeps are multiplied by ``--time-scale`` so a run takes seconds; reported
+latencies are divided back to modeled milliseconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.domain.model.meal_suggestion import SuggestionSession
+from src.domain.ports.cache_port import CachePort
+from src.domain.services.meal_suggestion.macro_validation_service import (
+    MacroValidationService,
+)
+from src.domain.services.meal_suggestion.nutrition_lookup_service import (
+    IngredientMacros,
+    MealMacros,
+)
+from src.domain.services.meal_suggestion.parallel_recipe_generator import (
+    ParallelRecipeGenerator,
+)
+from src.domain.services.meal_suggestion.recipe_result_cache import (
+    RecipeResultCache,
+)
+
+DEFAULT_REQUESTS = 400
+DEFAULT_CONCURRENCY = 20
+DEFAULT_DISHES = 150
+DEFAULT_ZIPF_S = 1.1
+DEFAULT_NAMES_LATENCY_MS = 1200.0
+DEFAULT_RECIPE_LATENCY_MS = 4000.0
+DEFAULT_REDIS_MS = 1.0
+DEFAULT_TIME_SCALE = 0.1
+CALORIE_TARGETS = (450, 520, 600, 610, 650, 700, 780)
+ALLERGY_PROFILES = ([], [], [], ["peanut"], ["shellfish"])
+
+
+@dataclass(frozen=True)
+class SuggestionStats:
+    requests: int
+    recipe_model_calls: int
+    cache_hits: int
+    cache_misses: int
+    hit_rate: float
+    p50_ms: float
+    p95_ms: float
+
+
+class _FakeGeneration:
+    def __init__(self, args, catalog: list[str], weights: list[float]):
+        self._args = args
+        self._catalog = catalog
+        self._weights = weights
+        self._rng = random.Random(args.seed)
+        self.recipe_calls = 0
+
+    async def generate_meal_plan_async(self, prompt, system, *args):
+        purpose = args[-1]
+        if purpose == "meal_names":
+            await _sleep(self._args, self._args.names_latency_ms)
+            names = self._rng.choices(self._catalog, self._weights, k=12)
+            return {"meal_names": list(dict.fromkeys(names))[:7]}
+        self.recipe_calls += 1
+        await _sleep(
+            self._args, self._args.recipe_latency_ms * self._rng.uniform(0.7, 1.3)
+        )
+        return {
+            "ingredients": [
+                {"name": "chicken breast", "amount": 150, "unit": "g"},
+                {"name": "rice", "amount": 180, "unit": "g"},
+            ],
+            "recipe_steps": [
+                {"step": 1, "instruction": "Cook.", "duration_minutes": 10}
+            ],
+            "prep_time_minutes": 20,
+            "cuisine_type": "International",
+        }
+
+
+class _FakeNutritionLookup:
+    async def calculate_meal_macros(self, ingredients):
+        return _macros(600.0)
+
+    def scale_to_target(self, meal_macros, target_calories, reject_out_of_range=True):
+        return _macros(float(target_calories))
+
+
+class _MemoryCache(CachePort):
+    def __init__(self, args):
+        self._args = args
+        self.values: dict = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key):
+        await _sleep(self._args, self._args.redis_ms)
+        value = self.values.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key, value, ttl_seconds):
+        await _sleep(self._args, self._args.redis_ms)
+        self.values[key] = value
+
+    async def invalidate(self, key):
+        return self.values.pop(key, None) is not None
+
+    async def invalidate_pattern(self, pattern):
+        return 0
+
+
+def main() -> None:
+    args = _parse_args()
+    report = {
+        "schema_version": "suggestion_recipe_cache_benchmark_v1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "runner": _runner_metadata(),
+        "parameters": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "dishes": args.dishes,
+            "zipf_s": args.zipf_s,
+            "names_latency_ms": args.names_latency_ms,
+            "recipe_latency_ms": args.recipe_latency_ms,
+            "redis_ms": args.redis_ms,
+            "time_scale": args.time_scale,
+            "seed": args.seed,
+        },
+        "results": {
+            "uncached": asdict(asyncio.run(_measure(args, cached=False))),
+            "cached": asdict(asyncio.run(_measure(args, cached=True))),
+        },
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+async def _measure(args, *, cached: bool) -> SuggestionStats:
+    catalog = [f"Dish {index}" for index in range(args.dishes)]
+    weights = [1 / (rank + 1) ** args.zipf_s for rank in range(args.dishes)]
+    generation = _FakeGeneration(args, catalog, weights)
+    cache = _MemoryCache(args)
+    generator = ParallelRecipeGenerator(
+        generation_service=generation,
+        translation_service=None,
+        macro_validator=MacroValidationService(),
+        nutrition_lookup=_FakeNutritionLookup(),
+        meal_names_schema_class=dict,
+        discovery_meals_schema_class=dict,
+        recipe_cache=RecipeResultCache(cache) if cached else None,
+    )
+    rng = random.Random(args.seed + 1)
+    sessions = [
+        SuggestionSession(
+            id=f"session_{index}",
+            user_id=f"user_{index % 97}",
+            meal_type="lunch",
+            meal_portion_type="main",
+            target_calories=rng.choice(CALORIE_TARGETS),
+            ingredients=[],
+            allergies=list(rng.choice(ALLERGY_PROFILES)),
+        )
+        for index in range(args.requests)
+    ]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+
+    async def _request(session: SuggestionSession) -> None:
+        async with semaphore:
+            started = perf_counter()
+            await generator.generate(session, exclude_meal_names=[])
+            latencies.append((perf_counter() - started) * 1000 / args.time_scale)
+
+    await asyncio.gather(*(_request(session) for session in sessions))
+    ordered = sorted(latencies)
+    lookups = cache.hits + cache.misses
+    return SuggestionStats(
+        requests=args.requests,
+        recipe_model_calls=generation.recipe_calls,
+        cache_hits=cache.hits,
+        cache_misses=cache.misses,
+        hit_rate=round(cache.hits / lookups, 3) if lookups else 0.0,
+        p50_ms=round(statistics.median(ordered), 1),
+        p95_ms=round(ordered[int(0.95 * (len(ordered) - 1))], 1),
+    )
+
+
+def _macros(calories: float) -> MealMacros:
+    ingredient = IngredientMacros(
+        name="chicken breast",
+        quantity_g=150.0,
+        calories=calories,
+        protein=40.0,
+        carbs=50.0,
+        fat=12.0,
+        fiber=2.0,
+        sugar=1.0,
+        source_tier="T1_food_reference",
+        food_reference_id=None,
+    )
+    return MealMacros(
+        calories=calories,
+        protein=40.0,
+        carbs=50.0,
+        fat=12.0,
+        fiber=2.0,
+        sugar=1.0,
+        ingredients=[ingredient, ingredient],
+        t1_count=2,
+        t2_count=0,
+        t3_count=0,
+    )
+
+
+async def _sleep(args, modeled_ms: float) -> None:
+    await asyncio.sleep(modeled_ms / 1000 * args.time_scale)
+
+
+def _runner_metadata() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--dishes", type=int, default=DEFAULT_DISHES)
+    parser.add_argument("--zipf-s", type=float, default=DEFAULT_ZIPF_S)
+    parser.add_argument(
+        "--names-latency-ms", type=float, default=DEFAULT_NAMES_LATENCY_MS
+    )
+    parser.add_argument(
+        "--recipe-latency-ms", type=float, default=DEFAULT_RECIPE_LATENCY_MS
+    )
+    parser.add_argument("--redis-ms", type=float, default=DEFAULT_REDIS_MS)
+    parser.add_argument("--time-scale", type=float, default=DEFAULT_TIME_SCALE)
+    parser.add_argument("--seed", type=int, default=20261016)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("plans/reports/suggestion-recipe-cache-benchmark.json"),
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
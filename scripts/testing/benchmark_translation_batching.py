@@ -0,0 +1,226 @@
+"""Translation benchmark: one model request per caller vs cross-request batches.
+
+Self-contained: the real ``OpenAITranslationAdapter`` runs against a fake
+provider that sleeps a modeled latency, admits at most ``--provider-concurrency``
+requests at once (the account's in-flight limit) and counts tokens from the
+actual request payloads. ``--callers`` requests arrive over ``--arrival-ms``,
+each translating two or three food names, as ``translate_food_texts`` does.
+
+Modes:
+
+- ``per_call``: the previous path, every caller sends its own request.
+- ``batched``: callers go through ``TranslationBatcherAdapter`` and share one
+  indexed request per language pair per ``--window-ms``.
+
+Latency per request is ``--base-latency-ms`` plus ``--output-token-ms`` per
+output token. Tokens are estimated at four UTF-8 bytes per token; the system
+message is counted on every request because that is what each call pays
+before prompt caching.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.infra.adapters.openai_translation_adapter import OpenAITranslationAdapter
+from src.infra.adapters.translation_batcher_adapter import TranslationBatcherAdapter
+from src.infra.services.ai.openai_structured_generation_result import (
+    OpenAIStructuredGenerationResult,
+)
+from src.infra.services.ai.openai_translation_schemas import (
+    OpenAITranslationBatch,
+    OpenAITranslationItem,
+)
+
+DEFAULT_CALLERS = 400
+DEFAULT_ARRIVAL_MS = 1000.0
+DEFAULT_WINDOW_MS = 5.0
+DEFAULT_PROVIDER_CONCURRENCY = 16
+DEFAULT_BASE_LATENCY_MS = 250.0
+DEFAULT_OUTPUT_TOKEN_MS = 1.0
+DEFAULT_VOCABULARY = 300
+TARGET_LANGUAGES = ("vi", "es", "fr")
+BYTES_PER_TOKEN = 4
+FOODS = (
+    "grilled chicken breast",
+    "steamed white rice",
+    "broccoli",
+    "fried egg",
+    "beef noodle soup",
+    "greek yogurt",
+    "banana",
+    "whole wheat toast",
+    "avocado",
+    "salmon fillet",
+)
+
+
+@dataclass(frozen=True)
+class BatchingStats:
+    callers: int
+    provider_requests: int
+    prompt_tokens: int
+    output_tokens: int
+    tokens_per_caller: float
+    wall_ms: float
+    callers_per_second: float
+    p50_ms: float
+    p95_ms: float
+
+
+class _FakeProvider:
+    def __init__(self, args):
+        self._semaphore = asyncio.Semaphore(args.provider_concurrency)
+        self._base_latency_s = args.base_latency_ms / 1000
+        self._output_token_s = args.output_token_ms / 1000
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.output_tokens = 0
+
+    async def generate_structured_result(self, *, prompt, system_message, **kwargs):
+        payload = json.loads(prompt)
+        target = payload["target_language"]
+        items = [
+            OpenAITranslationItem(index=item["index"], text=f"{target} {item['text']}")
+            for item in payload["items"]
+        ]
+        parsed = OpenAITranslationBatch(items=items)
+        output_tokens = _tokens(parsed.model_dump_json())
+        async with self._semaphore:
+            self.requests += 1
+            self.prompt_tokens += _tokens(system_message) + _tokens(prompt)
+            self.output_tokens += output_tokens
+            await asyncio.sleep(
+                self._base_latency_s + output_tokens * self._output_token_s
+            )
+        return OpenAIStructuredGenerationResult(parsed=parsed)
+
+
+def main() -> None:
+    args = _parse_args()
+    workload = _workload(args)
+    report = {
+        "schema_version": "translation_batching_benchmark_v1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "runner": _runner_metadata(),
+        "parameters": {
+            "callers": args.callers,
+            "arrival_ms": args.arrival_ms,
+            "window_ms": args.window_ms,
+            "provider_concurrency": args.provider_concurrency,
+            "base_latency_ms": args.base_latency_ms,
+            "output_token_ms": args.output_token_ms,
+            "vocabulary": args.vocabulary,
+            "seed": args.seed,
+        },
+        "results": {
+            "per_call": asdict(asyncio.run(_measure(args, workload, batched=False))),
+            "batched": asdict(asyncio.run(_measure(args, workload, batched=True))),
+        },
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+async def _measure(args, workload, *, batched: bool) -> BatchingStats:
+    provider = _FakeProvider(args)
+    port = OpenAITranslationAdapter(provider=provider, model="benchmark-model")
+    if batched:
+        port = TranslationBatcherAdapter(port, window_seconds=args.window_ms / 1000)
+    latencies: list[float] = []
+
+    async def _caller(delay_s: float, texts: list[str], target: str) -> None:
+        await asyncio.sleep(delay_s)
+        started = perf_counter()
+        result = await port.translate_texts(
+            texts, source_language="en", target_language=target
+        )
+        assert result.cacheable
+        latencies.append((perf_counter() - started) * 1000)
+
+    started = perf_counter()
+    await asyncio.gather(*(_caller(*call) for call in workload))
+    wall_s = perf_counter() - started
+    ordered = sorted(latencies)
+    tokens = provider.prompt_tokens + provider.output_tokens
+    return BatchingStats(
+        callers=len(workload),
+        provider_requests=provider.requests,
+        prompt_tokens=provider.prompt_tokens,
+        output_tokens=provider.output_tokens,
+        tokens_per_caller=round(tokens / len(workload), 1),
+        wall_ms=round(wall_s * 1000, 1),
+        callers_per_second=round(len(workload) / wall_s, 1),
+        p50_ms=round(statistics.median(ordered), 1),
+        p95_ms=round(ordered[int(0.95 * (len(ordered) - 1))], 1),
+    )
+
+
+def _workload(args) -> list[tuple[float, list[str], str]]:
+    rng = random.Random(args.seed)
+    vocabulary = [
+        f"{rng.choice(FOODS)} {index}" if index >= len(FOODS) else FOODS[index]
+        for index in range(args.vocabulary)
+    ]
+    return [
+        (
+            rng.uniform(0, args.arrival_ms / 1000),
+            rng.sample(vocabulary, rng.choice((2, 3))),
+            rng.choice(TARGET_LANGUAGES),
+        )
+        for _ in range(args.callers)
+    ]
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text.encode("utf-8")) // BYTES_PER_TOKEN)
+
+
+def _runner_metadata() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--callers", type=int, default=DEFAULT_CALLERS)
+    parser.add_argument("--arrival-ms", type=float, default=DEFAULT_ARRIVAL_MS)
+    parser.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW_MS)
+    parser.add_argument(
+        "--provider-concurrency", type=int, default=DEFAULT_PROVIDER_CONCURRENCY
+    )
+    parser.add_argument(
+        "--base-latency-ms", type=float, default=DEFAULT_BASE_LATENCY_MS
+    )
+    parser.add_argument(
+        "--output-token-ms", type=float, default=DEFAULT_OUTPUT_TOKEN_MS
+    )
+    parser.add_argument("--vocabulary", type=int, default=DEFAULT_VOCABULARY)
+    parser.add_argument("--seed", type=int, default=20261016)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("plans/reports/translation-batching-benchmark.json"),
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import logging
 import os
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
@@ -68,6 +69,11 @@ _image_store: ImageStorePort | None = None
 _vision_service: VisionAIServicePort | None = None
 _catalog_meal_snapshot_service: CatalogMealSnapshotService | None = None
 _catalog_meal_browse_service = None
+_image_preprocess_executor: ThreadPoolExecutor | None = None
+
+# PIL releases the GIL while decoding, resampling and encoding, so a small
+# thread pool keeps scan preprocessing off the event loop without pickling bytes.
+_IMAGE_PREPROCESS_WORKERS = min(4, os.cpu_count() or 1)
 
 
 async def initialize_cache_layer() -> None:
@@ -90,12 +96,18 @@ async def initialize_cache_layer() -> None:
         )
         await _redis_client.connect()
 
-    _cache_service = CacheService(
-        redis_client=_redis_client,
+    _cache_service = CacheService.create(
+        _redis_client,
+        local_tier_enabled=settings.CACHE_LOCAL_TIER_ENABLED,
+        versioned_codec=settings.CACHE_CODEC_VERSIONED_ENABLED,
+        compress_min_bytes=settings.CACHE_COMPRESS_MIN_BYTES,
         default_ttl=settings.CACHE_DEFAULT_TTL,
         monitor=_cache_monitor,
         enabled=settings.CACHE_ENABLED,
+        tagged_keys=settings.CACHE_TAGGED_KEYS_ENABLED,
+        fill_lock_ttl=settings.CACHE_FILL_LOCK_SECONDS,
     )
+    _cache_service.start_local_invalidation()
 
 
 async def shutdown_cache_layer() -> None:
@@ -103,6 +115,7 @@ async def shutdown_cache_layer() -> None:
     global _redis_client, _cache_service
 
     if _cache_service:
+        await _cache_service.stop_local_invalidation()
         _cache_service = None
     if _redis_client:
         await _redis_client.disconnect()
@@ -116,6 +129,11 @@ async def get_db():
         yield session
 
 
+def get_async_uow_factory() -> Callable[[], AsyncUnitOfWork]:
+    """Return the factory for units of work that open their own session."""
+    return AsyncUnitOfWork
+
+
 # Image Store (singleton pattern)
 def get_image_store() -> ImageStorePort:
     """
@@ -140,10 +158,31 @@ def get_vision_service() -> VisionAIServicePort:
     """
     global _vision_service
     if _vision_service is None:
-        _vision_service = VisionAIService()
+        _vision_service = VisionAIService(
+            preprocess_executor=get_image_preprocess_executor()
+        )
     return _vision_service
 
 
+def get_image_preprocess_executor() -> ThreadPoolExecutor:
+    """Bounded thread pool for scan image compression (singleton)."""
+    global _image_preprocess_executor
+    if _image_preprocess_executor is None:
+        _image_preprocess_executor = ThreadPoolExecutor(
+            max_workers=_IMAGE_PREPROCESS_WORKERS,
+            thread_name_prefix="image-preprocess",
+        )
+    return _image_preprocess_executor
+
+
+def shutdown_image_preprocess_executor() -> None:
+    """Stop the preprocessing pool; queued work is cancelled, running work ends."""
+    global _image_preprocess_executor
+    if _image_preprocess_executor is not None:
+        _image_preprocess_executor.shutdown(wait=False, cancel_futures=True)
+        _image_preprocess_executor = None
+
+
 # Vision Response Parser
 def get_vision_parser() -> VisionResponseParser:
     """
@@ -304,10 +343,10 @@ def get_open_food_facts_service_instance():
 
 # fatsecret Service
 def get_fat_secret_service_instance():
-    """Get the fatsecret service instance."""
+    """Get the fatsecret service instance, sharing its OAuth token via Redis."""
     from src.infra.adapters.fat_secret_service import get_fat_secret_service
 
-    return get_fat_secret_service()
+    return get_fat_secret_service(token_cache=get_cache_service())
 
 
 def get_meal_analyze_graph_settings():
@@ -324,6 +363,10 @@ def get_meal_analyze_graph_settings():
         ),
         "graph_enabled": current_settings.AI_MEAL_ANALYZE_GRAPH_ENABLED,
         "graph_version": current_settings.AI_MEAL_ANALYZE_GRAPH_VERSION,
+        "concurrent_upload_enabled": (
+            current_settings.AI_MEAL_ANALYZE_CONCURRENT_UPLOAD_ENABLED
+        ),
+        "result_cache_enabled": current_settings.AI_MEAL_ANALYZE_RESULT_CACHE_ENABLED,
     }
 
 
@@ -335,7 +378,10 @@ def get_parse_text_settings() -> dict[str, bool]:
     return {
         "structured_reference_enabled": bool(
             getattr(current_settings, "PARSE_TEXT_STRUCTURED_REFERENCE_ENABLED", False)
-        )
+        ),
+        "concurrent_lookup_enabled": bool(
+            getattr(current_settings, "PARSE_TEXT_CONCURRENT_LOOKUP_ENABLED", False)
+        ),
     }
 
 
@@ -386,6 +432,55 @@ def get_firebase_service() -> FirebaseService:
     return _firebase_service
 
 
+# Local Firebase ID token verification (None → SDK in a worker thread)
+_firebase_token_verifier = None
+
+
+async def initialize_firebase_token_verifier() -> None:
+    """Prefetch Google's signing keys and enable in-process token verification.
+
+    Must run after Firebase Admin is initialized (the project ID comes from the
+    default app). Stays disabled under the auth emulator or without a project ID.
+    """
+    global _firebase_token_verifier
+    if not settings.FIREBASE_LOCAL_TOKEN_VERIFICATION_ENABLED:
+        return
+    if os.getenv("FIREBASE_AUTH_EMULATOR_HOST"):
+        logger.info("Auth emulator configured; local token verification disabled")
+        return
+
+    import firebase_admin
+
+    from src.infra.services.firebase_token_verifier import (
+        FirebaseIdTokenVerifier,
+        GooglePublicKeySet,
+    )
+
+    project_id = firebase_admin.get_app().project_id
+    if not project_id:
+        logger.warning("Firebase project ID unknown; local token verification disabled")
+        return
+    key_set = GooglePublicKeySet()
+    await key_set.start()
+    _firebase_token_verifier = FirebaseIdTokenVerifier(
+        project_id,
+        key_set,
+        max_cached_tokens=settings.FIREBASE_TOKEN_CACHE_MAX_ENTRIES,
+    )
+
+
+async def shutdown_firebase_token_verifier() -> None:
+    global _firebase_token_verifier
+    if _firebase_token_verifier is not None:
+        await _firebase_token_verifier.key_set.stop()
+        _firebase_token_verifier = None
+
+
+def get_firebase_token_verifier():
+    """Return the local token verifier, or None when the SDK path is in use."""
+    return _firebase_token_verifier
+
+
 def get_daily_context_precompute_service():
     """Get daily context precompute service for notification rescheduling."""
     from src.infra.services.daily_context_precompute_service import (
@@ -448,6 +543,9 @@ def get_suggestion_orchestration_service():
 
     This service uses AsyncUnitOfWork for DB-backed user profile lookups.
     """
+    from src.domain.services.meal_suggestion.recipe_result_cache import (
+        RecipeResultCache,
+    )
     from src.domain.services.meal_suggestion.suggestion_orchestration_service import (
         SuggestionOrchestrationService,
     )
@@ -476,6 +574,11 @@ def get_suggestion_orchestration_service():
         discovery_meals_schema_class=DiscoveryMealsResponse,
         recipe_details_schema_class=RecipeDetailsResponse,
         translation_service=get_suggestion_translation_service(),
+        recipe_cache=(
+            RecipeResultCache(get_cache_service())
+            if settings.MEAL_SUGGESTION_RECIPE_CACHE_ENABLED
+            else None
+        ),
     )
 
 
@@ -561,13 +664,26 @@ def get_text_translation_service():
         prompt_cache_retention=settings.OPENAI_PROMPT_CACHE_RETENTION,
         prompt_cache_key_prefix=settings.OPENAI_PROMPT_CACHE_KEY_PREFIX,
     )
-    _text_translation_service = TextTranslationService(
-        adapter_module.OpenAITranslationAdapter(
-            provider=provider,
-            model=settings.OPENAI_TRANSLATION_MODEL,
-            timeout_seconds=settings.OPENAI_TRANSLATION_TIMEOUT_SECONDS,
-        )
+    adapter = adapter_module.OpenAITranslationAdapter(
+        provider=provider,
+        model=settings.OPENAI_TRANSLATION_MODEL,
+        timeout_seconds=settings.OPENAI_TRANSLATION_TIMEOUT_SECONDS,
     )
+    translator = adapter
+    if settings.TRANSLATION_BATCH_WINDOW_MS > 0:
+        batcher_module = import_module("src.infra.adapters.translation_batcher_adapter")
+        translator = batcher_module.TranslationBatcherAdapter(
+            translator,
+            window_seconds=settings.TRANSLATION_BATCH_WINDOW_MS / 1000,
+        )
+    if settings.TRANSLATION_MEMORY_ENABLED:
+        memory_module = import_module("src.infra.adapters.translation_memory_adapter")
+        translator = memory_module.TranslationMemoryAdapter(
+            translator,
+            prompt_version=adapter.prompt_version,
+            cache=get_cache_service(),
+        )
+    _text_translation_service = TextTranslationService(translator)
     logger.info("OpenAI translation service initialised")
     return _text_translation_service
 
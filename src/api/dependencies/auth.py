@@ -17,7 +17,7 @@ from firebase_admin import auth as firebase_auth
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.base_dependencies import get_cache_service
+from src.api.base_dependencies import get_cache_service, get_firebase_token_verifier
 from src.api.dependencies.auth_cache import get_cached_user_id, set_cached_user_id
 from src.domain.ports.cache_port import CachePort
 from src.infra.config.settings import settings
@@ -94,9 +94,7 @@ async def verify_firebase_token(
     token = credentials.credentials
 
     try:
-        # Firebase Admin verification is synchronous and may fetch public certs.
-        # Keep it off the event loop so unrelated requests do not stall.
-        decoded_token = await asyncio.to_thread(firebase_auth.verify_id_token, token)
+        decoded_token = await _verify_id_token(token)
         logger.debug(
             "Successfully verified token for user: %s", decoded_token.get("uid")
         )
@@ -138,6 +136,16 @@ async def verify_firebase_token(
         ) from e
 
 
+async def _verify_id_token(token: str) -> dict:
+    """Verify an ID token locally when enabled, else via the Admin SDK."""
+    verifier = get_firebase_token_verifier()
+    if verifier is not None:
+        return await verifier.verify(token)
+    # Firebase Admin verification is synchronous and may fetch public certs.
+    # Keep it off the event loop so unrelated requests do not stall.
+    return await asyncio.to_thread(firebase_auth.verify_id_token, token)
+
+
 async def verify_firebase_token_revocation_checked(
     request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
@@ -411,9 +419,7 @@ async def optional_authentication(
         return None
 
     try:
-        decoded_token = await asyncio.to_thread(
-            firebase_auth.verify_id_token, credentials.credentials
-        )
+        decoded_token = await _verify_id_token(credentials.credentials)
         return decoded_token
     except Exception as e:
         logger.debug("Optional auth failed: %s", str(e))
@@ -255,6 +255,24 @@ def _build_provider_budget(cache_service):
     return None
 
 
+def _build_stale_while_revalidate(cache_service, task_manager):
+    """Dashboard stale-while-revalidate needs both a cache and a task manager."""
+    if not settings.CACHE_SWR_ENABLED:
+        return None
+    if cache_service is None or task_manager is None:
+        logger.warning(
+            "Stale-while-revalidate enabled but cache or task manager unavailable"
+        )
+        return None
+    from src.app.services.stale_while_revalidate import StaleWhileRevalidate
+
+    return StaleWhileRevalidate(
+        cache_service,
+        task_manager,
+        stale_seconds=settings.CACHE_SWR_STALE_SECONDS,
+    )
+
+
 async def _search_local_food_references(
     query: str,
     region: str,
@@ -423,6 +441,7 @@ def get_configured_event_bus() -> EventBus:
         FoodReferenceValidationService,
     )
     from src.app.services.meal_analyze_workflow import MealAnalyzeWorkflow
+    from src.app.services.meal_vision_result_cache import MealVisionResultCache
     from src.domain.services.meal_recommendation.three_day_plan_optimizer import (
         ThreeDayPlanOptimizer,
     )
@@ -434,12 +453,17 @@ def get_configured_event_bus() -> EventBus:
         cache_service, task_manager=task_manager
     )
     provider_budget = _build_provider_budget(cache_service)
+    stale_while_revalidate = _build_stale_while_revalidate(cache_service, task_manager)
     nutrition_integrity_policy = NutritionIntegrityPolicy()
 
     event_bus = PyMediatorEventBus()
-    from src.api.base_dependencies import get_catalog_meal_snapshot_service
+    from src.api.base_dependencies import (
+        get_catalog_meal_snapshot_service,
+        get_image_preprocess_executor,
+    )
 
     recommendation_snapshot = get_catalog_meal_snapshot_service()
+    image_preprocess_executor = get_image_preprocess_executor()
     recommendation_history = MealRecommendationHistoryProjector()
     graph_settings = get_meal_analyze_graph_settings()
 
@@ -462,6 +486,9 @@ def get_configured_event_bus() -> EventBus:
         fatsecret_validation_enabled=graph_settings["fatsecret_validation_enabled"],
         graph_version=graph_settings["graph_version"],
     )
+    meal_vision_result_cache = MealVisionResultCache(
+        cache_service, store_results=graph_settings["result_cache_enabled"]
+    )
     parse_text_settings = get_parse_text_settings()
 
     # Register meal command handlers
@@ -487,6 +514,9 @@ def get_configured_event_bus() -> EventBus:
             meal_value_insight_ai_manager=ai_manager,
             meal_analyze_workflow=meal_analyze_workflow,
             meal_analyze_graph_enabled=graph_settings["graph_enabled"],
+            meal_analyze_concurrent_upload=graph_settings["concurrent_upload_enabled"],
+            meal_vision_result_cache=meal_vision_result_cache,
+            image_preprocess_executor=image_preprocess_executor,
         ),
     )
     event_bus.register_handler(
@@ -504,6 +534,8 @@ def get_configured_event_bus() -> EventBus:
             meal_value_insight_ai_manager=ai_manager,
             meal_analyze_workflow=meal_analyze_workflow,
             meal_analyze_graph_enabled=graph_settings["graph_enabled"],
+            meal_vision_result_cache=meal_vision_result_cache,
+            image_preprocess_executor=image_preprocess_executor,
         ),
     )
 
@@ -576,6 +608,7 @@ def get_configured_event_bus() -> EventBus:
                 "structured_reference_enabled"
             ],
             uow_factory=AsyncUnitOfWork,
+            concurrent_lookup=parse_text_settings["concurrent_lookup_enabled"],
         ),
     )
 
@@ -606,11 +639,15 @@ def get_configured_event_bus() -> EventBus:
         GetDailyMacrosQuery,
         GetDailyMacrosQueryHandler(
             cache_service=cache_service,
+            stale_while_revalidate=stale_while_revalidate,
         ),
     )
     event_bus.register_handler(
         GetWeeklyBudgetQuery,
-        GetWeeklyBudgetQueryHandler(cache_service=cache_service),
+        GetWeeklyBudgetQueryHandler(
+            cache_service=cache_service,
+            stale_while_revalidate=stale_while_revalidate,
+        ),
     )
     event_bus.register_handler(
         GetStreakQuery,
@@ -624,7 +661,10 @@ def get_configured_event_bus() -> EventBus:
     # Register bulk nutrition query handlers
     event_bus.register_handler(
         GetNutritionBulkQuery,
-        GetNutritionBulkQueryHandler(cache_service=cache_service),
+        GetNutritionBulkQueryHandler(
+            cache_service=cache_service,
+            stale_while_revalidate=stale_while_revalidate,
+        ),
     )
     event_bus.register_handler(
         GetActivitiesPresenceQuery,
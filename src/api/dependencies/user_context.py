@@ -0,0 +1,25 @@
+"""Request-scoped UserContext loader dependency.
+
+FastAPI caches dependency results per request, so every route parameter and
+sub-dependency asking for the loader shares one instance and the context is
+read from the database at most once per request.
+"""
+
+from fastapi import Depends, Request
+
+from src.api.base_dependencies import get_async_uow_factory
+from src.api.dependencies.auth import get_current_user_id
+from src.app.services.user_context_loader import UserContextLoader
+
+
+def get_user_context_loader(
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+    uow_factory=Depends(get_async_uow_factory),
+) -> UserContextLoader:
+    """Build the lazy per-request loader for the authenticated user."""
+    return UserContextLoader(
+        user_id=user_id,
+        uow_factory=uow_factory,
+        header_timezone=request.headers.get("X-Timezone"),
+    )
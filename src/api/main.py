@@ -33,7 +33,10 @@ from firebase_admin import credentials
 
 from src.api.base_dependencies import (
     initialize_cache_layer,
+    initialize_firebase_token_verifier,
     shutdown_cache_layer,
+    shutdown_firebase_token_verifier,
+    shutdown_image_preprocess_executor,
 )
 from src.api.dependencies.task_manager import (
     clear_task_manager,
@@ -221,6 +224,11 @@ async def lifespan(app: FastAPI):
         logger.critical("Failed to initialize Firebase; aborting startup: %s", e)
         raise
 
+    try:
+        await initialize_firebase_token_verifier()
+    except Exception as e:
+        logger.warning("Local token verification unavailable (non-fatal): %s", e)
+
     # NOTE: Database migrations are run via docker-entrypoint.sh BEFORE app startup
     # This ensures migrations complete before any workers start, preventing race conditions
     # See: migrations/run.py and docker-entrypoint.sh
@@ -271,6 +279,9 @@ async def lifespan(app: FastAPI):
     finally:
         clear_task_manager()
 
+    await shutdown_firebase_token_verifier()
+    shutdown_image_preprocess_executor()
+
     # Disconnect cache
     await shutdown_cache_layer()
 
@@ -9,9 +9,11 @@ from fastapi import APIRouter, Depends, Query, Request
 
 from src.api.dependencies.auth import get_current_user_id
 from src.api.dependencies.event_bus import get_configured_event_bus
+from src.api.dependencies.user_context import get_user_context_loader
 from src.api.exceptions import ValidationException
 from src.api.middleware.accept_language import get_request_language
 from src.app.queries.activity import GetDailyActivitiesQuery, GetBulkActivitiesQuery
+from src.app.services.user_context_loader import UserContextLoader
 from src.domain.utils.timezone_utils import utc_now
 from src.infra.event_bus import EventBus
 
@@ -29,6 +31,7 @@ async def get_daily_activities(
         None, description="Date in YYYY-MM-DD format, defaults to today"
     ),
     event_bus: EventBus = Depends(get_configured_event_bus),
+    user_context: UserContextLoader = Depends(get_user_context_loader),
 ):
     """
     Get all activities (meals and workouts) for a specific date.
@@ -61,6 +64,7 @@ async def get_daily_activities(
         target_date=target_date,
         language=language,
         header_timezone=header_tz,
+        user_context=user_context,
     )
     activities = await event_bus.send(query)
 
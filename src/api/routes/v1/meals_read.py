@@ -16,6 +16,7 @@ from src.api.base_dependencies import (
 from src.api.dependencies.auth import get_current_user_id
 from src.api.dependencies.event_bus import get_configured_event_bus
 from src.api.dependencies.task_manager import get_optional_task_manager
+from src.api.dependencies.user_context import get_user_context_loader
 from src.api.mappers.meal_locale_ensure import (
     ensure_requested_meal_translation,
     without_requested_meal_translation,
@@ -43,6 +44,7 @@ from src.app.services.meal_value_insight_scheduler import (
     get_meal_insight_user_context,
     schedule_value_insight_generation,
 )
+from src.app.services.user_context_loader import UserContextLoader
 from src.domain.ports.cache_port import CachePort
 from src.domain.ports.meal_insight_ai_port import MealInsightAIPort
 from src.domain.services.meal_value_insight_service import MealValueInsightService
@@ -86,6 +88,7 @@ async def _source_nutrition_by_food_reference(meal, food_reference_repository):
 async def get_streak(
     request: Request,
     user_id: str = Depends(get_current_user_id),
+    user_context: UserContextLoader = Depends(get_user_context_loader),
     event_bus: EventBus = Depends(get_configured_event_bus),
 ):
     """
@@ -96,7 +99,9 @@ async def get_streak(
     - last_logged_date: most recent date with a meal (YYYY-MM-DD), null if never logged
     """
     header_tz = request.headers.get("X-Timezone")
-    query = GetStreakQuery(user_id=user_id, header_timezone=header_tz)
+    query = GetStreakQuery(
+        user_id=user_id, header_timezone=header_tz, user_context=user_context
+    )
     result = await event_bus.send(query)
     return result
 
@@ -279,6 +284,7 @@ async def get_daily_macros(
     user_id: str = Depends(get_current_user_id),
     date: str | None = Query(None, description="Date in YYYY-MM-DD format"),
     event_bus: EventBus = Depends(get_configured_event_bus),
+    user_context: UserContextLoader = Depends(get_user_context_loader),
 ):
     """
     Get daily macronutrient summary for all meals with user targets from TDEE.
@@ -294,6 +300,7 @@ async def get_daily_macros(
         user_id=user_id,
         target_date=target_date,
         header_timezone=header_tz,
+        user_context=user_context,
     )
     result = await event_bus.send(query)
 
@@ -309,6 +316,7 @@ async def get_weekly_budget(
         description="Week start date in YYYY-MM-DD format (Monday). Defaults to current week.",
     ),
     event_bus: EventBus = Depends(get_configured_event_bus),
+    user_context: UserContextLoader = Depends(get_user_context_loader),
 ):
     """
     Get weekly macro budget status.
@@ -324,6 +332,7 @@ async def get_weekly_budget(
         user_id=user_id,
         target_date=target_date,
         header_timezone=header_tz,
+        user_context=user_context,
     )
     result = await event_bus.send(query)
     return result
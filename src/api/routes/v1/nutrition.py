@@ -7,9 +7,11 @@ from fastapi import APIRouter, Depends, Query, Request
 
 from src.api.dependencies.auth import get_current_user_id
 from src.api.dependencies.event_bus import get_configured_event_bus
+from src.api.dependencies.user_context import get_user_context_loader
 from src.api.exceptions import ValidationException
 from src.api.schemas.response.nutrition_responses import BulkNutritionResponse
 from src.app.queries.nutrition import GetNutritionBulkQuery, GetActivitiesPresenceQuery
+from src.app.services.user_context_loader import UserContextLoader
 from src.infra.event_bus import EventBus
 
 router = APIRouter(
@@ -25,6 +27,7 @@ async def get_nutrition_bulk(
     end: date = Query(..., description="End date (inclusive)"),
     user_id: str = Depends(get_current_user_id),
     event_bus: EventBus = Depends(get_configured_event_bus),
+    user_context: UserContextLoader = Depends(get_user_context_loader),
 ):
     """
     Get bulk nutrition summaries for a date range.
@@ -54,6 +57,7 @@ async def get_nutrition_bulk(
         start_date=start,
         end_date=end,
         header_timezone=header_tz,
+        user_context=user_context,
     )
     return await event_bus.send(query)
 
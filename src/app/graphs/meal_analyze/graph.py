@@ -7,6 +7,7 @@ from langgraph.graph import END, START, StateGraph
 from src.app.graphs.meal_analyze.nodes import (
     acquire_image,
     analyze_vision,
+    await_upload,
     complete,
     invalidate_cache,
     maybe_validate_reference,
@@ -55,6 +56,11 @@ def build_runtime_meal_analyze_graph(runtime: MealAnalyzeRuntime) -> Any:
     ) -> MealAnalyzeGraphState:
         return await maybe_validate_reference(state, runtime)
 
+    async def await_upload_node(
+        state: MealAnalyzeGraphState,
+    ) -> MealAnalyzeGraphState:
+        return await await_upload(state, runtime)
+
     async def persist_meal_node(
         state: MealAnalyzeGraphState,
     ) -> MealAnalyzeGraphState:
@@ -88,7 +94,13 @@ def build_runtime_meal_analyze_graph(runtime: MealAnalyzeRuntime) -> Any:
         graph.add_edge("select_mode", "analyze_vision")
         graph.add_edge("analyze_vision", "parse_nutrition")
         graph.add_edge("parse_nutrition", "maybe_validate_reference")
-        graph.add_edge("maybe_validate_reference", "persist_meal")
+        if runtime.uploads_concurrently():
+            # acquire_image started the upload; vision and parsing overlap it.
+            graph.add_node("await_upload", await_upload_node)
+            graph.add_edge("maybe_validate_reference", "await_upload")
+            graph.add_edge("await_upload", "persist_meal")
+        else:
+            graph.add_edge("maybe_validate_reference", "persist_meal")
         graph.add_edge("persist_meal", "invalidate_cache")
         graph.add_edge("invalidate_cache", "schedule_value_insights")
     else:
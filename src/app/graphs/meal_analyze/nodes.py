@@ -1,6 +1,9 @@
 """Nodes for the meal image analysis graph."""
 
+import asyncio
+import json
 import logging
+from time import perf_counter
 
 from src.api.exceptions import ValidationException
 from src.app.commands.meal.scan_by_url_command import ScanByUrlCommand
@@ -32,12 +35,14 @@ from src.domain.strategies.meal_analysis_strategy import (
     AnalysisStrategyFactory,
     FoodLabelImageAnalysisStrategy,
 )
+from src.domain.utils.image_compression import compress_image_async
 from src.domain.utils.timezone_utils import (
     get_zone_info,
     is_valid_timezone,
     noon_utc_for_date,
     utc_now,
 )
+from src.observability import distribution_metric
 
 logger = logging.getLogger(__name__)
 
@@ -76,29 +81,91 @@ async def _acquire_uploaded_image(
         raise RuntimeError("Image store dependency is required for upload acquisition")
 
     image_id = runtime.image_id_factory()
-    image_url = await runtime.image_store.save_async(
-        command.file_contents,
-        command.content_type,
-        image_id,
-    )
-    if not image_url or not image_url.startswith("https://"):
-        raise RuntimeError("Cloudinary upload failed - invalid URL returned")
-
     runtime.acquired_image = AcquiredImage(
         image_id=image_id,
-        image_url=image_url,
+        image_url="",
         persisted_image_id=image_id,
-        persisted_image_url=image_url,
+        persisted_image_url="",
         source_bytes=command.file_contents,
         analysis_bytes=command.file_contents,
         content_type=command.content_type,
         content_kind="meal_image",
     )
-    return {
+    acquired: MealAnalyzeGraphState = {
         "image_id": image_id,
         "content_kind": "meal_image",
         "image_size_bytes": len(command.file_contents),
     }
+    upload = _upload_image(command, runtime, image_id)
+    if runtime.uploads_concurrently():
+        # The bytes for analysis are already in memory; await_upload joins
+        # the durable copy before the meal row references its URL.
+        runtime.upload_task = asyncio.ensure_future(upload)
+        runtime.upload_task.add_done_callback(_retrieve_upload_failure)
+        await _prepare_analysis_rendition(runtime)
+        return {**acquired, "upload_mode": "concurrent"}
+
+    _attach_image_url(runtime, await upload)
+    await _prepare_analysis_rendition(runtime)
+    return {
+        **acquired,
+        "upload_mode": "sequential",
+        "upload_duration_ms": runtime.upload_duration_ms,
+    }
+
+
+async def _upload_image(
+    command: UploadMealImageImmediatelyCommand,
+    runtime: MealAnalyzeRuntime,
+    image_id: str,
+) -> str:
+    started = perf_counter()
+    try:
+        image_url = await runtime.image_store.save_async(
+            command.file_contents,
+            command.content_type,
+            image_id,
+        )
+    finally:
+        runtime.upload_duration_ms = _elapsed_ms(started)
+        _record_branch_duration("upload", runtime)
+    if not image_url or not image_url.startswith("https://"):
+        raise RuntimeError("Cloudinary upload failed - invalid URL returned")
+    return image_url
+
+
+async def _prepare_analysis_rendition(runtime: MealAnalyzeRuntime) -> None:
+    # The durable upload keeps the original; vision gets the one rendition.
+    runtime.acquired_image.analysis_bytes = await compress_image_async(
+        runtime.acquired_image.source_bytes,
+        runtime.compress_image,
+        runtime.preprocess_executor,
+    )
+
+
+def _attach_image_url(runtime: MealAnalyzeRuntime, image_url: str) -> None:
+    runtime.acquired_image.image_url = image_url
+    runtime.acquired_image.persisted_image_url = image_url
+
+
+def _retrieve_upload_failure(task: asyncio.Task) -> None:
+    # Marks the exception retrieved when the graph stops before await_upload.
+    if not task.cancelled() and task.exception() is not None:
+        logger.info(
+            "meal_analyze.concurrent_upload_failed error=%s",
+            type(task.exception()).__name__,
+        )
+
+
+async def await_upload(
+    state: MealAnalyzeGraphState,
+    runtime: MealAnalyzeRuntime,
+) -> MealAnalyzeGraphState:
+    """Join the concurrent durable upload before the meal is persisted."""
+    if runtime.upload_task is None:
+        return {}
+    _attach_image_url(runtime, await runtime.upload_task)
+    return {"upload_duration_ms": runtime.upload_duration_ms}
 
 
 async def _acquire_scan_by_url_image(
@@ -120,7 +187,13 @@ async def _acquire_scan_by_url_image(
         source_public_id = command.label_crop_public_id or command.public_id
 
     raw_bytes = await runtime.download_image_bytes(source_url)
-    analysis_bytes = raw_bytes if is_food_label else runtime.compress_image(raw_bytes)
+    analysis_bytes = (
+        raw_bytes
+        if is_food_label
+        else await compress_image_async(
+            raw_bytes, runtime.compress_image, runtime.preprocess_executor
+        )
+    )
     content_kind = "food_label_image" if is_food_label else "meal_image"
     image_id = source_public_id.split("/")[-1]
 
@@ -195,42 +268,160 @@ async def analyze_vision(
     if runtime.vision_service is None:
         raise RuntimeError("Vision service dependency is required for analysis")
 
+    started = perf_counter()
+    if runtime.upload_task is None:
+        await _analyze_acquired_image(runtime)
+    else:
+        await _analyze_alongside_upload(runtime, runtime.upload_task)
+    vision_duration_ms = _elapsed_ms(started)
+    _record_branch_duration("vision", runtime, vision_duration_ms)
+    return {"vision_analyzed": True, "vision_duration_ms": vision_duration_ms}
+
+
+async def _analyze_alongside_upload(
+    runtime: MealAnalyzeRuntime,
+    upload: asyncio.Task[str],
+) -> None:
+    """Run vision while the upload is in flight; a failed upload cancels it.
+
+    Only vision is awaited: parsing and validation overlap the rest of the
+    upload, which ``await_upload`` joins before persistence.
+    """
+    vision = asyncio.ensure_future(_analyze_acquired_image(runtime))
+
+    def _cancel_vision_on_failed_upload(task: asyncio.Task) -> None:
+        if task.cancelled() or task.exception() is not None:
+            vision.cancel()
+
+    upload.add_done_callback(_cancel_vision_on_failed_upload)
+    try:
+        await vision
+    except asyncio.CancelledError:
+        if vision.cancelled() and upload.done():
+            # Surface the upload failure that cancelled vision.
+            upload.result()
+        raise
+    finally:
+        upload.remove_done_callback(_cancel_vision_on_failed_upload)
+        if not vision.done():
+            vision.cancel()
+
+
+async def _analyze_acquired_image(runtime: MealAnalyzeRuntime) -> None:
     command = runtime.command
     image_bytes = runtime.acquired_image.analysis_bytes
     if isinstance(command, ScanByUrlCommand) and command.scan_mode == "food_label":
         strategy = FoodLabelImageAnalysisStrategy(crop_metadata=command.crop_metadata)
-        runtime.vision_result = await runtime.vision_service.analyze_with_strategy(
-            image_bytes,
-            strategy,
+        _key_vision_result(
+            runtime,
+            "food_label",
+            context=(
+                json.dumps(command.crop_metadata, sort_keys=True, default=str)
+                if command.crop_metadata
+                else None
+            ),
+        )
+        runtime.vision_result = await _through_vision_cache(
+            runtime,
+            lambda: runtime.vision_service.analyze_with_strategy(
+                image_bytes,
+                strategy,
+            ),
         )
     elif command.user_description:
         strategy = AnalysisStrategyFactory.create_user_context_strategy(
             command.user_description,
             language=command.language,
         )
+        _key_vision_result(runtime, "user_context", context=command.user_description)
         runtime.vision_result = await _run_vision_with_retry(
             runtime,
             lambda: _analyze_and_validate_locale(
                 runtime,
-                lambda: runtime.vision_service.analyze_with_strategy(
-                    image_bytes,
-                    strategy,
+                lambda: _through_vision_cache(
+                    runtime,
+                    lambda: runtime.vision_service.analyze_with_strategy(
+                        image_bytes,
+                        strategy,
+                    ),
                 ),
             ),
         )
     else:
+        _key_vision_result(runtime, "standard")
         runtime.vision_result = await _run_vision_with_retry(
             runtime,
             lambda: _analyze_and_validate_locale(
                 runtime,
-                lambda: runtime.vision_service.analyze(
-                    image_bytes,
-                    language=command.language,
+                lambda: _through_vision_cache(
+                    runtime,
+                    lambda: runtime.vision_service.analyze(
+                        image_bytes,
+                        language=command.language,
+                    ),
                 ),
             ),
         )
 
-    return {"vision_analyzed": True}
+
+def _key_vision_result(
+    runtime: MealAnalyzeRuntime,
+    strategy: str,
+    *,
+    context: str | None = None,
+) -> None:
+    if runtime.vision_result_cache is None:
+        return
+    runtime.vision_cache_key = runtime.vision_result_cache.key_for(
+        runtime.acquired_image.analysis_bytes,
+        strategy=strategy,
+        language=runtime.command.language,
+        context=context,
+    )
+
+
+async def _through_vision_cache(runtime: MealAnalyzeRuntime, operation) -> dict:
+    """Serve a cached result or join an identical in-flight provider call."""
+    if runtime.vision_cache_key is None:
+        return await operation()
+    key, _ = runtime.vision_cache_key
+    result, from_provider = await runtime.vision_result_cache.get_or_analyze(
+        key, operation
+    )
+    runtime.vision_result_from_provider = from_provider
+    return result
+
+
+async def _store_vision_result(runtime: MealAnalyzeRuntime) -> None:
+    """Cache the vision result once it has parsed into usable nutrition.
+
+    Only the scan that made the provider call writes; hits and scans that
+    joined it in flight would rewrite the same entry.
+    """
+    if runtime.vision_cache_key is None or not runtime.vision_result_from_provider:
+        return
+    key, ttl_seconds = runtime.vision_cache_key
+    await runtime.vision_result_cache.store(key, ttl_seconds, runtime.vision_result)
+
+
+def _record_branch_duration(
+    branch: str,
+    runtime: MealAnalyzeRuntime,
+    duration_ms: float | None = None,
+) -> None:
+    distribution_metric(
+        "meal_analyze.branch.duration_ms",
+        runtime.upload_duration_ms if duration_ms is None else duration_ms,
+        unit="millisecond",
+        attributes={
+            "operation": branch,
+            "phase": "concurrent" if runtime.uploads_concurrently() else "sequential",
+        },
+    )
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((perf_counter() - started) * 1000, 1)
 
 
 async def _analyze_and_validate_locale(runtime: MealAnalyzeRuntime, operation):
@@ -329,6 +520,7 @@ async def parse_nutrition(
             language=runtime.command.language,
             translation_service=runtime.text_translation_service,
         )
+        await _store_vision_result(runtime)
         return {"nutrition_parsed": True}
 
     if not runtime.gpt_parser.parse_is_food(runtime.vision_result):
@@ -356,6 +548,7 @@ async def parse_nutrition(
             error_code="NOT_FOOD_IMAGE",
         )
     runtime.nutrition = nutrition
+    await _store_vision_result(runtime)
     return {"nutrition_parsed": True}
 
 
@@ -1,6 +1,8 @@
 """Runtime-bound dependencies for meal analysis graph nodes."""
 
+import asyncio
 from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import date
 from typing import Any
@@ -19,6 +21,7 @@ from src.app.services.meal_value_insight_scheduler import (
     MealInsightTaskScheduler,
     schedule_value_insight_generation,
 )
+from src.app.services.meal_vision_result_cache import MealVisionResultCache
 from src.domain.model.meal import Meal
 from src.domain.model.meal.meal_response_localization import MealResponseLocalization
 from src.domain.ports.cache_port import CachePort
@@ -53,6 +56,7 @@ class MealAnalyzeRuntime:
     image_store: ImageStorePort | None = None
     download_image_bytes: Callable[[str], Awaitable[bytes]] | None = None
     compress_image: Callable[[bytes], bytes] = default_compress_image
+    preprocess_executor: Executor | None = None
     image_id_factory: Callable[[], str] = field(
         default_factory=lambda: lambda: str(uuid4())
     )
@@ -75,6 +79,12 @@ class MealAnalyzeRuntime:
     food_reference_validation_service: FoodReferenceValidationService | None = None
     fatsecret_validation_enabled: bool = False
     max_vision_attempts: int = 1
+    concurrent_upload: bool = False
+    upload_task: asyncio.Task[str] | None = None
+    upload_duration_ms: float | None = None
+    vision_result_cache: MealVisionResultCache | None = None
+    vision_cache_key: tuple[str, int] | None = None
+    vision_result_from_provider: bool = False
     acquired_image: AcquiredImage | None = None
     vision_result: dict[str, Any] | None = None
     localization: MealResponseLocalization | None = None
@@ -86,3 +96,9 @@ class MealAnalyzeRuntime:
     def has_analysis_dependencies(self) -> bool:
         """Return whether the graph can run beyond image acquisition."""
         return all([self.vision_service, self.gpt_parser, self.uow])
+
+    def uploads_concurrently(self) -> bool:
+        """Return whether the durable upload runs alongside vision analysis."""
+        return self.concurrent_upload and isinstance(
+            self.command, UploadMealImageImmediatelyCommand
+        )
@@ -13,6 +13,9 @@ class MealAnalyzeGraphState(TypedDict, total=False):
     image_id: str
     content_kind: str
     image_size_bytes: int
+    upload_mode: Literal["sequential", "concurrent"]
+    upload_duration_ms: float
+    vision_duration_ms: float
     user_id: str
     target_date: str | None
     prepared: bool
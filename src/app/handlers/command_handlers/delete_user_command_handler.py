@@ -171,6 +171,10 @@ class DeleteUserCommandHandler(EventHandler[DeleteUserCommand, dict[str, Any]]):
                 .values(status=MealStatusEnum.INACTIVE)
             )
             meals_count = meals_result.rowcount
+            # The bulk update bypasses the repository's streak and rollup
+            # maintenance; drop both so a restored account rebuilds them.
+            await uow.streak_summaries.delete_for_user(user_id)
+            await uow.daily_nutrition_rollups.delete_for_user(user_id)
 
             # 2. Soft-delete meal plans - no longer applicable (feature removed)
             meal_plans_count = 0
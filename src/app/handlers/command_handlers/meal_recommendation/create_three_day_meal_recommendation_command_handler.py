@@ -78,9 +78,11 @@ class CreateThreeDayMealRecommendationCommandHandler(
                 snapshot = await self.catalog_snapshot_service.get_snapshot(uow)
                 catalog_meals = list(snapshot.meals)
                 ingredient_statistics = snapshot.ingredient_statistics
+                scoring_index = snapshot.scoring_index
             else:
                 catalog_meals = await uow.catalog_recipes.list_active_meals()
                 ingredient_statistics = None
+                scoring_index = None
             if not catalog_meals:
                 raise MealRecommendationCatalogUnavailableError
 
@@ -96,6 +98,7 @@ class CreateThreeDayMealRecommendationCommandHandler(
                 daily_calories=command.daily_calories,
                 affinity=affinity,
                 ingredient_statistics=ingredient_statistics,
+                scoring_index=scoring_index,
             )
             if isinstance(result, MealRecommendationInsufficiency):
                 logger.warning(
@@ -34,6 +34,7 @@ from src.domain.model.ai.nutrition_contracts import (
     MealTextNutritionResponse,
 )
 from src.domain.model.nutrition.macros import Macros
+from src.domain.ports.food_reference_repository_port import ProviderFoodAdoption
 from src.domain.ports.meal_generation_service_port import MealGenerationServicePort
 from src.domain.services.ai_output_validation_service import (
     build_validation_retry_prompt,
@@ -68,6 +69,7 @@ from src.domain.services.prompts.input_sanitizer import (
     validate_refinement_items,
 )
 from src.domain.services.prompts.system_prompts import SystemPrompts
+from src.observability import distribution_metric
 
 logger = logging.getLogger(__name__)
 PARSE_TEXT_VALIDATION_PURPOSE = "parse_text"
@@ -123,6 +125,16 @@ class _ParseTextRequestBudget:
     )
 
 
+def _item_count_bucket(count: int) -> str:
+    if count <= 1:
+        return "1"
+    if count <= 3:
+        return "2-3"
+    if count <= 6:
+        return "4-6"
+    return "7+"
+
+
 def _parse_text_fatsecret_timeout_seconds() -> float:
     try:
         return max(0.01, float(os.getenv("PARSE_TEXT_FATSECRET_TIMEOUT_SECONDS", "3")))
@@ -144,6 +156,7 @@ class ParseMealTextHandler(
         food_reference_batch_lookup: Any | None = None,
         structured_reference_enabled: bool = True,
         uow_factory: Any | None = None,
+        concurrent_lookup: bool = False,
     ):
         self._meal_generation_service = meal_generation_service
         self._fat_secret_service = fat_secret_service
@@ -151,6 +164,7 @@ class ParseMealTextHandler(
         self._food_reference_batch_lookup = food_reference_batch_lookup
         self._structured_reference_enabled = structured_reference_enabled
         self._uow_factory = uow_factory
+        self._concurrent_lookup = concurrent_lookup
 
     async def handle(self, command: ParseMealTextCommand) -> ParseMealTextResponseDto:
         # Sanitize user input
@@ -208,24 +222,9 @@ class ParseMealTextHandler(
                 parsed_items, budget, command.language
             )
             try:
-                enhanced_items = []
-                unmatched_terms = []
-                for item in parsed_items:
-                    resolved = await self._cascade_lookup(
-                        item,
-                        budget=budget,
-                        local_reference=local_references.get(
-                            normalize_food_lookup_name(
-                                item.get("lookup_name") or item.get("name", "")
-                            )
-                        ),
-                    )
-                    if resolved is None:
-                        original = str(item.get("name") or item.get("lookup_name") or "")
-                        if original:
-                            unmatched_terms.append(original)
-                        continue
-                    enhanced_items.append(resolved)
+                enhanced_items, unmatched_terms = await self._resolve_items(
+                    parsed_items, budget=budget, local_references=local_references
+                )
                 break
             except AIOutputValidationError as exc:
                 if semantic_attempt >= 1 or budget.ai_generations >= 2:
@@ -583,6 +582,89 @@ class ParseMealTextHandler(
         async with self._uow_factory() as uow:
             return await uow.food_references.find_by_locale_names(language, names)
 
+    async def _resolve_items(
+        self,
+        parsed_items: list[dict[str, Any]],
+        *,
+        budget: _ParseTextRequestBudget,
+        local_references: dict[str, dict[str, Any]],
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Resolve every parsed item; results and unmatched terms keep input order.
+
+        In concurrent mode each item runs its cascade as its own task. They
+        share ``budget``: one deadline, the search/detail caps, and the
+        provider semaphore that bounds in-flight FatSecret calls.
+        """
+        started = time.perf_counter()
+        concurrent = self._concurrent_lookup and len(parsed_items) > 1
+        if concurrent:
+            tasks = [
+                asyncio.ensure_future(
+                    self._timed_cascade_lookup(item, budget, local_references)
+                )
+                for item in parsed_items
+            ]
+            try:
+                results = await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+        else:
+            results = [
+                await self._timed_cascade_lookup(item, budget, local_references)
+                for item in parsed_items
+            ]
+
+        enhanced_items: list[dict[str, Any]] = []
+        unmatched_terms: list[str] = []
+        for item, resolved in zip(parsed_items, results, strict=True):
+            if resolved is None:
+                original = str(item.get("name") or item.get("lookup_name") or "")
+                if original:
+                    unmatched_terms.append(original)
+                continue
+            enhanced_items.append(resolved)
+
+        distribution_metric(
+            "parse_text.lookup.duration_ms",
+            (time.perf_counter() - started) * 1000,
+            unit="millisecond",
+            attributes={
+                "operation": "parse_text.lookup",
+                "phase": "concurrent" if concurrent else "sequential",
+                "item_count_bucket": _item_count_bucket(len(parsed_items)),
+            },
+        )
+        return enhanced_items, unmatched_terms
+
+    async def _timed_cascade_lookup(
+        self,
+        item: dict[str, Any],
+        budget: _ParseTextRequestBudget,
+        local_references: dict[str, dict[str, Any]],
+    ) -> dict[str, Any] | None:
+        started = time.perf_counter()
+        resolved = await self._cascade_lookup(
+            item,
+            budget=budget,
+            local_reference=local_references.get(
+                normalize_food_lookup_name(
+                    item.get("lookup_name") or item.get("name", "")
+                )
+            ),
+        )
+        distribution_metric(
+            "parse_text.item_lookup.duration_ms",
+            (time.perf_counter() - started) * 1000,
+            unit="millisecond",
+            attributes={
+                "operation": "parse_text.item_lookup",
+                "result": "matched" if resolved is not None else "unmatched",
+                "source": (resolved or {}).get("data_source") or "none",
+            },
+        )
+        return resolved
+
     async def _cascade_lookup(
         self,
         item: dict[str, Any],
@@ -846,6 +928,7 @@ class ParseMealTextHandler(
         """
         if command.user_id is None or self._uow_factory is None:
             return
+        pending: list[tuple[dict[str, Any], ProviderFoodAdoption]] = []
         for item in items:
             if item.get("origin") != "provider":
                 continue
@@ -869,26 +952,31 @@ class ParseMealTextHandler(
                 "fiber_100g": item.get("fiber_per_100g") or 0.0,
                 "sugar_100g": item.get("sugar_per_100g") or 0.0,
             }
-            servings = item.get("allowed_units") or None
-            try:
-                async with self._uow_factory() as uow:
-                    adopted = await uow.food_references.adopt_provider_food(
-                        str(namespace),
-                        str(source_food_id),
-                        english_name,
-                        per_100g,
-                        servings,
-                        command.language,
-                        locale_name,
-                    )
-            except Exception:
-                logger.warning(
-                    "parse_text adopt_provider_food failed namespace=%s food_id=%s",
-                    namespace,
-                    source_food_id,
-                    exc_info=True,
+            adoption = ProviderFoodAdoption(
+                namespace=str(namespace),
+                food_id=str(source_food_id),
+                english_name=english_name,
+                per_100g=per_100g,
+                servings=item.get("allowed_units") or None,
+                locale_name=locale_name,
+            )
+            pending.append((item, adoption))
+        if not pending:
+            return
+        try:
+            async with self._uow_factory() as uow:
+                adopted_by_identity = await uow.food_references.adopt_provider_foods(
+                    [adoption for _, adoption in pending], command.language
                 )
-                continue
+        except Exception:
+            logger.warning(
+                "parse_text adopt_provider_foods failed count=%d",
+                len(pending),
+                exc_info=True,
+            )
+            return
+        for item, adoption in pending:
+            adopted = adopted_by_identity.get(adoption.identity)
             reference_id = adopted.get("id") if isinstance(adopted, dict) else None
             if reference_id is None:
                 continue
@@ -1,8 +1,8 @@
 """Handler for scan-by-url: download Cloudinary image → compress → AI bytes path."""
 
-import asyncio
 import logging
 import time
+from concurrent.futures import Executor
 from typing import Any
 from uuid import uuid4
 
@@ -15,6 +15,7 @@ from src.app.graphs.meal_analyze.runtime import MealAnalyzeRuntime
 from src.app.services.cache_invalidation_service import CacheInvalidationService
 from src.app.services.food_label_localizer import localize_food_label_display
 from src.app.services.meal_analyze_workflow import MealAnalyzeWorkflow
+from src.app.services.meal_vision_result_cache import MealVisionResultCache
 from src.domain.constants import MealDefaults
 from src.domain.model.meal import Meal, MealImage, MealStatus
 from src.domain.model.meal.meal_response_localization import (
@@ -37,7 +38,7 @@ from src.domain.services.meal_type_determination_service import (
 from src.domain.strategies.meal_analysis_strategy import (
     FoodLabelImageAnalysisStrategy,
 )
-from src.domain.utils.image_compression import compress_image
+from src.domain.utils.image_compression import compress_image, compress_image_async
 from src.domain.utils.timezone_utils import (
     get_zone_info,
     is_valid_timezone,
@@ -67,6 +68,8 @@ class ScanByUrlCommandHandler(EventHandler[ScanByUrlCommand, Meal]):
         meal_value_insight_ai_manager: MealInsightAIPort | None = None,
         meal_analyze_workflow: MealAnalyzeWorkflow | None = None,
         meal_analyze_graph_enabled: bool = False,
+        meal_vision_result_cache: MealVisionResultCache | None = None,
+        image_preprocess_executor: Executor | None = None,
     ):
         self.uow = uow
         self.event_bus = event_bus
@@ -80,6 +83,8 @@ class ScanByUrlCommandHandler(EventHandler[ScanByUrlCommand, Meal]):
         self.meal_value_insight_ai_manager = meal_value_insight_ai_manager
         self.meal_analyze_workflow = meal_analyze_workflow
         self.meal_analyze_graph_enabled = meal_analyze_graph_enabled
+        self.meal_vision_result_cache = meal_vision_result_cache
+        self.image_preprocess_executor = image_preprocess_executor
 
     def _record_food_label_metric(
         self,
@@ -172,7 +177,9 @@ class ScanByUrlCommandHandler(EventHandler[ScanByUrlCommand, Meal]):
             raw_bytes = await self._download_image_bytes(command.image_url)
             image_bytes: bytes | None = None
             if command.scan_mode != "food_label":
-                image_bytes = await asyncio.to_thread(compress_image, raw_bytes)
+                image_bytes = await compress_image_async(
+                    raw_bytes, compress_image, self.image_preprocess_executor
+                )
                 logger.info(
                     "[SCAN-BY-URL] image_id=%s raw=%d compressed=%d bytes",
                     image_id,
@@ -415,6 +422,8 @@ class ScanByUrlCommandHandler(EventHandler[ScanByUrlCommand, Meal]):
                     event_bus=self.event_bus,
                     meal_translation_service=self.meal_translation_service,
                     text_translation_service=self.text_translation_service,
+                    vision_result_cache=self.meal_vision_result_cache,
+                    preprocess_executor=self.image_preprocess_executor,
                 ),
             )
 
@@ -4,6 +4,7 @@ Handler for immediate meal image upload and analysis.
 
 import logging
 import time
+from concurrent.futures import Executor
 from typing import Any
 from uuid import uuid4
 
@@ -13,6 +14,7 @@ from src.app.events.base import EventHandler, handles
 from src.app.graphs.meal_analyze.runtime import MealAnalyzeRuntime
 from src.app.services.cache_invalidation_service import CacheInvalidationService
 from src.app.services.meal_analyze_workflow import MealAnalyzeWorkflow
+from src.app.services.meal_vision_result_cache import MealVisionResultCache
 from src.domain.exceptions.ai_exceptions import (
     AIVisionError,
     AIVisionFailureKind,
@@ -71,6 +73,9 @@ class UploadMealImageImmediatelyHandler(
         meal_value_insight_ai_manager: MealInsightAIPort | None = None,
         meal_analyze_workflow: MealAnalyzeWorkflow | None = None,
         meal_analyze_graph_enabled: bool = False,
+        meal_analyze_concurrent_upload: bool = False,
+        meal_vision_result_cache: MealVisionResultCache | None = None,
+        image_preprocess_executor: Executor | None = None,
     ):
         self.uow = uow
         self.event_bus = event_bus
@@ -84,6 +89,9 @@ class UploadMealImageImmediatelyHandler(
         self.meal_value_insight_ai_manager = meal_value_insight_ai_manager
         self.meal_analyze_workflow = meal_analyze_workflow
         self.meal_analyze_graph_enabled = meal_analyze_graph_enabled
+        self.meal_analyze_concurrent_upload = meal_analyze_concurrent_upload
+        self.meal_vision_result_cache = meal_vision_result_cache
+        self.image_preprocess_executor = image_preprocess_executor
         if fast_path_policy is None:
             self._fast_path_policy = MealAnalyzeFastPathPolicy.from_settings(
                 get_settings()
@@ -408,6 +416,9 @@ class UploadMealImageImmediatelyHandler(
                     event_bus=self.event_bus,
                     meal_translation_service=self.meal_translation_service,
                     max_vision_attempts=max(1, self._fast_path_policy.max_attempts),
+                    concurrent_upload=self.meal_analyze_concurrent_upload,
+                    vision_result_cache=self.meal_vision_result_cache,
+                    preprocess_executor=self.image_preprocess_executor,
                 ),
             )
 
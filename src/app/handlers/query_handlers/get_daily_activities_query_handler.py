@@ -95,6 +95,8 @@ class GetDailyActivitiesQueryHandler(
 
     async def _resolve_user_timezone(self, query: GetDailyActivitiesQuery) -> str:
         """Resolve timezone in its own UoW so later reads do not hold its checkout."""
+        if query.user_context is not None:
+            return (await query.user_context.load()).timezone
         async with AsyncUnitOfWork() as uow:
             return await resolve_user_timezone_async(
                 query.user_id, uow, query.header_timezone
@@ -5,16 +5,14 @@ GetDailyBreakdownQueryHandler — 7-day macro breakdown (actual vs target).
 from __future__ import annotations
 
 import logging
-from datetime import UTC, date, datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from src.app.events.base import EventHandler, handles
 from src.app.queries.meal.get_daily_breakdown_query import GetDailyBreakdownQuery
 from src.domain.cache.cache_keys import CacheKeys
 from src.domain.model.meal import MealStatus
-from src.domain.model.meal_projection import MealProjection
 from src.domain.ports.cache_port import CachePort
-from src.domain.services.meal_calorie_service import effective_meal_calories
 from src.domain.utils.timezone_utils import (
     get_user_monday,
     get_zone_info,
@@ -53,23 +51,20 @@ class GetDailyBreakdownQueryHandler(
                 return cached
 
             days = [week_start + timedelta(days=i) for i in range(7)]
-            meals = await uow.meals.find_by_date_range(
-                user_id=query.user_id,
-                start_date=week_start,
-                end_date=week_start + timedelta(days=6),
+            totals = await uow.meals.sum_macros_by_local_date(
+                query.user_id,
+                week_start,
+                week_start + timedelta(days=6),
                 user_timezone=user_tz_str,
-                projection=MealProjection.MACROS_ONLY,
             )
 
         base_daily_cal, base_daily_protein, base_daily_carbs, base_daily_fat = (
             await self._get_base_daily_targets(query.user_id)
         )
 
-        meals_by_day: dict[date, list[Any]] = {day: [] for day in days}
-        for meal in meals:
-            meal_day = self._local_meal_date(meal.created_at, user_tz)
-            if meal_day in meals_by_day:
-                meals_by_day[meal_day].append(meal)
+        totals_by_day: dict[date, list] = {}
+        for day_totals in totals:
+            totals_by_day.setdefault(day_totals.local_date, []).append(day_totals)
 
         entries: list[dict[str, Any]] = []
         for day in days:
@@ -79,19 +74,13 @@ class GetDailyBreakdownQueryHandler(
             total_calories = 0.0
             meal_count = 0
 
-            for meal in meals_by_day.get(day, []):
-                if meal.status == MealStatus.INACTIVE:
-                    continue
-                meal_count += 1
-                if meal.nutrition and meal.status in [
-                    MealStatus.READY,
-                    MealStatus.ENRICHING,
-                ]:
-                    if meal.nutrition.macros:
-                        total_protein += meal.nutrition.macros.protein or 0.0
-                        total_carbs += meal.nutrition.macros.carbs or 0.0
-                        total_fat += meal.nutrition.macros.fat or 0.0
-                        total_calories += effective_meal_calories(meal)
+            for day_totals in totals_by_day.get(day, []):
+                meal_count += day_totals.meal_count
+                if day_totals.status in (MealStatus.READY, MealStatus.ENRICHING):
+                    total_protein += day_totals.protein
+                    total_carbs += day_totals.carbs
+                    total_fat += day_totals.fat
+                    total_calories += day_totals.calories
 
             entries.append(
                 {
@@ -115,12 +104,6 @@ class GetDailyBreakdownQueryHandler(
         await self._write_cache(query.user_id, week_start, result)
         return result
 
-    def _local_meal_date(self, created_at: datetime, user_tz) -> date:
-        """Return the user's local date for a meal timestamp."""
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=UTC)
-        return created_at.astimezone(user_tz).date()
-
     async def _get_base_daily_targets(
         self, user_id: str
     ) -> tuple[float, float, float, float]:
@@ -4,12 +4,15 @@ Auto-extracted for better maintainability.
 """
 
 import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
 from src.app.events.base import EventHandler, handles
 from src.app.queries.meal import GetDailyMacrosQuery
+from src.app.services.stale_while_revalidate import StaleWhileRevalidate
 from src.domain.cache.cache_keys import CacheKeys
 from src.domain.model.meal import MealStatus
 from src.domain.model.meal_projection import MealProjection
@@ -37,11 +40,19 @@ class GetDailyMacrosQueryHandler(EventHandler[GetDailyMacrosQuery, dict[str, Any
     def __init__(
         self,
         cache_service: CachePort | None = None,
+        stale_while_revalidate: StaleWhileRevalidate | None = None,
     ):
         self.cache_service = cache_service
+        self.swr = stale_while_revalidate
 
     async def handle(self, query: GetDailyMacrosQuery) -> dict[str, Any]:
         """Calculate daily macros for a given date with user targets."""
+        return await self._run(query, use_cache=True)
+
+    async def _run(
+        self, query: GetDailyMacrosQuery, *, use_cache: bool
+    ) -> dict[str, Any]:
+        """Compute the response; ``use_cache=False`` is the background refresh."""
         # TDEE lookup FIRST — behind Redis cache, rarely opens its own DB
         # connection. Resolving it before the UoW below lets that single UoW
         # also run the weekly effective-adjusted call (previously a second,
@@ -53,6 +64,10 @@ class GetDailyMacrosQueryHandler(EventHandler[GetDailyMacrosQuery, dict[str, Any
         macro_preset = MacroPreset.STANDARD
         is_custom = False
 
+        context = None
+        if query.user_context is not None:
+            context = await query.user_context.load()
+
         try:
             from src.app.handlers.query_handlers.get_user_tdee_query_handler import (
                 GetUserTdeeQueryHandler,
@@ -61,7 +76,12 @@ class GetDailyMacrosQueryHandler(EventHandler[GetDailyMacrosQuery, dict[str, Any
 
             tdee_handler = GetUserTdeeQueryHandler(cache_service=self.cache_service)
             tdee_result = await tdee_handler.handle(
-                GetUserTdeeQuery(user_id=query.user_id)
+                GetUserTdeeQuery(
+                    user_id=query.user_id,
+                    profile_target_revision=(
+                        context.profile_target_revision if context else None
+                    ),
+                )
             )
             target_calories = tdee_result.get("target_calories")
             target_macros = tdee_result.get("macros", {})
@@ -82,20 +102,28 @@ class GetDailyMacrosQueryHandler(EventHandler[GetDailyMacrosQuery, dict[str, Any
         # a calorie target resolved above) the weekly effective-adjusted call.
         weekly_context: dict[str, Any] | None = None
         async with AsyncUnitOfWork() as uow:
-            user_tz_str = await resolve_user_timezone_async(
-                query.user_id, uow, query.header_timezone
-            )
+            if context is not None:
+                user_tz_str = context.timezone
+            else:
+                user_tz_str = await resolve_user_timezone_async(
+                    query.user_id, uow, query.header_timezone
+                )
             user_tz = get_zone_info(user_tz_str)
             target_date = query.target_date or datetime.now(user_tz).date()
 
             # Cache-aside BEFORE meal aggregation. Returning a Redis hit after
             # computing fresh totals discarded those totals and could leave
             # clients with stale consumed=0 while meals already existed.
-            cached_result = await self._try_get_cached_result(
-                query.user_id, target_date, target_revision
-            )
-            if cached_result is not None:
-                return cached_result
+            if use_cache:
+                pinned = replace(query, target_date=target_date)
+                cached_result = await self._try_get_cached_result(
+                    query.user_id,
+                    target_date,
+                    target_revision,
+                    refresh=lambda: self._run(pinned, use_cache=False),
+                )
+                if cached_result is not None:
+                    return cached_result
 
             meals = await uow.meals.find_by_date(
                 target_date,
@@ -260,7 +288,8 @@ class GetDailyMacrosQueryHandler(EventHandler[GetDailyMacrosQuery, dict[str, Any
             ),
         }
 
-        await self._write_cache(query.user_id, target_date, result)
+        if use_cache:
+            await self._write_cache(query.user_id, target_date, result)
         return result
 
     async def _get_weekly_context(
@@ -338,13 +367,33 @@ class GetDailyMacrosQueryHandler(EventHandler[GetDailyMacrosQuery, dict[str, Any
             logger.warning(f"Could not fetch weekly budget context: {e}")
             return None
 
-    async def _try_get_cached_result(self, user_id: str, target_date: date, revision: int | None):
+    async def _try_get_cached_result(
+        self,
+        user_id: str,
+        target_date: date,
+        revision: int | None,
+        refresh: Callable[[], Awaitable[dict[str, Any]]] | None = None,
+    ):
         if not self.cache_service:
             return None
-        cache_key, _ = CacheKeys.daily_macros(user_id, target_date)
+        cache_key, ttl = CacheKeys.daily_macros(user_id, target_date)
         try:
-            cached = await self.cache_service.get_json(cache_key)
-            if revision is not None and cached and cached.get("target_revision") == revision:
+            stale = False
+            if self.swr is not None:
+                entry = await self.swr.read(cache_key)
+                cached = entry.value if entry is not None else None
+                stale = entry is not None and entry.stale
+            else:
+                cached = await self.cache_service.get_json(cache_key)
+            if (
+                revision is not None
+                and isinstance(cached, dict)
+                and cached.get("target_revision") == revision
+            ):
+                # Stale but still on the current target revision: serve it and
+                # recompute in the background.
+                if stale and refresh is not None and self.swr is not None:
+                    self.swr.schedule_refresh(cache_key, ttl, refresh)
                 return cached
             return None
         except Exception as exc:
@@ -358,7 +407,10 @@ class GetDailyMacrosQueryHandler(EventHandler[GetDailyMacrosQuery, dict[str, Any
             return
         cache_key, ttl = CacheKeys.daily_macros(user_id, target_date)
         try:
-            await self.cache_service.set_json(cache_key, payload, ttl)
+            if self.swr is not None:
+                await self.swr.write(cache_key, payload, ttl)
+            else:
+                await self.cache_service.set_json(cache_key, payload, ttl)
         except Exception as exc:
             logger.warning(
                 "Failed to write daily macros cache for %s: %s", user_id, exc
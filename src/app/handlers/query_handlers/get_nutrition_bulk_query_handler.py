@@ -4,22 +4,21 @@ Handler for bulk nutrition query - returns date-indexed summaries for a range.
 
 import hashlib
 import logging
-from datetime import UTC, date, datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from src.app.events.base import EventHandler, handles
 from src.app.queries.nutrition import GetNutritionBulkQuery
+from src.app.services.stale_while_revalidate import StaleWhileRevalidate
 from src.domain.cache.cache_keys import CacheKeys
-from src.domain.model.meal import MealStatus
+from src.domain.model.meal import DailyNutritionRollup
+from src.domain.model.meal.daily_nutrition_rollup import local_day_bounds_utc
 from src.domain.model.meal_projection import MealProjection
-from src.domain.model.nutrition.macros import Macros
 from src.domain.model.user import MacroPreset, MacroTargets
 from src.domain.ports.cache_port import CachePort
-from src.domain.services.meal_calorie_service import effective_meal_calories
 from src.domain.services.tdee_service import TdeeCalculationService
 from src.domain.services.weekly_budget_service import WeeklyBudgetService
 from src.domain.utils.timezone_utils import (
-    ensure_utc,
     get_user_monday,
     get_zone_info,
     resolve_user_timezone_async,
@@ -35,8 +34,13 @@ MAX_DATE_RANGE = 60
 class GetNutritionBulkQueryHandler(EventHandler[GetNutritionBulkQuery, dict[str, Any]]):
     """Handler for bulk nutrition data retrieval."""
 
-    def __init__(self, cache_service: CachePort | None = None):
+    def __init__(
+        self,
+        cache_service: CachePort | None = None,
+        stale_while_revalidate: StaleWhileRevalidate | None = None,
+    ):
         self.cache_service = cache_service
+        self.swr = stale_while_revalidate
 
     async def handle(self, query: GetNutritionBulkQuery) -> dict[str, Any]:
         """Fetch nutrition summaries for all dates in range (cache-aside).
@@ -46,6 +50,10 @@ class GetNutritionBulkQueryHandler(EventHandler[GetNutritionBulkQuery, dict[str,
         to "today") and from rare target changes not on the high-frequency
         write paths; meal/movement/hydration/custom-macro writes purge this key
         synchronously (CacheInvalidationService) for instant freshness.
+
+        With stale-while-revalidate, an entry past its TTL that still matches
+        the target revision is returned while a background refresh runs, so
+        day-rollover staleness is bounded by the stale window instead.
         """
         if (query.end_date - query.start_date).days > MAX_DATE_RANGE:
             raise ValueError(f"Date range cannot exceed {MAX_DATE_RANGE} days")
@@ -57,7 +65,14 @@ class GetNutritionBulkQueryHandler(EventHandler[GetNutritionBulkQuery, dict[str,
             query.user_id, query.start_date, query.end_date
         )
         # A target-bearing cache is valid only for the current DB profile fence.
-        _, _, _, revision, _, _ = await self._get_user_targets(query.user_id)
+        if query.user_context is not None:
+            revision = (await query.user_context.load()).profile_target_revision
+        else:
+            _, _, _, revision, _, _ = await self._get_user_targets(query.user_id)
+        if self.swr is not None:
+            return await self._handle_stale_while_revalidate(
+                self.swr, query, key, ttl, revision
+            )
         cached = await self.cache_service.get_json(key)
         if revision is not None and cached and cached.get("target_revision") == revision:
             return cached
@@ -65,82 +80,58 @@ class GetNutritionBulkQueryHandler(EventHandler[GetNutritionBulkQuery, dict[str,
         await self.cache_service.set_json(key, result, ttl)
         return result
 
+    async def _handle_stale_while_revalidate(
+        self,
+        swr: StaleWhileRevalidate,
+        query: GetNutritionBulkQuery,
+        key: str,
+        ttl: int,
+        revision: int | None,
+    ) -> dict[str, Any]:
+        cached = await swr.read(key)
+        if (
+            revision is not None
+            and cached is not None
+            and isinstance(cached.value, dict)
+            and cached.value.get("target_revision") == revision
+        ):
+            if cached.stale:
+                swr.schedule_refresh(key, ttl, lambda: self._compute(query))
+            return cached.value
+        result = await self._compute(query)
+        await swr.write(key, result, ttl)
+        return result
+
     async def _compute(self, query: GetNutritionBulkQuery) -> dict[str, Any]:
         """Build the bulk nutrition response (uncached)."""
+        context = None
+        if query.user_context is not None:
+            context = await query.user_context.load()
         async with AsyncUnitOfWork() as uow:
-            user_tz_str = await resolve_user_timezone_async(
-                query.user_id, uow, query.header_timezone
-            )
+            if context is not None:
+                user_tz_str = context.timezone
+            else:
+                user_tz_str = await resolve_user_timezone_async(
+                    query.user_id, uow, query.header_timezone
+                )
             user_tz = get_zone_info(user_tz_str)
             today = datetime.now(user_tz).date()
 
-            meals = await uow.meals.find_by_date_range(
-                query.user_id,
-                query.start_date,
-                query.end_date,
-                user_timezone=user_tz_str,
-                projection=MealProjection.MACROS_ONLY,
-            )
+            rollups = await self._load_rollups(uow, query, user_tz_str)
 
             target_calories, target_macros, bmr, target_revision, macro_preset, is_custom = await self._get_user_targets(
-                query.user_id
+                query.user_id,
+                context.profile_target_revision if context is not None else None,
             )
 
-            meals_by_date: dict[date, list] = {}
-            for meal in meals:
-                if meal.status == MealStatus.INACTIVE:
-                    continue
-                meal_date = self._get_meal_date(meal, user_tz_str)
-                if meal_date:
-                    meals_by_date.setdefault(meal_date, []).append(meal)
-
-            # Fetch hydration entries for range; dedup by legacy_meal_id
-            hydration_by_date: dict[date, list] = {}
-            try:
-                meal_id_set = {m.meal_id for m in meals}
-                h_entries = await uow.hydration_entries.find_by_date_range(
-                    query.user_id,
-                    query.start_date,
-                    query.end_date,
-                    user_timezone=user_tz_str,
-                )
-                for entry in h_entries:
-                    if entry.legacy_meal_id and entry.legacy_meal_id in meal_id_set:
-                        continue
-                    entry_date = self._get_hydration_date(entry, user_tz_str)
-                    if entry_date:
-                        hydration_by_date.setdefault(entry_date, []).append(entry)
-            except Exception as exc:
-                logger.warning("Failed to fetch bulk hydration data: %s", exc)
-
-            # Single query for the full range; bucket by local date in Python.
-            movement_by_date: dict[date, float] = {}
-            try:
-                overall_start, _ = self._local_day_utc_range(
-                    query.start_date, user_tz_str
-                )
-                _, overall_end = self._local_day_utc_range(query.end_date, user_tz_str)
-                included = await uow.movement_entries.fetch_included_kcal_for_range(
-                    query.user_id, overall_start, overall_end
-                )
-                for logged_at, kcal in included:
-                    local_date = logged_at.astimezone(user_tz).date()
-                    movement_by_date[local_date] = (
-                        movement_by_date.get(local_date, 0.0) + kcal
-                    )
-            except Exception as exc:
-                logger.warning("Failed to fetch bulk movement data: %s", exc)
-
             dates_result: dict[str, dict[str, Any]] = {}
             current = query.start_date
             while current <= query.end_date:
-                day_meals = meals_by_date.get(current, [])
+                rollup = rollups.get(current) or DailyNutritionRollup(
+                    query.user_id, current, user_tz_str
+                )
                 dates_result[current.isoformat()] = self._build_date_summary(
-                    day_meals,
-                    target_calories,
-                    target_macros,
-                    movement_kcal=movement_by_date.get(current, 0.0),
-                    hydration_entries=hydration_by_date.get(current, []),
+                    rollup, target_calories, target_macros
                 )
                 current += timedelta(days=1)
 
@@ -208,69 +199,77 @@ class GetNutritionBulkQueryHandler(EventHandler[GetNutritionBulkQuery, dict[str,
             "macro_preset": macro_preset.value,
         }
 
-    def _local_day_utc_range(self, target: date, user_tz_str: str):
-        from datetime import datetime, time
-
-        tz = get_zone_info(user_tz_str)
-        start_local = datetime.combine(target, time.min, tzinfo=tz)
-        end_local = start_local + timedelta(days=1)
-        return start_local.astimezone(UTC), end_local.astimezone(UTC)
-
-    def _get_meal_date(self, meal, user_tz_str: str) -> date | None:
-        """Extract local date from meal's created_at timestamp."""
-        if not meal.created_at:
-            return None
-        tz = get_zone_info(user_tz_str)
-        from src.domain.utils.timezone_utils import ensure_utc
+    async def _load_rollups(
+        self, uow, query: GetNutritionBulkQuery, user_tz_str: str
+    ) -> dict[date, DailyNutritionRollup]:
+        """Per-day totals for the range, from the rollup table when available.
 
-        aware_dt = ensure_utc(meal.created_at)
-        return aware_dt.astimezone(tz).date()
+        A failing rollup read falls back to the sources, where hydration and
+        movement failures only drop those totals instead of failing the read.
+        """
+        rollup_repo = uow.daily_nutrition_rollups
+        if rollup_repo is not None:
+            try:
+                return await rollup_repo.get_range(
+                    query.user_id, query.start_date, query.end_date, user_tz_str
+                )
+            except Exception as exc:
+                logger.warning("Failed to load bulk nutrition rollups: %s", exc)
+
+        meals = await uow.meals.find_by_date_range(
+            query.user_id,
+            query.start_date,
+            query.end_date,
+            user_timezone=user_tz_str,
+            projection=MealProjection.MACROS_ONLY,
+        )
+        hydration_entries = []
+        try:
+            hydration_entries = await uow.hydration_entries.find_by_date_range(
+                query.user_id,
+                query.start_date,
+                query.end_date,
+                user_timezone=user_tz_str,
+            )
+        except Exception as exc:
+            logger.warning("Failed to fetch bulk hydration data: %s", exc)
 
-    def _get_hydration_date(self, entry, user_tz_str: str):
-        if not entry.logged_at:
-            return None
-        tz = get_zone_info(user_tz_str)
-        return ensure_utc(entry.logged_at).astimezone(tz).date()
+        # Single query for the full range; bucketed by local date below.
+        movements = []
+        try:
+            start_utc, end_utc = local_day_bounds_utc(
+                query.start_date, query.end_date, user_tz_str
+            )
+            movements = await uow.movement_entries.fetch_included_kcal_for_range(
+                query.user_id, start_utc, end_utc
+            )
+        except Exception as exc:
+            logger.warning("Failed to fetch bulk movement data: %s", exc)
+
+        return DailyNutritionRollup.build_range(
+            query.user_id,
+            user_tz_str,
+            query.start_date,
+            query.end_date,
+            meals=meals,
+            hydration_entries=hydration_entries,
+            movements=movements,
+        )
 
     def _build_date_summary(
         self,
-        meals: list,
+        rollup: DailyNutritionRollup,
         target_calories: float | None,
         target_macros: dict | None,
-        movement_kcal: float = 0.0,
-        hydration_entries: list | None = None,
     ) -> dict[str, Any]:
         """Build summary for a single date."""
-        total_protein = 0.0
-        total_carbs = 0.0
-        total_fat = 0.0
-        food_calories = 0.0
-        meal_count = 0
-
-        for meal in meals:
-            meal_count += 1
-            if meal.nutrition and meal.status in [
-                MealStatus.READY,
-                MealStatus.ENRICHING,
-            ]:
-                if meal.nutrition.macros:
-                    total_protein += meal.nutrition.macros.protein or 0
-                    total_carbs += meal.nutrition.macros.carbs or 0
-                    total_fat += meal.nutrition.macros.fat or 0
-                    food_calories += effective_meal_calories(meal)
-
-        for entry in hydration_entries or []:
-            meal_count += 1
-            total_protein += entry.protein_g or 0
-            total_carbs += entry.carbs_g or 0
-            total_fat += entry.fat_g or 0
-            food_calories += Macros(
-                protein=entry.protein_g or 0,
-                carbs=entry.carbs_g or 0,
-                fat=entry.fat_g or 0,
-                fiber=entry.fiber_g or 0,
-            ).total_calories
-        net_calories = food_calories - movement_kcal
+        total_protein = rollup.protein
+        total_carbs = rollup.carbs
+        total_fat = rollup.fat
+        food_calories = rollup.calories
+        movement_kcal = rollup.movement_kcal
+        meal_count = rollup.entry_count
+        net_calories = rollup.net_calories
 
         target_cal = target_calories or 2000
         target_prot = (target_macros or {}).get("protein", 70)
@@ -304,7 +303,9 @@ class GetNutritionBulkQueryHandler(EventHandler[GetNutritionBulkQuery, dict[str,
             },
         }
 
-    async def _get_user_targets(self, user_id: str) -> tuple:
+    async def _get_user_targets(
+        self, user_id: str, profile_target_revision: int | None = None
+    ) -> tuple:
         """Get user's TDEE targets. Returns (target_calories, target_macros, bmr)."""
         try:
             from src.app.handlers.query_handlers.get_user_tdee_query_handler import (
@@ -313,7 +314,11 @@ class GetNutritionBulkQueryHandler(EventHandler[GetNutritionBulkQuery, dict[str,
             from src.app.queries.tdee import GetUserTdeeQuery
 
             tdee_handler = GetUserTdeeQueryHandler(cache_service=self.cache_service)
-            tdee_result = await tdee_handler.handle(GetUserTdeeQuery(user_id=user_id))
+            tdee_result = await tdee_handler.handle(
+                GetUserTdeeQuery(
+                    user_id=user_id, profile_target_revision=profile_target_revision
+                )
+            )
             return (
                 tdee_result.get("target_calories"),
                 tdee_result.get("macros", {}),
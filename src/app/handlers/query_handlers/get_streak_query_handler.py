@@ -38,38 +38,42 @@ class GetStreakQueryHandler(EventHandler[GetStreakQuery, Dict[str, Any]]):
         return result
 
     async def _compute(self, query: GetStreakQuery) -> Dict[str, Any]:
-        """Compute streak from DB."""
+        """Read the persisted streak summary, rebuilding it when missing.
+
+        Meal writes keep the summary current, so a miss costs one primary-key
+        read instead of scanning every logged date. The full scan only runs the
+        first time, after a timezone change, or after a delete broke the best
+        run.
+        """
+        context_tz = None
+        if query.user_context is not None:
+            context_tz = (await query.user_context.load()).timezone
         async with AsyncUnitOfWork() as uow:
-            user_tz_str = await resolve_user_timezone_async(
+            user_tz_str = context_tz or await resolve_user_timezone_async(
                 query.user_id, uow, query.header_timezone
             )
             user_tz = get_zone_info(user_tz_str)
             today = datetime.now(user_tz).date()
 
-            dates = await uow.meals.get_dates_with_meals(
-                query.user_id, user_timezone=user_tz_str
-            )
-            scan_count = await uow.meals.count_by_source(query.user_id, "scanner")
-
-        if not dates:
-            return {
-                "current_streak": 0,
-                "best_streak": 0,
-                "last_logged_date": None,
-                "scan_count": scan_count,
-            }
-
-        last_logged = dates[0]
-
-        current_streak = self._calculate_current_streak(dates, today)
-        best_streak = self._calculate_best_streak(dates)
-
-        return {
-            "current_streak": current_streak,
-            "best_streak": best_streak,
-            "last_logged_date": last_logged.isoformat(),
-            "scan_count": scan_count,
-        }
+            summary = await uow.streak_summaries.get(query.user_id)
+            if summary is None or summary.timezone != user_tz_str:
+                summary = await uow.meals.rebuild_streak_summary(
+                    query.user_id, user_tz_str
+                )
+
+            current_streak = summary.current_streak(today)
+            if current_streak is None:
+                # A meal dated after today hides the run ending today; that run
+                # is no longer than the best one, so scan just that window.
+                recent = await uow.meals.get_dates_with_meals(
+                    query.user_id,
+                    user_timezone=user_tz_str,
+                    start_date=today - timedelta(days=summary.best_run_length),
+                    end_date=today,
+                )
+                current_streak = self._calculate_current_streak(recent, today)
+
+        return summary.to_response(current_streak)
 
     def _calculate_current_streak(self, dates: list[date], today: date) -> int:
         """Walk backwards from today; streak not broken until day ends."""
@@ -87,21 +91,3 @@ class GetStreakQueryHandler(EventHandler[GetStreakQuery, Dict[str, Any]]):
             streak += 1
             cursor -= timedelta(days=1)
         return streak
-
-    def _calculate_best_streak(self, dates: list[date]) -> int:
-        """Find the longest consecutive run across all logged dates."""
-        if not dates:
-            return 0
-
-        date_set = set(dates)
-        best = 0
-        for d in date_set:
-            # Only start counting from a "streak start" (day before not in set)
-            if (d - timedelta(days=1)) not in date_set:
-                length = 0
-                cursor = d
-                while cursor in date_set:
-                    length += 1
-                    cursor += timedelta(days=1)
-                best = max(best, length)
-        return best
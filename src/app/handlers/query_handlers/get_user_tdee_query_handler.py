@@ -37,7 +37,9 @@ class GetUserTdeeQueryHandler(EventHandler[GetUserTdeeQuery, dict[str, Any]]):
 
     async def handle(self, query: GetUserTdeeQuery) -> dict[str, Any]:
         cache_key, ttl = CacheKeys.user_tdee(query.user_id)
-        current_revision = await self._current_profile_revision(query.user_id)
+        current_revision = query.profile_target_revision
+        if current_revision is None:
+            current_revision = await self._current_profile_revision(query.user_id)
         if self.cache_service:
             cached = await self.cache_service.get_json(cache_key)
             if (
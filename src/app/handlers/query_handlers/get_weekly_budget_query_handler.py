@@ -3,6 +3,7 @@ Handler for getting weekly macro budget status.
 """
 
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import replace
 from datetime import date, datetime, timedelta
 from typing import Any
@@ -10,6 +11,7 @@ from typing import Any
 from src.api.exceptions import ExternalServiceException
 from src.app.events.base import EventHandler, handles
 from src.app.queries.get_weekly_budget_query import GetWeeklyBudgetQuery
+from src.app.services.stale_while_revalidate import StaleWhileRevalidate
 from src.domain.cache.cache_keys import CacheKeys
 from src.domain.constants import WeeklyBudgetConstants
 from src.domain.model.user import MacroPreset, MacroTargets
@@ -36,19 +38,38 @@ class GetWeeklyBudgetQueryHandler(EventHandler[GetWeeklyBudgetQuery, dict[str, A
         self,
         uow: AsyncUnitOfWorkPort | None = None,
         cache_service: CachePort | None = None,
+        stale_while_revalidate: StaleWhileRevalidate | None = None,
     ):
         self.uow = uow
         self.cache_service = cache_service
+        self.swr = stale_while_revalidate
 
     async def handle(self, query: GetWeeklyBudgetQuery) -> dict[str, Any]:
         """Handle getting weekly budget status."""
-        uow = self.uow or AsyncUnitOfWork()
+        return await self._run(query, self.uow or AsyncUnitOfWork(), use_cache=True)
+
+    async def _run(
+        self,
+        query: GetWeeklyBudgetQuery,
+        uow: AsyncUnitOfWorkPort,
+        *,
+        use_cache: bool,
+    ) -> dict[str, Any]:
+        """Compute the response; ``use_cache=False`` is the background refresh."""
+        # Loaded before entering the UoW so its read never holds a second
+        # connection checkout.
+        context = None
+        if query.user_context is not None:
+            context = await query.user_context.load()
         async with uow:
             try:
                 # Resolve user timezone (DB → X-Timezone header → UTC)
-                user_tz_str = await resolve_user_timezone_async(
-                    query.user_id, uow, query.header_timezone
-                )
+                if context is not None:
+                    user_tz_str = context.timezone
+                else:
+                    user_tz_str = await resolve_user_timezone_async(
+                        query.user_id, uow, query.header_timezone
+                    )
                 user_tz = get_zone_info(user_tz_str)
 
                 # Default to today in USER's timezone (not server's UTC)
@@ -65,15 +86,23 @@ class GetWeeklyBudgetQueryHandler(EventHandler[GetWeeklyBudgetQuery, dict[str, A
                 cache_key, ttl = CacheKeys.weekly_budget(
                     query.user_id, week_start, target_date
                 )
-                profile_revision = await self._profile_target_revision(
-                    uow, query.user_id
-                )
-                if self.cache_service:
-                    cached = await self.cache_service.get_json(cache_key)
-                    if (
-                        cached is not None
-                        and cached.get("profile_target_revision") == profile_revision
-                    ):
+                if context is not None and context.profile_target_revision is not None:
+                    profile_revision = context.profile_target_revision
+                else:
+                    profile_revision = await self._profile_target_revision(
+                        uow, query.user_id
+                    )
+                if self.cache_service and use_cache:
+                    pinned = replace(query, target_date=target_date)
+                    cached = await self._read_cache(
+                        cache_key,
+                        ttl,
+                        profile_revision,
+                        refresh=lambda: self._run(
+                            pinned, AsyncUnitOfWork(), use_cache=False
+                        ),
+                    )
+                    if cached is not None:
                         return cached
 
                 # Find or create weekly budget
@@ -140,7 +169,7 @@ class GetWeeklyBudgetQueryHandler(EventHandler[GetWeeklyBudgetQuery, dict[str, A
                 adjusted = effective.adjusted
                 adjusted = self._apply_target_policy(
                     adjusted,
-                    await self._current_target_policy(query.user_id),
+                    await self._current_target_policy(query.user_id, profile_revision),
                 )
                 consumed_before_today = effective.consumed_before_today
                 consumed = effective.consumed_total
@@ -208,7 +237,9 @@ class GetWeeklyBudgetQueryHandler(EventHandler[GetWeeklyBudgetQuery, dict[str, A
                         bmr=bmr,
                         remaining_days=tomorrow_remaining,
                     )
-                    policy = await self._current_target_policy(query.user_id)
+                    policy = await self._current_target_policy(
+                        query.user_id, profile_revision
+                    )
                     tomorrow_adjusted = self._apply_target_policy(
                         tomorrow_adjusted, policy
                     )
@@ -287,14 +318,44 @@ class GetWeeklyBudgetQueryHandler(EventHandler[GetWeeklyBudgetQuery, dict[str, A
                     **preview_data,
                 }
 
-                if self.cache_service:
-                    await self.cache_service.set_json(cache_key, result, ttl)
+                if self.cache_service and use_cache:
+                    if self.swr is not None:
+                        await self.swr.write(cache_key, result, ttl)
+                    else:
+                        await self.cache_service.set_json(cache_key, result, ttl)
 
                 return result
 
             except Exception:
                 raise
 
+    async def _read_cache(
+        self,
+        cache_key: str,
+        ttl: int,
+        profile_revision: int,
+        refresh: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any] | None:
+        stale = False
+        if self.swr is not None:
+            entry = await self.swr.read(cache_key)
+            cached = entry.value if entry is not None else None
+            stale = entry is not None and entry.stale
+        elif self.cache_service is not None:
+            cached = await self.cache_service.get_json(cache_key)
+        else:
+            return None
+        if (
+            not isinstance(cached, dict)
+            or cached.get("profile_target_revision") != profile_revision
+        ):
+            return None
+        # Stale but still on the current target revision: serve it and
+        # recompute in the background.
+        if stale and self.swr is not None:
+            self.swr.schedule_refresh(cache_key, ttl, refresh)
+        return cached
+
     @staticmethod
     async def _profile_target_revision(uow: AsyncUnitOfWorkPort, user_id: str) -> int:
         profile = await uow.users.get_profile(user_id)
@@ -304,14 +365,18 @@ class GetWeeklyBudgetQueryHandler(EventHandler[GetWeeklyBudgetQuery, dict[str, A
             )
         return profile.profile_target_revision
 
-    async def _current_target_policy(self, user_id: str) -> tuple[MacroPreset, bool]:
+    async def _current_target_policy(
+        self, user_id: str, profile_target_revision: int | None = None
+    ) -> tuple[MacroPreset, bool]:
         from src.app.handlers.query_handlers.get_user_tdee_query_handler import (
             GetUserTdeeQueryHandler,
         )
         from src.app.queries.tdee import GetUserTdeeQuery
 
         target = await GetUserTdeeQueryHandler(cache_service=self.cache_service).handle(
-            GetUserTdeeQuery(user_id=user_id)
+            GetUserTdeeQuery(
+                user_id=user_id, profile_target_revision=profile_target_revision
+            )
         )
         return MacroPreset(target["macro_preset"]), bool(target["is_custom"])
 
@@ -16,6 +16,7 @@ from src.domain.model.translation_result import TranslationOutcome
 from src.domain.ports.food_mapping_service_port import FoodMappingServicePort
 from src.domain.ports.food_reference_repository_port import (
     FoodReferenceSearchProjection,
+    ProviderFoodAdoption,
 )
 from src.domain.services.nutrition_integrity_policy import NutritionIntegrityError
 from src.observability import distribution_metric, increment_metric
@@ -209,32 +210,40 @@ class SearchFoodsQueryHandler(EventHandler[SearchFoodsQuery, dict[str, Any]]):
         """
         if self.uow_factory is None:
             return
+        pending: list[tuple[dict[str, Any], ProviderFoodAdoption]] = []
         for item in items:
             if not self._is_adoptable_provider_hit(item):
                 continue
             display_name = str(item.get("description") or item.get("name") or "")
-            english_name = str(item.get("canonical_name") or display_name)
-            try:
-                async with self.uow_factory() as uow:
-                    adopted = await uow.food_references.adopt_provider_food(
-                        item.get("source_namespace") or "fatsecret",
-                        str(item.get("source_food_id") or item.get("food_id")),
-                        english_name,
-                        {
-                            "protein_100g": item.get("protein_100g"),
-                            "carbs_100g": item.get("carbs_100g"),
-                            "fat_100g": item.get("fat_100g"),
-                            "fiber_100g": item.get("fiber_100g") or 0,
-                            "sugar_100g": item.get("sugar_100g") or 0,
-                        },
-                        item.get("allowed_units"),
-                        locale,
-                        display_name,
-                    )
-            except Exception:
-                logger.warning("food search adopt failed", exc_info=True)
-                continue
-            item["food_reference_id"] = adopted.get("id")
+            adoption = ProviderFoodAdoption(
+                namespace=item.get("source_namespace") or "fatsecret",
+                food_id=str(item.get("source_food_id") or item.get("food_id")),
+                english_name=str(item.get("canonical_name") or display_name),
+                per_100g={
+                    "protein_100g": item.get("protein_100g"),
+                    "carbs_100g": item.get("carbs_100g"),
+                    "fat_100g": item.get("fat_100g"),
+                    "fiber_100g": item.get("fiber_100g") or 0,
+                    "sugar_100g": item.get("sugar_100g") or 0,
+                },
+                servings=item.get("allowed_units"),
+                locale_name=display_name,
+            )
+            pending.append((item, adoption))
+        if not pending:
+            return
+        try:
+            async with self.uow_factory() as uow:
+                adopted_by_identity = await uow.food_references.adopt_provider_foods(
+                    [adoption for _, adoption in pending], locale
+                )
+        except Exception:
+            logger.warning("food search adopt failed", exc_info=True)
+            return
+        for item, adoption in pending:
+            adopted = adopted_by_identity.get(adoption.identity)
+            if adopted is not None:
+                item["food_reference_id"] = adopted.get("id")
 
     @staticmethod
     def _is_adoptable_provider_hit(item: dict[str, Any]) -> bool:
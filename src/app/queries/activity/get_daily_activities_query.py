@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Optional
 
 from src.app.events.base import Query
+from src.app.services.user_context_loader import UserContextLoader
 
 
 @dataclass
@@ -17,3 +18,4 @@ class GetDailyActivitiesQuery(Query):
     target_date: datetime
     language: Optional[str] = field(default="en")
     header_timezone: Optional[str] = field(default=None)  # X-Timezone header fallback
+    user_context: UserContextLoader | None = field(default=None)
@@ -5,6 +5,8 @@ Query to get weekly macro budget status.
 from dataclasses import dataclass
 from datetime import date
 
+from src.app.services.user_context_loader import UserContextLoader
+
 
 @dataclass
 class GetWeeklyBudgetQuery:
@@ -12,3 +14,4 @@ class GetWeeklyBudgetQuery:
     target_date: date | None = None  # Defaults to today
     header_timezone: str | None = None  # X-Timezone header fallback
     read_only: bool = False  # Browse callers must not initialize or update state
+    user_context: UserContextLoader | None = None
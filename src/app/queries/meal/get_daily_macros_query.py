@@ -7,6 +7,7 @@ from datetime import date
 from typing import Optional
 
 from src.app.events.base import Query
+from src.app.services.user_context_loader import UserContextLoader
 
 
 @dataclass
@@ -16,3 +17,4 @@ class GetDailyMacrosQuery(Query):
     user_id: str
     target_date: Optional[date] = None
     header_timezone: Optional[str] = None  # X-Timezone header fallback
+    user_context: UserContextLoader | None = None
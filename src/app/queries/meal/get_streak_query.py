@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from src.app.events.base import Query
+from src.app.services.user_context_loader import UserContextLoader
 
 
 @dataclass
@@ -16,3 +17,4 @@ class GetStreakQuery(Query):
 
     user_id: str
     header_timezone: Optional[str] = None
+    user_context: UserContextLoader | None = None
@@ -6,6 +6,7 @@ from datetime import date
 from typing import Optional
 
 from src.app.events.base import Query
+from src.app.services.user_context_loader import UserContextLoader
 
 
 @dataclass
@@ -15,3 +16,4 @@ class GetNutritionBulkQuery(Query):
     start_date: date
     end_date: date
     header_timezone: Optional[str] = None
+    user_context: UserContextLoader | None = None
@@ -12,3 +12,5 @@ class GetUserTdeeQuery(Query):
     """Query to get user's current TDEE calculation."""
 
     user_id: str
+    # Current revision already read this request; skips the revision lookup.
+    profile_target_revision: int | None = None
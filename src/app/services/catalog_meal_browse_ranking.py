@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import unicodedata
-
+from src.app.services.catalog_meal_search_index import (
+    CatalogMealSearchIndex,
+    normalize,
+)
 from src.app.services.catalog_meal_snapshot_service import CatalogMealSnapshot
 from src.domain.model.meal_recommendation import CatalogMeal
 from src.domain.services.meal_recommendation.plan_diversity_reranking_service import (
-    SHORTLIST_LIMIT,
+    DiversityOverlapCache,
     PlanDiversityRerankingService,
 )
 from src.domain.services.meal_recommendation.recipe_scoring_service import RecipeScore
@@ -22,7 +24,11 @@ def filter_meals(
     query: str | None,
     cuisine: str | None,
     meal_type: str | None,
+    *,
+    search_index: CatalogMealSearchIndex | None = None,
 ) -> list[CatalogMeal]:
+    if search_index is not None and search_index.meals is meals:
+        return search_index.filter(query, cuisine, meal_type)
     normalized_query = normalize(query)
     normalized_cuisine = normalize(cuisine)
     return [
@@ -40,15 +46,19 @@ def filter_meals(
 
 
 def rank_popular(
-    meals: list[CatalogMeal], *, popularity_configured: bool
+    meals: list[CatalogMeal],
+    *,
+    popularity_configured: bool,
+    search_index: CatalogMealSearchIndex | None = None,
 ) -> list[CatalogMeal]:
     if not popularity_configured or any(meal.popularity_rank is None for meal in meals):
         raise CatalogPopularityUnavailableError
+    name_keys = search_index.name_key_by_meal_id if search_index is not None else {}
     return sorted(
         meals,
         key=lambda meal: (
             meal.popularity_rank,
-            normalize(meal.name),
+            name_keys[meal.id] if meal.id in name_keys else normalize(meal.name),
             meal.id,
         ),
     )
@@ -59,23 +69,13 @@ def diversity_rank(
     diversity: PlanDiversityRerankingService,
     snapshot: CatalogMealSnapshot,
 ) -> list[CatalogMeal]:
-    selected: list[RecipeScore] = []
-    remaining = ranked_scores[:]
-    while remaining and len(selected) < SHORTLIST_LIMIT:
-        reranked = diversity.rerank_shortlist(
-            remaining,
-            comparison_meals=tuple(item.catalog_meal for item in selected),
-            ingredient_statistics=snapshot.ingredient_statistics,
-        )
-        winner = reranked[0]
-        selected.append(winner)
-        remaining = [
-            item for item in remaining if item.catalog_meal.id != winner.catalog_meal.id
-        ]
+    selected, remaining = diversity.select_shortlist(
+        ranked_scores,
+        ingredient_statistics=snapshot.ingredient_statistics,
+        overlaps=DiversityOverlapCache(
+            snapshot.ingredient_statistics, snapshot.scoring_index
+        ),
+    )
     return [item.catalog_meal for item in selected] + [
         item.catalog_meal for item in remaining
     ]
-
-
-def normalize(value: str | None) -> str:
-    return " ".join(unicodedata.normalize("NFKC", value or "").split()).casefold()
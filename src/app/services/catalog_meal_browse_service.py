@@ -28,6 +28,7 @@ from src.domain.services.meal_recommendation.plan_diversity_reranking_service im
     PlanDiversityRerankingService,
 )
 from src.domain.services.meal_recommendation.recipe_scoring_service import (
+    RecipeScore,
     RecipeScoringService,
 )
 
@@ -106,7 +107,13 @@ class CatalogMealBrowseService:
                     fallback=False,
                 )
             snapshot = await self._get_snapshot(uow)
-            candidates = filter_meals(snapshot.meals, query, cuisine, meal_type)
+            candidates = filter_meals(
+                snapshot.meals,
+                query,
+                cuisine,
+                meal_type,
+                search_index=snapshot.search_index,
+            )
             popularity_configured = any(
                 meal.popularity_rank is not None for meal in snapshot.meals
             )
@@ -166,7 +173,9 @@ class CatalogMealBrowseService:
             or not timezone
         ):
             return rank_popular(
-                candidates, popularity_configured=popularity_configured
+                candidates,
+                popularity_configured=popularity_configured,
+                search_index=snapshot.search_index,
             ), True
         affinity = await self._history_projector.build_affinity(
             uow,
@@ -176,33 +185,56 @@ class CatalogMealBrowseService:
         )
         if not affinity.weights:
             return rank_popular(
-                candidates, popularity_configured=popularity_configured
+                candidates,
+                popularity_configured=popularity_configured,
+                search_index=snapshot.search_index,
             ), True
 
-        scored = []
-        for meal in candidates:
-            eligible_types = (
-                [meal_type] if meal_type is not None else list(meal.meal_types)
-            )
-            meal_scores = [
-                self._scoring.score(
-                    meal,
+        # One ingredient fit per request and one vectorized pass per meal
+        # type; each meal keeps its best type, the first in its meal_types
+        # order on a tie.
+        scores_by_type: dict[str, dict[str, RecipeScore]] = {}
+        types = [meal_type] if meal_type is not None else []
+        if meal_type is None:
+            for meal in candidates:
+                types.extend(t for t in meal.meal_types if t not in types)
+        scoring_index = snapshot.scoring_index
+        ingredient_fits = (
+            scoring_index.ingredient_fit(affinity)
+            if scoring_index is not None
+            and scoring_index.statistics is snapshot.ingredient_statistics
+            else None
+        )
+        for candidate_type in types:
+            typed_meals = [
+                meal for meal in candidates if candidate_type in meal.meal_types
+            ]
+            scores_by_type[candidate_type] = {
+                score.catalog_meal.id: score
+                for score in self._scoring.score_many(
+                    typed_meals,
                     target_calories=self._allocation.target_for(
                         daily_calories, candidate_type
                     ),
                     affinity=affinity,
                     ingredient_statistics=snapshot.ingredient_statistics,
+                    scoring_index=scoring_index,
+                    ingredient_fits=ingredient_fits,
                 )
-                for candidate_type in eligible_types
-                if candidate_type in meal.meal_types
-            ]
-            if meal_scores:
-                scored.append(
-                    sorted(
-                        meal_scores,
-                        key=lambda item: (-item.score, item.catalog_meal.id),
-                    )[0]
-                )
+            }
+
+        scored = []
+        for meal in candidates:
+            eligible_types = (
+                [meal_type] if meal_type is not None else list(meal.meal_types)
+            )
+            best: RecipeScore | None = None
+            for candidate_type in eligible_types:
+                score = scores_by_type.get(candidate_type, {}).get(meal.id)
+                if score is not None and (best is None or score.score > best.score):
+                    best = score
+            if best is not None:
+                scored.append(best)
         ranked_scores = sorted(
             scored, key=lambda item: (-item.score, item.catalog_meal.id)
         )
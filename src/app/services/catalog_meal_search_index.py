@@ -0,0 +1,107 @@
+"""Snapshot-scoped inverted indexes for catalog browse filtering."""
+
+from __future__ import annotations
+
+import unicodedata
+from dataclasses import dataclass
+
+from src.domain.model.meal_recommendation import CatalogMeal
+
+NGRAM_SIZE = 3
+
+
+@dataclass(frozen=True, eq=False)
+class CatalogMealSearchIndex:
+    """Pre-normalized browse fields and posting lists over one snapshot.
+
+    Postings hold positions into ``meals`` so filtered results keep snapshot
+    order. Substring queries intersect the trigram postings of the query and
+    then confirm the match against the pre-normalized strings; queries shorter
+    than a trigram scan those strings directly.
+    """
+
+    meals: tuple[CatalogMeal, ...]
+    normalized_names: tuple[str, ...]
+    normalized_cuisines: tuple[str, ...]
+    name_key_by_meal_id: dict[str, str]
+    browsable: frozenset[int]
+    by_cuisine: dict[str, frozenset[int]]
+    by_meal_type: dict[str, frozenset[int]]
+    by_ngram: dict[str, frozenset[int]]
+
+    @classmethod
+    def build(
+        cls, meals: list[CatalogMeal] | tuple[CatalogMeal, ...]
+    ) -> CatalogMealSearchIndex:
+        meals = tuple(meals)
+        names = tuple(normalize(meal.name) for meal in meals)
+        cuisines = tuple(normalize(meal.cuisine) for meal in meals)
+        by_cuisine: dict[str, set[int]] = {}
+        by_meal_type: dict[str, set[int]] = {}
+        by_ngram: dict[str, set[int]] = {}
+        for position, meal in enumerate(meals):
+            by_cuisine.setdefault(cuisines[position], set()).add(position)
+            for meal_type in meal.meal_types:
+                by_meal_type.setdefault(meal_type, set()).add(position)
+            for gram in _ngrams(names[position]) | _ngrams(cuisines[position]):
+                by_ngram.setdefault(gram, set()).add(position)
+        return cls(
+            meals=meals,
+            normalized_names=names,
+            normalized_cuisines=cuisines,
+            name_key_by_meal_id={
+                meal.id: name for meal, name in zip(meals, names, strict=True)
+            },
+            browsable=frozenset(
+                position for position, meal in enumerate(meals) if meal.calories > 0
+            ),
+            by_cuisine=_freeze(by_cuisine),
+            by_meal_type=_freeze(by_meal_type),
+            by_ngram=_freeze(by_ngram),
+        )
+
+    def filter(
+        self,
+        query: str | None,
+        cuisine: str | None,
+        meal_type: str | None,
+    ) -> list[CatalogMeal]:
+        """Same result and order as a full ``filter_meals`` scan of ``meals``."""
+
+        normalized_query = normalize(query)
+        normalized_cuisine = normalize(cuisine)
+        postings = [self.browsable]
+        if meal_type is not None:
+            postings.append(self.by_meal_type.get(meal_type, frozenset()))
+        if normalized_cuisine:
+            postings.append(self.by_cuisine.get(normalized_cuisine, frozenset()))
+        if len(normalized_query) >= NGRAM_SIZE:
+            postings.extend(
+                self.by_ngram.get(gram, frozenset())
+                for gram in _ngrams(normalized_query)
+            )
+        postings.sort(key=len)
+        positions = postings[0].intersection(*postings[1:])
+        if normalized_query:
+            positions = {
+                position
+                for position in positions
+                if normalized_query in self.normalized_names[position]
+                or normalized_query in self.normalized_cuisines[position]
+            }
+        return [self.meals[position] for position in sorted(positions)]
+
+
+def normalize(value: str | None) -> str:
+    return " ".join(unicodedata.normalize("NFKC", value or "").split()).casefold()
+
+
+def _ngrams(value: str) -> set[str]:
+    return {
+        value[start : start + NGRAM_SIZE]
+        for start in range(len(value) - NGRAM_SIZE + 1)
+    }
+
+
+def _freeze(postings: dict[str, set[int]]) -> dict[str, frozenset[int]]:
+    return {key: frozenset(positions) for key, positions in postings.items()}
@@ -7,6 +7,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from time import monotonic
 
+from src.app.services.catalog_meal_search_index import CatalogMealSearchIndex
 from src.domain.exceptions.meal_recommendation_exceptions import (
     MealRecommendationCatalogUnavailableError,
 )
@@ -16,6 +17,9 @@ from src.domain.services.meal_recommendation.catalog_ingredient_statistics_servi
     CatalogIngredientStatistics,
     CatalogIngredientStatisticsService,
 )
+from src.domain.services.meal_recommendation.catalog_scoring_index import (
+    CatalogScoringIndex,
+)
 from src.observability import distribution_metric, gauge_metric, increment_metric
 
 
@@ -28,6 +32,8 @@ class CatalogMealSnapshot:
     ingredient_statistics: CatalogIngredientStatistics
     refreshed_at: float
     expires_at: float
+    scoring_index: CatalogScoringIndex | None = None
+    search_index: CatalogMealSearchIndex | None = None
 
 
 class CatalogMealSnapshotService:
@@ -89,6 +95,8 @@ class CatalogMealSnapshotService:
                 ingredient_statistics=snapshot.ingredient_statistics,
                 refreshed_at=snapshot.refreshed_at,
                 expires_at=now + self._ttl_seconds,
+                scoring_index=snapshot.scoring_index,
+                search_index=snapshot.search_index,
             )
             self._snapshot = refreshed
             self._record_snapshot_metrics(refreshed, status="unchanged")
@@ -130,12 +138,15 @@ class CatalogMealSnapshotService:
                     loaded_revision = await uow.catalog_recipes.get_active_catalog_revision()
                 if not meals:
                     raise MealRecommendationCatalogUnavailableError
+                statistics = self._statistics_service.build(meals)
                 snapshot = CatalogMealSnapshot(
                     revision=loaded_revision,
                     meals=meals,
-                    ingredient_statistics=self._statistics_service.build(meals),
+                    ingredient_statistics=statistics,
                     refreshed_at=now,
                     expires_at=now + self._ttl_seconds,
+                    scoring_index=CatalogScoringIndex.build(meals, statistics),
+                    search_index=CatalogMealSearchIndex.build(meals),
                 )
                 self._snapshot = snapshot
                 self._next_refresh_after = 0.0
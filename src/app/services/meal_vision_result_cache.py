@@ -0,0 +1,117 @@
+"""Content-addressed cache for meal image vision results.
+
+A scan is identified by the digest of the exact bytes sent to the provider,
+the analysis strategy (including any user description or label crop) and the
+response locale. Concurrent identical scans in this process share one provider
+call. A result is only written to the shared cache once the graph has parsed
+it into usable nutrition, so rejected or partial answers are never replayed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.domain.cache.cache_keys import CacheKeys
+from src.domain.ports.cache_port import CachePort
+from src.observability import increment_metric
+
+logger = logging.getLogger(__name__)
+
+
+class MealVisionResultCache:
+    """Result cache plus in-flight coalescing in front of the vision provider."""
+
+    def __init__(self, cache: CachePort | None, *, store_results: bool = True):
+        self._cache = cache if store_results else None
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def key_for(
+        image_bytes: bytes,
+        *,
+        strategy: str,
+        language: str,
+        context: str | None = None,
+    ) -> tuple[str, int]:
+        digest = hashlib.sha256(image_bytes)
+        if context:
+            digest.update(b"\0")
+            digest.update(context.encode("utf-8"))
+        return CacheKeys.meal_vision_result(digest.hexdigest(), strategy, language)
+
+    async def get_or_analyze(
+        self,
+        key: str,
+        analyze: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> tuple[dict[str, Any], bool]:
+        """Return ``(result, from_provider)`` for ``key``.
+
+        ``from_provider`` is True only for the caller whose ``analyze`` ran;
+        that caller alone stores the result once it is accepted. Cache hits
+        and callers that joined an in-flight provider call, sharing its
+        result or its error, get False.
+        """
+        cached = await self._read(key)
+        if cached is not None:
+            _record_lookup("hit")
+            return cached, False
+
+        loop = asyncio.get_running_loop()
+        future = self._inflight.get(key)
+        if future is not None and future.get_loop() is loop:
+            _record_lookup("coalesced")
+            try:
+                return await asyncio.shield(future), False
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader went away; fall through and call the provider.
+
+        _record_lookup("miss")
+        future = loop.create_future()
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            result = await analyze()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result, True
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def store(self, key: str, ttl_seconds: int, result: dict[str, Any]) -> None:
+        """Persist a parsed-and-accepted vision result; failures are logged."""
+        if self._cache is None:
+            return
+        try:
+            await self._cache.set(key, result, ttl_seconds)
+        except Exception as exc:
+            logger.warning("Meal vision result cache write failed: %s", exc)
+
+    async def _read(self, key: str) -> dict[str, Any] | None:
+        if self._cache is None:
+            return None
+        try:
+            cached = await self._cache.get(key)
+        except Exception as exc:
+            logger.warning("Meal vision result cache read failed: %s", exc)
+            return None
+        return cached if isinstance(cached, dict) else None
+
+
+def _record_lookup(outcome: str) -> None:
+    increment_metric(
+        "meal_analyze.vision_cache.lookup",
+        attributes={"result": outcome},
+    )
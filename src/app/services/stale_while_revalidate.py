@@ -0,0 +1,115 @@
+"""Stale-while-revalidate reads for dashboard read models.
+
+Entries are stored in an envelope carrying a soft expiry. The cache key itself
+lives for ``soft TTL + stale_seconds`` (the hard TTL). Between the two, readers
+get the stale value immediately and one background refresh per key is
+scheduled on the task manager.
+
+This never weakens read-your-own-write: write paths keep purging keys hard
+through ``CacheInvalidationService``, so a purged entry has nothing stale to
+serve. A refresh only replaces an entry that is still present and still stale;
+if a write purged it meanwhile, the refreshed value is dropped rather than
+resurrecting pre-write data. Callers remain responsible for their revision
+fences: a stale entry is only usable when its ``target_revision`` matches.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from src.domain.ports.cache_port import CachePort
+
+logger = logging.getLogger(__name__)
+
+_ENVELOPE_MARKER = "swr"
+
+
+class RefreshTaskScheduler(Protocol):
+    """Background task behavior needed to run refreshes off the request path."""
+
+    def spawn(self, name: str, coro: Coroutine[Any, Any, Any]) -> Any: ...
+
+
+@dataclass(frozen=True)
+class CachedRead:
+    value: Any
+    stale: bool
+
+
+class StaleWhileRevalidate:
+    """Soft/hard TTL reads over a ``CachePort`` with background refresh."""
+
+    def __init__(
+        self,
+        cache: CachePort,
+        task_manager: RefreshTaskScheduler,
+        stale_seconds: int,
+    ):
+        self._cache = cache
+        self._task_manager = task_manager
+        self._stale_seconds = stale_seconds
+        self._refreshing: set[str] = set()
+
+    async def read(self, key: str) -> CachedRead | None:
+        """Return the cached value and whether its soft TTL has passed.
+
+        Plain (pre-envelope) entries are reported stale so the first refresh
+        rewrites them in envelope form.
+        """
+        raw = await self._cache.get(key)
+        if raw is None:
+            return None
+        if isinstance(raw, dict) and raw.get(_ENVELOPE_MARKER) == 1:
+            return CachedRead(
+                value=raw.get("value"),
+                stale=time.time() >= float(raw.get("fresh_until", 0)),
+            )
+        return CachedRead(value=raw, stale=True)
+
+    async def write(self, key: str, value: Any, soft_ttl: int) -> None:
+        await self._cache.set(
+            key,
+            {
+                _ENVELOPE_MARKER: 1,
+                "fresh_until": time.time() + soft_ttl,
+                "value": value,
+            },
+            soft_ttl + self._stale_seconds,
+        )
+
+    def schedule_refresh(
+        self,
+        key: str,
+        soft_ttl: int,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Recompute ``key`` in the background unless a refresh is already running."""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        self._task_manager.spawn(
+            f"cache:swr_refresh:{key}", self._refresh(key, soft_ttl, compute)
+        )
+
+    async def _refresh(
+        self,
+        key: str,
+        soft_ttl: int,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> None:
+        try:
+            value = await compute()
+            current = await self.read(key)
+            if current is None or not current.stale:
+                # Purged by a write (or refreshed elsewhere) while we computed.
+                logger.debug("Dropping stale-while-revalidate refresh for %s", key)
+                return
+            await self.write(key, value, soft_ttl)
+        except Exception as exc:
+            logger.warning("Stale-while-revalidate refresh failed for %s: %s", key, exc)
+        finally:
+            self._refreshing.discard(key)
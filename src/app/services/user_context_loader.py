@@ -0,0 +1,62 @@
+"""Request-scoped loader for the user's timezone, language and target revision.
+
+Dashboard handlers each used to resolve the timezone (``find_by_id`` with its
+eager-loaded profiles, preferences and subscriptions) and re-read the current
+profile for its target revision. The API builds one loader per request and
+passes it on the query; the first handler that needs the context pays one
+column-only query and every later ``load()`` in the request reuses it. Handlers
+that hit their cache first never load it at all.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from src.domain.model.user import UserContext
+from src.domain.utils.timezone_utils import choose_user_timezone
+
+logger = logging.getLogger(__name__)
+
+
+class UserContextLoader:
+    """Load a ``UserContext`` at most once for the lifetime of a request."""
+
+    def __init__(
+        self,
+        user_id: str,
+        uow_factory: Callable[[], Any],
+        header_timezone: str | None = None,
+    ):
+        self.user_id = user_id
+        self.header_timezone = header_timezone
+        self._uow_factory = uow_factory
+        self._loading: asyncio.Future[UserContext] | None = None
+
+    async def load(self) -> UserContext:
+        if self._loading is None:
+            self._loading = asyncio.ensure_future(self._load())
+        return await asyncio.shield(self._loading)
+
+    async def _load(self) -> UserContext:
+        stored: UserContext | None = None
+        try:
+            async with self._uow_factory() as uow:
+                stored = await uow.users.get_user_context(self.user_id)
+        except Exception as exc:
+            # Same degradation as resolve_user_timezone_async: fall back to the
+            # header timezone rather than failing the read.
+            logger.warning("User context lookup failed for %s: %s", self.user_id, exc)
+        if stored is None:
+            return UserContext(
+                user_id=self.user_id,
+                timezone=choose_user_timezone(None, self.header_timezone),
+            )
+        return UserContext(
+            user_id=self.user_id,
+            timezone=choose_user_timezone(stored.timezone, self.header_timezone),
+            language=stored.language,
+            profile_target_revision=stored.profile_target_revision,
+        )
@@ -65,8 +65,9 @@ async def run() -> None:
     now = utc_now()
 
     # Phase 1 — precompute notification rows for each timezone today
-    # DailyContextPrecomputeService.precompute_for_timezone() is idempotent:
-    # it checks an in-memory sentinel (fast) then a DB fallback, so re-running is free.
+    # Timezones run concurrently on a bounded number of sessions. Each shard is
+    # claimed with an advisory lock, so overlapping cron runs split the work,
+    # and the DB sentinel makes re-running an already precomputed shard free.
     try:
         with start_span(
             operation="cron.push.precompute", description="daily context precompute"
@@ -80,10 +81,19 @@ async def run() -> None:
                 tz_rows = tz_result.fetchall()
             timezones = [r.timezone for r in tz_rows]
             precompute = DailyContextPrecomputeService()
-            for tz_name in timezones:
-                local_today = now.astimezone(ZoneInfo(tz_name)).date()
-                await precompute.precompute_for_timezone(tz_name, local_today)
-        log_event("info", "cron.phase.completed", attributes={"phase": "push.precompute", "status": "success"})
+            summary = await precompute.precompute_timezones(
+                (tz_name, now.astimezone(ZoneInfo(tz_name)).date())
+                for tz_name in timezones
+            )
+        log_event(
+            "info",
+            "cron.phase.completed",
+            attributes={
+                "phase": "push.precompute",
+                "status": "success",
+                **summary.as_attributes(),
+            },
+        )
     except Exception as exc:
         logger.exception("Phase 1 (precompute) failed")
         capture_exception(
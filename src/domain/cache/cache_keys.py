@@ -18,6 +18,15 @@ class CacheKeys:
     # result contains (e.g. adding food_reference_id to provider hits), so
     # stale pre-adoption entries expire instead of serving thin ids forever.
     CATALOG_ADOPT_CACHE_VERSION = "catalog_adopt_v1"
+    # Bumped when vision prompts or the parsed response shape change, so
+    # cached provider answers from the previous prompt are not replayed.
+    MEAL_VISION_RESULT_CACHE_VERSION = "meal_vision_v1"
+    # Bumped when the stored segment value changes shape. Prompt and model
+    # changes already move keys through the prompt version in the segment key.
+    TRANSLATION_MEMORY_CACHE_VERSION = "translation_memory_v1"
+    # Bumped when the stored recipe response shape changes. Recipe prompt and
+    # system prompt changes already move keys through the prompt fingerprint.
+    MEAL_SUGGESTION_RECIPE_CACHE_VERSION = "suggestion_recipe_v1"
 
     TTL_10_MIN = 600
     TTL_5_MIN = 300
@@ -27,6 +36,32 @@ class CacheKeys:
     TTL_7_DAYS = 604_800
     TTL_30_DAYS = 2_592_000
 
+    # User-scoped key families that support generation-tagged invalidation.
+    # The family is the third ':'-separated segment of ``user:{id}:{family}:...``.
+    TAGGED_USER_FAMILIES = frozenset(
+        {
+            "activities",
+            "hydration",
+            "hydration_weekly",
+            "macros",
+            "nutrition_bulk",
+            "weekly_budget_v4",
+        }
+    )
+    # Must outlive every tagged family TTL, otherwise an expired counter could
+    # restart at a generation whose entries are still live.
+    TTL_GENERATION = TTL_7_DAYS
+
+    # Key prefix -> (max entries, TTL seconds) for the optional in-process L1
+    # tier. Only hot, almost-static families belong here: the TTL is the worst
+    # stale window on a worker that missed a pub/sub invalidation message.
+    LOCAL_TIER_FAMILIES: dict[str, tuple[int, int]] = {
+        "user:profile:": (5_000, 30),
+        "user:tdee_v2:": (5_000, 30),
+        "food:details:": (2_000, 300),
+        "food:search:": (2_000, 120),
+    }
+
     @staticmethod
     def user_profile(user_id: str) -> tuple[str, int]:
         return (f"user:profile:{user_id}", CacheKeys.TTL_30_DAYS)
@@ -123,6 +158,40 @@ class CacheKeys:
     def food_details(food_id: str) -> tuple[str, int]:
         return (f"food:details:{food_id}", CacheKeys.TTL_7_DAYS)
 
+    @staticmethod
+    def meal_vision_result(
+        image_digest: str, strategy: str, language: str
+    ) -> tuple[str, int]:
+        return (
+            f"meal:vision:{CacheKeys.MEAL_VISION_RESULT_CACHE_VERSION}:"
+            f"{strategy}:{language}:{image_digest}",
+            CacheKeys.TTL_1_DAY,
+        )
+
+    @staticmethod
+    def translation_memory(segment_key: str) -> tuple[str, int]:
+        return (
+            f"translation:memory:{CacheKeys.TRANSLATION_MEMORY_CACHE_VERSION}:"
+            f"{segment_key}",
+            CacheKeys.TTL_30_DAYS,
+        )
+
+    @staticmethod
+    def meal_suggestion_recipe(fingerprint: str) -> tuple[str, int]:
+        return (
+            f"meal_suggestion:recipe:"
+            f"{CacheKeys.MEAL_SUGGESTION_RECIPE_CACHE_VERSION}:{fingerprint}",
+            CacheKeys.TTL_30_DAYS,
+        )
+
+    @staticmethod
+    def fatsecret_token(client_hash: str) -> tuple[str, int]:
+        """Shared FatSecret OAuth token per client; the TTL is an upper bound.
+
+        Writers also cap the TTL at the token's own remaining lifetime.
+        """
+        return (f"provider:fatsecret:token:{client_hash}", CacheKeys.TTL_1_DAY)
+
     @staticmethod
     def feature_flag(flag_name: str) -> tuple[str, int]:
         return (f"feature:flag:{flag_name}", CacheKeys.TTL_10_MIN)
@@ -182,3 +251,33 @@ class CacheKeys:
     @staticmethod
     def pattern_for_user(user_id: str) -> str:
         return f"user:{user_id}:*"
+
+    @staticmethod
+    def user_generation(user_id: str, family: str) -> tuple[str, int]:
+        """Generation counter for one user key family.
+
+        Lives outside the ``user:{id}:`` prefix so a user-wide SCAN delete can
+        never reset the counter and resurrect entries of an older generation.
+        """
+        return (f"gen:user:{user_id}:{family}", CacheKeys.TTL_GENERATION)
+
+    @staticmethod
+    def tagged_family(key_or_pattern: str) -> tuple[str, str] | None:
+        """Return ``(user_id, family)`` when the key belongs to a tagged family."""
+        parts = key_or_pattern.split(":", 3)
+        if len(parts) < 4 or parts[0] != "user":
+            return None
+        user_id, family = parts[1], parts[2]
+        if "*" in user_id or family not in CacheKeys.TAGGED_USER_FAMILIES:
+            return None
+        return (user_id, family)
+
+    @staticmethod
+    def fill_lock(key: str) -> str:
+        """Short-lived lock that marks one process as filling a cache key."""
+        return f"lock:fill:{key}"
+
+    @staticmethod
+    def with_generation(key: str, generation: int) -> str:
+        """Fold a namespace generation into a physical cache key."""
+        return f"{key}:g{generation}"
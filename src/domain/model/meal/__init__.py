@@ -2,11 +2,13 @@
 Meal bounded context - Domain models for meals and ingredients.
 """
 
+from .daily_nutrition_rollup import DailyNutritionRollup
 from .ingredient import Ingredient
 from .meal import Meal, MealStatus
 from .meal_image import MealImage
 from .meal_response_localization import MealResponseLocalization
 from .meal_translation_domain_models import FoodItemTranslation, MealTranslation
+from .streak_summary import StreakSummary
 
 __all__ = [
     "Meal",
@@ -16,4 +18,6 @@ __all__ = [
     "Ingredient",
     "MealTranslation",
     "FoodItemTranslation",
+    "StreakSummary",
+    "DailyNutritionRollup",
 ]
@@ -0,0 +1,208 @@
+"""Persisted per-user, per-local-day nutrition totals."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from src.domain.model.meal.meal import MealStatus
+from src.domain.model.meal_projection import MealMacroRow
+from src.domain.model.nutrition.macros import Macros
+from src.domain.utils.timezone_utils import ensure_utc, get_zone_info
+
+_INTAKE_STATUSES = (MealStatus.READY, MealStatus.ENRICHING)
+
+
+@dataclass(frozen=True)
+class DailyNutritionRollup:
+    """One local day of a user's logged nutrition, summed once at write time.
+
+    Two calorie/macro sets are kept because the dashboard and the weekly
+    budget count different meals:
+
+    - ``calories``..``fiber``: READY and ENRICHING meals plus standalone
+      hydration entries (the daily dashboard totals).
+    - ``ready_*``: READY meals only (weekly budget consumption).
+
+    ``meal_count`` counts active meals and ``hydration_entry_count`` the
+    hydration entries not already mirrored by a legacy hydration meal.
+    ``hydration_ml`` is the credited entry volume, falling back to legacy
+    hydration meals for days logged before hydration entries existed.
+    Dates are local to ``timezone``.
+    """
+
+    user_id: str
+    local_date: date
+    timezone: str
+    meal_count: int = 0
+    hydration_entry_count: int = 0
+    calories: float = 0.0
+    protein: float = 0.0
+    carbs: float = 0.0
+    fat: float = 0.0
+    fiber: float = 0.0
+    ready_calories: float = 0.0
+    ready_protein: float = 0.0
+    ready_carbs: float = 0.0
+    ready_fat: float = 0.0
+    hydration_ml: int = 0
+    movement_kcal: float = 0.0
+
+    @property
+    def entry_count(self) -> int:
+        return self.meal_count + self.hydration_entry_count
+
+    @property
+    def net_calories(self) -> float:
+        return self.calories - self.movement_kcal
+
+    @classmethod
+    def from_day(
+        cls,
+        user_id: str,
+        local_date: date,
+        timezone: str,
+        *,
+        meals: Iterable[Any] = (),
+        hydration_entries: Iterable[Any] = (),
+        movement_kcal: float = 0.0,
+    ) -> DailyNutritionRollup:
+        """Sum one day's active meals, hydration entries and movement.
+
+        ``meals`` may be domain meals or ``MealMacroRow`` projections.
+        """
+        from src.domain.services.meal_calorie_service import effective_meal_calories
+
+        totals = dict.fromkeys(
+            (
+                "calories",
+                "protein",
+                "carbs",
+                "fat",
+                "fiber",
+                "ready_calories",
+                "ready_protein",
+                "ready_carbs",
+                "ready_fat",
+            ),
+            0.0,
+        )
+        meal_ids = set()
+        meal_count = 0
+        legacy_hydration_ml = 0
+        for meal in meals:
+            if meal.status == MealStatus.INACTIVE:
+                continue
+            meal_ids.add(meal.meal_id)
+            meal_count += 1
+            if meal.meal_type == "hydration":
+                legacy_hydration_ml += meal.quantity or 0
+            if meal.status not in _INTAKE_STATUSES:
+                continue
+            if isinstance(meal, MealMacroRow):
+                macros, calories = meal.macros, meal.calories
+            elif meal.nutrition and meal.nutrition.macros:
+                macros = meal.nutrition.macros
+                calories = effective_meal_calories(meal)
+            else:
+                continue
+            if macros is None:
+                continue
+            totals["calories"] += calories
+            totals["protein"] += macros.protein or 0
+            totals["carbs"] += macros.carbs or 0
+            totals["fat"] += macros.fat or 0
+            totals["fiber"] += macros.fiber or 0
+            if meal.status == MealStatus.READY:
+                totals["ready_calories"] += calories
+                totals["ready_protein"] += macros.protein or 0
+                totals["ready_carbs"] += macros.carbs or 0
+                totals["ready_fat"] += macros.fat or 0
+
+        hydration_entry_count = 0
+        hydration_ml = 0
+        for entry in hydration_entries:
+            hydration_ml += entry.credited_ml or 0
+            if entry.legacy_meal_id and entry.legacy_meal_id in meal_ids:
+                continue
+            hydration_entry_count += 1
+            totals["protein"] += entry.protein_g or 0
+            totals["carbs"] += entry.carbs_g or 0
+            totals["fat"] += entry.fat_g or 0
+            totals["fiber"] += entry.fiber_g or 0
+            totals["calories"] += Macros(
+                protein=entry.protein_g or 0,
+                carbs=entry.carbs_g or 0,
+                fat=entry.fat_g or 0,
+                fiber=entry.fiber_g or 0,
+            ).total_calories
+
+        return cls(
+            user_id=user_id,
+            local_date=local_date,
+            timezone=timezone,
+            meal_count=meal_count,
+            hydration_entry_count=hydration_entry_count,
+            hydration_ml=hydration_ml or legacy_hydration_ml,
+            movement_kcal=movement_kcal,
+            **totals,
+        )
+
+    @classmethod
+    def build_range(
+        cls,
+        user_id: str,
+        timezone: str,
+        start_date: date,
+        end_date: date,
+        *,
+        meals: Iterable[Any] = (),
+        hydration_entries: Iterable[Any] = (),
+        movements: Iterable[tuple[datetime, float]] = (),
+    ) -> dict[date, DailyNutritionRollup]:
+        """One rollup per local day in ``[start_date, end_date]``, empty days included.
+
+        Rows outside the range are ignored; ``movements`` holds
+        ``(logged_at, kcal)`` pairs for entries included in the balance.
+        """
+        tz = get_zone_info(timezone)
+        meals_by_day: dict[date, list] = {}
+        for meal in meals:
+            if meal.created_at:
+                day = ensure_utc(meal.created_at).astimezone(tz).date()
+                meals_by_day.setdefault(day, []).append(meal)
+        entries_by_day: dict[date, list] = {}
+        for entry in hydration_entries:
+            if entry.logged_at:
+                day = ensure_utc(entry.logged_at).astimezone(tz).date()
+                entries_by_day.setdefault(day, []).append(entry)
+        movement_by_day: dict[date, float] = {}
+        for logged_at, kcal in movements:
+            day = ensure_utc(logged_at).astimezone(tz).date()
+            movement_by_day[day] = movement_by_day.get(day, 0.0) + kcal
+
+        rollups: dict[date, DailyNutritionRollup] = {}
+        day = start_date
+        while day <= end_date:
+            rollups[day] = cls.from_day(
+                user_id,
+                day,
+                timezone,
+                meals=meals_by_day.get(day, ()),
+                hydration_entries=entries_by_day.get(day, ()),
+                movement_kcal=movement_by_day.get(day, 0.0),
+            )
+            day += timedelta(days=1)
+        return rollups
+
+
+def local_day_bounds_utc(
+    start_date: date, end_date: date, timezone: str
+) -> tuple[datetime, datetime]:
+    """UTC instants bounding local days ``[start_date, end_date]``."""
+    tz = get_zone_info(timezone)
+    start = datetime.combine(start_date, datetime.min.time(), tzinfo=tz)
+    end = datetime.combine(end_date + timedelta(days=1), datetime.min.time(), tzinfo=tz)
+    return start.astimezone(UTC), end.astimezone(UTC)
@@ -0,0 +1,184 @@
+"""Persisted per-user logging streak summary."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+
+_ONE_DAY = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class StreakSummary:
+    """Streak facts kept up to date by meal writes instead of history scans.
+
+    Dates are local to ``timezone``. The current run is the latest run of
+    logged days, ``[current_run_start, last_logged_date]``; it only counts as a
+    live streak while ``last_logged_date`` is today or yesterday. Older runs are
+    not stored; ``best_run_length``/``best_run_end`` remember the longest one
+    (the most recent on ties).
+    """
+
+    user_id: str
+    timezone: str
+    last_logged_date: date | None = None
+    current_run_start: date | None = None
+    best_run_length: int = 0
+    best_run_end: date | None = None
+    scan_count: int = 0
+
+    @classmethod
+    def from_logged_dates(
+        cls,
+        user_id: str,
+        timezone: str,
+        dates: Iterable[date],
+        scan_count: int = 0,
+    ) -> StreakSummary:
+        """Full rebuild from every distinct logged date."""
+        summary = cls(user_id=user_id, timezone=timezone, scan_count=scan_count)
+        run_start: date | None = None
+        previous: date | None = None
+        for day in sorted(set(dates)):
+            if previous is None or day != previous + _ONE_DAY:
+                if previous is not None:
+                    summary = summary._with_run_length(run_start, previous)
+                run_start = day
+            previous = day
+        if previous is None:
+            return summary
+        summary = summary._with_run_length(run_start, previous)
+        return replace(summary, last_logged_date=previous, current_run_start=run_start)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def current_streak(self, today: date) -> int | None:
+        """Days in the live streak, or None when a meal is dated after today.
+
+        A streak is not broken until the day ends, so a run ending yesterday
+        still counts. Future-dated meals hide the run that ends today; callers
+        fall back to scanning a bounded window in that case.
+        """
+        if self.last_logged_date is None:
+            return 0
+        if self.last_logged_date > today:
+            return None
+        if self.last_logged_date < today - _ONE_DAY:
+            return 0
+        return (self.last_logged_date - self.current_run_start).days + 1
+
+    def to_response(self, current_streak: int) -> dict:
+        return {
+            "current_streak": current_streak,
+            "best_streak": self.best_run_length,
+            "last_logged_date": (
+                self.last_logged_date.isoformat() if self.last_logged_date else None
+            ),
+            "scan_count": self.scan_count,
+        }
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    def scan_window_for_added_day(self, day: date) -> tuple[date, date] | None:
+        """Dates to load before ``with_added_day`` for a backdated day.
+
+        A day logged before the current run can join older runs on either
+        side. Those runs are no longer than the best run, so a window of
+        ``best_run_length + 1`` days each way is enough to see both ends.
+        """
+        if self.current_run_start is None or day >= self.current_run_start:
+            return None
+        span = timedelta(days=self.best_run_length + 1)
+        return day - span, day + span
+
+    def with_added_day(
+        self, day: date, nearby_dates: Iterable[date] = ()
+    ) -> StreakSummary:
+        """Account for a newly logged ``day``.
+
+        ``nearby_dates`` are the logged dates in ``scan_window_for_added_day``
+        and are only needed when that window is not None.
+        """
+        if self.last_logged_date is None:
+            return self._with_current_run(day, day)
+        if self.current_run_start <= day <= self.last_logged_date:
+            return self
+        if day == self.last_logged_date + _ONE_DAY:
+            return self._with_current_run(self.current_run_start, day)
+        if day > self.last_logged_date:
+            return self._with_current_run(day, day)
+
+        logged = set(nearby_dates)
+        logged.add(day)
+        start = end = day
+        while start - _ONE_DAY in logged:
+            start -= _ONE_DAY
+        while end + _ONE_DAY in logged and end + _ONE_DAY < self.current_run_start:
+            end += _ONE_DAY
+        if end + _ONE_DAY == self.current_run_start:
+            return self._with_current_run(start, self.last_logged_date)
+        return self._with_run_length(start, end)
+
+    def is_in_best_run(self, day: date) -> bool:
+        if self.best_run_end is None:
+            return False
+        best_start = self.best_run_end - timedelta(days=self.best_run_length - 1)
+        return best_start <= day <= self.best_run_end
+
+    def empties_current_run(self, day: date) -> bool:
+        """True when removing ``day`` leaves no day in the current run."""
+        return day == self.last_logged_date == self.current_run_start
+
+    def with_removed_day(
+        self, day: date, previous_run_dates: Iterable[date] = ()
+    ) -> StreakSummary | None:
+        """Account for ``day`` no longer having any logged meal.
+
+        Returns None when the best run was broken: older runs are not stored,
+        so the new best can only come from a full rebuild. When
+        ``empties_current_run(day)`` is true, ``previous_run_dates`` must hold
+        the logged dates of the run before it (at most ``best_run_length``
+        days ending at the latest earlier logged date).
+        """
+        if self.last_logged_date is None or day > self.last_logged_date:
+            return self
+        if self.is_in_best_run(day):
+            return None
+        if day < self.current_run_start:
+            return self
+        if day < self.last_logged_date:
+            return replace(self, current_run_start=day + _ONE_DAY)
+        if day > self.current_run_start:
+            return replace(self, last_logged_date=day - _ONE_DAY)
+
+        earlier = set(previous_run_dates)
+        if not earlier:
+            return replace(self, last_logged_date=None, current_run_start=None)
+        end = start = max(earlier)
+        while start - _ONE_DAY in earlier:
+            start -= _ONE_DAY
+        return replace(self, last_logged_date=end, current_run_start=start)
+
+    def with_scan_count_delta(self, delta: int) -> StreakSummary:
+        return replace(self, scan_count=max(0, self.scan_count + delta))
+
+    def _with_current_run(self, start: date, end: date) -> StreakSummary:
+        return replace(
+            self._with_run_length(start, end),
+            last_logged_date=end,
+            current_run_start=start,
+        )
+
+    def _with_run_length(self, start: date, end: date) -> StreakSummary:
+        length = (end - start).days + 1
+        if length > self.best_run_length or (
+            length == self.best_run_length
+            and (self.best_run_end is None or end > self.best_run_end)
+        ):
+            return replace(self, best_run_length=length, best_run_end=end)
+        return self
@@ -3,12 +3,59 @@
 Controls which related data a meal query eagerly loads. Lives in the domain layer
 so application handlers can request a projection without importing infrastructure
 (the SQLAlchemy load options for each projection stay in the repositories).
+Aggregate reads that skip hydration entirely return the row tuples below.
 """
 
+from datetime import date, datetime
 from enum import Enum, auto
+from typing import NamedTuple
+
+from src.domain.model.meal.meal import MealStatus
+from src.domain.model.nutrition.macros import Macros
 
 
 class MealProjection(Enum):
     MACROS_ONLY = auto()  # nutrition + food_items only
     FULL = auto()  # image + nutrition + food_items (default)
     FULL_WITH_TRANSLATIONS = auto()  # everything, including translations
+
+
+class MealMacroRow(NamedTuple):
+    """One meal's list-row columns and macros, read without ORM hydration.
+
+    ``calories`` is already the effective value (overrides and label scans
+    applied); ``has_nutrition`` is False for meals still being analyzed.
+    """
+
+    meal_id: str
+    created_at: datetime
+    status: MealStatus
+    meal_type: str | None
+    quantity: int | None
+    has_nutrition: bool
+    calories: float
+    protein: float
+    carbs: float
+    fat: float
+    fiber: float
+
+    @property
+    def macros(self) -> Macros | None:
+        if not self.has_nutrition:
+            return None
+        return Macros(
+            protein=self.protein, carbs=self.carbs, fat=self.fat, fiber=self.fiber
+        )
+
+
+class DailyMacroTotals(NamedTuple):
+    """Active meals of one status on one local date, summed in SQL."""
+
+    local_date: date
+    status: MealStatus
+    meal_count: int
+    calories: float
+    protein: float
+    carbs: float
+    fat: float
+    fiber: float
@@ -14,6 +14,7 @@ from .tdee import (
     TrainingLevel,
     UnitSystem,
 )
+from .user_context import UserContext
 from .user_macros import UserMacros
 
 # Alias for backward compatibility if needed, but explicit is better
@@ -34,6 +35,7 @@ __all__ = [
     "UnitSystem",
     "MacroTargets",
     "UserMacros",
+    "UserContext",
     "UserDomainModel",
     "UserProfileDomainModel",
 ]
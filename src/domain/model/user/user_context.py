@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class UserContext:
+    """Per-request user facts most read handlers need before touching data.
+
+    ``timezone`` is the resolved timezone (stored value, X-Timezone fallback,
+    then UTC). ``profile_target_revision`` is None when the user has no
+    current profile.
+    """
+
+    user_id: str
+    timezone: str = "UTC"
+    language: str = "en"
+    profile_target_revision: int | None = None
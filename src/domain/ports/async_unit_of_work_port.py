@@ -38,12 +38,15 @@ class AsyncUnitOfWorkPort(ABC):
 
     weekly_budgets: Any
     cheat_days: Any
+    streak_summaries: Any
     hydration_entries: Any
     weight_entries: Any
     movement_entries: Any
+    daily_nutrition_rollups: Any
     food_references: Any
     catalog_recipes: Any
     meal_translations: Any
+    translation_memory: Any
     promo_codes: Any
     referrals: Any
     meal_write_operations: Any
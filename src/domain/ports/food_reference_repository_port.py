@@ -56,6 +56,22 @@ class FoodReferenceSearchProjection:
     name_vi: str | None = None
 
 
+@dataclass(frozen=True)
+class ProviderFoodAdoption:
+    """One provider hit to adopt into the catalog by source identity."""
+
+    namespace: str
+    food_id: str
+    english_name: str
+    per_100g: dict[str, Any]
+    servings: list[dict[str, Any]] | None = None
+    locale_name: str = ""
+
+    @property
+    def identity(self) -> tuple[str, str]:
+        return self.namespace, self.food_id
+
+
 class FoodReferenceRepositoryPort(Protocol):
     """Repository contract for typed canonical food-reference projections."""
 
@@ -117,6 +133,13 @@ class FoodReferenceRepositoryPort(Protocol):
     ) -> dict[str, Any]:
         """Adopt one identity-scoped provider food and persist ``name_vi``."""
 
+    async def adopt_provider_foods(
+        self,
+        adoptions: list[ProviderFoodAdoption],
+        locale: str,
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """Adopt a batch of provider foods; results are keyed by identity."""
+
     async def find_by_locale_names(
         self,
         language: str,
@@ -3,6 +3,7 @@ from datetime import date, datetime
 from typing import Any
 
 from src.domain.model.meal import Meal, MealStatus
+from src.domain.model.meal_projection import DailyMacroTotals, MealMacroRow
 from src.domain.services.meal_recommendation.ingredient_affinity_service import (
     IngredientHistoryBucket,
 )
@@ -113,6 +114,28 @@ class MealRepositoryPort(ABC):
         """Find meals created within a local date range, inclusive."""
         return []
 
+    async def sum_macros_by_local_date(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+        user_timezone: str | None = None,
+        exclude_dates: set[date] | None = None,
+    ) -> list[DailyMacroTotals]:
+        """Return active-meal totals per (local date, status) in the range."""
+        return []
+
+    async def find_macro_rows_by_date_range(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+        limit: int = 500,
+        user_timezone: str | None = None,
+    ) -> list[MealMacroRow]:
+        """Return active meals in a local date range as flat macro rows."""
+        return []
+
     async def aggregate_linked_ingredient_history(
         self,
         *,
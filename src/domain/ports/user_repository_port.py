@@ -6,7 +6,11 @@ separation between the domain and infrastructure layers.
 from abc import ABC, abstractmethod
 from uuid import UUID
 
-from src.domain.model.user import UserDomainModel, UserProfileDomainModel
+from src.domain.model.user import (
+    UserContext,
+    UserDomainModel,
+    UserProfileDomainModel,
+)
 
 
 class UserRepositoryPort(ABC):
@@ -59,6 +63,11 @@ class UserRepositoryPort(ABC):
         """Get user profile by user ID."""
         pass
 
+    @abstractmethod
+    async def get_user_context(self, user_id: UUID) -> UserContext | None:
+        """Get stored timezone, language and current target revision in one read."""
+        pass
+
     @abstractmethod
     async def update_profile(
         self, profile: UserProfileDomainModel
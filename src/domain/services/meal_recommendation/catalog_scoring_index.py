@@ -0,0 +1,148 @@
+"""Snapshot-scoped sparse meal x ingredient matrix for vectorized scoring."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import sqrt
+
+import numpy as np
+
+from src.domain.model.meal_recommendation import CatalogMeal
+from src.domain.services.meal_recommendation.catalog_ingredient_statistics_service import (
+    CatalogIngredientStatistics,
+)
+from src.domain.services.meal_recommendation.ingredient_affinity_service import (
+    IngredientAffinityProfile,
+)
+
+
+@dataclass(frozen=True, eq=False)
+class CatalogScoringIndex:
+    """IDF-weighted CSR matrix over one catalog snapshot's meals.
+
+    Row ``i`` is ``meals[i]``. Its entries are the IDF of each distinct linked
+    ingredient, so one mat-vec against the user's ``weight * idf`` vector gives
+    every meal's cosine numerator. Meal norms are accumulated in the same
+    order as ``recipe_scoring_service._ingredient_cosine`` so the vectorized
+    and per-meal paths round to the same scores.
+
+    ``canonical_ids_by_row`` keeps each meal's linked ingredient set for
+    diversity reranking; the sets are shared and must not be mutated.
+    """
+
+    meals: tuple[CatalogMeal, ...]
+    statistics: CatalogIngredientStatistics
+    row_by_meal_id: dict[str, int]
+    column_by_food_reference_id: dict[int, int]
+    indptr: np.ndarray
+    indices: np.ndarray
+    entry_rows: np.ndarray
+    data: np.ndarray
+    meal_norms: np.ndarray
+    calories: np.ndarray
+    canonical_ids_by_row: tuple[set[int], ...]
+
+    @classmethod
+    def build(
+        cls,
+        meals: list[CatalogMeal] | tuple[CatalogMeal, ...],
+        statistics: CatalogIngredientStatistics,
+    ) -> CatalogScoringIndex:
+        meals = tuple(meals)
+        columns: dict[int, int] = {}
+        indptr = [0]
+        indices: list[int] = []
+        data: list[float] = []
+        meal_norms: list[float] = []
+        canonical_ids: list[set[int]] = []
+        for meal in meals:
+            meal_ids = {
+                ingredient.food_reference_id
+                for ingredient in meal.ingredients
+                if ingredient.food_reference_id > 0
+            }
+            canonical_ids.append(meal_ids)
+            meal_norm = 0.0
+            for food_reference_id in meal_ids:
+                idf = statistics.idf(food_reference_id)
+                meal_norm += idf * idf
+                column = columns.setdefault(food_reference_id, len(columns))
+                indices.append(column)
+                data.append(idf)
+            indptr.append(len(indices))
+            meal_norms.append(sqrt(meal_norm))
+        indptr_array = np.asarray(indptr, dtype=np.int64)
+        return cls(
+            meals=meals,
+            statistics=statistics,
+            row_by_meal_id={meal.id: row for row, meal in enumerate(meals)},
+            column_by_food_reference_id=columns,
+            indptr=indptr_array,
+            indices=np.asarray(indices, dtype=np.int64),
+            entry_rows=np.repeat(
+                np.arange(len(meals), dtype=np.int64), np.diff(indptr_array)
+            ),
+            data=np.asarray(data, dtype=np.float64),
+            meal_norms=np.asarray(meal_norms, dtype=np.float64),
+            calories=np.asarray([meal.calories for meal in meals], dtype=np.float64),
+            canonical_ids_by_row=tuple(canonical_ids),
+        )
+
+    def rows_for(
+        self, catalog_meals: list[CatalogMeal] | tuple[CatalogMeal, ...]
+    ) -> np.ndarray | None:
+        """Return row numbers for ``catalog_meals``, or None if any is not indexed."""
+        rows = []
+        for meal in catalog_meals:
+            row = self.row_by_meal_id.get(meal.id)
+            if row is None or self.meals[row] is not meal:
+                return None
+            rows.append(row)
+        return np.asarray(rows, dtype=np.int64)
+
+    def canonical_ids(self, catalog_meal: CatalogMeal) -> set[int] | None:
+        """Linked ingredient ids of an indexed meal, or None if not indexed."""
+        row = self.row_by_meal_id.get(catalog_meal.id)
+        if row is None or self.meals[row] is not catalog_meal:
+            return None
+        return self.canonical_ids_by_row[row]
+
+    def ingredient_fit(self, affinity: IngredientAffinityProfile) -> np.ndarray:
+        """Bounded IDF cosine between ``affinity`` and every indexed meal."""
+        fits = np.zeros(len(self.meals), dtype=np.float64)
+        if not affinity.weights or not len(self.data):
+            return fits
+        columns = len(self.column_by_food_reference_id)
+        query = np.zeros(columns, dtype=np.float64)
+        # Position of each column in affinity order; the per-meal path sums
+        # the dot product in that order, so matched entries are summed in it
+        # too and the results agree bit for bit.
+        query_order = np.full(columns, columns, dtype=np.int64)
+        user_norm = 0.0
+        for position, (food_reference_id, history_weight) in enumerate(
+            affinity.weights.items()
+        ):
+            component = history_weight * self.statistics.idf(food_reference_id)
+            user_norm += component * component
+            column = self.column_by_food_reference_id.get(food_reference_id)
+            if column is not None:
+                query[column] = component
+                query_order[column] = position
+        if user_norm <= 0:
+            return fits
+
+        matched = np.flatnonzero(query_order[self.indices] < columns)
+        matched = matched[
+            np.lexsort((query_order[self.indices[matched]], self.entry_rows[matched]))
+        ]
+        dot = np.bincount(
+            self.entry_rows[matched],
+            weights=query[self.indices[matched]] * self.data[matched],
+            minlength=len(self.meals),
+        )
+        scored = self.meal_norms > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = dot[scored] / (sqrt(user_norm) * self.meal_norms[scored])
+        values[~np.isfinite(values)] = 0.0
+        fits[scored] = np.clip(values, 0.0, 1.0)
+        return fits
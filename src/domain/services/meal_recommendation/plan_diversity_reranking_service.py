@@ -9,11 +9,55 @@ from src.domain.model.meal_recommendation import CatalogMeal
 from src.domain.services.meal_recommendation.catalog_ingredient_statistics_service import (
     CatalogIngredientStatistics,
 )
+from src.domain.services.meal_recommendation.catalog_scoring_index import (
+    CatalogScoringIndex,
+)
 from src.domain.services.meal_recommendation.recipe_scoring_service import RecipeScore
 
 SHORTLIST_LIMIT = 30
 
 
+class DiversityOverlapCache:
+    """Memoized ingredient sets and pairwise overlaps for one ranking pass.
+
+    Ingredient sets come from the snapshot's scoring index when the meal is
+    indexed. Overlaps are keyed by ``(candidate id, comparison id)`` in that
+    order, matching the argument order ``diversity_fit`` uses.
+    """
+
+    def __init__(
+        self,
+        ingredient_statistics: CatalogIngredientStatistics,
+        scoring_index: CatalogScoringIndex | None = None,
+    ) -> None:
+        self.ingredient_statistics = ingredient_statistics
+        self._scoring_index = scoring_index
+        self._ids: dict[str, set[int]] = {}
+        self._overlaps: dict[tuple[str, str], float] = {}
+
+    def canonical_ids(self, catalog_meal: CatalogMeal) -> set[int]:
+        ids = self._ids.get(catalog_meal.id)
+        if ids is None:
+            if self._scoring_index is not None:
+                ids = self._scoring_index.canonical_ids(catalog_meal)
+            if ids is None:
+                ids = _canonical_ids(catalog_meal)
+            self._ids[catalog_meal.id] = ids
+        return ids
+
+    def overlap(self, candidate: CatalogMeal, comparison: CatalogMeal) -> float:
+        key = (candidate.id, comparison.id)
+        value = self._overlaps.get(key)
+        if value is None:
+            value = _weighted_overlap(
+                self.canonical_ids(candidate),
+                self.canonical_ids(comparison),
+                self.ingredient_statistics,
+            )
+            self._overlaps[key] = value
+        return value
+
+
 class PlanDiversityRerankingService:
     """Apply deterministic diversity scoring to a fixed shortlist."""
 
@@ -32,18 +76,9 @@ class PlanDiversityRerankingService:
         right: CatalogMeal,
         ingredient_statistics: CatalogIngredientStatistics,
     ) -> float:
-        left_ids = _canonical_ids(left)
-        right_ids = _canonical_ids(right)
-        union = left_ids | right_ids
-        if not union:
-            return 0.0
-        union_weight = sum(ingredient_statistics.idf(food_id) for food_id in union)
-        if union_weight <= 0:
-            return 0.0
-        intersection_weight = sum(
-            ingredient_statistics.idf(food_id) for food_id in left_ids & right_ids
+        return _weighted_overlap(
+            _canonical_ids(left), _canonical_ids(right), ingredient_statistics
         )
-        return max(0.0, min(1.0, intersection_weight / union_weight))
 
     def diversity_fit(
         self,
@@ -65,14 +100,28 @@ class PlanDiversityRerankingService:
         *,
         comparison_meals: tuple[CatalogMeal, ...],
         ingredient_statistics: CatalogIngredientStatistics,
+        overlaps: DiversityOverlapCache | None = None,
     ) -> list[RecipeScore]:
+        if not self._uses_cached_overlaps(overlaps, ingredient_statistics):
+            overlaps = None
         contextual = []
         for item in ranked_pool[:SHORTLIST_LIMIT]:
-            diversity_fit = self._diversity_fit(
-                item.catalog_meal,
-                comparison_meals,
-                ingredient_statistics,
-            )
+            if overlaps is None:
+                diversity_fit = self._diversity_fit(
+                    item.catalog_meal,
+                    comparison_meals,
+                    ingredient_statistics,
+                )
+            else:
+                diversity_fit = _fit_from_overlap(
+                    max(
+                        (
+                            overlaps.overlap(item.catalog_meal, meal)
+                            for meal in comparison_meals
+                        ),
+                        default=None,
+                    )
+                )
             contextual.append(
                 replace(
                     item,
@@ -80,7 +129,119 @@ class PlanDiversityRerankingService:
                     score=item.contextual_score(diversity_fit=diversity_fit),
                 )
             )
-        return sorted(contextual, key=lambda item: (-item.score, item.catalog_meal.id))
+        return sorted(contextual, key=_rank_key)
+
+    def select_shortlist(
+        self,
+        ranked_pool: list[RecipeScore],
+        *,
+        ingredient_statistics: CatalogIngredientStatistics,
+        limit: int = SHORTLIST_LIMIT,
+        overlaps: DiversityOverlapCache | None = None,
+    ) -> tuple[list[RecipeScore], list[RecipeScore]]:
+        """Greedily pick up to ``limit`` items, each diversified against earlier picks.
+
+        Returns the reranked picks and the untouched rest of ``ranked_pool`` in
+        order. The result equals calling ``rerank_shortlist`` on what remains
+        once per pick, but each candidate keeps a running maximum overlap and
+        only catches up on picks made since it was last in the shortlist.
+        """
+        if overlaps is None:
+            overlaps = DiversityOverlapCache(ingredient_statistics)
+        if not self._uses_cached_overlaps(overlaps, ingredient_statistics):
+            return self._select_shortlist_by_rerank(
+                ranked_pool, ingredient_statistics=ingredient_statistics, limit=limit
+            )
+        remaining = list(ranked_pool)
+        selected: list[RecipeScore] = []
+        # meal id -> (picks already compared, max overlap with those picks)
+        running: dict[str, tuple[int, float | None]] = {}
+        while remaining and len(selected) < limit:
+            best = None
+            for position, item in enumerate(remaining[:SHORTLIST_LIMIT]):
+                meal = item.catalog_meal
+                compared, maximum = running.get(meal.id, (0, None))
+                for pick in selected[compared:]:
+                    value = overlaps.overlap(meal, pick.catalog_meal)
+                    if maximum is None or value > maximum:
+                        maximum = value
+                running[meal.id] = (len(selected), maximum)
+                diversity_fit = _fit_from_overlap(maximum)
+                key = (-item.contextual_score(diversity_fit=diversity_fit), meal.id)
+                if best is None or key < best[0]:
+                    best = (key, position, diversity_fit)
+            _, position, diversity_fit = best
+            winner = remaining.pop(position)
+            selected.append(
+                replace(
+                    winner,
+                    diversity_fit=diversity_fit,
+                    score=winner.contextual_score(diversity_fit=diversity_fit),
+                )
+            )
+        return selected, remaining
+
+    def _select_shortlist_by_rerank(
+        self,
+        ranked_pool: list[RecipeScore],
+        *,
+        ingredient_statistics: CatalogIngredientStatistics,
+        limit: int,
+    ) -> tuple[list[RecipeScore], list[RecipeScore]]:
+        selected: list[RecipeScore] = []
+        remaining = list(ranked_pool)
+        while remaining and len(selected) < limit:
+            winner = self.rerank_shortlist(
+                remaining,
+                comparison_meals=tuple(item.catalog_meal for item in selected),
+                ingredient_statistics=ingredient_statistics,
+            )[0]
+            selected.append(winner)
+            remaining = [
+                item
+                for item in remaining
+                if item.catalog_meal.id != winner.catalog_meal.id
+            ]
+        return selected, remaining
+
+    def _uses_cached_overlaps(
+        self,
+        overlaps: DiversityOverlapCache | None,
+        ingredient_statistics: CatalogIngredientStatistics,
+    ) -> bool:
+        # An injected diversity_fit may not be overlap-based.
+        return (
+            overlaps is not None
+            and overlaps.ingredient_statistics is ingredient_statistics
+            and self._diversity_fit == self.diversity_fit
+        )
+
+
+def _weighted_overlap(
+    left_ids: set[int],
+    right_ids: set[int],
+    ingredient_statistics: CatalogIngredientStatistics,
+) -> float:
+    union = left_ids | right_ids
+    if not union:
+        return 0.0
+    union_weight = sum(ingredient_statistics.idf(food_id) for food_id in union)
+    if union_weight <= 0:
+        return 0.0
+    intersection_weight = sum(
+        ingredient_statistics.idf(food_id) for food_id in left_ids & right_ids
+    )
+    return max(0.0, min(1.0, intersection_weight / union_weight))
+
+
+def _fit_from_overlap(maximum_overlap: float | None) -> float:
+    if maximum_overlap is None:
+        return 1.0
+    return max(0.0, min(1.0, 1.0 - maximum_overlap))
+
+
+def _rank_key(item: RecipeScore) -> tuple[float, str]:
+    return (-item.score, item.catalog_meal.id)
 
 
 def _canonical_ids(catalog_meal: CatalogMeal) -> set[int]:
@@ -5,11 +5,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from math import isfinite, sqrt
 
+import numpy as np
+
 from src.domain.model.meal_recommendation import CatalogMeal
 from src.domain.services.meal_recommendation.catalog_ingredient_statistics_service import (
     EMPTY_CATALOG_INGREDIENT_STATISTICS,
     CatalogIngredientStatistics,
 )
+from src.domain.services.meal_recommendation.catalog_scoring_index import (
+    CatalogScoringIndex,
+)
 from src.domain.services.meal_recommendation.ingredient_affinity_service import (
     IngredientAffinityProfile,
 )
@@ -74,6 +79,78 @@ class RecipeScoringService:
             diversity_weight=diversity_weight,
         )
 
+    def score_many(
+        self,
+        catalog_meals: list[CatalogMeal],
+        *,
+        target_calories: int,
+        affinity: IngredientAffinityProfile,
+        ingredient_statistics: CatalogIngredientStatistics = EMPTY_CATALOG_INGREDIENT_STATISTICS,
+        scoring_index: CatalogScoringIndex | None = None,
+        ingredient_fits: np.ndarray | None = None,
+    ) -> list[RecipeScore]:
+        """Score meals in order; equal to ``score`` per meal, vectorized when indexed.
+
+        ``scoring_index`` is used only when it was built from
+        ``ingredient_statistics`` and holds every meal; otherwise each meal is
+        scored individually. ``ingredient_fits`` is
+        ``scoring_index.ingredient_fit(affinity)`` when the caller already has
+        it, so one request scoring several meal types computes it once.
+        """
+        if not catalog_meals:
+            return []
+        if target_calories <= 0:
+            raise ValueError("target_calories must be positive")
+        rows = None
+        if (
+            scoring_index is not None
+            and scoring_index.statistics is ingredient_statistics
+        ):
+            rows = scoring_index.rows_for(catalog_meals)
+        if rows is None:
+            return [
+                self.score(
+                    catalog_meal,
+                    target_calories=target_calories,
+                    affinity=affinity,
+                    ingredient_statistics=ingredient_statistics,
+                )
+                for catalog_meal in catalog_meals
+            ]
+
+        calorie_distance = (
+            np.abs(scoring_index.calories[rows] - target_calories) / target_calories
+        )
+        calorie_fits = np.maximum(0.0, 1.0 - np.minimum(calorie_distance, 1.0))
+        if ingredient_fits is None:
+            ingredient_fits = scoring_index.ingredient_fit(affinity)
+        ingredient_fits = ingredient_fits[rows]
+        ingredient_weight = 0.35 * _bounded(affinity.confidence)
+        diversity_weight = 0.10
+        calorie_weight = 0.90 - ingredient_weight
+        scores = calorie_fits * calorie_weight + ingredient_fits * ingredient_weight
+        # Python's round() is correctly rounded; np.round is not, so scores
+        # are rounded per meal to stay identical to ``score``.
+        return [
+            RecipeScore(
+                catalog_meal=catalog_meal,
+                score=_round_score(score),
+                calorie_fit=calorie_fit,
+                ingredient_fit=ingredient_fit,
+                diversity_fit=0.0,
+                calorie_weight=calorie_weight,
+                ingredient_weight=ingredient_weight,
+                diversity_weight=diversity_weight,
+            )
+            for catalog_meal, score, calorie_fit, ingredient_fit in zip(
+                catalog_meals,
+                scores.tolist(),
+                calorie_fits.tolist(),
+                ingredient_fits.tolist(),
+                strict=True,
+            )
+        ]
+
     def rank(
         self,
         catalog_meals: list[CatalogMeal],
@@ -83,20 +160,25 @@ class RecipeScoringService:
         affinity: IngredientAffinityProfile,
         excluded_catalog_meal_ids: set[str] | None = None,
         ingredient_statistics: CatalogIngredientStatistics = EMPTY_CATALOG_INGREDIENT_STATISTICS,
+        scoring_index: CatalogScoringIndex | None = None,
+        ingredient_fits: np.ndarray | None = None,
     ) -> list[RecipeScore]:
         excluded_catalog_meal_ids = excluded_catalog_meal_ids or set()
-        scored = [
-            self.score(
-                catalog_meal,
-                target_calories=target_calories,
-                affinity=affinity,
-                ingredient_statistics=ingredient_statistics,
-            )
+        candidates = [
+            catalog_meal
             for catalog_meal in catalog_meals
             if catalog_meal.id not in excluded_catalog_meal_ids
             and meal_type in catalog_meal.meal_types
             and catalog_meal.calories > 0
         ]
+        scored = self.score_many(
+            candidates,
+            target_calories=target_calories,
+            affinity=affinity,
+            ingredient_statistics=ingredient_statistics,
+            scoring_index=scoring_index,
+            ingredient_fits=ingredient_fits,
+        )
         return sorted(scored, key=lambda item: (-item.score, item.catalog_meal.id))
 
 
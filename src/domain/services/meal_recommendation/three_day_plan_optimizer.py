@@ -20,10 +20,14 @@ from src.domain.services.meal_recommendation.catalog_ingredient_statistics_servi
     CatalogIngredientStatistics,
     CatalogIngredientStatisticsService,
 )
+from src.domain.services.meal_recommendation.catalog_scoring_index import (
+    CatalogScoringIndex,
+)
 from src.domain.services.meal_recommendation.ingredient_affinity_service import (
     IngredientAffinityProfile,
 )
 from src.domain.services.meal_recommendation.plan_diversity_reranking_service import (
+    DiversityOverlapCache,
     PlanDiversityRerankingService,
 )
 from src.domain.services.meal_recommendation.recipe_scoring_service import (
@@ -63,6 +67,7 @@ class ThreeDayPlanOptimizer:
         cuisines: set[str] | None = None,
         user_id: str | None = None,
         ingredient_statistics: CatalogIngredientStatistics | None = None,
+        scoring_index: CatalogScoringIndex | None = None,
     ) -> MealRecommendationPlan | MealRecommendationInsufficiency:
         candidates = _filter_supported_catalog_meals(catalog_meals, cuisines)
         unique_count = len({catalog_meal.id for catalog_meal in candidates})
@@ -87,6 +92,13 @@ class ThreeDayPlanOptimizer:
             ingredient_statistics
             or CatalogIngredientStatisticsService().build(candidates)
         )
+        # The ingredient fit does not depend on the meal type, so it is
+        # computed once for all ranked pools.
+        ingredient_fits = (
+            scoring_index.ingredient_fit(affinity)
+            if scoring_index is not None and scoring_index.statistics is statistics
+            else None
+        )
         ranked_pools = {
             meal_type: self._scoring.rank(
                 candidates,
@@ -94,9 +106,14 @@ class ThreeDayPlanOptimizer:
                 target_calories=allocations[meal_type],
                 affinity=affinity,
                 ingredient_statistics=statistics,
+                scoring_index=scoring_index,
+                ingredient_fits=ingredient_fits,
             )
             for meal_type in MEAL_TYPE_ORDER
         }
+        # Slots and alternatives compare the same candidates against the
+        # same picks, so pairwise overlaps are shared across the whole plan.
+        overlaps = DiversityOverlapCache(statistics, scoring_index)
         selected_ids: set[str] = set()
         slots: list[MealRecommendationSlot] = []
 
@@ -112,6 +129,7 @@ class ThreeDayPlanOptimizer:
                     ranked,
                     comparison_meals=tuple(slot.catalog_meal for slot in slots),
                     ingredient_statistics=statistics,
+                    overlaps=overlaps,
                 )
                 if not ranked:
                     logger.warning(
@@ -155,6 +173,7 @@ class ThreeDayPlanOptimizer:
                     if selected_slot.catalog_meal.id != slot.catalog_meal.id
                 ),
                 ingredient_statistics=statistics,
+                overlaps=overlaps,
             )
             if isinstance(result, MealRecommendationInsufficiency):
                 return result
@@ -243,6 +262,7 @@ class ThreeDayPlanOptimizer:
         comparison_meals: tuple[CatalogMeal, ...] = (),
         ingredient_statistics: CatalogIngredientStatistics | None = None,
         count: int = 5,
+        overlaps: DiversityOverlapCache | None = None,
     ) -> tuple[MealRecommendationAlternative, ...] | MealRecommendationInsufficiency:
         excluded = set(selected_catalog_meal_ids)
         excluded.add(selected_catalog_meal_id)
@@ -261,6 +281,7 @@ class ThreeDayPlanOptimizer:
                     [item.catalog_meal for item in ranked]
                 )
             ),
+            overlaps=overlaps,
         )
         if len(ranked) < count:
             logger.warning(
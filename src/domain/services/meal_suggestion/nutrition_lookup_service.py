@@ -14,7 +14,7 @@ import asyncio
 import inspect
 import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -24,18 +24,10 @@ from src.domain.model.nutrition.macros import Macros
 from src.domain.services.meal_suggestion.ingredient_name_normalizer import (
     normalize_food_name,
 )
+from src.observability import increment_metric
 
 logger = logging.getLogger(__name__)
 
-# Cache metrics for observability
-_cache_metrics = {
-    "redis_hits": 0,
-    "redis_misses": 0,
-    "t1_hits": 0,
-    "t2_hits": 0,
-    "t3_hits": 0,
-}
-
 NUTRITION_CACHE_TTL = 86400  # 24 hours
 T2_TIMEOUT = 2.0  # fatsecret timeout
 T3_TIMEOUT = 3.0  # AI estimate timeout
@@ -44,6 +36,42 @@ T3_TIMEOUT = 3.0  # AI estimate timeout
 _VOLUME_TO_ML: dict[str, float] = {"cup": 240.0, "tbsp": 15.0, "tsp": 5.0}
 
 
+# counter field -> (tier, result) attributes of the nutrition_lookup.tier metric
+_TIER_METRIC_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "redis_hits": ("redis", "hit"),
+    "redis_misses": ("redis", "miss"),
+    "t1_hits": ("t1_food_reference", "hit"),
+    "t2_hits": ("t2_fatsecret", "hit"),
+    "t3_hits": ("t3_ai_estimate", "hit"),
+}
+
+
+@dataclass
+class NutritionTierCounters:
+    """Per-service tier outcome counts, mirrored to the observability backend."""
+
+    redis_hits: int = 0
+    redis_misses: int = 0
+    t1_hits: int = 0
+    t2_hits: int = 0
+    t3_hits: int = 0
+
+    def record(self, counter: str, count: int = 1) -> None:
+        if count <= 0:
+            return
+        setattr(self, counter, getattr(self, counter) + count)
+        tier, result = _TIER_METRIC_ATTRIBUTES[counter]
+        increment_metric(
+            "nutrition_lookup.tier",
+            count,
+            attributes={"source": tier, "result": result},
+        )
+
+    @property
+    def total_lookups(self) -> int:
+        return self.redis_hits + self.redis_misses
+
+
 # ---------------------------------------------------------------------------
 # Output dataclasses
 # ---------------------------------------------------------------------------
@@ -115,6 +143,7 @@ class NutritionLookupService:
         self._resolver = ingredient_nutrition_resolver
         self._gen = generation_service
         self._redis = redis_client
+        self.counters = NutritionTierCounters()
 
     # ------------------------------------------------------------------
     # Public API
@@ -141,15 +170,8 @@ class NutritionLookupService:
             for ing in ingredients
         ]
 
-        # Tier 0 (Redis): check every key concurrently.
-        results: list[IngredientMacros | None] = list(
-            await asyncio.gather(
-                *(
-                    self._check_redis_cache(normalized, name, quantity_g)
-                    for name, normalized, quantity_g in prepared
-                )
-            )
-        )
+        # Tier 0 (Redis): one MGET for every ingredient.
+        results = await self._check_redis_cache_batch(prepared)
 
         # Tier 1 (food_reference): resolve every Redis miss with ONE batched
         # query instead of N concurrent single-row lookups.
@@ -165,22 +187,29 @@ class NutritionLookupService:
             t1_map = await self._find_batch_by_normalized_names(miss_normalized)
 
         # Resolve the Redis misses concurrently: T1 from the batch map → T2 → T3.
+        # Resolved macros are collected and written back in one pipeline.
         pending = [i for i, cached in enumerate(results) if cached is None]
+        self.counters.record("redis_misses", len(pending))
+        write_back: dict[str, str] = {}
 
         async def _resolve(index: int) -> IngredientMacros:
             name, normalized, quantity_g = prepared[index]
-            _cache_metrics["redis_misses"] += 1
             return await self._resolve_uncached(
-                name, normalized, quantity_g, t1_map.get(normalized)
+                name,
+                normalized,
+                quantity_g,
+                t1_map.get(normalized),
+                write_back=write_back,
             )
 
         resolved = await asyncio.gather(*(_resolve(i) for i in pending))
         for index, macros in zip(pending, resolved, strict=False):
             results[index] = macros
+        await self._cache_results(write_back)
 
         meal = self._aggregate([m for m in results if m is not None])
-        total = _cache_metrics["redis_hits"] + _cache_metrics["redis_misses"]
-        if total > 0 and total % 100 == 0:
+        total_before = self.counters.total_lookups - len(prepared)
+        if self.counters.total_lookups // 100 > total_before // 100:
             self.log_cache_metrics()
         return meal
 
@@ -193,7 +222,7 @@ class NutritionLookupService:
     ) -> IngredientMacros | None:
         """Tier 0: return cached macros from Redis, or None on miss/disabled/error.
 
-        Increments the redis_hits metric on a hit; misses are counted by the
+        Records the redis_hits counter on a hit; misses are counted by the
         caller so the totals are identical whether lookups run singly (via
         _lookup_ingredient) or batched (via calculate_meal_macros).
         """
@@ -204,34 +233,70 @@ class NutritionLookupService:
             cached = await self._redis.get(cache_key)
             if cached:
                 data = json.loads(cached)
-                _cache_metrics["redis_hits"] += 1
+                self.counters.record("redis_hits")
                 return self._build_from_cached(data, name, quantity_g)
         except Exception as exc:
             logger.warning("Redis get failed for %s: %s", cache_key, exc)
         return None
 
+    async def _check_redis_cache_batch(
+        self, prepared: list[tuple[str, str, float]]
+    ) -> list[IngredientMacros | None]:
+        """Tier 0 for a whole meal: one MGET, results aligned with ``prepared``."""
+        results: list[IngredientMacros | None] = [None] * len(prepared)
+        if not self._redis or not prepared:
+            return results
+        keys = list(dict.fromkeys(f"nutrition:{n}" for _, n, _ in prepared))
+        try:
+            raw_values = await self._redis.mget(keys)
+            cached_by_key = dict(zip(keys, raw_values, strict=True))
+        except Exception as exc:
+            logger.warning("Redis mget failed for %d keys: %s", len(keys), exc)
+            return results
+        for index, (name, normalized, quantity_g) in enumerate(prepared):
+            cached = cached_by_key.get(f"nutrition:{normalized}")
+            if not cached:
+                continue
+            try:
+                data = json.loads(cached)
+                results[index] = self._build_from_cached(data, name, quantity_g)
+            except Exception as exc:
+                logger.warning("Redis payload invalid for %s: %s", normalized, exc)
+        self.counters.record(
+            "redis_hits", sum(1 for result in results if result is not None)
+        )
+        return results
+
     async def _resolve_uncached(
         self,
         name: str,
         normalized: str,
         quantity_g: float,
         t1_ref: dict[str, Any] | None,
+        write_back: dict[str, str] | None = None,
     ) -> IngredientMacros:
         """Resolve a Redis-missed ingredient: T1 (caller-supplied ref) → T2 → T3.
 
         ``t1_ref`` is the food_reference row for ``normalized`` (or None), fetched
         by the caller either singly or in one batch. The resolved per-100g macros
-        are cached back to Redis.
+        are cached back to Redis, or added to ``write_back`` when the caller
+        flushes a whole meal at once.
         """
         cache_key = f"nutrition:{normalized}"
 
+        async def _remember(result: IngredientMacros) -> None:
+            if write_back is None:
+                await self._cache_result(cache_key, result)
+            else:
+                write_back[cache_key] = self._cache_payload(result)
+
         # T1: exact match on name_normalized (already fetched by the caller).
         if t1_ref:
-            _cache_metrics["t1_hits"] += 1
+            self.counters.record("t1_hits")
             result = self._calculate_from_ref(
                 t1_ref, name, quantity_g, "T1_food_reference"
             )
-            await self._cache_result(cache_key, result)
+            await _remember(result)
             return result
 
         # T2: fatsecret (resolver handles caching to food_reference)
@@ -243,18 +308,18 @@ class NutritionLookupService:
             logger.warning("T2 fatsecret timeout for %s", name)
             per100 = None
         if per100 is not None:
-            _cache_metrics["t2_hits"] += 1
+            self.counters.record("t2_hits")
             result = self._build_from_per100(per100, name, quantity_g, "T2_fatsecret")
-            await self._cache_result(cache_key, result)
+            await _remember(result)
             return result
 
         # T3: AI estimate — last resort
-        _cache_metrics["t3_hits"] += 1
+        self.counters.record("t3_hits")
         try:
             result = await asyncio.wait_for(
                 self._ai_estimate(name, quantity_g), timeout=T3_TIMEOUT
             )
-            await self._cache_result(cache_key, result)
+            await _remember(result)
             return result
         except TimeoutError:
             logger.warning("T3 AI timeout for %s", name)
@@ -283,7 +348,7 @@ class NutritionLookupService:
         cached = await self._check_redis_cache(normalized, name, quantity_g)
         if cached is not None:
             return cached
-        _cache_metrics["redis_misses"] += 1
+        self.counters.record("redis_misses")
         ref = await self._find_by_normalized_name(normalized)
         return await self._resolve_uncached(name, normalized, quantity_g, ref)
 
@@ -331,26 +396,42 @@ class NutritionLookupService:
             food_reference_id=data.get("food_reference_id"),
         )
 
+    @staticmethod
+    def _cache_payload(result: IngredientMacros) -> str:
+        """Serialize ``result`` back to the per-100g macros stored in Redis."""
+        factor = 100.0 / result.quantity_g if result.quantity_g > 0 else 1.0
+        data = {
+            "protein": round(result.protein * factor, 2),
+            "carbs": round(result.carbs * factor, 2),
+            "fat": round(result.fat * factor, 2),
+            "fiber": round(result.fiber * factor, 2),
+            "sugar": round(result.sugar * factor, 2),
+            "source_tier": result.source_tier,
+        }
+        if result.food_reference_id is not None:
+            data["food_reference_id"] = result.food_reference_id
+        return json.dumps(data)
+
     async def _cache_result(self, key: str, result: IngredientMacros) -> None:
         """Cache per-100g macros in Redis."""
         if not self._redis:
             return
         try:
-            factor = 100.0 / result.quantity_g if result.quantity_g > 0 else 1.0
-            data = {
-                "protein": round(result.protein * factor, 2),
-                "carbs": round(result.carbs * factor, 2),
-                "fat": round(result.fat * factor, 2),
-                "fiber": round(result.fiber * factor, 2),
-                "sugar": round(result.sugar * factor, 2),
-                "source_tier": result.source_tier,
-            }
-            if result.food_reference_id is not None:
-                data["food_reference_id"] = result.food_reference_id
-            await self._redis.set(key, json.dumps(data), ttl=NUTRITION_CACHE_TTL)
+            await self._redis.set(
+                key, self._cache_payload(result), ttl=NUTRITION_CACHE_TTL
+            )
         except Exception as exc:
             logger.warning("Redis set failed for %s: %s", key, exc)
 
+    async def _cache_results(self, payloads: dict[str, str]) -> None:
+        """Write a meal's resolved macros back in one pipelined round trip."""
+        if not self._redis or not payloads:
+            return
+        try:
+            await self._redis.mset_with_ttl(payloads, NUTRITION_CACHE_TTL)
+        except Exception as exc:
+            logger.warning("Redis mset failed for %d keys: %s", len(payloads), exc)
+
     # ------------------------------------------------------------------
     # Calculation helpers
     # ------------------------------------------------------------------
@@ -574,21 +655,20 @@ class NutritionLookupService:
             t3_count=sum(1 for i in ingredients if i.source_tier == "T3_ai_estimate"),
         )
 
-    @staticmethod
-    def get_cache_metrics() -> dict:
-        """Return current cache metrics for monitoring."""
-        total = _cache_metrics["redis_hits"] + _cache_metrics["redis_misses"]
-        hit_rate = _cache_metrics["redis_hits"] / total * 100 if total > 0 else 0.0
+    def get_cache_metrics(self) -> dict:
+        """Return this service's tier counters for monitoring."""
+        counters = self.counters
+        total = counters.total_lookups
+        hit_rate = counters.redis_hits / total * 100 if total > 0 else 0.0
         return {
-            **_cache_metrics,
+            **asdict(counters),
             "total_lookups": total,
             "redis_hit_rate_pct": round(hit_rate, 1),
         }
 
-    @staticmethod
-    def log_cache_metrics() -> None:
+    def log_cache_metrics(self) -> None:
         """Log current cache metrics at INFO level."""
-        metrics = NutritionLookupService.get_cache_metrics()
+        metrics = self.get_cache_metrics()
         logger.info(
             "[NUTRITION-CACHE] hits=%d misses=%d hit_rate=%.1f%% | "
             "T1=%d T2=%d T3=%d",
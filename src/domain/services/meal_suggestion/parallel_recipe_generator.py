@@ -30,10 +30,12 @@ from src.domain.services.meal_suggestion.nutrition_lookup_service import (
 from src.domain.services.meal_suggestion.recipe_attempt_builder import (
     attempt_recipe_generation,
 )
+from src.domain.services.meal_suggestion.recipe_result_cache import RecipeResultCache
 from src.domain.services.meal_suggestion.suggestion_translation_service import (
     SuggestionTranslationService,
 )
 from src.domain.services.prompts.system_prompts import SystemPrompts
+from src.observability import distribution_metric
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +96,7 @@ class ParallelRecipeGenerator:
         meal_names_schema_class: type,
         discovery_meals_schema_class: type,
         recipe_details_schema_class: type | None = None,
+        recipe_cache: RecipeResultCache | None = None,
     ) -> None:
         self._generation = generation_service
         self._translation_service = translation_service
@@ -102,6 +105,7 @@ class ParallelRecipeGenerator:
         self._meal_names_schema = meal_names_schema_class
         self._discovery_meals_schema = discovery_meals_schema_class
         self._recipe_details_schema = recipe_details_schema_class
+        self._recipe_cache = recipe_cache
 
     async def generate(
         self,
@@ -527,7 +531,36 @@ class ParallelRecipeGenerator:
         reject_on_scale_out_of_range: bool = True,
         fill_missing_steps: bool = False,
     ) -> Optional[MealSuggestion]:
-        """Try recipe model; retry on failure."""
+        """Serve a cached recipe when one rescales to this session; else try
+        the recipe model and retry on failure."""
+        started = time.perf_counter()
+        store_response = None
+        if self._recipe_cache is not None:
+            cache_key, ttl = self._recipe_cache.key_for(meal_name, session)
+            cached = await self._recipe_cache.get(cache_key)
+            if cached is not None:
+                result = await attempt_recipe_generation(
+                    self._generation,
+                    self._macro_validator,
+                    self._nutrition_lookup,
+                    prompt,
+                    meal_name,
+                    index,
+                    "recipe",
+                    recipe_system,
+                    session,
+                    reject_on_scale_out_of_range=reject_on_scale_out_of_range,
+                    fill_missing_steps=fill_missing_steps,
+                    recipe_schema=self._recipe_details_schema,
+                    cached_response=cached,
+                )
+                if result is not None:
+                    _record_recipe_duration(started, "cache")
+                    return result
+
+            async def store_response(response: dict) -> None:
+                await self._recipe_cache.store(cache_key, ttl, response)
+
         result = await attempt_recipe_generation(
             self._generation,
             self._macro_validator,
@@ -541,11 +574,13 @@ class ParallelRecipeGenerator:
             reject_on_scale_out_of_range=reject_on_scale_out_of_range,
             fill_missing_steps=fill_missing_steps,
             recipe_schema=self._recipe_details_schema,
+            store_response=store_response,
         )
         if result is not None:
+            _record_recipe_duration(started, "model")
             return result
         logger.debug(f"[PHASE-2-RETRY] index={index}")
-        return await attempt_recipe_generation(
+        result = await attempt_recipe_generation(
             self._generation,
             self._macro_validator,
             self._nutrition_lookup,
@@ -559,7 +594,11 @@ class ParallelRecipeGenerator:
             reject_on_scale_out_of_range=reject_on_scale_out_of_range,
             fill_missing_steps=fill_missing_steps,
             recipe_schema=self._recipe_details_schema,
+            store_response=store_response,
         )
+        if result is not None:
+            _record_recipe_duration(started, "model")
+        return result
 
     async def _translate_single(
         self, suggestion: MealSuggestion, language: str
@@ -669,3 +708,12 @@ class ParallelRecipeGenerator:
 
         translated_results = await asyncio.gather(*translate_tasks)
         return [result.suggestion for result in translated_results]
+
+
+def _record_recipe_duration(started: float, source: str) -> None:
+    distribution_metric(
+        "meal_suggestion.recipe.duration",
+        (time.perf_counter() - started) * 1000,
+        unit="millisecond",
+        attributes={"source": source},
+    )
@@ -4,8 +4,10 @@ Used by ParallelRecipeGenerator for each individual recipe AI call.
 """
 
 import asyncio
+import copy
 import logging
 import uuid
+from collections.abc import Awaitable, Callable
 
 from src.domain.model.meal_suggestion import (
     Ingredient,
@@ -44,6 +46,8 @@ async def attempt_recipe_generation(
     reject_on_scale_out_of_range: bool = True,
     fill_missing_steps: bool = False,
     recipe_schema: type | None = None,
+    cached_response: dict | None = None,
+    store_response: Callable[[dict], Awaitable[None]] | None = None,
 ) -> MealSuggestion | None:
     """
     Single AI call to generate one recipe. Returns MealSuggestion on success, None on failure.
@@ -62,20 +66,30 @@ async def attempt_recipe_generation(
         recipe_system: System prompt with JSON schema instructions
         session: Current suggestion session (used for fallback values)
         is_retry: Whether this is a retry attempt on an alternate model
+        cached_response: Previously accepted raw response to rebuild from
+            instead of calling the model; it is rescaled to this session
+        store_response: Called with the unscaled raw response once a freshly
+            generated recipe is accepted
     """
     marker = "[RETRY]" if is_retry else ""
+    if cached_response is not None:
+        marker = f"{marker}[CACHED]"
     try:
-        raw = await asyncio.wait_for(
-            generation_service.generate_meal_plan_async(
-                prompt,
-                recipe_system,
-                "json",
-                PARALLEL_SINGLE_MEAL_TOKENS,
-                recipe_schema,
-                model_purpose,
-            ),
-            timeout=PARALLEL_SINGLE_MEAL_TIMEOUT,
-        )
+        if cached_response is not None:
+            raw = copy.deepcopy(cached_response)
+        else:
+            raw = await asyncio.wait_for(
+                generation_service.generate_meal_plan_async(
+                    prompt,
+                    recipe_system,
+                    "json",
+                    PARALLEL_SINGLE_MEAL_TOKENS,
+                    recipe_schema,
+                    model_purpose,
+                ),
+                timeout=PARALLEL_SINGLE_MEAL_TIMEOUT,
+            )
+        unscaled = copy.deepcopy(raw) if store_response is not None else None
 
         ingredients: list[dict] = raw.get("ingredients", [])
         recipe_steps: list[dict] = raw.get("recipe_steps", [])
@@ -134,6 +148,8 @@ async def attempt_recipe_generation(
                 raw_ing["food_reference_id"] = scaled_ing_list[i].food_reference_id
 
         _log_ingredient_coverage(session, ingredients, meal_name, index, marker)
+        if unscaled is not None and cached_response is None:
+            await store_response(unscaled)
 
         logger.info(
             f"[PHASE-2-SUCCESS]{marker} index={index} | "
@@ -0,0 +1,115 @@
+"""
+Shared cache of generated recipe details for meal suggestions.
+
+A recipe is keyed by the normalized meal name and a fingerprint of the recipe
+prompt, rendered from the session with its calorie and macro targets rounded
+to bands, so the same dish with the same portion, equipment, allergies and
+preferences is generated once and reused across users. The cached value is
+the raw model response: every hit still has its macros recalculated and
+scaled to the session's own calorie target.
+"""
+
+import hashlib
+import logging
+from dataclasses import replace
+from typing import Any
+
+from src.domain.cache.cache_keys import CacheKeys
+from src.domain.model.meal_suggestion import SuggestionSession
+from src.domain.ports.cache_port import CachePort
+from src.domain.services.prompts.system_prompts import SystemPrompts
+from src.observability import increment_metric
+
+logger = logging.getLogger(__name__)
+
+# Widths of the target bands; scale_to_target absorbs the difference.
+RECIPE_CALORIE_BAND = 100
+RECIPE_MACRO_BAND_G = 10.0
+
+_RESPONSE_FIELDS = (
+    "ingredients",
+    "recipe_steps",
+    "prep_time_minutes",
+    "origin_country",
+    "cuisine_type",
+    "emoji",
+)
+
+
+def normalize_meal_name(meal_name: str) -> str:
+    """Case- and whitespace-insensitive form of a meal name."""
+    return " ".join(meal_name.split()).casefold()
+
+
+class RecipeResultCache:
+    """Read and write raw recipe responses through the domain cache port."""
+
+    def __init__(self, cache: CachePort | None):
+        self._cache = cache
+
+    @staticmethod
+    def key_for(meal_name: str, session: SuggestionSession) -> tuple[str, int]:
+        from src.domain.services.meal_suggestion.suggestion_prompt_builder import (
+            build_recipe_details_prompt,
+        )
+
+        banded = replace(
+            session,
+            target_calories=_band(session.target_calories, RECIPE_CALORIE_BAND),
+            protein_target=_band(session.protein_target, RECIPE_MACRO_BAND_G),
+            carbs_target=_band(session.carbs_target, RECIPE_MACRO_BAND_G),
+            fat_target=_band(session.fat_target, RECIPE_MACRO_BAND_G),
+            ingredients=_sorted(session.ingredients[:6] if session.ingredients else []),
+            allergies=_sorted(session.allergies),
+            dietary_preferences=_sorted(session.dietary_preferences),
+            cooking_equipment=_sorted(session.cooking_equipment),
+        )
+        digest = hashlib.sha256()
+        for part in (
+            SystemPrompts.RECIPE_GENERATION,
+            build_recipe_details_prompt(normalize_meal_name(meal_name), banded),
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return CacheKeys.meal_suggestion_recipe(digest.hexdigest())
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        if self._cache is None:
+            return None
+        try:
+            cached = await self._cache.get(key)
+        except Exception as exc:
+            logger.warning("Recipe cache read failed: %s", exc)
+            cached = None
+        hit = isinstance(cached, dict) and bool(cached.get("ingredients"))
+        _record_lookup("hit" if hit else "miss")
+        return cached if hit else None
+
+    async def store(self, key: str, ttl_seconds: int, response: dict) -> None:
+        """Persist a raw response whose recipe was accepted; failures are logged."""
+        if self._cache is None:
+            return
+        value = {field: response.get(field) for field in _RESPONSE_FIELDS}
+        try:
+            await self._cache.set(key, value, ttl_seconds)
+        except Exception as exc:
+            logger.warning("Recipe cache write failed: %s", exc)
+
+
+def _band(value, width):
+    if value is None:
+        return None
+    return type(value)(round(value / width) * width)
+
+
+def _sorted(values):
+    if not isinstance(values, list):
+        return values
+    return sorted(values, key=lambda value: str(value).casefold())
+
+
+def _record_lookup(outcome: str) -> None:
+    increment_metric(
+        "meal_suggestion.recipe_cache.lookup",
+        attributes={"result": outcome},
+    )
@@ -31,6 +31,7 @@ from src.domain.services.meal_suggestion.nutrition_lookup_service import (
 from src.domain.services.meal_suggestion.parallel_recipe_generator import (
     ParallelRecipeGenerator,
 )
+from src.domain.services.meal_suggestion.recipe_result_cache import RecipeResultCache
 from src.domain.services.meal_suggestion.suggestion_tdee_helpers import (
     get_adjusted_daily_target,
 )
@@ -59,6 +60,7 @@ class SuggestionOrchestrationService:
         profile_provider: Optional[Callable[[str], Any]] = None,
         uow_factory: Optional[Callable[[], Any]] = None,
         translation_service: Optional[SuggestionTranslationService] = None,
+        recipe_cache: RecipeResultCache | None = None,
     ):
         self._generation = generation_service
         self._repo = suggestion_repo
@@ -75,6 +77,7 @@ class SuggestionOrchestrationService:
             meal_names_schema_class=meal_names_schema_class,
             discovery_meals_schema_class=discovery_meals_schema_class,
             recipe_details_schema_class=recipe_details_schema_class,
+            recipe_cache=recipe_cache,
         )
 
     async def generate_suggestions(
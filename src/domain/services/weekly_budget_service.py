@@ -12,7 +12,7 @@ from datetime import UTC, date, datetime, time, timedelta
 from typing import Any
 
 from src.domain.constants import WeeklyBudgetConstants
-from src.domain.model.meal import MealStatus
+from src.domain.model.meal import DailyNutritionRollup, MealStatus
 from src.domain.model.nutrition.macros import Macros
 from src.domain.model.weekly import WeeklyMacroBudget
 from src.domain.services.meal_calorie_service import effective_meal_calories
@@ -68,10 +68,29 @@ class WeeklyBudgetService:
         exclude_dates: list[date] | None = None,
         user_timezone: str | None = None,
     ) -> dict[str, float]:
-        """Async version of calculate_weekly_consumed for AsyncUnitOfWork."""
+        """Async version of calculate_weekly_consumed for AsyncUnitOfWork.
+
+        Reads the week's daily nutrition rollups when the unit of work has
+        them instead of loading and summing every meal.
+        """
         week_end = end_date or week_start + timedelta(days=6)
         tz = get_zone_info(user_timezone) if user_timezone else None
 
+        rollup_repo = uow.daily_nutrition_rollups
+        if rollup_repo is not None:
+            rollups = {}
+            if week_end >= week_start:
+                rollups = await rollup_repo.get_range(
+                    user_id, week_start, week_end, user_timezone or "UTC"
+                )
+            return WeeklyBudgetService.aggregate_weekly_consumed_from_rollups(
+                rollups,
+                week_start=week_start,
+                end_date=week_end,
+                exclude_date=exclude_date,
+                exclude_dates=exclude_dates,
+            )
+
         meals = await uow.meals.find_by_date_range(
             user_id,
             week_start,
@@ -263,6 +282,69 @@ class WeeklyBudgetService:
             "fat": total_fat,
         }
 
+    @staticmethod
+    def aggregate_weekly_consumed_from_rollups(
+        rollups: dict[date, DailyNutritionRollup],
+        *,
+        week_start: date,
+        end_date: date | None = None,
+        exclude_date: date | None = None,
+        exclude_dates: list[date] | None = None,
+    ) -> dict[str, float]:
+        """Sum READY-meal macros and movement from per-day rollups."""
+        week_end = end_date or week_start + timedelta(days=6)
+        excluded = set(exclude_dates) if exclude_dates else set()
+        if exclude_date:
+            excluded.add(exclude_date)
+
+        totals = {"calories": 0.0, "protein": 0.0, "carbs": 0.0, "fat": 0.0}
+        for day, rollup in rollups.items():
+            if day < week_start or day > week_end or day in excluded:
+                continue
+            totals["calories"] += rollup.ready_calories - rollup.movement_kcal
+            totals["protein"] += rollup.ready_protein
+            totals["carbs"] += rollup.ready_carbs
+            totals["fat"] += rollup.ready_fat
+        return totals
+
+    @staticmethod
+    def build_weekly_effective_preload_from_rollups(
+        rollups: dict[date, DailyNutritionRollup],
+        *,
+        cheat_dates: list[date],
+        week_start: date,
+        target_date: date,
+    ) -> WeeklyEffectivePreload:
+        """Build the weekly preload from the week's daily nutrition rollups."""
+        calc = WeeklyBudgetService
+        past_end = target_date - timedelta(days=1)
+        past_cheat_dates = [d for d in cheat_dates if d < target_date]
+        logged_past_days = sum(
+            1
+            for day, rollup in rollups.items()
+            if week_start <= day <= past_end and rollup.meal_count > 0
+        )
+        consumed_before_today = calc.aggregate_weekly_consumed_from_rollups(
+            rollups, week_start=week_start, end_date=past_end
+        )
+        if past_cheat_dates:
+            consumed_for_redistribution = calc.aggregate_weekly_consumed_from_rollups(
+                rollups,
+                week_start=week_start,
+                end_date=past_end,
+                exclude_dates=past_cheat_dates,
+            )
+        else:
+            consumed_for_redistribution = consumed_before_today
+        return WeeklyEffectivePreload(
+            logged_past_days=logged_past_days,
+            consumed_total=calc.aggregate_weekly_consumed_from_rollups(
+                rollups, week_start=week_start
+            ),
+            consumed_before_today=consumed_before_today,
+            consumed_for_redistribution=consumed_for_redistribution,
+        )
+
     @staticmethod
     def build_weekly_effective_preload(
         *,
@@ -448,6 +530,18 @@ class WeeklyBudgetService:
         else:
             all_cheat_dates = cheat_dates
 
+        rollup_repo = uow.daily_nutrition_rollups
+        if weekly_preload is None and rollup_repo is not None:
+            rollups = await rollup_repo.get_range(
+                user_id, week_start, week_start + timedelta(days=6), user_timezone
+            )
+            weekly_preload = calc.build_weekly_effective_preload_from_rollups(
+                rollups,
+                cheat_dates=all_cheat_dates,
+                week_start=week_start,
+                target_date=target_date,
+            )
+
         if weekly_preload is not None:
             return calc._apply_effective_adjusted_policy(
                 weekly_budget=weekly_budget,
@@ -1,5 +1,8 @@
 """Shared image compression — resize to max dimension, encode as JPEG."""
+import asyncio
 import logging
+from collections.abc import Callable
+from concurrent.futures import Executor
 from io import BytesIO
 
 from PIL import Image
@@ -8,14 +11,21 @@ logger = logging.getLogger(__name__)
 
 _MAX_DIM = 768
 _MAX_BYTES = 200 * 1024
+# JPEG COM marker written into every rendition so later stages skip it.
+_RENDITION_COMMENT = b"mealtrack:analysis-rendition"
+_RENDITION_HEADER_BYTES = 64
 
 
 def compress_image(image_bytes: bytes, max_dim: int = _MAX_DIM) -> bytes:
     """Resize to max_dim on longest axis, encode as JPEG quality=85.
 
-    Returns original bytes unchanged if already a small JPEG within limits.
+    Returns original bytes unchanged if already a small JPEG within limits or
+    already an analysis rendition. JPEGs are downscaled during decode with
+    ``Image.draft`` before the final LANCZOS resize.
     Never raises — falls back to original on PIL errors.
     """
+    if is_analysis_rendition(image_bytes):
+        return image_bytes
     try:
         img = Image.open(BytesIO(image_bytes))
         w, h = img.size
@@ -23,12 +33,37 @@ def compress_image(image_bytes: bytes, max_dim: int = _MAX_DIM) -> bytes:
             return image_bytes
         if max(w, h) > max_dim:
             ratio = max_dim / max(w, h)
-            img = img.resize((int(w * ratio), int(h * ratio)), Image.LANCZOS)
+            size = (int(w * ratio), int(h * ratio))
+            if img.format == "JPEG":
+                img.draft("RGB", size)
+            img = img.resize(size, Image.LANCZOS)
         if img.mode != "RGB":
             img = img.convert("RGB")
         buf = BytesIO()
-        img.save(buf, format="JPEG", quality=85)
+        img.save(buf, format="JPEG", quality=85, comment=_RENDITION_COMMENT)
         return buf.getvalue()
     except Exception as exc:
         logger.warning("Image compression failed, using original: %s", exc)
         return image_bytes
+
+
+def is_analysis_rendition(image_bytes: bytes) -> bool:
+    """Return whether ``image_bytes`` was produced by ``compress_image``."""
+    return image_bytes[:2] == b"\xff\xd8" and (
+        _RENDITION_COMMENT in image_bytes[:_RENDITION_HEADER_BYTES]
+    )
+
+
+async def compress_image_async(
+    image_bytes: bytes,
+    compress: Callable[[bytes], bytes] = compress_image,
+    executor: Executor | None = None,
+) -> bytes:
+    """Run ``compress`` on ``executor`` (the loop's default executor if None).
+
+    Renditions are returned without leaving the event loop.
+    """
+    if is_analysis_rendition(image_bytes):
+        return image_bytes
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, compress, image_bytes)
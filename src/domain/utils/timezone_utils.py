@@ -240,24 +240,27 @@ async def resolve_user_timezone_async(
     header_timezone: str | None = None,
 ) -> str:
     """Async version of resolve_user_timezone for use with AsyncUnitOfWork."""
-    db_tz = "UTC"
+    stored_tz = None
     try:
         user = await uow.users.find_by_id(user_id)
-        if user and user.timezone and user.timezone != "UTC":
-            return user.timezone
-        if user and user.timezone:
-            db_tz = user.timezone
+        if user:
+            stored_tz = user.timezone
     except Exception:
         pass
+    return choose_user_timezone(stored_tz, header_timezone)
+
 
+def choose_user_timezone(stored_timezone: str | None, header_timezone: str | None) -> str:
+    """Apply the DB → X-Timezone header → UTC precedence to already-loaded values."""
+    if stored_timezone and stored_timezone != "UTC":
+        return stored_timezone
     if (
         header_timezone
         and header_timezone != "UTC"
         and is_valid_timezone(header_timezone)
     ):
         return normalize_timezone(header_timezone)
-
-    return db_tz
+    return stored_timezone or "UTC"
 
 
 def resolve_user_timezone(
@@ -5,6 +5,7 @@ Provides product lookup by barcode and food search using OAuth 2.0.
 
 import asyncio
 import base64
+import hashlib
 import logging
 import math
 import re
@@ -13,11 +14,14 @@ from typing import Any
 
 import httpx
 
+from src.domain.cache.cache_keys import CacheKeys
+from src.domain.ports.cache_port import CachePort
 from src.domain.services.nutrition_integrity_policy import (
     NutritionIntegrityPolicy,
     normalize_serving_options,
 )
 from src.infra.config.settings import settings
+from src.observability import distribution_metric, increment_metric
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +29,23 @@ logger = logging.getLogger(__name__)
 FATSECRET_TOKEN_URL = "https://oauth.fatsecret.com/connect/token"
 FATSECRET_API_BASE = "https://platform.fatsecret.com/rest/server.api"
 
+# Connection pool shared by every request in the process. FatSecret serves
+# HTTP/2, so concurrent searches multiplex over a few warm connections.
+FATSECRET_POOL_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=60.0,
+)
+FATSECRET_TOKEN_TIMEOUT = httpx.Timeout(5.0, connect=3.0)
+FATSECRET_API_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+# A token is treated as expired this long before FatSecret says it is, and is
+# renewed in the background once it enters the renewal window. A failed
+# renewal is not retried for TOKEN_RENEW_BACKOFF_SECONDS.
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+TOKEN_RENEW_AHEAD_SECONDS = 300
+TOKEN_RENEW_BACKOFF_SECONDS = 30
+
 # Barcode validation pattern (8-14 digits)
 BARCODE_PATTERN = re.compile(r"^\d{8,14}$")
 
@@ -55,33 +76,105 @@ class FatSecretService:
         client_id: str,
         client_secret: str,
         integrity_policy: NutritionIntegrityPolicy | None = None,
+        token_cache: CachePort | None = None,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
+        self.token_cache = token_cache
         self._access_token: str | None = None
         self._token_expires_at: float = 0
+        self._token_lock = asyncio.Lock()
+        self._renewal_task: asyncio.Task | None = None
+        self._renewal_failed_at: float = 0
         self._client: httpx.AsyncClient | None = None
         self._integrity_policy = integrity_policy or NutritionIntegrityPolicy()
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client."""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=FATSECRET_POOL_LIMITS,
+                timeout=FATSECRET_API_TIMEOUT,
+            )
         return self._client
 
     async def close(self):
         """Close the HTTP client."""
+        if self._renewal_task and not self._renewal_task.done():
+            self._renewal_task.cancel()
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
 
     async def _get_access_token(self) -> str | None:
-        """Get OAuth 2.0 access token, refreshing if needed."""
-        # Check if token is still valid (with 60s buffer)
-        if self._access_token and time.time() < self._token_expires_at - 60:
+        """Get OAuth 2.0 access token, refreshing if needed.
+
+        Concurrent callers that find the token expired wait on one refresh.
+        A token inside the renewal window is still returned immediately while
+        a single background task renews it.
+        """
+        now = time.time()
+        if self._token_usable(now):
+            if now >= self._token_expires_at - TOKEN_RENEW_AHEAD_SECONDS and (
+                now >= self._renewal_failed_at + TOKEN_RENEW_BACKOFF_SECONDS
+            ):
+                self._schedule_token_renewal()
+            return self._access_token
+
+        async with self._token_lock:
+            if self._token_usable(time.time()):
+                return self._access_token
+            return await self._refresh_access_token()
+
+    def _token_usable(self, now: float) -> bool:
+        return bool(self._access_token) and (
+            now < self._token_expires_at - TOKEN_EXPIRY_MARGIN_SECONDS
+        )
+
+    def _schedule_token_renewal(self) -> None:
+        if self._renewal_task is None or self._renewal_task.done():
+            self._renewal_task = asyncio.create_task(self._renew_access_token())
+
+    async def _renew_access_token(self) -> None:
+        async with self._token_lock:
+            if time.time() < self._token_expires_at - TOKEN_RENEW_AHEAD_SECONDS:
+                return
+            await self._refresh_access_token()
+
+    async def _refresh_access_token(self) -> str | None:
+        """Adopt a fresher token shared by another worker, or request one.
+
+        Must be called with ``_token_lock`` held. On failure the current
+        token, if still usable, is kept.
+        """
+        shared = await self._read_shared_token()
+        if shared is not None:
+            self._access_token, self._token_expires_at = shared
+            increment_metric("fatsecret.token.refresh", attributes={"result": "shared"})
             return self._access_token
 
-        # Get new token
+        started = time.perf_counter()
+        token = await self._request_access_token()
+        distribution_metric(
+            "fatsecret.token.refresh.duration_ms",
+            (time.perf_counter() - started) * 1000,
+            unit="millisecond",
+            attributes={"result": "success" if token else "failure"},
+        )
+        increment_metric(
+            "fatsecret.token.refresh",
+            attributes={"result": "success" if token else "failure"},
+        )
+        if token is None:
+            self._renewal_failed_at = time.time()
+            return self._access_token if self._token_usable(time.time()) else None
+        self._renewal_failed_at = 0
+        self._access_token, self._token_expires_at = token
+        await self._write_shared_token()
+        return self._access_token
+
+    async def _request_access_token(self) -> tuple[str, float] | None:
         try:
             credentials = f"{self.client_id}:{self.client_secret}"
             b64_credentials = base64.b64encode(credentials.encode()).decode()
@@ -95,7 +188,10 @@ class FatSecretService:
 
             client = await self._get_client()
             response = await client.post(
-                FATSECRET_TOKEN_URL, headers=headers, data=data
+                FATSECRET_TOKEN_URL,
+                headers=headers,
+                data=data,
+                timeout=FATSECRET_TOKEN_TIMEOUT,
             )
 
             if response.status_code != 200:
@@ -106,15 +202,63 @@ class FatSecretService:
                 return None
 
             token_data = response.json()
-            self._access_token = token_data.get("access_token")
+            access_token = token_data.get("access_token")
+            if not access_token:
+                return None
             expires_in = token_data.get("expires_in", 3600)
-            self._token_expires_at = time.time() + expires_in
-
-            return self._access_token
+            return access_token, time.time() + expires_in
         except Exception as exc:
             logger.warning("fatsecret OAuth error: %s", type(exc).__name__)
             return None
 
+    def _token_cache_key(self) -> tuple[str, int]:
+        # Keyed by client so rotated credentials never pick up the old token.
+        client_hash = hashlib.sha256(self.client_id.encode()).hexdigest()[:16]
+        return CacheKeys.fatsecret_token(client_hash)
+
+    async def _read_shared_token(self) -> tuple[str, float] | None:
+        if self.token_cache is None:
+            return None
+        try:
+            key, _ = self._token_cache_key()
+            cached = await self.token_cache.get(key)
+        except Exception as exc:
+            logger.warning("fatsecret shared token read failed: %s", type(exc).__name__)
+            return None
+        if not isinstance(cached, dict) or not cached.get("access_token"):
+            return None
+        expires_at = float(cached.get("expires_at") or 0)
+        # Only adopt a token that outlives ours and is not itself due for renewal.
+        if expires_at <= max(
+            self._token_expires_at, time.time() + TOKEN_RENEW_AHEAD_SECONDS
+        ):
+            return None
+        return cached["access_token"], expires_at
+
+    async def _write_shared_token(self) -> None:
+        if self.token_cache is None:
+            return
+        key, max_ttl = self._token_cache_key()
+        ttl_seconds = min(
+            max_ttl,
+            int(self._token_expires_at - time.time() - TOKEN_EXPIRY_MARGIN_SECONDS),
+        )
+        if ttl_seconds <= 0:
+            return
+        try:
+            await self.token_cache.set(
+                key,
+                {
+                    "access_token": self._access_token,
+                    "expires_at": self._token_expires_at,
+                },
+                ttl_seconds,
+            )
+        except Exception as exc:
+            logger.warning(
+                "fatsecret shared token write failed: %s", type(exc).__name__
+            )
+
     async def _api_request(
         self,
         method: str,
@@ -133,12 +277,16 @@ class FatSecretService:
             "Content-Type": "application/x-www-form-urlencoded",
         }
 
+        operation = (params or {}).get("method") or endpoint or "request"
+        started = time.perf_counter()
+        status = "error"
         try:
             client = await self._get_client()
             if method.upper() == "GET":
                 response = await client.get(url, headers=headers, params=params)
             else:
                 response = await client.post(url, headers=headers, data=params)
+            status = str(response.status_code)
 
             if response.status_code != 200:
                 logger.warning(
@@ -157,6 +305,13 @@ class FatSecretService:
         except httpx.HTTPError as exc:
             logger.warning("fatsecret request error: %s", type(exc).__name__)
             return None
+        finally:
+            distribution_metric(
+                "fatsecret.request.duration_ms",
+                (time.perf_counter() - started) * 1000,
+                unit="millisecond",
+                attributes={"operation": operation, "status": status},
+            )
 
     async def get_product(
         self,
@@ -570,8 +725,14 @@ _fat_secret_service: FatSecretService | None = None
 _fat_secret_service_initialized = False
 
 
-def get_fat_secret_service() -> FatSecretService | None:
-    """Get the optional FatSecret service when credentials are configured."""
+def get_fat_secret_service(
+    token_cache: CachePort | None = None,
+) -> FatSecretService | None:
+    """Get the optional FatSecret service when credentials are configured.
+
+    ``token_cache`` shares the OAuth token across workers; it is only used
+    when the singleton is first built.
+    """
     global _fat_secret_service, _fat_secret_service_initialized
     if _fat_secret_service_initialized:
         return _fat_secret_service
@@ -587,6 +748,7 @@ def get_fat_secret_service() -> FatSecretService | None:
     _fat_secret_service = FatSecretService(
         client_id=client_id,
         client_secret=client_secret,
+        token_cache=token_cache,
     )
     _fat_secret_service_initialized = True
     return _fat_secret_service
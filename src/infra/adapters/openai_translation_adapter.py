@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import re
 from collections import Counter
@@ -34,6 +35,11 @@ _SYSTEM_MESSAGE = (
     "an English ingredient unchanged unless it is a brand or proper name. Return one item "
     "per input index as JSON."
 )
+# Bumped when output validation or the request shape changes; translation
+# memory keys carry it (with the model and a digest of the system message) so
+# segments produced under an older prompt are never replayed.
+_PROMPT_REVISION = "translation_prompt_v1"
+_PROMPT_DIGEST = hashlib.sha256(_SYSTEM_MESSAGE.encode("utf-8")).hexdigest()[:12]
 _MAX_REPAIR_ATTEMPTS = 1
 _TOKEN_PATTERN = re.compile(r"\{[^{}]+\}|\d+(?:[.,]\d+)?")
 _UNIT_PATTERN = re.compile(
@@ -308,6 +314,10 @@ class OpenAITranslationAdapter(TextTranslationPort):
         self._timeout_seconds = max(0.1, timeout_seconds)
         self._max_output_tokens = max_output_tokens
 
+    @property
+    def prompt_version(self) -> str:
+        return f"{_PROMPT_REVISION}:{self._model}:{_PROMPT_DIGEST}"
+
     async def translate_texts(
         self,
         texts: Sequence[str],
@@ -0,0 +1,197 @@
+"""Cross-request micro-batching in front of a text translation port.
+
+Concurrent callers translating into the same language pair within a short
+window share one indexed provider request instead of paying model latency and
+prompt overhead each. A batch is sent when its window elapses or when the next
+caller would push it past the provider batch limits.
+
+A shared batch only fans out when it comes back fully translated. Otherwise
+each caller is translated on its own, so a partial result or refusal caused by
+one caller's text never degrades another caller's outcome.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+
+from src.domain.constants.languages import normalize_language
+from src.domain.constants.translation_limits import (
+    MAX_TRANSLATION_ITEMS,
+    translation_batch_within_limits,
+)
+from src.domain.model.translation_result import TranslationOutcome, TranslationResult
+from src.domain.ports.text_translation_port import TextTranslationPort
+from src.observability import increment_metric
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_WINDOW_SECONDS = 0.005
+
+
+class _PendingBatch:
+    """Unique texts of one language pair plus the callers waiting on them."""
+
+    def __init__(self) -> None:
+        self.texts: dict[str, None] = {}
+        self.callers: list[tuple[tuple[str, ...], asyncio.Future]] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+    def accepts(self, texts: tuple[str, ...], max_items: int) -> bool:
+        merged = list({**self.texts, **dict.fromkeys(texts)})
+        return len(merged) <= max_items and translation_batch_within_limits(merged)
+
+    def add(self, texts: tuple[str, ...], future: asyncio.Future) -> None:
+        self.texts.update(dict.fromkeys(texts))
+        self.callers.append((texts, future))
+
+
+class TranslationBatcherAdapter(TextTranslationPort):
+    """Coalesce concurrent translation calls into one batch per language pair."""
+
+    def __init__(
+        self,
+        inner: TextTranslationPort,
+        *,
+        window_seconds: float = DEFAULT_BATCH_WINDOW_SECONDS,
+        max_items: int = MAX_TRANSLATION_ITEMS,
+    ) -> None:
+        self._inner = inner
+        self._window_seconds = max(0.0, window_seconds)
+        self._max_items = max(1, min(max_items, MAX_TRANSLATION_ITEMS))
+        self._pending: dict[tuple[str, str], _PendingBatch] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def translate_texts(
+        self,
+        texts: Sequence[str],
+        *,
+        source_language: str,
+        target_language: str,
+    ) -> TranslationResult:
+        original = tuple(str(text) for text in texts)
+        source = normalize_language(source_language)
+        target = normalize_language(target_language)
+        if (
+            not original
+            or source == target
+            or len(set(original)) > self._max_items
+            or not translation_batch_within_limits(list(original))
+        ):
+            return await self._inner.translate_texts(
+                original, source_language=source, target_language=target
+            )
+
+        loop = asyncio.get_running_loop()
+        pair = (source, target)
+        batch = self._pending.get(pair)
+        if batch is not None and not batch.accepts(original, self._max_items):
+            self._dispatch(pair, batch)
+            batch = None
+        if batch is None:
+            batch = _PendingBatch()
+            self._pending[pair] = batch
+            batch.timer = loop.call_later(
+                self._window_seconds, self._dispatch, pair, batch
+            )
+        future = loop.create_future()
+        batch.add(original, future)
+        if len(batch.texts) >= self._max_items:
+            self._dispatch(pair, batch)
+        return await future
+
+    def _dispatch(self, pair: tuple[str, str], batch: _PendingBatch) -> None:
+        if self._pending.get(pair) is not batch:
+            return
+        del self._pending[pair]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.create_task(
+            self._run(pair, batch), name="translation:micro-batch"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pair: tuple[str, str], batch: _PendingBatch) -> None:
+        _, target = pair
+        callers = [(texts, f) for texts, f in batch.callers if not f.done()]
+        if not callers:
+            return
+        increment_metric(
+            "ai.translation.batch.callers",
+            len(callers),
+            attributes={"language": target},
+        )
+        try:
+            await self._translate_batch(pair, callers)
+        except Exception as exc:
+            _fail(callers, exc)
+        except BaseException:
+            # Cancelled (e.g. loop shutdown): never leave a caller waiting.
+            _cancel(callers)
+            raise
+
+    async def _translate_batch(
+        self,
+        pair: tuple[str, str],
+        callers: list[tuple[tuple[str, ...], asyncio.Future]],
+    ) -> None:
+        source, target = pair
+        texts = list(dict.fromkeys(text for own, _ in callers for text in own))
+        result = await self._inner.translate_texts(
+            texts, source_language=source, target_language=target
+        )
+
+        if len(callers) > 1 and not result.cacheable:
+            increment_metric(
+                "ai.translation.batch.isolated",
+                len(callers),
+                attributes={"language": target, "status": result.outcome.value},
+            )
+            await asyncio.gather(*(self._run_alone(pair, own, f) for own, f in callers))
+            return
+
+        by_text = dict(zip(texts, result.texts, strict=False))
+        outcome = result.outcome if len(callers) == 1 else TranslationOutcome.TRANSLATED
+        for caller_texts, future in callers:
+            if not future.done():
+                future.set_result(
+                    TranslationResult(
+                        tuple(by_text.get(text, text) for text in caller_texts),
+                        outcome,
+                        source,
+                        target,
+                    )
+                )
+
+    async def _run_alone(
+        self, pair: tuple[str, str], texts: tuple[str, ...], future: asyncio.Future
+    ) -> None:
+        if future.done():
+            return
+        source, target = pair
+        try:
+            result = await self._inner.translate_texts(
+                texts, source_language=source, target_language=target
+            )
+        except Exception as exc:
+            _fail([(texts, future)], exc)
+            return
+        except BaseException:
+            _cancel([(texts, future)])
+            raise
+        if not future.done():
+            future.set_result(result)
+
+
+def _fail(callers, exc: Exception) -> None:
+    logger.warning("Translation micro-batch failed: %s", exc)
+    for _, future in callers:
+        if not future.done():
+            future.set_exception(exc)
+
+
+def _cancel(callers) -> None:
+    for _, future in callers:
+        future.cancel()
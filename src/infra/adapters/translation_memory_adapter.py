@@ -0,0 +1,237 @@
+"""Segment-level translation memory in front of a text translation port.
+
+Every non-empty text is keyed by the prompt version, the language pair and its
+normalized form, then looked up in Redis and, for Redis misses, in the durable
+``translation_memory`` table. Only the remaining segments are sent to the
+model. Segments are stored only from a cacheable (complete) model result, so
+partial, refused or unavailable answers are never replayed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import unicodedata
+from collections.abc import Sequence
+from typing import Any
+
+from src.domain.cache.cache_keys import CacheKeys
+from src.domain.constants.languages import normalize_language
+from src.domain.model.translation_result import TranslationOutcome, TranslationResult
+from src.domain.ports.text_translation_port import TextTranslationPort
+from src.infra.cache.cache_service import CacheService
+from src.infra.database.uow_async import AsyncUnitOfWork
+from src.observability import increment_metric
+
+logger = logging.getLogger(__name__)
+
+# Rough provider tokens per byte of text, plus the JSON framing of one item in
+# the request and the response; used only for the tokens-saved estimate.
+_BYTES_PER_TOKEN = 4
+_ITEM_TOKEN_OVERHEAD = 12
+
+
+class TranslationMemoryAdapter(TextTranslationPort):
+    """Serve known segments from memory and translate only the rest."""
+
+    def __init__(
+        self,
+        inner: TextTranslationPort,
+        *,
+        prompt_version: str,
+        cache: CacheService | None = None,
+        uow_factory: Any | None = AsyncUnitOfWork,
+    ) -> None:
+        self._inner = inner
+        self._prompt_version = prompt_version
+        self._cache = cache
+        self._uow_factory = uow_factory
+
+    def key_for(self, text: str, source_language: str, target_language: str) -> str:
+        digest = hashlib.sha256()
+        for part in (
+            self._prompt_version,
+            source_language,
+            target_language,
+            normalize_segment(text),
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    async def translate_texts(
+        self,
+        texts: Sequence[str],
+        *,
+        source_language: str,
+        target_language: str,
+    ) -> TranslationResult:
+        original = tuple(str(text) for text in texts)
+        source = normalize_language(source_language)
+        target = normalize_language(target_language)
+        if not original or source == target:
+            return await self._inner.translate_texts(
+                original, source_language=source, target_language=target
+            )
+
+        keys = [
+            self.key_for(text, source, target) if normalize_segment(text) else None
+            for text in original
+        ]
+        known = await self._lookup([key for key in keys if key], target)
+        translated = [
+            known.get(key, text) if key else text
+            for key, text in zip(keys, original, strict=True)
+        ]
+        misses = list(
+            dict.fromkeys(
+                text
+                for key, text in zip(keys, original, strict=True)
+                if key and key not in known
+            )
+        )
+        self._record_savings(original, keys, known, target)
+        if not misses:
+            return TranslationResult(
+                tuple(translated), TranslationOutcome.TRANSLATED, source, target
+            )
+
+        result = await self._inner.translate_texts(
+            misses, source_language=source, target_language=target
+        )
+        by_text = dict(zip(misses, result.texts, strict=False))
+        for index, (key, text) in enumerate(zip(keys, original, strict=True)):
+            if key and key not in known:
+                translated[index] = by_text.get(text, text)
+        if result.cacheable:
+            await self._store(
+                {
+                    self.key_for(text, source, target): (text, by_text[text])
+                    for text in misses
+                    if text in by_text
+                },
+                source,
+                target,
+            )
+
+        outcome = result.outcome
+        if known and outcome is TranslationOutcome.UNAVAILABLE:
+            outcome = TranslationOutcome.PARTIAL
+        return TranslationResult(tuple(translated), outcome, source, target)
+
+    async def _lookup(self, keys: list[str], target: str) -> dict[str, str]:
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+        found: dict[str, str] = {}
+        if self._cache is not None:
+            try:
+                values = await self._cache.mget(
+                    [CacheKeys.translation_memory(key)[0] for key in unique]
+                )
+            except Exception as exc:
+                logger.warning("Translation memory cache read failed: %s", exc)
+                values = []
+            found = {
+                key: value
+                for key, value in zip(unique, values, strict=False)
+                if isinstance(value, str) and value
+            }
+        cached = len(found)
+
+        remaining = [key for key in unique if key not in found]
+        durable: dict[str, str] = {}
+        if remaining and self._uow_factory is not None:
+            try:
+                async with self._uow_factory() as uow:
+                    durable = await uow.translation_memory.find_many(remaining)
+            except Exception as exc:
+                logger.warning("Translation memory table read failed: %s", exc)
+            if durable:
+                found.update(durable)
+                await self._write_cache(durable)
+
+        _record_lookup("redis", cached, target)
+        _record_lookup("postgres", len(durable), target)
+        _record_lookup("miss", len(unique) - len(found), target)
+        return found
+
+    async def _store(
+        self, segments: dict[str, tuple[str, str]], source: str, target: str
+    ) -> None:
+        if not segments:
+            return
+        await self._write_cache(
+            {key: translated for key, (_, translated) in segments.items()}
+        )
+        if self._uow_factory is None:
+            return
+        try:
+            async with self._uow_factory() as uow:
+                await uow.translation_memory.save_many(
+                    {
+                        "segment_key": key,
+                        "prompt_version": self._prompt_version,
+                        "source_language": source,
+                        "target_language": target,
+                        "source_text": text,
+                        "translated_text": translated,
+                    }
+                    for key, (text, translated) in segments.items()
+                )
+        except Exception as exc:
+            logger.warning("Translation memory table write failed: %s", exc)
+
+    async def _write_cache(self, values: dict[str, str]) -> None:
+        if self._cache is None or not values:
+            return
+        _, ttl = CacheKeys.translation_memory("")
+        try:
+            await self._cache.mset_with_ttl(
+                {
+                    CacheKeys.translation_memory(key)[0]: value
+                    for key, value in values.items()
+                },
+                ttl,
+            )
+        except Exception as exc:
+            logger.warning("Translation memory cache write failed: %s", exc)
+
+    def _record_savings(
+        self,
+        original: tuple[str, ...],
+        keys: list[str | None],
+        known: dict[str, str],
+        target: str,
+    ) -> None:
+        saved = sum(
+            _estimated_tokens(text, known[key])
+            for key, text in zip(keys, original, strict=True)
+            if key in known
+        )
+        if saved:
+            increment_metric(
+                "ai.translation.memory.tokens_saved",
+                saved,
+                unit="token",
+                attributes={"language": target},
+            )
+
+
+def normalize_segment(text: str) -> str:
+    """Canonical form of a segment for keying: NFC with collapsed whitespace."""
+    return unicodedata.normalize("NFC", " ".join(text.split()))
+
+
+def _estimated_tokens(source: str, translated: str) -> int:
+    size = len(source.encode("utf-8")) + len(translated.encode("utf-8"))
+    return size // _BYTES_PER_TOKEN + _ITEM_TOKEN_OVERHEAD
+
+
+def _record_lookup(tier: str, count: int, target: str) -> None:
+    if count:
+        increment_metric(
+            "ai.translation.memory.segments",
+            count,
+            attributes={"tier": tier, "language": target},
+        )
@@ -1,13 +1,11 @@
 import asyncio
 import json
 import logging
-from io import BytesIO
+from concurrent.futures import Executor
 from typing import Any
 from urllib.parse import urlparse
 from urllib.request import Request, urlopen
 
-from PIL import Image
-
 from src.domain.exceptions.ai_exceptions import (
     AIOutputValidationError,
     AIUnavailableError,
@@ -26,6 +24,7 @@ from src.domain.strategies.meal_analysis_strategy import (
     IngredientIdentificationStrategy,
     MealAnalysisStrategy,
 )
+from src.domain.utils.image_compression import compress_image, compress_image_async
 from src.infra.adapters.ai_json_utils import extract_json
 from src.infra.config.settings import get_settings
 from src.infra.services.ai.ai_model_manager import AIModelManager, ModelPurpose
@@ -41,9 +40,14 @@ VISION_VALIDATION_PURPOSE = "meal_scan"
 class VisionAIService(VisionAIServicePort):
     """Vision AI service with automatic fallback on failures."""
 
-    def __init__(self, max_output_tokens: int | None = None):
+    def __init__(
+        self,
+        max_output_tokens: int | None = None,
+        preprocess_executor: Executor | None = None,
+    ):
         """Initialize with AI model manager."""
         self._ai_manager = AIModelManager.get_instance()
+        self._preprocess_executor = preprocess_executor
         self._optimized_prompt_enabled = True
         self._max_output_tokens = (
             max_output_tokens
@@ -53,33 +57,7 @@ class VisionAIService(VisionAIServicePort):
 
     def _compress_image(self, image_bytes: bytes) -> bytes:
         """Compress image for faster upload."""
-        try:
-            img: Image.Image = Image.open(BytesIO(image_bytes))
-            w, h = img.size
-
-            if (
-                img.format == "JPEG"
-                and max(w, h) <= 768
-                and len(image_bytes) < 200 * 1024
-            ):  # already small JPEG
-                return image_bytes
-
-            if max(w, h) > 768:
-                ratio = 768 / max(w, h)
-                img = img.resize(
-                    (int(w * ratio), int(h * ratio)),
-                    Image.Resampling.LANCZOS,
-                )
-
-            if img.mode != "RGB":
-                img = img.convert("RGB")
-
-            buf = BytesIO()
-            img.save(buf, format="JPEG", quality=85)
-            return buf.getvalue()
-        except Exception as exc:
-            logger.warning("Image compression failed, using original: %s", exc)
-            return image_bytes
+        return compress_image(image_bytes)
 
     async def analyze_with_strategy(
         self, image_bytes: bytes, strategy: MealAnalysisStrategy
@@ -97,7 +75,11 @@ class VisionAIService(VisionAIServicePort):
         Raises:
             RuntimeError: If analysis fails
         """
-        image_bytes = self._compress_image(image_bytes)
+        # Renditions prepared upstream pass straight through; anything else is
+        # compressed on the shared preprocessing pool, not the event loop.
+        image_bytes = await compress_image_async(
+            image_bytes, self._compress_image, self._preprocess_executor
+        )
 
         if isinstance(strategy, IngredientIdentificationStrategy):
             return await self._analyze_without_nutrition_contract(image_bytes, strategy)
@@ -4,27 +4,52 @@ High-level cache service that handles serialization and metrics.
 
 from __future__ import annotations
 
-import json
-import re
-from datetime import datetime
-from typing import Any, Awaitable, Callable, Optional, TypeVar
-
-from pydantic import BaseModel
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, Optional, TypeVar
 
+from src.domain.cache.cache_keys import CacheKeys
 from src.domain.ports.cache_port import CachePort
-from src.infra.cache.metrics import CacheMonitor
+from src.infra.cache.codec import (
+    CacheCodec,
+    CacheDecodeError,
+    LegacyJsonCodec,
+    TaggedJsonCodec,
+)
+from src.infra.cache.local_tier import (
+    LOCAL_INVALIDATION_CHANNEL,
+    LocalCacheTier,
+    LocalTierInvalidationSubscriber,
+    invalidation_message,
+)
+from src.infra.cache.metrics import TIER_LOCAL, CacheMonitor
 from src.infra.cache.redis_client import RedisClient
+from src.infra.cache.single_flight import SingleFlight
 
-# Strip the trailing 'Z' produced by an older serializer bug that wrote
-# tz-aware datetimes as '...+HH:MMZ' (offset + Z together is invalid ISO8601
-# and rejected by Pydantic v2). Heals existing Redis entries on read.
-_LEGACY_OFFSET_Z_RE = re.compile(r"([+-]\d{2}:\d{2})Z")
+_PEER_FILL_POLL_SECONDS = 0.05
 
 T = TypeVar("T")
 
 
 class CacheService(CachePort):
-    """Cache service implementing the cache-aside pattern."""
+    """Cache service implementing the cache-aside pattern.
+
+    With ``tagged_keys`` enabled, keys in ``CacheKeys.TAGGED_USER_FAMILIES``
+    get their user/family generation folded in on every read and write, and
+    pattern invalidation of such a family is a single INCR of that generation
+    instead of a keyspace SCAN. Orphaned entries age out by their own TTL.
+
+    An optional ``local_tier`` answers hot families in-process before Redis;
+    see ``src.infra.cache.local_tier`` for its coherence contract.
+
+    ``get_or_set`` misses are single-flight: concurrent callers in one process
+    share a computation, and with ``fill_lock_ttl`` other processes wait for
+    the lock holder's value instead of recomputing it.
+
+    Payloads go through ``codec`` (see ``src.infra.cache.codec``); versioned
+    codecs still read untagged entries written before they were enabled.
+    """
 
     def __init__(
         self,
@@ -32,11 +57,67 @@ class CacheService(CachePort):
         default_ttl: int = 3600,
         monitor: Optional[CacheMonitor] = None,
         enabled: bool = True,
+        tagged_keys: bool = False,
+        local_tier: LocalCacheTier | None = None,
+        fill_lock_ttl: int = 0,
+        codec: CacheCodec | None = None,
     ):
         self.redis = redis_client
         self.default_ttl = default_ttl
         self.monitor = monitor
         self.enabled = enabled
+        self.tagged_keys = tagged_keys
+        self.local_tier = local_tier
+        self.codec: CacheCodec = codec or LegacyJsonCodec()
+        self.single_flight = SingleFlight(monitor)
+        # >0 also coalesces get_or_set misses across processes via SET NX.
+        self.fill_lock_ttl = fill_lock_ttl
+        # Identifies this process's invalidation messages so it skips its own.
+        self.instance_id = uuid.uuid4().hex
+        self._local_subscriber: LocalTierInvalidationSubscriber | None = None
+
+    @classmethod
+    def create(
+        cls,
+        redis_client: RedisClient,
+        *,
+        local_tier_enabled: bool = False,
+        versioned_codec: bool = False,
+        compress_min_bytes: int | None = 4096,
+        **options: Any,
+    ) -> CacheService:
+        """Build a service with an L1 tier over ``CacheKeys.LOCAL_TIER_FAMILIES``.
+
+        The tier is only added to an enabled service; call
+        ``start_local_invalidation`` once the event loop is running.
+        ``versioned_codec`` selects ``TaggedJsonCodec`` (compressing payloads
+        of at least ``compress_min_bytes``) over the legacy untagged JSON.
+        """
+        local_tier = (
+            LocalCacheTier(CacheKeys.LOCAL_TIER_FAMILIES)
+            if local_tier_enabled and options.get("enabled", True)
+            else None
+        )
+        codec = (
+            TaggedJsonCodec(compress_min_bytes=compress_min_bytes)
+            if versioned_codec
+            else LegacyJsonCodec()
+        )
+        return cls(redis_client, local_tier=local_tier, codec=codec, **options)
+
+    def start_local_invalidation(self) -> None:
+        """Apply peer invalidations to the L1 tier; a no-op without one."""
+        if self.local_tier is None or self._local_subscriber is not None:
+            return
+        self._local_subscriber = LocalTierInvalidationSubscriber(
+            self.redis, self.local_tier, self.instance_id
+        )
+        self._local_subscriber.start()
+
+    async def stop_local_invalidation(self) -> None:
+        subscriber, self._local_subscriber = self._local_subscriber, None
+        if subscriber is not None:
+            await subscriber.stop()
 
     async def get(self, key: str) -> Optional[Any]:
         """Implement CachePort.get — delegates to get_json."""
@@ -51,7 +132,29 @@ class CacheService(CachePort):
         if not self.enabled:
             return None
 
-        raw = await self.redis.get(key)
+        local = self._get_local(key)
+        if local is not None:
+            return local
+
+        physical_key = await self._physical_key(key)
+        if physical_key is None:
+            return None
+        return await self._get_physical(physical_key, key)
+
+    def _get_local(self, key: str) -> Any | None:
+        if self.local_tier is None or not self.local_tier.handles(key):
+            return None
+        raw = self.local_tier.get(key)
+        if raw is None:
+            if self.monitor:
+                self.monitor.record_miss(TIER_LOCAL)
+            return None
+        if self.monitor:
+            self.monitor.record_hit(TIER_LOCAL)
+        return self._decode(raw)
+
+    async def _get_physical(self, physical_key: str, key: str) -> Any | None:
+        raw = await self.redis.get(physical_key)
         if raw is None:
             if self.monitor:
                 self.monitor.record_miss()
@@ -60,26 +163,85 @@ class CacheService(CachePort):
         if self.monitor:
             self.monitor.record_hit()
 
-        try:
-            sanitized = (
-                _LEGACY_OFFSET_Z_RE.sub(r"\1", raw) if isinstance(raw, str) else raw
-            )
-            return json.loads(sanitized)
-        except json.JSONDecodeError:
-            return None
+        value = self._decode(raw)
+        if value is not None and self.local_tier is not None:
+            self.local_tier.put(key, raw)
+        return value
 
     async def set_json(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Serialize and cache a value."""
         if not self.enabled:
             return False
 
-        payload: str
-        if isinstance(value, BaseModel):
-            payload = value.model_dump_json()
-        else:
-            payload = json.dumps(value, default=_json_serializer)
+        physical_key = await self._physical_key(key)
+        if physical_key is None:
+            return False
+        return await self._set_physical(physical_key, key, value, ttl)
+
+    async def _set_physical(
+        self, physical_key: str, key: str, value: Any, ttl: int | None
+    ) -> bool:
+        payload = self.codec.encode(value)
+        stored = await self.redis.set(physical_key, payload, ttl or self.default_ttl)
+        if stored and self.local_tier is not None:
+            self.local_tier.put(key, payload)
+        return stored
+
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        """Retrieve several cached values, reading all Redis misses in one MGET.
+
+        Results line up with ``keys``; a miss, decode failure or unavailable
+        generation is None.
+        """
+        if not self.enabled:
+            return [None] * len(keys)
+        results = [self._get_local(key) for key in keys]
+        lookups: list[tuple[int, str]] = []
+        for index, key in enumerate(keys):
+            if results[index] is not None:
+                continue
+            physical_key = await self._physical_key(key)
+            if physical_key is not None:
+                lookups.append((index, physical_key))
+        if not lookups:
+            return results
+
+        raws = await self.redis.mget([physical_key for _, physical_key in lookups])
+        for (index, _), raw in zip(lookups, raws, strict=True):
+            if raw is None:
+                if self.monitor:
+                    self.monitor.record_miss()
+                continue
+            if self.monitor:
+                self.monitor.record_hit()
+            value = self._decode(raw)
+            if value is not None and self.local_tier is not None:
+                self.local_tier.put(keys[index], raw)
+            results[index] = value
+        return results
 
-        return await self.redis.set(key, payload, ttl or self.default_ttl)
+    async def mset_with_ttl(
+        self, values: Mapping[str, Any], ttl: int | None = None
+    ) -> bool:
+        """Serialize and cache several values with one TTL in one round trip."""
+        if not self.enabled or not values:
+            return False
+        payloads: dict[str, str] = {}
+        local_payloads: dict[str, str] = {}
+        for key, value in values.items():
+            physical_key = await self._physical_key(key)
+            if physical_key is None:
+                continue
+            payload = self.codec.encode(value)
+            payloads[physical_key] = payload
+            local_payloads[key] = payload
+        if not payloads:
+            return False
+        stored = await self.redis.mset_with_ttl(payloads, ttl or self.default_ttl)
+        if stored and self.local_tier is not None:
+            for key, payload in local_payloads.items():
+                self.local_tier.put(key, payload)
+        return stored
 
     async def get_or_set(
         self,
@@ -89,40 +251,140 @@ class CacheService(CachePort):
     ) -> Optional[T]:
         """
         Cache-aside helper that fetches data from cache or executes the factory.
+
+        In tagged mode the generation is resolved once, before the factory
+        runs, so a value computed across a concurrent invalidation is written
+        under the superseded generation and never served.
         """
-        cached = await self.get_json(key)
+        if not self.enabled:
+            return await factory()
+
+        local = self._get_local(key)
+        if local is not None:
+            return local  # type: ignore[return-value]
+
+        physical_key = await self._physical_key(key)
+        if physical_key is None:
+            return await factory()
+
+        cached = await self._get_physical(physical_key, key)
         if cached is not None:
             return cached  # type: ignore[return-value]
 
-        value = await factory()
-        if value is not None:
-            await self.set_json(key, value, ttl)
-        return value
+        # Concurrent misses in this process share one fill; keyed by the
+        # physical key so a post-invalidation generation never joins it.
+        return await self.single_flight.run(
+            physical_key, lambda: self._fill(physical_key, key, factory, ttl)
+        )
+
+    async def _fill(
+        self,
+        physical_key: str,
+        key: str,
+        factory: Callable[[], Awaitable[T]],
+        ttl: int | None,
+    ) -> T | None:
+        lock_key: str | None = None
+        if self.fill_lock_ttl > 0:
+            lock_key = CacheKeys.fill_lock(physical_key)
+            acquired = await self.redis.set_if_not_exists(
+                lock_key, self.instance_id, self.fill_lock_ttl
+            )
+            if acquired is False:
+                lock_key = None
+                peer_value = await self._await_peer_fill(physical_key, key)
+                if peer_value is not None:
+                    if self.monitor:
+                        self.monitor.record_coalesced(remote=True)
+                    return peer_value  # type: ignore[return-value]
+
+        try:
+            value = await factory()
+            if value is not None:
+                await self._set_physical(physical_key, key, value, ttl)
+            return value
+        finally:
+            # Advisory lock: if it already expired and a peer re-took it, the
+            # worst case is one duplicate computation.
+            if lock_key is not None:
+                await self.redis.delete(lock_key)
+
+    async def _await_peer_fill(self, physical_key: str, key: str) -> Any | None:
+        """Poll for another process's fill until its lock would have expired."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.fill_lock_ttl
+        while loop.time() < deadline:
+            await asyncio.sleep(_PEER_FILL_POLL_SECONDS)
+            raw = await self.redis.get(physical_key)
+            if raw is not None:
+                value = self._decode(raw)
+                if value is not None and self.local_tier is not None:
+                    self.local_tier.put(key, raw)
+                return value
+        return None
 
     async def invalidate(self, key: str) -> bool:
         """Remove a cached value."""
         if not self.enabled:
             return False
-        return await self.redis.delete(key)
+        if self.local_tier is not None and self.local_tier.handles(key):
+            self.local_tier.evict(key)
+            await self._publish_local_invalidation("key", key)
+        physical_key = await self._physical_key(key)
+        if physical_key is None:
+            return False
+        self.single_flight.forget(physical_key)
+        return await self.redis.delete(physical_key)
 
     async def invalidate_pattern(self, pattern: str) -> int:
-        """Remove all cache keys matching a pattern."""
+        """Remove all cache keys matching a pattern.
+
+        In tagged mode a pattern inside a tagged family bumps the whole
+        user/family generation (one INCR) and returns 1 when it succeeded.
+        Narrower patterns such as one date's activities therefore invalidate
+        the family for every date, which is safe but coarser.
+        """
         if not self.enabled:
             return 0
+        if self.local_tier is not None and self.local_tier.may_match(pattern):
+            self.local_tier.evict_pattern(pattern)
+            await self._publish_local_invalidation("pattern", pattern)
+        self.single_flight.forget_pattern(pattern)
+        tagged = CacheKeys.tagged_family(pattern) if self.tagged_keys else None
+        if tagged is not None:
+            generation_key, ttl = CacheKeys.user_generation(*tagged)
+            bumped = await self.redis.incr_with_expiry(
+                generation_key, ttl, refresh=True
+            )
+            return 0 if bumped is None else 1
         return await self.redis.delete_pattern(pattern)
 
-
-def _json_serializer(value: Any) -> Any:
-    """Helper to serialize objects that aren't JSON-serializable by default."""
-    if isinstance(value, BaseModel):
-        return value.model_dump()
-    if isinstance(value, datetime):
-        # tz-aware datetimes already encode the offset (e.g. +00:00); only
-        # append 'Z' for naive datetimes (assumed UTC) to avoid producing
-        # malformed strings like '...+00:00Z' that Pydantic rejects.
-        return (
-            value.isoformat() if value.tzinfo is not None else value.isoformat() + "Z"
+    async def _publish_local_invalidation(self, op: str, target: str) -> None:
+        await self.redis.publish(
+            LOCAL_INVALIDATION_CHANNEL,
+            invalidation_message(op, target, self.instance_id),
         )
-    raise TypeError(
-        f"Object of type {value.__class__.__name__} is not JSON serializable"
-    )
+
+    def _decode(self, raw: Any) -> Any | None:
+        try:
+            return self.codec.decode(raw)
+        except CacheDecodeError:
+            return None
+
+    async def _physical_key(self, key: str) -> str | None:
+        """Resolve the stored key, or None when its generation is unavailable.
+
+        Falling back to generation 0 on a Redis error could read an entry that
+        a later INCR already superseded, so the caller bypasses the cache.
+        """
+        tagged = CacheKeys.tagged_family(key) if self.tagged_keys else None
+        if tagged is None:
+            return key
+        generation_key, ttl = CacheKeys.user_generation(*tagged)
+        generation = await self.redis.read_counter(generation_key, ttl)
+        if generation is None:
+            if self.monitor:
+                self.monitor.record_error()
+            return None
+        return CacheKeys.with_generation(key, generation)
+
@@ -0,0 +1,134 @@
+"""
+Versioned payload codecs for Redis cache values.
+
+Every payload written by ``TaggedJsonCodec`` starts with a one-character
+version tag that can never begin a JSON document:
+
+- ``\\x01`` + JSON text
+- ``\\x02`` + base64(zlib(JSON bytes)), used above a size threshold
+
+Untagged payloads are legacy entries written before the codec existed; only
+those go through the ``'+HH:MMZ'`` datetime repair regex. The Redis pool uses
+``decode_responses=True``, so compressed bodies are base64 text rather than
+raw bytes.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import re
+import zlib
+from datetime import datetime
+from typing import Any, Protocol
+
+from pydantic import BaseModel
+
+try:  # orjson is optional; stdlib json produces the same documents.
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+TAG_JSON = "\x01"
+TAG_JSON_ZLIB = "\x02"
+
+# Strip the trailing 'Z' produced by an older serializer bug that wrote
+# tz-aware datetimes as '...+HH:MMZ' (offset + Z together is invalid ISO8601
+# and rejected by Pydantic v2). Heals existing Redis entries on read.
+_LEGACY_OFFSET_Z_RE = re.compile(r"([+-]\d{2}:\d{2})Z")
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+)
+
+
+class CacheDecodeError(ValueError):
+    """Raised when a cached payload cannot be decoded; callers treat it as a miss."""
+
+
+class CacheCodec(Protocol):
+    def encode(self, value: Any) -> str: ...
+
+    def decode(self, raw: Any) -> Any: ...
+
+
+class LegacyJsonCodec:
+    """Untagged JSON, the format written before payloads were versioned."""
+
+    def encode(self, value: Any) -> str:
+        if isinstance(value, BaseModel):
+            return value.model_dump_json()
+        return json.dumps(value, default=json_serializer)
+
+    def decode(self, raw: Any) -> Any:
+        return decode_legacy(raw)
+
+
+class TaggedJsonCodec:
+    """Version-tagged JSON with zlib compression above ``compress_min_bytes``."""
+
+    def __init__(self, compress_min_bytes: int | None = 4096, level: int = 6):
+        self.compress_min_bytes = compress_min_bytes or None
+        self.level = level
+
+    def encode(self, value: Any) -> str:
+        body = _dumps(value)
+        if self.compress_min_bytes and len(body) >= self.compress_min_bytes:
+            packed = zlib.compress(body, self.level)
+            return TAG_JSON_ZLIB + base64.b64encode(packed).decode("ascii")
+        return TAG_JSON + body.decode("utf-8")
+
+    def decode(self, raw: Any) -> Any:
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        if not isinstance(raw, str) or not raw:
+            raise CacheDecodeError("empty cache payload")
+        tag = raw[0]
+        try:
+            if tag == TAG_JSON:
+                return _loads(raw[1:])
+            if tag == TAG_JSON_ZLIB:
+                return _loads(zlib.decompress(base64.b64decode(raw[1:])))
+        except (ValueError, zlib.error) as exc:
+            raise CacheDecodeError(str(exc)) from exc
+        return decode_legacy(raw)
+
+
+def decode_legacy(raw: Any) -> Any:
+    try:
+        sanitized = _LEGACY_OFFSET_Z_RE.sub(r"\1", raw) if isinstance(raw, str) else raw
+        return json.loads(sanitized)
+    except (TypeError, ValueError) as exc:
+        raise CacheDecodeError(str(exc)) from exc
+
+
+def json_serializer(value: Any) -> Any:
+    """Helper to serialize objects that aren't JSON-serializable by default."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, datetime):
+        # tz-aware datetimes already encode the offset (e.g. +00:00); only
+        # append 'Z' for naive datetimes (assumed UTC) to avoid producing
+        # malformed strings like '...+00:00Z' that Pydantic rejects.
+        return (
+            value.isoformat() if value.tzinfo is not None else value.isoformat() + "Z"
+        )
+    raise TypeError(
+        f"Object of type {value.__class__.__name__} is not JSON serializable"
+    )
+
+
+def _dumps(value: Any) -> bytes:
+    if isinstance(value, BaseModel):
+        return value.model_dump_json().encode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(value, default=json_serializer, option=_ORJSON_OPTIONS)
+    return json.dumps(value, default=json_serializer, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def _loads(body: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
@@ -13,12 +13,15 @@ from typing import Awaitable, Callable, Optional, TypeVar, ParamSpec
 
 from src.domain.cache.cache_keys import CacheKeys
 from src.infra.cache.cache_service import CacheService
+from src.infra.cache.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+_default_flight = SingleFlight()
+
 
 def cached(
     key_func: Callable[..., str],
@@ -34,7 +37,8 @@ def cached(
         cache_none: Whether to cache None results (default False)
 
     The wrapped function must be an async method whose first argument is `self`
-    and `self` must expose a `cache_service` attribute.
+    and `self` must expose a `cache_service` attribute. Concurrent misses on
+    the same key are coalesced onto one call of the wrapped function.
 
     Example:
         class MyService:
@@ -66,21 +70,32 @@ def cached(
                 logger.warning(f"Cache GET failed: {cache_key} - {e}")
 
             logger.debug(f"Cache MISS: {cache_key}")
-            result = await func(*args, **kwargs)
 
-            if result is not None or cache_none:
-                try:
-                    await cache_service.set_json(cache_key, result, ttl)
-                except Exception as e:
-                    logger.warning(f"Cache SET failed: {cache_key} - {e}")
+            async def compute() -> T:
+                result = await func(*args, **kwargs)
 
-            return result
+                if result is not None or cache_none:
+                    try:
+                        await cache_service.set_json(cache_key, result, ttl)
+                    except Exception as e:
+                        logger.warning(f"Cache SET failed: {cache_key} - {e}")
+
+                return result
+
+            # Concurrent misses on the same key share one computation.
+            return await _flight_for(cache_service).run(cache_key, compute)
 
         return wrapper
 
     return decorator
 
 
+def _flight_for(cache_service: object) -> SingleFlight:
+    """Use the cache service's flight group (and metrics) when it has one."""
+    flight = getattr(cache_service, "single_flight", None)
+    return flight if isinstance(flight, SingleFlight) else _default_flight
+
+
 def cached_method(
     prefix: str,
     ttl: int = CacheKeys.TTL_1_HOUR,
@@ -0,0 +1,163 @@
+"""
+Bounded in-process L1 tier in front of Redis for hot, near-static key families.
+
+Entries hold the raw Redis payload, not the decoded object, so callers never
+share a mutable value. Cross-worker coherence is best-effort Redis pub/sub:
+``CacheService.invalidate``/``invalidate_pattern`` publish to
+``LOCAL_INVALIDATION_CHANNEL`` and every worker evicts its copy. A lost message
+is bounded by the family's short TTL, and the subscriber clears the whole tier
+whenever its connection drops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import json
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+from cachetools import TTLCache
+
+from src.infra.cache.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+LOCAL_INVALIDATION_CHANNEL = "cache:local-invalidation:v1"
+_RESUBSCRIBE_DELAY_SECONDS = 5.0
+_POLL_TIMEOUT_SECONDS = 1.0
+
+
+class LocalCacheTier:
+    """Per-family LRU+TTL caches keyed by logical cache key prefix."""
+
+    def __init__(self, families: Mapping[str, tuple[int, int]]):
+        # Longest prefix first so a specific family wins over a broader one.
+        self._families: list[tuple[str, TTLCache[str, Any]]] = [
+            (prefix, TTLCache(maxsize=maxsize, ttl=ttl))
+            for prefix, (maxsize, ttl) in sorted(
+                families.items(), key=lambda item: len(item[0]), reverse=True
+            )
+        ]
+
+    def _cache_for(self, key: str) -> TTLCache[str, Any] | None:
+        for prefix, cache in self._families:
+            if key.startswith(prefix):
+                return cache
+        return None
+
+    def handles(self, key: str) -> bool:
+        return self._cache_for(key) is not None
+
+    def may_match(self, pattern: str) -> bool:
+        """True when a glob pattern could cover keys of some local family."""
+        literal = pattern.split("*", 1)[0].split("?", 1)[0].split("[", 1)[0]
+        return any(
+            prefix.startswith(literal) or literal.startswith(prefix)
+            for prefix, _ in self._families
+        )
+
+    def get(self, key: str) -> Any | None:
+        cache = self._cache_for(key)
+        return cache.get(key) if cache is not None else None
+
+    def put(self, key: str, raw: Any) -> None:
+        cache = self._cache_for(key)
+        if cache is not None:
+            cache[key] = raw
+
+    def evict(self, key: str) -> None:
+        cache = self._cache_for(key)
+        if cache is not None:
+            cache.pop(key, None)
+
+    def evict_pattern(self, pattern: str) -> int:
+        evicted = 0
+        for _, cache in self._families:
+            for key in [
+                k for k in list(cache.keys()) if fnmatch.fnmatchcase(k, pattern)
+            ]:
+                cache.pop(key, None)
+                evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        for _, cache in self._families:
+            cache.clear()
+
+    def apply_message(self, data: Any, origin: str) -> None:
+        """Apply one pub/sub invalidation message; ignore our own and malformed ones."""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if not isinstance(message, dict) or message.get("origin") == origin:
+            return
+        target = message.get("target")
+        if not isinstance(target, str):
+            return
+        if message.get("op") == "pattern":
+            self.evict_pattern(target)
+        else:
+            self.evict(target)
+
+
+def invalidation_message(op: str, target: str, origin: str) -> str:
+    return json.dumps({"op": op, "target": target, "origin": origin})
+
+
+class LocalTierInvalidationSubscriber:
+    """Owns the per-process pub/sub listener that keeps one L1 tier coherent."""
+
+    def __init__(self, redis_client: RedisClient, tier: LocalCacheTier, origin: str):
+        self.redis = redis_client
+        self.tier = tier
+        self.origin = origin
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._run(), name="cache:local-invalidation-subscriber"
+            )
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001 - keep listening
+                logger.warning(
+                    "Local cache invalidation subscriber error: %s",
+                    type(exc).__name__,
+                )
+            # Messages may have been missed while disconnected.
+            self.tier.clear()
+            await asyncio.sleep(_RESUBSCRIBE_DELAY_SECONDS)
+
+    async def _listen_once(self) -> None:
+        await self.redis.connect()
+        if self.redis.client is None:
+            return
+        pubsub = self.redis.client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(LOCAL_INVALIDATION_CHANNEL)
+            while True:
+                # Poll with an explicit timeout: a blocking read would inherit
+                # the pool's socket_timeout and fail on every idle period.
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=_POLL_TIMEOUT_SECONDS
+                )
+                if message and message.get("type") == "message":
+                    self.tier.apply_message(message.get("data"), self.origin)
+        finally:
+            await pubsub.aclose()
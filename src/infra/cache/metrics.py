@@ -5,10 +5,12 @@ Simple cache metrics collector.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
 
 from src.domain.utils.timezone_utils import utc_now
 
+TIER_LOCAL = "local"
+TIER_REDIS = "redis"
+
 
 @dataclass
 class CacheMetrics:
@@ -23,35 +25,77 @@ class CacheMetrics:
             return 0.0
         return (self.hits / self.total_requests) * 100
 
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_requests": self.total_requests,
+            "hit_rate": round(self.hit_rate, 2),
+        }
+
 
 class CacheMonitor:
-    """In-memory metrics tracker for cache activity."""
+    """In-memory metrics tracker for cache activity.
+
+    Top-level counters record the final outcome of each lookup. Per-tier
+    counters show where it was answered: a local (L1) hit is a Redis
+    round-trip saved, and a local miss falls through to the Redis tier.
+    """
 
     def __init__(self):
         self.metrics = CacheMetrics()
+        self.tiers: dict[str, CacheMetrics] = {}
+        self.single_flight: dict[str, int] = _empty_single_flight()
         self.last_reset = utc_now()
 
-    def record_hit(self) -> None:
+    def _tier(self, tier: str) -> CacheMetrics:
+        return self.tiers.setdefault(tier, CacheMetrics())
+
+    def record_hit(self, tier: str = TIER_REDIS) -> None:
+        tier_metrics = self._tier(tier)
+        tier_metrics.hits += 1
+        tier_metrics.total_requests += 1
         self.metrics.hits += 1
         self.metrics.total_requests += 1
 
-    def record_miss(self) -> None:
-        self.metrics.misses += 1
-        self.metrics.total_requests += 1
+    def record_miss(self, tier: str = TIER_REDIS) -> None:
+        tier_metrics = self._tier(tier)
+        tier_metrics.misses += 1
+        tier_metrics.total_requests += 1
+        # Only the last tier's miss is a miss for the caller.
+        if tier == TIER_REDIS:
+            self.metrics.misses += 1
+            self.metrics.total_requests += 1
 
     def record_error(self) -> None:
         self.metrics.errors += 1
 
-    def snapshot(self) -> Dict[str, float | int | str]:
+    def record_flight_leader(self) -> None:
+        self.single_flight["leaders"] += 1
+
+    def record_coalesced(self, remote: bool = False) -> None:
+        """Count a miss that reused another caller's computation."""
+        self.single_flight["coalesced_remote" if remote else "coalesced_local"] += 1
+
+    def snapshot(self) -> dict[str, object]:
         return {
             "hits": self.metrics.hits,
             "misses": self.metrics.misses,
             "errors": self.metrics.errors,
             "total_requests": self.metrics.total_requests,
             "hit_rate": round(self.metrics.hit_rate, 2),
+            "tiers": {name: m.as_dict() for name, m in sorted(self.tiers.items())},
+            "redis_round_trips_saved": self.tiers.get(TIER_LOCAL, CacheMetrics()).hits,
+            "single_flight": dict(self.single_flight),
             "since": self.last_reset.isoformat(),
         }
 
     def reset(self) -> None:
         self.metrics = CacheMetrics()
+        self.tiers = {}
+        self.single_flight = _empty_single_flight()
         self.last_reset = utc_now()
+
+
+def _empty_single_flight() -> dict[str, int]:
+    return {"leaders": 0, "coalesced_local": 0, "coalesced_remote": 0}
@@ -6,7 +6,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Awaitable, Callable, Optional, TypeVar
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Optional, TypeVar
 from urllib.parse import urlparse
 
 import redis.asyncio as redis
@@ -157,6 +158,32 @@ class RedisClient:
 
         return await self._with_client("SET", operation, False, key)
 
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """Retrieve several values in one MGET; all None if Redis unavailable."""
+        if not keys:
+            return []
+        return await self._with_client(
+            "MGET", lambda client: client.mget(keys), [None] * len(keys)
+        )
+
+    async def mset_with_ttl(self, values: Mapping[str, str], ttl: int) -> bool:
+        """Store several values with one TTL in a single pipelined round trip.
+
+        MSET has no expiry, so this pipelines SETEX per key (non-transactional:
+        each key is an independent cache entry).
+        """
+        if not values:
+            return True
+
+        async def operation(client: redis.Redis) -> bool:
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.setex(key, ttl, value)
+                await pipe.execute()
+            return True
+
+        return await self._with_client("MSET", operation, False)
+
     async def delete(self, key: str) -> bool:
         """Delete a cached key."""
 
@@ -219,13 +246,46 @@ class RedisClient:
             return None
         return raw == "set"
 
-    async def incr_with_expiry(self, key: str, ttl: int) -> int | None:
-        """Atomically increment a bounded counter, returning None if unavailable."""
+    async def incr_with_expiry(
+        self, key: str, ttl: int, *, refresh: bool = False
+    ) -> int | None:
+        """Atomically increment a bounded counter, returning None if unavailable.
+
+        The expiry is set by the first increment (a fixed window), or by every
+        increment in the same MULTI when ``refresh`` is set (a sliding one).
+        """
 
         async def operation(client: redis.Redis) -> int:
+            if refresh:
+                async with client.pipeline(transaction=True) as pipe:
+                    pipe.incr(key)
+                    pipe.expire(key, ttl)
+                    count, _ = await pipe.execute()
+                return int(count)
             count = await client.incr(key)
             if count == 1:
                 await client.expire(key, ttl)
             return count
 
         return await self._with_client("INCR", operation, None, key)
+
+    async def read_counter(self, key: str, ttl: int) -> int | None:
+        """
+        GETEX key EX ttl: read a counter and refresh its expiry in one trip.
+        Returns 0 if the counter is missing, None if Redis unavailable.
+        """
+
+        async def operation(client: redis.Redis) -> int:
+            raw = await client.getex(key, ex=ttl)
+            return int(raw) if raw is not None else 0
+
+        return await self._with_client("GETEX", operation, None, key)
+
+    async def publish(self, channel: str, message: str) -> bool:
+        """Publish a pub/sub message; False if Redis unavailable."""
+
+        async def operation(client: redis.Redis) -> bool:
+            await client.publish(channel, message)
+            return True
+
+        return await self._with_client("PUBLISH", operation, False, channel)
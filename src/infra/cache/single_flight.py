@@ -0,0 +1,73 @@
+"""
+In-process single-flight coalescing for cache misses.
+
+Concurrent misses on the same key share one in-flight computation: the first
+caller runs the factory and later callers await its future. Errors are shared
+the same way. If the leader is cancelled (e.g. client disconnect), waiters run
+the factory themselves instead of failing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from src.infra.cache.metrics import CacheMonitor
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls per key within one event loop."""
+
+    def __init__(self, monitor: CacheMonitor | None = None):
+        self.monitor = monitor
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        future = self._inflight.get(key)
+        if future is not None and future.get_loop() is loop:
+            if self.monitor:
+                self.monitor.record_coalesced()
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader went away; fall through and compute ourselves.
+
+        future = loop.create_future()
+        # Nobody may be waiting; mark any exception as retrieved.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        if self.monitor:
+            self.monitor.record_flight_leader()
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def forget(self, key: str) -> None:
+        """Detach an in-flight key so later callers start a fresh computation.
+
+        Callers already waiting keep the original result; only callers that
+        arrive after an invalidation must not join a pre-write computation.
+        """
+        self._inflight.pop(key, None)
+
+    def forget_pattern(self, pattern: str) -> None:
+        for key in [k for k in self._inflight if fnmatch.fnmatchcase(k, pattern)]:
+            self._inflight.pop(key, None)
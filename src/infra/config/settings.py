@@ -97,9 +97,45 @@ class Settings(BaseSettings):
     # Cache configuration
     CACHE_ENABLED: bool = Field(default=True)
     CACHE_DEFAULT_TTL: int = Field(default=3600)  # 1 hour
+    CACHE_TAGGED_KEYS_ENABLED: bool = Field(
+        default=False,
+        description="Fold per-user generations into user read-model keys; invalidate by INCR instead of SCAN.",
+    )
+    CACHE_LOCAL_TIER_ENABLED: bool = Field(
+        default=False,
+        description="In-process L1 tier for CacheKeys.LOCAL_TIER_FAMILIES, kept coherent via Redis pub/sub.",
+    )
+    CACHE_FILL_LOCK_SECONDS: int = Field(
+        default=0,
+        ge=0,
+        description="Cross-process single-flight lock TTL for get_or_set misses; 0 keeps coalescing in-process only.",
+    )
+    CACHE_SWR_ENABLED: bool = Field(
+        default=False,
+        description="Serve dashboard read models past their TTL while a background refresh runs.",
+    )
+    CACHE_SWR_STALE_SECONDS: int = Field(
+        default=900,
+        ge=0,
+        description="How long past its soft TTL a stale-while-revalidate entry may still be served.",
+    )
+    CACHE_CODEC_VERSIONED_ENABLED: bool = Field(
+        default=False,
+        description="Write version-tagged cache payloads (compact JSON, zlib above the threshold); legacy entries stay readable.",
+    )
+    CACHE_COMPRESS_MIN_BYTES: int = Field(
+        default=4096,
+        ge=0,
+        description="Versioned-codec payloads at least this large are zlib-compressed; 0 disables compression.",
+    )
 
     # Firebase
     FIREBASE_CREDENTIALS: str | None = Field(default=None)
+    FIREBASE_LOCAL_TOKEN_VERIFICATION_ENABLED: bool = Field(
+        default=False,
+        description="Verify ID tokens in-process against prefetched Google keys and cache verified claims until exp.",
+    )
+    FIREBASE_TOKEN_CACHE_MAX_ENTRIES: int = Field(default=20_000, ge=1)
     FIREBASE_SERVICE_ACCOUNT_JSON: str | None = Field(default=None)
     FIREBASE_SERVICE_ACCOUNT_PATH: str | None = Field(default=None)
 
@@ -139,6 +175,21 @@ class Settings(BaseSettings):
     OPENAI_TEXT_MODEL: str = Field(default="gpt-5.4-mini-2026-03-17")
     OPENAI_TRANSLATION_MODEL: str = Field(default="gpt-5.4-mini-2026-03-17")
     OPENAI_TRANSLATION_TIMEOUT_SECONDS: float = Field(default=8.0)
+    TRANSLATION_MEMORY_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "Serve repeated translation segments from Redis and the "
+            "translation_memory table; only misses are sent to the model."
+        ),
+    )
+    TRANSLATION_BATCH_WINDOW_MS: float = Field(
+        default=0.0,
+        ge=0.0,
+        description=(
+            "How long concurrent translation calls for one language pair are "
+            "collected into a single model request; 0 disables micro-batching."
+        ),
+    )
     OPENAI_REQUEST_TIMEOUT_SECONDS: int = Field(default=20)
     OPENAI_MAX_RETRIES: int = Field(default=1)
     OPENAI_STORE_RESPONSES: bool = Field(
@@ -300,6 +351,28 @@ class Settings(BaseSettings):
         default="v1",
         description="Meal analysis graph version emitted in workflow state.",
     )
+    AI_MEAL_ANALYZE_CONCURRENT_UPLOAD_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "Run the durable image upload alongside vision analysis in the meal "
+            "analysis graph, joining before the meal is persisted."
+        ),
+    )
+    AI_MEAL_ANALYZE_RESULT_CACHE_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "Cache parsed meal vision results by image digest, strategy and locale "
+            "so re-scans and retries of the same photo skip the provider call. "
+            "Identical in-flight scans are coalesced either way."
+        ),
+    )
+    MEAL_SUGGESTION_RECIPE_CACHE_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "Reuse generated suggestion recipes across users for the same dish, "
+            "banded targets and constraints; hits are rescaled per session."
+        ),
+    )
     PARSE_TEXT_STRUCTURED_REFERENCE_ENABLED: bool = Field(
         default=False,
         description="Enable structured local/FatSecret resolution for parse-text.",
@@ -309,6 +382,10 @@ class Settings(BaseSettings):
         gt=0,
         description="Request-wide parse-text FatSecret deadline in seconds.",
     )
+    PARSE_TEXT_CONCURRENT_LOOKUP_ENABLED: bool = Field(
+        default=False,
+        description="Resolve parse-text items concurrently under the shared budget.",
+    )
 
     # Catalog meal recommendations analytics
     MEAL_RECOMMENDATIONS_ANALYTICS_SALT: str = Field(
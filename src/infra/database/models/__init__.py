@@ -40,6 +40,7 @@ from .meal.meal_instruction_step import MealInstructionStepORM
 
 # Translation models (meals + food items)
 from .meal.meal_translation_model import MealTranslationORM
+from .meal.user_streak_summary import UserStreakSummaryORM
 from .meal_image_cache import MealImageCacheModel
 from .meal_recommendation import (
     MealCatalogIngredientORM,
@@ -51,6 +52,7 @@ from .meal_write_operation import MealWriteOperationORM
 
 # Notification models
 from .notification import NotificationORM, NotificationPreferencesORM, UserFcmTokenORM
+from .nutrition.daily_nutrition_rollup import DailyNutritionRollupORM
 from .nutrition.food_item import FoodItemORM
 
 # Nutrition models
@@ -66,6 +68,7 @@ from .saved_suggestion import SavedSuggestionModel
 from .saved_suggestion_item import SavedSuggestionItemModel
 from .saved_suggestion_step import SavedSuggestionStepModel
 from .subscription import Subscription
+from .translation_memory import TranslationMemoryORM
 from .user.body_fat_visual_profile import BodyFatVisualProfile
 from .user.profile import UserProfile
 from .user.profile_preference import UserProfilePreference
@@ -132,6 +135,7 @@ __all__ = [
     # Nutrition models
     "NutritionORM",
     "FoodItemORM",
+    "DailyNutritionRollupORM",
     # Meal models
     "MealORM",
     "MealImageORM",
@@ -139,6 +143,7 @@ __all__ = [
     "MealWriteOperationORM",
     "MealTranslationORM",
     "FoodItemTranslationORM",
+    "UserStreakSummaryORM",
     # Test models
     # Notification models
     "NotificationORM",
@@ -163,6 +168,7 @@ __all__ = [
     "BarcodeProductModel",  # backward-compatible alias
     "HydrationEntryORM",
     "MealImageCacheModel",
+    "TranslationMemoryORM",
     # Meal recommendation catalog
     "MealCatalogORM",
     "MealCatalogIngredientORM",
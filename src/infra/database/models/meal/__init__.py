@@ -4,10 +4,12 @@ from .meal import MealORM
 from .meal_image import MealImageORM
 from .meal_translation_model import MealTranslationORM
 from .food_item_translation_model import FoodItemTranslationORM
+from .user_streak_summary import UserStreakSummaryORM
 
 __all__ = [
     "MealORM",
     "MealImageORM",
     "MealTranslationORM",
     "FoodItemTranslationORM",
+    "UserStreakSummaryORM",
 ]
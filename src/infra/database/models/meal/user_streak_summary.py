@@ -0,0 +1,30 @@
+"""
+Per-user logging streak summary, maintained by meal writes.
+"""
+
+from sqlalchemy import Column, Date, ForeignKey, Integer, String
+
+from src.infra.database.base import Base
+from src.infra.database.models.base import TimestampMixin
+
+
+class UserStreakSummaryORM(Base, TimestampMixin):
+    """SQLAlchemy model for the user_streak_summaries table."""
+
+    __tablename__ = "user_streak_summaries"
+
+    user_id = Column(
+        String(36),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Timezone the local dates below were computed in; a mismatch forces a rebuild.
+    # Meal writes set it to "" to mark the summary stale.
+    timezone = Column(String(64), nullable=False)
+    # Bumped by every meal write touching the summary; guards rebuild upserts.
+    version = Column(Integer, nullable=False, default=0)
+    last_logged_date = Column(Date, nullable=True)
+    current_run_start = Column(Date, nullable=True)
+    best_run_length = Column(Integer, nullable=False, default=0)
+    best_run_end = Column(Date, nullable=True)
+    scan_count = Column(Integer, nullable=False, default=0)
@@ -1,9 +1,11 @@
 """Nutrition-related database models."""
 
+from .daily_nutrition_rollup import DailyNutritionRollupORM
 from .food_item import FoodItemORM
 from .nutrition import NutritionORM
 
 __all__ = [
     "NutritionORM",
     "FoodItemORM",
+    "DailyNutritionRollupORM",
 ]
@@ -0,0 +1,40 @@
+"""
+Per-user, per-local-day nutrition totals, kept in step with meal, hydration
+and movement writes.
+"""
+
+from sqlalchemy import Column, Date, Float, ForeignKey, Integer, String
+
+from src.infra.database.base import Base
+from src.infra.database.models.base import TimestampMixin
+
+
+class DailyNutritionRollupORM(Base, TimestampMixin):
+    """SQLAlchemy model for the daily_nutrition_rollups table."""
+
+    __tablename__ = "daily_nutrition_rollups"
+
+    user_id = Column(
+        String(36),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    local_date = Column(Date, primary_key=True)
+    # Timezone local_date was computed in; a mismatch makes the row stale.
+    # Source writes set it to "" to mark the day stale.
+    timezone = Column(String(64), nullable=False)
+    # Bumped by every source write touching the day; guards rebuild upserts.
+    version = Column(Integer, nullable=False, default=0)
+    meal_count = Column(Integer, nullable=False, default=0)
+    hydration_entry_count = Column(Integer, nullable=False, default=0)
+    calories = Column(Float, nullable=False, default=0.0)
+    protein = Column(Float, nullable=False, default=0.0)
+    carbs = Column(Float, nullable=False, default=0.0)
+    fat = Column(Float, nullable=False, default=0.0)
+    fiber = Column(Float, nullable=False, default=0.0)
+    ready_calories = Column(Float, nullable=False, default=0.0)
+    ready_protein = Column(Float, nullable=False, default=0.0)
+    ready_carbs = Column(Float, nullable=False, default=0.0)
+    ready_fat = Column(Float, nullable=False, default=0.0)
+    hydration_ml = Column(Integer, nullable=False, default=0)
+    movement_kcal = Column(Float, nullable=False, default=0.0)
@@ -0,0 +1,24 @@
+"""Durable segment-level translation memory shared by all translation callers."""
+
+from sqlalchemy import Column, String, Text
+
+from src.infra.database.base import Base
+from src.infra.database.models.base import TimestampMixin
+
+
+class TranslationMemoryORM(Base, TimestampMixin):
+    """SQLAlchemy model for the translation_memory table.
+
+    ``segment_key`` is the SHA-256 of the prompt version, language pair and
+    normalized source text; the other columns are kept for inspection and
+    targeted purges.
+    """
+
+    __tablename__ = "translation_memory"
+
+    segment_key = Column(String(64), primary_key=True)
+    prompt_version = Column(String(128), nullable=False)
+    source_language = Column(String(16), nullable=False)
+    target_language = Column(String(16), nullable=False)
+    source_text = Column(Text, nullable=False)
+    translated_text = Column(Text, nullable=False)
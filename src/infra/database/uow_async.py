@@ -21,6 +21,9 @@ from src.infra.repositories.catalog_recipe_repository_async import (
     AsyncCatalogMealRepository,
 )
 from src.infra.repositories.cheat_day_repository_async import AsyncCheatDayRepository
+from src.infra.repositories.daily_nutrition_rollup_repository_async import (
+    AsyncDailyNutritionRollupRepository,
+)
 from src.infra.repositories.food_reference_integrity_repository import (
     FoodReferenceIntegrityRepository,
 )
@@ -47,9 +50,15 @@ from src.infra.repositories.referral_repository import ReferralRepository
 from src.infra.repositories.saved_suggestion_db_repository_async import (
     AsyncSavedSuggestionDbRepository,
 )
+from src.infra.repositories.streak_summary_repository_async import (
+    AsyncStreakSummaryRepository,
+)
 from src.infra.repositories.subscription_repository_async import (
     AsyncSubscriptionRepository,
 )
+from src.infra.repositories.translation_memory_repository_async import (
+    AsyncTranslationMemoryRepository,
+)
 from src.infra.repositories.user_repository_async import AsyncUserRepository
 from src.infra.repositories.weekly_budget_repository_async import (
     AsyncWeeklyBudgetRepository,
@@ -126,6 +135,7 @@ class AsyncUnitOfWork(AsyncUnitOfWorkPort):
         self.users = AsyncUserRepository(session)
         self.weekly_budgets = AsyncWeeklyBudgetRepository(session)
         self.cheat_days = AsyncCheatDayRepository(session)
+        self.streak_summaries = AsyncStreakSummaryRepository(session)
         self.subscriptions = AsyncSubscriptionRepository(session)
         self.notifications = AsyncNotificationRepository(session)
         self.saved_suggestions = AsyncSavedSuggestionDbRepository(session)
@@ -134,10 +144,17 @@ class AsyncUnitOfWork(AsyncUnitOfWorkPort):
         )  # alias for handlers using this name
         self.weight_entries = AsyncWeightRepository(session)
         self.movement_entries = AsyncMovementRepository(session)
+        self.daily_nutrition_rollups = AsyncDailyNutritionRollupRepository(
+            session,
+            meals=self.meals,
+            hydration_entries=self.hydration_entries,
+            movement_entries=self.movement_entries,
+        )
         self.food_references = AsyncFoodReferenceRepository(session)
         self.food_reference_integrity = FoodReferenceIntegrityRepository(session)
         self.catalog_recipes = AsyncCatalogMealRepository(session)
         self.meal_translations = AsyncMealTranslationRepository(session)
+        self.translation_memory = AsyncTranslationMemoryRepository(session)
         self.promo_codes = PromoCodeRepository(session)
         self.referrals = ReferralRepository(session)
         self.affiliate_outbox = AffiliateEventOutboxRepository(session)
@@ -0,0 +1,289 @@
+"""Async repository for persisted per-user daily nutrition rollups."""
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import DateTime, case, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.model.meal import DailyNutritionRollup
+from src.domain.model.meal.daily_nutrition_rollup import local_day_bounds_utc
+from src.domain.utils.timezone_utils import ensure_utc, utc_now
+from src.infra.database.models.nutrition.daily_nutrition_rollup import (
+    DailyNutritionRollupORM,
+)
+
+# Upper bound on meals loaded for one rebuild; ranges are at most ~two months.
+_REBUILD_MEAL_LIMIT = 10_000
+
+# Timezone of a row a source write has marked stale; no user timezone matches.
+STALE_TIMEZONE = ""
+
+# UTC offsets bounding every timezone: an instant falls on one of the local
+# dates between these two, whatever timezone a row was built in.
+_MIN_UTC_OFFSET = timedelta(hours=-12)
+_MAX_UTC_OFFSET = timedelta(hours=14)
+
+_VALUE_COLUMNS = (
+    "timezone",
+    "meal_count",
+    "hydration_entry_count",
+    "calories",
+    "protein",
+    "carbs",
+    "fat",
+    "fiber",
+    "ready_calories",
+    "ready_protein",
+    "ready_carbs",
+    "ready_fat",
+    "hydration_ml",
+    "movement_kcal",
+)
+
+
+class AsyncDailyNutritionRollupRepository:
+    """Async daily nutrition rollup repository. Never calls session.commit().
+
+    A stored row is always current without locking the user. Every row
+    carries a ``version``: meal, hydration and movement writes bump it for the
+    local days they may touch and mark the day holding the write stale, in
+    their own transaction, by upserting the row (so a write also conflicts
+    with a rebuild's uncommitted insert). Reads rebuild stale and missing days
+    from the sources and store a day only while its version is still the one
+    read before the sources were scanned. A write the rebuild's scan missed
+    has therefore either bumped the version first, and the rebuild's guarded
+    upsert leaves the day alone, or marks the rebuilt row stale afterwards.
+
+    ``meals``, ``hydration_entries`` and ``movement_entries`` are only needed
+    for ``get_range``/``rebuild``; source repositories construct this class
+    without them to invalidate days.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        meals=None,
+        hydration_entries=None,
+        movement_entries=None,
+    ):
+        self.session = session
+        self._meals = meals
+        self._hydration_entries = hydration_entries
+        self._movement_entries = movement_entries
+
+    async def get_range(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+        user_timezone: str,
+    ) -> dict[date, DailyNutritionRollup]:
+        """One rollup per local day in the range, rebuilding missing and stale days.
+
+        The rebuild runs in a savepoint, so when it fails the caller's
+        transaction is still usable for reading the sources directly.
+        """
+        stored = await self.find_range(user_id, start_date, end_date)
+        missing = [
+            day
+            for day in _days(start_date, end_date)
+            if day not in stored or stored[day].timezone != user_timezone
+        ]
+        if missing:
+            async with self.session.begin_nested():
+                rebuilt = await self.rebuild(
+                    user_id, missing[0], missing[-1], user_timezone
+                )
+            stored.update(rebuilt)
+        return stored
+
+    async def find_range(
+        self, user_id: str, start_date: date, end_date: date
+    ) -> dict[date, DailyNutritionRollup]:
+        result = await self.session.execute(
+            select(DailyNutritionRollupORM).where(
+                DailyNutritionRollupORM.user_id == user_id,
+                DailyNutritionRollupORM.local_date >= start_date,
+                DailyNutritionRollupORM.local_date <= end_date,
+                DailyNutritionRollupORM.timezone != STALE_TIMEZONE,
+            )
+        )
+        return {
+            row.local_date: DailyNutritionRollup(
+                user_id=row.user_id,
+                local_date=row.local_date,
+                **{column: getattr(row, column) for column in _VALUE_COLUMNS},
+            )
+            for row in result.scalars().all()
+        }
+
+    async def rebuild(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+        user_timezone: str,
+    ) -> dict[date, DailyNutritionRollup]:
+        """Recompute local days ``[start_date, end_date]`` from sources and store them.
+
+        Days written by a source write since the versions were read are
+        returned but not stored; the next read rebuilds them.
+        """
+        versions = await self._find_versions(user_id, start_date, end_date)
+        meals = await self._meals.find_macro_rows_by_date_range(
+            user_id,
+            start_date,
+            end_date,
+            limit=_REBUILD_MEAL_LIMIT,
+            user_timezone=user_timezone,
+        )
+        hydration_entries = await self._hydration_entries.find_by_date_range(
+            user_id, start_date, end_date, user_timezone=user_timezone
+        )
+        start_utc, end_utc = local_day_bounds_utc(start_date, end_date, user_timezone)
+        movements = await self._movement_entries.fetch_included_kcal_for_range(
+            user_id, start_utc, end_utc
+        )
+        rollups = DailyNutritionRollup.build_range(
+            user_id,
+            user_timezone,
+            start_date,
+            end_date,
+            meals=meals,
+            hydration_entries=hydration_entries,
+            movements=movements,
+        )
+        await self.save_many(rollups.values(), versions)
+        return rollups
+
+    async def save_many(self, rollups, versions: dict[date, int]) -> None:
+        """Upsert rollups whose stored version still equals ``versions[day]``.
+
+        Days absent from ``versions`` are expected to have no row yet.
+        """
+        now = utc_now()
+        rows = [
+            _row(rollup, versions.get(rollup.local_date, 0) + 1, now)
+            for rollup in sorted(rollups, key=lambda rollup: rollup.local_date)
+        ]
+        if not rows:
+            return
+        stmt = pg_insert(DailyNutritionRollupORM).values(rows)
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    DailyNutritionRollupORM.user_id,
+                    DailyNutritionRollupORM.local_date,
+                ],
+                set_={
+                    **{column: stmt.excluded[column] for column in _VALUE_COLUMNS},
+                    "version": stmt.excluded.version,
+                    "updated_at": now,
+                },
+                where=DailyNutritionRollupORM.version == stmt.excluded.version - 1,
+            )
+        )
+
+    async def delete_for_user(self, user_id: str) -> None:
+        await self.session.execute(
+            delete(DailyNutritionRollupORM).where(
+                DailyNutritionRollupORM.user_id == user_id
+            )
+        )
+
+    async def invalidate(self, user_id: str, *logged_at: datetime | None) -> None:
+        """Mark the local days containing ``logged_at`` stale.
+
+        Each stored row is matched in its own timezone. Every date an instant
+        can fall on gets its version bumped, with a stale row inserted where
+        none exists yet, so an in-flight rebuild of any of them never stores
+        a result that missed this write.
+        """
+        instants = sorted(
+            {ensure_utc(value) for value in logged_at if value is not None}
+        )
+        if not instants:
+            return
+        now = utc_now()
+        days = sorted(
+            {
+                day
+                for instant in instants
+                for day in _days(
+                    (instant + _MIN_UTC_OFFSET).date(),
+                    (instant + _MAX_UTC_OFFSET).date(),
+                )
+            }
+        )
+        stmt = pg_insert(DailyNutritionRollupORM).values(
+            [
+                _row(DailyNutritionRollup(user_id, day, STALE_TIMEZONE), 1, now)
+                for day in days
+            ]
+        )
+        holds_write = DailyNutritionRollupORM.local_date.in_(
+            [
+                func.date(
+                    func.timezone(
+                        DailyNutritionRollupORM.timezone,
+                        literal(instant, DateTime(timezone=True)),
+                    )
+                )
+                for instant in instants
+            ]
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    DailyNutritionRollupORM.user_id,
+                    DailyNutritionRollupORM.local_date,
+                ],
+                set_={
+                    # CASE keeps timezone() away from rows already marked stale.
+                    "timezone": case(
+                        (
+                            DailyNutritionRollupORM.timezone == STALE_TIMEZONE,
+                            STALE_TIMEZONE,
+                        ),
+                        (holds_write, STALE_TIMEZONE),
+                        else_=DailyNutritionRollupORM.timezone,
+                    ),
+                    "version": DailyNutritionRollupORM.version + 1,
+                    "updated_at": now,
+                },
+            )
+        )
+
+    async def _find_versions(
+        self, user_id: str, start_date: date, end_date: date
+    ) -> dict[date, int]:
+        result = await self.session.execute(
+            select(
+                DailyNutritionRollupORM.local_date, DailyNutritionRollupORM.version
+            ).where(
+                DailyNutritionRollupORM.user_id == user_id,
+                DailyNutritionRollupORM.local_date >= start_date,
+                DailyNutritionRollupORM.local_date <= end_date,
+            )
+        )
+        return dict(result.all())
+
+
+def _row(rollup: DailyNutritionRollup, version: int, now: datetime) -> dict:
+    return {
+        "user_id": rollup.user_id,
+        "local_date": rollup.local_date,
+        **{column: getattr(rollup, column) for column in _VALUE_COLUMNS},
+        "version": version,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _days(start_date: date, end_date: date) -> list[date]:
+    return [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+    ]
@@ -6,18 +6,23 @@ import logging
 from collections.abc import Mapping
 from typing import Any
 
-from sqlalchemy import inspect, select
+from sqlalchemy import inspect, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import set_committed_value
 
 from src.domain.constants.languages import normalize_language
+from src.domain.ports.food_reference_repository_port import ProviderFoodAdoption
 from src.domain.services.food_reference_identity import (
     platform_name_normalized,
     sanitize_locale_name,
 )
-from src.domain.services.nutrition_integrity_policy import NutritionIntegrityPolicy
+from src.domain.services.nutrition_integrity_policy import (
+    NutritionIntegrityError,
+    NutritionIntegrityPolicy,
+)
 from src.infra.database.models.food_reference_model import FoodReferenceModel
 from src.infra.repositories.food_reference_integrity_repository import (
     FoodReferenceIntegrityRepository,
@@ -105,6 +110,143 @@ class FoodReferenceAdoptRepository:
             "locale_name": clean_locale_name or None,
         }
 
+    async def adopt_provider_foods(
+        self, adoptions: list[ProviderFoodAdoption], locale: str
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """Adopt a batch of provider hits in the caller's transaction.
+
+        Missing identity rows are created by one multi-row
+        ``INSERT ... ON CONFLICT DO NOTHING`` and every row is then loaded by
+        one identity ``SELECT``, so concurrent adopters converge on the same
+        ids. Identities are handled in sorted order throughout, so two
+        batches sharing foods take their row locks in the same order and
+        cannot deadlock. A hit whose macros fail the integrity policy is
+        skipped rather than failing the batch; it is never inserted, and an
+        existing unverified row is left untouched.
+        """
+        pending: dict[tuple[str, str], ProviderFoodAdoption] = {}
+        for adoption in adoptions:
+            if adoption.namespace and adoption.food_id:
+                pending.setdefault(
+                    (adoption.namespace, str(adoption.food_id)), adoption
+                )
+        if not pending:
+            return {}
+        identities = sorted(pending)
+        rejected = {
+            identity
+            for identity in identities
+            if not self._passes_policy(pending[identity])
+        }
+        await self._insert_missing_identities(
+            [identity for identity in identities if identity not in rejected]
+        )
+        models = await self._find_models_by_source_identities(identities)
+
+        adopted: dict[tuple[str, str], tuple[FoodReferenceModel, str]] = {}
+        for identity in identities:
+            adoption = pending[identity]
+            model = models.get(identity)
+            if model is None:
+                logger.info("food_reference_adopt.identity_missing %s:%s", *identity)
+                continue
+            if identity in rejected and not model.is_verified:
+                continue
+            self._apply_nutrition(
+                model, adoption.english_name, adoption.per_100g, adoption.servings
+            )
+            clean_locale_name = sanitize_locale_name(adoption.locale_name)
+            self._apply_name_vi(model, locale, clean_locale_name)
+            adopted[identity] = (model, clean_locale_name)
+        await self._session.flush()
+        for model, _ in adopted.values():
+            await self._integrity_repository.materialize_reference(
+                model, actor_kind="system", reason_code="provider_adopt"
+            )
+        await self._session.flush()
+        return {
+            identity: {
+                **food_reference_model_to_dict(model),
+                "name_normalized": model.name_normalized,
+                "locale": locale,
+                "locale_name": clean_locale_name or None,
+            }
+            for identity, (model, clean_locale_name) in adopted.items()
+        }
+
+    def _passes_policy(self, adoption: ProviderFoodAdoption) -> bool:
+        try:
+            self._integrity_policy.require_valid(
+                {
+                    "protein_100g": adoption.per_100g.get("protein_100g"),
+                    "carbs_100g": adoption.per_100g.get("carbs_100g"),
+                    "fat_100g": adoption.per_100g.get("fat_100g"),
+                    "fiber_100g": adoption.per_100g.get("fiber_100g", 0),
+                    "sugar_100g": adoption.per_100g.get("sugar_100g", 0),
+                    "allowed_units": adoption.servings,
+                },
+                require_energy=False,
+                require_metric_basis=False,
+            )
+        except NutritionIntegrityError as exc:
+            logger.info(
+                "food_reference_adopt.rejected %s:%s reason=%s",
+                adoption.namespace,
+                adoption.food_id,
+                exc.result.reason_code,
+            )
+            return False
+        return True
+
+    async def _insert_missing_identities(
+        self, identities: list[tuple[str, str]]
+    ) -> None:
+        if not identities:
+            return
+        rows = []
+        for namespace, food_id in sorted(identities):
+            identity_key = platform_name_normalized(namespace, food_id)
+            rows.append(
+                {
+                    "name": identity_key,
+                    "name_normalized": identity_key,
+                    "source": namespace,
+                    "source_namespace": namespace,
+                    "source_food_id": food_id,
+                    "is_verified": False,
+                    "density": 1.0,
+                    "fiber_100g": 0,
+                    "sugar_100g": 0,
+                }
+            )
+        # No conflict target: a row already holding the identity (partial
+        # unique index) or its name_normalized key is reused by the SELECT.
+        await self._session.execute(
+            pg_insert(FoodReferenceModel).values(rows).on_conflict_do_nothing()
+        )
+
+    async def _find_models_by_source_identities(
+        self, identities: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], FoodReferenceModel]:
+        stmt = (
+            select(FoodReferenceModel)
+            .where(
+                tuple_(
+                    FoodReferenceModel.source_namespace,
+                    FoodReferenceModel.source_food_id,
+                ).in_(sorted(identities))
+            )
+            .order_by(
+                FoodReferenceModel.source_namespace,
+                FoodReferenceModel.source_food_id,
+            )
+        )
+        result = await self._session.execute(stmt.options(*_ADOPT_LOAD_OPTIONS))
+        return {
+            (model.source_namespace, model.source_food_id): model
+            for model in result.scalars().all()
+        }
+
     def _apply_name_vi(
         self, model: FoodReferenceModel, locale: str, locale_name: str
     ) -> None:
@@ -13,6 +13,7 @@ from sqlalchemy.orm import selectinload
 from src.domain.ports.food_reference_repository_port import (
     FoodReferenceNutritionProjection,
     FoodReferenceSearchProjection,
+    ProviderFoodAdoption,
 )
 from src.domain.services.food_reference_identity import (
     FATSECRET_NAMESPACE,
@@ -366,6 +367,11 @@ class AsyncFoodReferenceRepository:
             locale_name,
         )
 
+    async def adopt_provider_foods(
+        self, adoptions: list[ProviderFoodAdoption], locale: str
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        return await self._adopt_repository.adopt_provider_foods(adoptions, locale)
+
     async def find_by_locale_names(
         self, language: str, names: list[str]
     ) -> dict[str, dict[str, Any]]:
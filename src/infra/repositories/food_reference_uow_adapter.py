@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from src.domain.ports.food_reference_repository_port import ProviderFoodAdoption
 from src.infra.database.uow_async import AsyncUnitOfWork
 
 
@@ -111,6 +112,12 @@ class AsyncFoodReferenceUowAdapter:
                 locale_name,
             )
 
+    async def adopt_provider_foods(
+        self, adoptions: list[ProviderFoodAdoption], locale: str
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        async with self._uow_factory() as uow:
+            return await uow.food_references.adopt_provider_foods(adoptions, locale)
+
     async def find_by_locale_names(
         self, language: str, names: list[str]
     ) -> dict[str, dict[str, Any]]:
@@ -8,6 +8,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.model.hydration import HydrationEntry
 from src.domain.utils.timezone_utils import get_zone_info
 from src.infra.database.models.hydration_entry import HydrationEntryORM
+from src.infra.repositories.daily_nutrition_rollup_repository_async import (
+    AsyncDailyNutritionRollupRepository,
+)
 
 
 def _local_day_range(
@@ -74,14 +77,18 @@ def _domain_to_orm(entry: HydrationEntry) -> HydrationEntryORM:
 
 
 class AsyncHydrationRepository:
+    """Writes also mark the daily nutrition rollup of the entry's local day stale."""
+
     def __init__(self, session: AsyncSession):
         self.session = session
+        self._rollups = AsyncDailyNutritionRollupRepository(session)
 
     async def add(self, entry: HydrationEntry) -> HydrationEntry:
         db = _domain_to_orm(entry)
         self.session.add(db)
         await self.session.flush()
         await self.session.refresh(db)
+        await self._rollups.invalidate(db.user_id, db.logged_at)
         return _orm_to_domain(db)
 
     async def find_by_id_or_legacy_meal_id(
@@ -223,12 +230,15 @@ class AsyncHydrationRepository:
 
     async def delete_by_id_or_legacy_meal_id(self, user_id: str, entry_id: str) -> bool:
         result = await self.session.execute(
-            delete(HydrationEntryORM).where(
+            delete(HydrationEntryORM)
+            .where(
                 HydrationEntryORM.user_id == user_id,
                 or_(
                     HydrationEntryORM.id == entry_id,
                     HydrationEntryORM.legacy_meal_id == entry_id,
                 ),
             )
+            .returning(HydrationEntryORM.logged_at)
         )
+        await self._rollups.invalidate(user_id, *result.scalars().all())
         return result.rowcount > 0
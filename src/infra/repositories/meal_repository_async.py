@@ -3,20 +3,35 @@
 import logging
 from datetime import UTC, date, datetime, timedelta
 
-from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy import (
+    Text,
+    and_,
+    cast,
+    delete,
+    func,
+    not_,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, noload, selectinload
 
-from src.domain.model.meal import Meal, MealStatus
+from src.domain.model.meal import Meal, MealStatus, StreakSummary
 from src.domain.model.meal.meal_image import MealImage as DomainMealImage
-from src.domain.model.meal_projection import MealProjection
+from src.domain.model.meal_projection import (
+    DailyMacroTotals,
+    MealMacroRow,
+    MealProjection,
+)
 from src.domain.model.nutrition import Nutrition
 from src.domain.model.nutrition.macros import Macros
 from src.domain.ports.meal_repository_port import MealRepositoryPort
+from src.domain.services.meal_calorie_service import effective_meal_calories
 from src.domain.services.meal_recommendation.ingredient_affinity_service import (
     IngredientHistoryBucket,
 )
-from src.domain.utils.timezone_utils import get_zone_info, utc_now
+from src.domain.utils.timezone_utils import ensure_utc, get_zone_info, utc_now
 from src.infra.database.models.enums import MealStatusEnum
 from src.infra.database.models.meal.food_item_translation_model import (
     FoodItemTranslationORM,
@@ -36,6 +51,13 @@ from src.infra.mappers.meal_mapper import (
     meal_orm_to_domain_if_hydratable,
     nutrition_domain_to_orm,
 )
+from src.infra.repositories.daily_nutrition_rollup_repository_async import (
+    AsyncDailyNutritionRollupRepository,
+)
+from src.infra.repositories.streak_summary_repository_async import (
+    STALE_TIMEZONE,
+    AsyncStreakSummaryRepository,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +92,39 @@ def _domain_hydratable_active_meal_filter():
     )
 
 
+def _json_present(column):
+    # Overrides are stored as JSON; SQL NULL, JSON null and {} all mean unset.
+    return and_(column.is_not(None), cast(column, Text).not_in(("null", "{}")))
+
+
+def _needs_effective_calories():
+    """Meals whose calories are not their macro formula (see effective_meal_calories)."""
+    return or_(
+        MealORM.source == "food_label",
+        _json_present(NutritionORM.nutrition_override),
+        select(FoodItemORM.id)
+        .where(
+            FoodItemORM.nutrition_id == NutritionORM.id,
+            _json_present(FoodItemORM.nutrition_override),
+        )
+        .exists(),
+    )
+
+
+def _macro_calories_expr():
+    """SQL twin of ``Macros.raw_total_calories``, unrounded.
+
+    Same float8 operations in the same order as the Python formula, so
+    rounding the value in Python gives exactly ``Macros.total_calories``.
+    SQL ``round`` on numeric would not: it rounds halves away from zero.
+    """
+    protein = func.coalesce(NutritionORM.protein, 0)
+    carbs = func.coalesce(NutritionORM.carbs, 0)
+    fat = func.coalesce(NutritionORM.fat, 0)
+    fiber = func.coalesce(NutritionORM.fiber, 0)
+    return protein * 4 + func.greatest(carbs - fiber, 0) * 4 + fiber * 2 + fat * 9
+
+
 def _map_domain_hydratable_meals(db_meals: list[MealORM]) -> list[Meal]:
     meals: list[Meal] = []
     for db_meal in db_meals:
@@ -79,11 +134,23 @@ def _map_domain_hydratable_meals(db_meals: list[MealORM]) -> list[Meal]:
     return meals
 
 
+def _local_date(created_at: datetime | None, user_timezone: str) -> date:
+    local = ensure_utc(created_at or utc_now()).astimezone(get_zone_info(user_timezone))
+    return local.date()
+
+
 class AsyncMealRepository(MealRepositoryPort):
-    """Async SQLAlchemy meal repository. Never calls session.commit()."""
+    """Async SQLAlchemy meal repository. Never calls session.commit().
+
+    Meal inserts, deactivations and deletes also keep the user's streak summary
+    current (see ``StreakSummary``) in the same transaction, and every meal
+    write marks the daily nutrition rollup of the meal's local day stale.
+    """
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self._streaks = AsyncStreakSummaryRepository(session)
+        self._rollups = AsyncDailyNutritionRollupRepository(session)
 
     async def save(self, meal: Meal) -> Meal:
         result = await self.session.execute(
@@ -97,6 +164,10 @@ class AsyncMealRepository(MealRepositoryPort):
         existing_meal = result.scalars().first()
 
         if existing_meal:
+            deactivated = (
+                existing_meal.status != MealStatusEnum.INACTIVE
+                and meal.status == MealStatus.INACTIVE
+            )
             existing_meal.status = MealStatusMapper.to_db(meal.status)
             existing_meal.dish_name = meal.dish_name
             existing_meal.meal_type = meal.meal_type
@@ -140,6 +211,13 @@ class AsyncMealRepository(MealRepositoryPort):
                     )
 
             await self.session.flush()
+            if deactivated:
+                await self._record_streak_day_removed(
+                    existing_meal.user_id, existing_meal.created_at
+                )
+            await self._rollups.invalidate(
+                existing_meal.user_id, existing_meal.created_at
+            )
             return await self._reload_meal_domain(
                 meal.meal_id, fallback_image=meal.image
             )
@@ -152,6 +230,11 @@ class AsyncMealRepository(MealRepositoryPort):
 
             self.session.add(db_meal)
             await self.session.flush()
+            if meal.status != MealStatus.INACTIVE:
+                await self._record_streak_day_added(
+                    db_meal.user_id, db_meal.created_at, db_meal.source
+                )
+            await self._rollups.invalidate(db_meal.user_id, db_meal.created_at)
             return await self._reload_meal_domain(
                 db_meal.meal_id, fallback_image=meal.image
             )
@@ -199,6 +282,13 @@ class AsyncMealRepository(MealRepositoryPort):
         return [meal_orm_to_domain(m) for m in result.scalars().all()]
 
     async def delete(self, meal_id: str) -> None:
+        meal_result = await self.session.execute(
+            select(
+                MealORM.user_id, MealORM.created_at, MealORM.source, MealORM.status
+            ).where(MealORM.meal_id == meal_id)
+        )
+        deleted = meal_result.first()
+
         nutrition_result = await self.session.execute(
             select(NutritionORM).where(NutritionORM.meal_id == meal_id)
         )
@@ -234,6 +324,15 @@ class AsyncMealRepository(MealRepositoryPort):
         )
         await self.session.execute(delete(MealORM).where(MealORM.meal_id == meal_id))
 
+        if deleted is not None:
+            await self._record_streak_day_removed(
+                deleted.user_id,
+                deleted.created_at,
+                day_removed=deleted.status != MealStatusEnum.INACTIVE,
+                scan_delta=-1 if deleted.source == "scanner" else 0,
+            )
+            await self._rollups.invalidate(deleted.user_id, deleted.created_at)
+
     async def find_by_date(
         self,
         date_obj: date,
@@ -390,6 +489,194 @@ class AsyncMealRepository(MealRepositoryPort):
         )
         return _map_domain_hydratable_meals(result.unique().scalars().all())
 
+    async def sum_macros_by_local_date(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+        user_timezone: str | None = None,
+        exclude_dates: set[date] | None = None,
+    ) -> list[DailyMacroTotals]:
+        """Per local date and status totals of active meals, grouped in SQL.
+
+        Plain meals' unrounded formula calories are collected per group in
+        SQL and rounded per meal here, like ``Macros.total_calories``; the
+        few whose calories are not their macro formula (overrides, food-label
+        scans) are loaded and added through ``effective_meal_calories``.
+        """
+        tz = get_zone_info(user_timezone) if user_timezone else UTC
+        start_dt = datetime.combine(
+            start_date, datetime.min.time(), tzinfo=tz
+        ).astimezone(UTC)
+        end_dt = (
+            datetime.combine(end_date, datetime.min.time(), tzinfo=tz)
+            + timedelta(days=1)
+        ).astimezone(UTC)
+        if user_timezone and user_timezone != "UTC":
+            date_expr = func.date(func.timezone(user_timezone, MealORM.created_at))
+        else:
+            date_expr = func.date(MealORM.created_at)
+        needs_effective = _needs_effective_calories()
+        criteria = [
+            MealORM.user_id == user_id,
+            MealORM.created_at >= start_dt,
+            MealORM.created_at < end_dt,
+            _domain_hydratable_active_meal_filter(),
+        ]
+        if exclude_dates:
+            criteria.append(date_expr.not_in(sorted(exclude_dates)))
+
+        result = await self.session.execute(
+            select(
+                date_expr,
+                MealORM.status,
+                func.count(),
+                func.array_agg(_macro_calories_expr()).filter(not_(needs_effective)),
+                func.coalesce(func.sum(NutritionORM.protein), 0),
+                func.coalesce(func.sum(NutritionORM.carbs), 0),
+                func.coalesce(func.sum(NutritionORM.fat), 0),
+                func.coalesce(func.sum(NutritionORM.fiber), 0),
+                func.count().filter(needs_effective),
+            )
+            .select_from(MealORM)
+            .join(NutritionORM, NutritionORM.meal_id == MealORM.meal_id, isouter=True)
+            .where(*criteria)
+            .group_by(date_expr, MealORM.status)
+        )
+        totals: dict[tuple[date, MealStatus], list] = {}
+        needs_effective_count = 0
+        for day_val, status, count, calories, *macros, effective in result.all():
+            if isinstance(day_val, str):
+                day_val = date.fromisoformat(day_val)
+            totals[(day_val, MealStatusMapper.to_domain(status))] = [
+                count,
+                sum((round(float(value), 1) for value in calories or ()), 0.0),
+                *(float(value) for value in macros),
+            ]
+            needs_effective_count += effective
+
+        if needs_effective_count:
+            for meal in await self._find_meals_needing_effective_calories(*criteria):
+                key = (_local_date(meal.created_at, user_timezone), meal.status)
+                if key in totals:
+                    totals[key][1] += effective_meal_calories(meal)
+
+        return [
+            DailyMacroTotals(day_val, status, *values)
+            for (day_val, status), values in sorted(
+                totals.items(), key=lambda item: (item[0][0], item[0][1].value)
+            )
+        ]
+
+    async def find_macro_rows_by_date_range(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+        limit: int = 500,
+        user_timezone: str | None = None,
+    ) -> list[MealMacroRow]:
+        """Active meals in a local date range as flat rows, oldest first.
+
+        Same filter and order as ``find_by_date_range`` without images, food
+        items or instruction steps; only meals whose calories need
+        ``effective_meal_calories`` are hydrated.
+        """
+        tz = get_zone_info(user_timezone) if user_timezone else UTC
+        start_dt = datetime.combine(
+            start_date, datetime.min.time(), tzinfo=tz
+        ).astimezone(UTC)
+        end_dt = (
+            datetime.combine(end_date, datetime.min.time(), tzinfo=tz)
+            + timedelta(days=1)
+        ).astimezone(UTC)
+
+        result = await self.session.execute(
+            select(
+                MealORM.meal_id,
+                MealORM.created_at,
+                MealORM.status,
+                MealORM.meal_type,
+                MealORM.quantity,
+                NutritionORM.id,
+                NutritionORM.protein,
+                NutritionORM.carbs,
+                NutritionORM.fat,
+                NutritionORM.fiber,
+                _needs_effective_calories(),
+            )
+            .join(NutritionORM, NutritionORM.meal_id == MealORM.meal_id, isouter=True)
+            .where(
+                MealORM.created_at >= start_dt,
+                MealORM.created_at < end_dt,
+                MealORM.user_id == user_id,
+                _domain_hydratable_active_meal_filter(),
+            )
+            .order_by(MealORM.created_at.asc())
+            .limit(limit)
+        )
+        rows = result.all()
+        effective_ids = [row[0] for row in rows if row[-1]]
+        effective_calories = {}
+        if effective_ids:
+            effective_calories = {
+                meal.meal_id: effective_meal_calories(meal)
+                for meal in await self._find_meals_needing_effective_calories(
+                    MealORM.meal_id.in_(effective_ids)
+                )
+            }
+
+        macro_rows = []
+        for (
+            meal_id,
+            created_at,
+            status,
+            meal_type,
+            quantity,
+            nutrition_id,
+            protein,
+            carbs,
+            fat,
+            fiber,
+            _,
+        ) in rows:
+            protein = float(protein or 0.0)
+            carbs = float(carbs or 0.0)
+            fat = float(fat or 0.0)
+            fiber = float(fiber or 0.0)
+            calories = effective_calories.get(meal_id)
+            if calories is None:
+                calories = (
+                    round(Macros.raw_total_calories(protein, carbs, fat, fiber), 1)
+                    if nutrition_id is not None
+                    else 0.0
+                )
+            macro_rows.append(
+                MealMacroRow(
+                    meal_id=meal_id,
+                    created_at=created_at,
+                    status=MealStatusMapper.to_domain(status),
+                    meal_type=meal_type,
+                    quantity=quantity,
+                    has_nutrition=nutrition_id is not None,
+                    calories=calories,
+                    protein=protein,
+                    carbs=carbs,
+                    fat=fat,
+                    fiber=fiber,
+                )
+            )
+        return macro_rows
+
+    async def _find_meals_needing_effective_calories(self, *criteria) -> list[Meal]:
+        result = await self.session.execute(
+            select(MealORM)
+            .options(*_PROJECTION_OPTS[MealProjection.MACROS_ONLY])
+            .join(NutritionORM, NutritionORM.meal_id == MealORM.meal_id)
+            .where(_needs_effective_calories(), *criteria)
+        )
+        return _map_domain_hydratable_meals(result.unique().scalars().all())
+
     async def aggregate_linked_ingredient_history(
         self,
         *,
@@ -529,22 +816,41 @@ class AsyncMealRepository(MealRepositoryPort):
         return rows
 
     async def get_dates_with_meals(
-        self, user_id: str, user_timezone: str | None = None
+        self,
+        user_id: str,
+        user_timezone: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
     ) -> list[date]:
+        """Distinct local dates with an active meal, newest first.
+
+        ``start_date``/``end_date`` (inclusive, local) bound the scan by
+        ``created_at`` so streak repairs do not read the whole history.
+        """
         # Always PostgreSQL in async path
         if user_timezone and user_timezone != "UTC":
             date_expr = func.date(func.timezone(user_timezone, MealORM.created_at))
         else:
             date_expr = func.date(MealORM.created_at)
 
-        result = await self.session.execute(
-            select(date_expr)
-            .where(
-                MealORM.user_id == user_id,
-                _domain_hydratable_active_meal_filter(),
+        stmt = select(date_expr).where(
+            MealORM.user_id == user_id,
+            _domain_hydratable_active_meal_filter(),
+        )
+        tz = get_zone_info(user_timezone) if user_timezone else UTC
+        if start_date is not None:
+            stmt = stmt.where(
+                MealORM.created_at
+                >= datetime.combine(start_date, datetime.min.time(), tzinfo=tz)
+            )
+        if end_date is not None:
+            stmt = stmt.where(
+                MealORM.created_at
+                < datetime.combine(end_date, datetime.min.time(), tzinfo=tz)
+                + timedelta(days=1)
             )
-            .distinct()
-            .order_by(date_expr.desc())
+        result = await self.session.execute(
+            stmt.distinct().order_by(date_expr.desc())
         )
         out: list[date] = []
         for (day_val,) in result.all():
@@ -562,6 +868,102 @@ class AsyncMealRepository(MealRepositoryPort):
         )
         return result.scalar_one()
 
+    async def rebuild_streak_summary(
+        self, user_id: str, user_timezone: str
+    ) -> StreakSummary:
+        """Recompute the streak summary from the full meal history and store it.
+
+        The summary is not stored if a meal write bumped its version during
+        the scan; the caller still gets the summary it computed.
+        """
+        version = await self._streaks.find_version(user_id)
+        dates = await self.get_dates_with_meals(user_id, user_timezone=user_timezone)
+        scan_count = await self.count_by_source(user_id, "scanner")
+        summary = StreakSummary.from_logged_dates(
+            user_id, user_timezone, dates, scan_count=scan_count
+        )
+        await self._streaks.save(summary, version=version)
+        return summary
+
+    async def _record_streak_day_added(
+        self, user_id: str, created_at: datetime | None, source: str | None
+    ) -> None:
+        # Users without a current summary get one built on their next streak read.
+        summary = await self._streaks.get(user_id, for_update=True)
+        if summary is None or summary.timezone == STALE_TIMEZONE:
+            await self._streaks.mark_stale(user_id)
+            return
+        day = _local_date(created_at, summary.timezone)
+        nearby: list[date] = []
+        window = summary.scan_window_for_added_day(day)
+        if window is not None:
+            nearby = await self.get_dates_with_meals(
+                user_id, summary.timezone, start_date=window[0], end_date=window[1]
+            )
+        updated = summary.with_added_day(day, nearby)
+        if source == "scanner":
+            updated = updated.with_scan_count_delta(1)
+        if updated != summary:
+            await self._streaks.save(updated)
+
+    async def _record_streak_day_removed(
+        self,
+        user_id: str,
+        created_at: datetime | None,
+        *,
+        day_removed: bool = True,
+        scan_delta: int = 0,
+    ) -> None:
+        summary = await self._streaks.get(user_id, for_update=True)
+        if summary is None or summary.timezone == STALE_TIMEZONE:
+            await self._streaks.mark_stale(user_id)
+            return
+        updated = summary.with_scan_count_delta(scan_delta)
+        day = _local_date(created_at, summary.timezone)
+        if day_removed and not await self.get_dates_with_meals(
+            user_id, summary.timezone, start_date=day, end_date=day
+        ):
+            previous_run: list[date] = []
+            if summary.empties_current_run(day):
+                previous_run = await self._previous_run_dates(summary, day)
+            repaired = updated.with_removed_day(day, previous_run)
+            if repaired is None:
+                # The best run was broken; older runs are not stored, so the
+                # next streak read rebuilds the summary from history.
+                await self._streaks.mark_stale(user_id)
+                return
+            updated = repaired
+        if updated != summary:
+            await self._streaks.save(updated)
+
+    async def _previous_run_dates(
+        self, summary: StreakSummary, before: date
+    ) -> list[date]:
+        """Dates of the latest run ending before ``before``.
+
+        That run is no longer than the best run, so one indexed lookup of its
+        last day plus a ``best_run_length``-day window covers it.
+        """
+        tz = get_zone_info(summary.timezone)
+        result = await self.session.execute(
+            select(func.max(MealORM.created_at)).where(
+                MealORM.user_id == summary.user_id,
+                MealORM.created_at
+                < datetime.combine(before, datetime.min.time(), tzinfo=tz),
+                _domain_hydratable_active_meal_filter(),
+            )
+        )
+        latest_at = result.scalar_one_or_none()
+        if latest_at is None:
+            return []
+        latest = _local_date(latest_at, summary.timezone)
+        return await self.get_dates_with_meals(
+            summary.user_id,
+            summary.timezone,
+            start_date=latest - timedelta(days=summary.best_run_length),
+            end_date=latest,
+        )
+
     async def find_all_paginated(self, offset: int = 0, limit: int = 20) -> list[Meal]:
         result = await self.session.execute(
             select(MealORM)
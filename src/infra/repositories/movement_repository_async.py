@@ -11,17 +11,24 @@ from src.infra.mappers.movement_entry_mapper import (
     movement_entry_domain_to_orm,
     movement_entry_orm_to_domain,
 )
+from src.infra.repositories.daily_nutrition_rollup_repository_async import (
+    AsyncDailyNutritionRollupRepository,
+)
 
 
 class AsyncMovementRepository:
+    """Writes also mark the daily nutrition rollup of the entry's local day stale."""
+
     def __init__(self, session: AsyncSession):
         self.session = session
+        self._rollups = AsyncDailyNutritionRollupRepository(session)
 
     async def add(self, entry: MovementEntry) -> MovementEntry:
         db = movement_entry_domain_to_orm(entry)
         self.session.add(db)
         await self.session.flush()
         await self.session.refresh(db)
+        await self._rollups.invalidate(db.user_id, db.logged_at)
         return movement_entry_orm_to_domain(db)
 
     async def find_by_id(self, user_id: str, entry_id: str) -> MovementEntry | None:
@@ -136,13 +143,17 @@ class AsyncMovementRepository:
         row.include_in_balance = include_in_balance
         await self.session.flush()
         await self.session.refresh(row)
+        await self._rollups.invalidate(user_id, row.logged_at)
         return movement_entry_orm_to_domain(row)
 
     async def delete(self, user_id: str, entry_id: str) -> bool:
         result = await self.session.execute(
-            delete(MovementEntryORM).where(
+            delete(MovementEntryORM)
+            .where(
                 MovementEntryORM.id == entry_id,
                 MovementEntryORM.user_id == user_id,
             )
+            .returning(MovementEntryORM.logged_at)
         )
+        await self._rollups.invalidate(user_id, *result.scalars().all())
         return result.rowcount > 0
@@ -0,0 +1,121 @@
+"""Async repository for persisted per-user streak summaries."""
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.model.meal import StreakSummary
+from src.domain.utils.timezone_utils import utc_now
+from src.infra.database.models.meal.user_streak_summary import UserStreakSummaryORM
+
+# Timezone of a summary a meal write has marked stale; no user timezone matches.
+STALE_TIMEZONE = ""
+
+
+class AsyncStreakSummaryRepository:
+    """Async streak summary repository. Never calls session.commit().
+
+    A stored summary is kept current without locking the user. Every row
+    carries a ``version``: a meal write either updates the summary under its
+    row lock or, when there is no current summary to update, marks the row
+    stale by upserting it (so a write also conflicts with a rebuild's
+    uncommitted insert), bumping the version both ways. A rebuild reads the
+    version before scanning the meal history and stores its summary only
+    while the version is unchanged. A write the scan missed has therefore
+    either bumped the version first, and the guarded upsert leaves the row
+    alone, or is applied on top of the rebuilt row afterwards.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(
+        self, user_id: str, *, for_update: bool = False
+    ) -> StreakSummary | None:
+        stmt = select(UserStreakSummaryORM).where(
+            UserStreakSummaryORM.user_id == user_id
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
+        result = await self.session.execute(stmt)
+        row = result.scalars().first()
+        if row is None:
+            return None
+        return StreakSummary(
+            user_id=row.user_id,
+            timezone=row.timezone,
+            last_logged_date=row.last_logged_date,
+            current_run_start=row.current_run_start,
+            best_run_length=row.best_run_length,
+            best_run_end=row.best_run_end,
+            scan_count=row.scan_count,
+        )
+
+    async def find_version(self, user_id: str) -> int:
+        """Stored version of the user's summary row; 0 when there is none."""
+        result = await self.session.execute(
+            select(UserStreakSummaryORM.version).where(
+                UserStreakSummaryORM.user_id == user_id
+            )
+        )
+        return result.scalar() or 0
+
+    async def save(self, summary: StreakSummary, *, version: int | None = None) -> None:
+        """Upsert ``summary`` and bump the stored version.
+
+        With ``version`` (a rebuild) the row is only written while its stored
+        version still equals it; a row absent when it was read counts as 0.
+        """
+        now = utc_now()
+        values = {
+            "timezone": summary.timezone,
+            "last_logged_date": summary.last_logged_date,
+            "current_run_start": summary.current_run_start,
+            "best_run_length": summary.best_run_length,
+            "best_run_end": summary.best_run_end,
+            "scan_count": summary.scan_count,
+            "updated_at": now,
+        }
+        stmt = pg_insert(UserStreakSummaryORM).values(
+            user_id=summary.user_id,
+            created_at=now,
+            version=(version or 0) + 1,
+            **values,
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UserStreakSummaryORM.user_id],
+                set_={**values, "version": UserStreakSummaryORM.version + 1},
+                where=(
+                    None if version is None else UserStreakSummaryORM.version == version
+                ),
+            )
+        )
+
+    async def mark_stale(self, user_id: str) -> None:
+        """Make the next streak read rebuild, and an in-flight rebuild not store."""
+        now = utc_now()
+        stmt = pg_insert(UserStreakSummaryORM).values(
+            user_id=user_id,
+            timezone=STALE_TIMEZONE,
+            best_run_length=0,
+            scan_count=0,
+            version=1,
+            created_at=now,
+            updated_at=now,
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UserStreakSummaryORM.user_id],
+                set_={
+                    "timezone": STALE_TIMEZONE,
+                    "version": UserStreakSummaryORM.version + 1,
+                    "updated_at": now,
+                },
+            )
+        )
+
+    async def delete_for_user(self, user_id: str) -> None:
+        await self.session.execute(
+            delete(UserStreakSummaryORM).where(UserStreakSummaryORM.user_id == user_id)
+        )
@@ -0,0 +1,48 @@
+"""Async repository for the durable tier of the translation memory."""
+
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.utils.timezone_utils import utc_now
+from src.infra.database.models.translation_memory import TranslationMemoryORM
+
+
+class AsyncTranslationMemoryRepository:
+    """Translation memory segments by key. Never calls session.commit()."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_many(self, segment_keys: Sequence[str]) -> dict[str, str]:
+        """Translated text for each stored key; unknown keys are omitted."""
+        if not segment_keys:
+            return {}
+        result = await self.session.execute(
+            select(
+                TranslationMemoryORM.segment_key,
+                TranslationMemoryORM.translated_text,
+            ).where(TranslationMemoryORM.segment_key.in_(set(segment_keys)))
+        )
+        return dict(result.all())
+
+    async def save_many(self, segments: Iterable[dict[str, str]]) -> None:
+        """Insert segments; an existing key keeps its first stored translation.
+
+        Each segment carries ``segment_key``, ``prompt_version``,
+        ``source_language``, ``target_language``, ``source_text`` and
+        ``translated_text``.
+        """
+        now = utc_now()
+        rows = [
+            {**segment, "created_at": now, "updated_at": now} for segment in segments
+        ]
+        if not rows:
+            return
+        await self.session.execute(
+            pg_insert(TranslationMemoryORM)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[TranslationMemoryORM.segment_key])
+        )
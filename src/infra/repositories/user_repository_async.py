@@ -3,7 +3,7 @@
 import logging
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import and_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -11,7 +11,11 @@ from sqlalchemy.orm import selectinload
 from src.domain.exceptions.firebase_identity_exceptions import (
     FirebaseIdentityConflictError,
 )
-from src.domain.model.user import UserDomainModel, UserProfileDomainModel
+from src.domain.model.user import (
+    UserContext,
+    UserDomainModel,
+    UserProfileDomainModel,
+)
 from src.domain.ports.user_repository_port import UserRepositoryPort
 from src.domain.utils.timezone_utils import utc_now
 from src.infra.database.models.user.profile import UserProfile
@@ -202,6 +206,36 @@ class AsyncUserRepository(UserRepositoryPort):
         entity = result.scalars().first()
         return UserProfileMapper.to_domain(entity) if entity else None
 
+    async def get_user_context(self, user_id: UUID) -> UserContext | None:
+        # Column-only join: find_by_id + get_profile eager-load profiles,
+        # preference entries and subscriptions (up to six round-trips).
+        user_id_str = str(user_id) if isinstance(user_id, UUID) else user_id
+        result = await self.session.execute(
+            select(
+                User.timezone,
+                User.language_code,
+                UserProfile.profile_target_revision,
+            )
+            .outerjoin(
+                UserProfile,
+                and_(
+                    UserProfile.user_id == User.id,
+                    UserProfile.is_current.is_(True),
+                ),
+            )
+            .where(User.id == user_id_str, User.is_active.is_(True))
+            .limit(1)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return UserContext(
+            user_id=user_id_str,
+            timezone=row.timezone or "UTC",
+            language=row.language_code or "en",
+            profile_target_revision=row.profile_target_revision,
+        )
+
     _IMMUTABLE_COLS = {"id", "created_at", "updated_at"}
 
     async def update_profile(
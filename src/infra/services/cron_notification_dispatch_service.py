@@ -4,6 +4,7 @@ Cron push owns notification scheduling/precompute. This helper only claims due
 notification rows, renders display text, sends FCM batches, and marks rows sent.
 """
 
+import asyncio
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta
@@ -30,6 +31,7 @@ DEACTIVATABLE_FCM_ERRORS = {
 }
 
 PROCESSING_RECLAIM_AFTER = timedelta(minutes=10)
+FCM_MULTICAST_MAX_TOKENS = 500
 _NORMAL_NOTIFICATION_TYPES = {
     "meal_reminder_breakfast",
     "meal_reminder_lunch",
@@ -46,9 +48,22 @@ class CronNotificationDispatchService:
     # Rows claimed for sending sit in 'processing' only for one tick (seconds);
     # anything still 'processing' this long past its send time was abandoned.
     STALE_PROCESSING_MINUTES = 10
+    # FCM multicast calls in flight at once (each carries up to 500 tokens).
+    DISPATCH_CONCURRENCY = 8
+    # Finished rows buffered before one bulk status UPDATE.
+    MARK_BATCH_ROWS = 1000
 
-    def __init__(self, firebase_service: FirebaseService):
+    def __init__(
+        self,
+        firebase_service: FirebaseService,
+        dispatch_concurrency: int | None = None,
+        mark_batch_rows: int | None = None,
+    ):
         self._firebase = firebase_service
+        if dispatch_concurrency is not None:
+            self.DISPATCH_CONCURRENCY = dispatch_concurrency
+        if mark_batch_rows is not None:
+            self.MARK_BATCH_ROWS = mark_batch_rows
 
     # ── Send due notifications ───────────────────────────────────────────────
 
@@ -179,44 +194,120 @@ class CronNotificationDispatchService:
             group["ids"].append(str(notif.id))
             group["row_ids"].append(notif.id)
 
-        # Batch FCM — 500 tokens per call.
+        # FCM groups go out concurrently; rows are marked as groups finish.
+        await self._dispatch_groups(groups, sent_ids, failed_ids, retry_ids)
+
+    async def _dispatch_groups(
+        self,
+        groups: dict[tuple[str, str, str], dict[str, list]],
+        sent_ids: list,
+        failed_ids: list,
+        retry_ids: list,
+    ) -> None:
+        """Send (type, title, body) groups concurrently and mark rows in bulk.
+
+        At most ``DISPATCH_CONCURRENCY`` FCM batches are in flight. Finished
+        groups are marked once ``MARK_BATCH_ROWS`` rows accumulate, so a crash
+        late in a large tick does not re-send everything already delivered.
+        """
+        semaphore = asyncio.Semaphore(self.DISPATCH_CONCURRENCY)
+        tasks = [
+            asyncio.ensure_future(self._send_group(key, group, semaphore))
+            for key, group in groups.items()
+        ]
+        failed_tokens: list[dict] = []
+        try:
+            for finished in asyncio.as_completed(tasks):
+                delivered, row_ids, group_failed_tokens = await finished
+                (sent_ids if delivered else retry_ids).extend(row_ids)
+                failed_tokens.extend(group_failed_tokens)
+                if len(sent_ids) + len(failed_ids) + len(retry_ids) >= (
+                    self.MARK_BATCH_ROWS
+                ):
+                    await self._flush_results(
+                        sent_ids, failed_ids, retry_ids, failed_tokens
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+        await self._flush_results(sent_ids, failed_ids, retry_ids, failed_tokens)
+
+    async def _send_group(
+        self,
+        key: tuple[str, str, str],
+        group: dict[str, list],
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[bool, list, list[dict]]:
+        """Send one group in 500-token chunks; return (delivered, rows, bad tokens)."""
+        notif_type, title, body = key
         # DB stores trial_expiry_2d / trial_expiry_1d so the UNIQUE
         # (user_id, type, scheduled_date) constraint dedups per-day; mobile expects
         # a single "trial_expiry" type in data.type for dispatch.
-        for (notif_type, title, body), group in groups.items():
-            fcm_type = (
-                "trial_expiry" if notif_type.startswith("trial_expiry") else notif_type
+        fcm_type = (
+            "trial_expiry" if notif_type.startswith("trial_expiry") else notif_type
+        )
+        data = {
+            "notification_ids": ",".join(group["ids"]),
+            "notification_count": str(len(group["ids"])),
+        }
+        results = await asyncio.gather(
+            *(
+                self._send_chunk(chunk, title, body, fcm_type, data, semaphore)
+                for chunk in _chunked(group["tokens"], FCM_MULTICAST_MAX_TOKENS)
             )
-            data = {
-                "notification_ids": ",".join(group["ids"]),
-                "notification_count": str(len(group["ids"])),
-            }
-            tokens = group["tokens"]
-            # A batch is delivered only if every chunk's FCM call succeeds. A
-            # wholesale send failure (network/auth) returns success=False with no
-            # failed_tokens; those rows must NOT be marked sent or they are lost
-            # forever with zero delivery — return them to the queue to retry.
-            group_delivered = True
-            for chunk in _chunked(tokens, 500):
-                result = self._firebase.send_multicast(
-                    tokens=chunk,
+        )
+        # A group is delivered only if every chunk's FCM call succeeds. A
+        # wholesale send failure (network/auth) returns success=False with no
+        # failed_tokens; those rows must NOT be marked sent or they are lost
+        # forever with zero delivery — return them to the queue to retry.
+        delivered = all(result.get("success") for result in results)
+        failed_tokens = [
+            failed
+            for result in results
+            for failed in result.get("failed_tokens") or []
+        ]
+        return delivered, group["row_ids"], failed_tokens
+
+    async def _send_chunk(
+        self,
+        tokens: list[str],
+        title: str,
+        body: str,
+        notification_type: str,
+        data: dict[str, str],
+        semaphore: asyncio.Semaphore,
+    ) -> dict:
+        async with semaphore:
+            try:
+                return await self._firebase.send_multicast_async(
+                    tokens=tokens,
                     title=title,
                     body=body,
-                    notification_type=fcm_type,
+                    notification_type=notification_type,
                     data=data,
                 )
-                if not result.get("success"):
-                    group_delivered = False
-                if result.get("failed_tokens"):
-                    await self._handle_failed_tokens(result["failed_tokens"])
-            if group_delivered:
-                sent_ids.extend(group["row_ids"])
-            else:
-                retry_ids.extend(group["row_ids"])
+            except Exception as exc:
+                logger.warning("FCM multicast failed: %s", exc)
+                return {"success": False, "reason": "send_error"}
 
-        # Mark sent / failed / retry
+    async def _flush_results(
+        self,
+        sent_ids: list,
+        failed_ids: list,
+        retry_ids: list,
+        failed_tokens: list[dict],
+    ) -> None:
+        """Persist accumulated outcomes, then clear the buffers in place."""
+        if failed_tokens:
+            await self._handle_failed_tokens(list(failed_tokens))
+            failed_tokens.clear()
         if sent_ids or failed_ids or retry_ids:
-            await self._mark_notifications(sent_ids, failed_ids, retry_ids)
+            await self._mark_notifications(
+                list(sent_ids), list(failed_ids), list(retry_ids)
+            )
+            sent_ids.clear()
+            failed_ids.clear()
+            retry_ids.clear()
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
@@ -2,8 +2,11 @@
 
 import asyncio
 import logging
+import time
 import uuid
 from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -24,6 +27,7 @@ from src.domain.services.weekly_budget_service import (
 from src.domain.utils.timezone_utils import utc_now
 from src.infra.database.models.notification.notification import NotificationORM
 from src.infra.database.uow_async import AsyncUnitOfWork
+from src.infra.monitoring import start_span
 
 logger = logging.getLogger(__name__)
 
@@ -41,9 +45,54 @@ _DEFAULT_AFTERNOON_MINUTES = 780  # 13:00
 _DEFAULT_EVENING_MINUTES = 1_080  # 18:00 — intentionally same as dinner per design spec
 
 
+PRECOMPUTED = "precomputed"
+ALREADY_PRECOMPUTED = "already_precomputed"
+CLAIMED_ELSEWHERE = "claimed_elsewhere"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class TimezonePrecomputeResult:
+    """Outcome of one timezone shard in a concurrent precompute run."""
+
+    tz_name: str
+    status: str
+    users: int = 0
+    rows_written: int = 0
+    elapsed_ms: float = 0.0
+
+
+@dataclass
+class PrecomputeSummary:
+    """Aggregate of a concurrent precompute run, shaped for ``log_event``."""
+
+    results: list[TimezonePrecomputeResult] = field(default_factory=list)
+
+    def as_attributes(self) -> dict[str, int | float | str]:
+        by_status: dict[str, int] = defaultdict(int)
+        for result in self.results:
+            by_status[result.status] += 1
+        slowest = max(self.results, key=lambda r: r.elapsed_ms, default=None)
+        return {
+            "timezones": len(self.results),
+            "precomputed": by_status[PRECOMPUTED],
+            "already_precomputed": by_status[ALREADY_PRECOMPUTED],
+            "claimed_elsewhere": by_status[CLAIMED_ELSEWHERE],
+            "failed": by_status[FAILED],
+            "users": sum(r.users for r in self.results),
+            "rows_written": sum(r.rows_written for r in self.results),
+            "slowest_timezone": slowest.tz_name if slowest else "",
+            "slowest_ms": slowest.elapsed_ms if slowest else 0.0,
+        }
+
+
 class DailyContextPrecomputeService:
     """Pre-computes notification context per user and timezone-local date."""
 
+    # Timezones precomputed at once by ``precompute_timezones``. Each in-flight
+    # shard holds two connections (the claim transaction and the work UoW).
+    PRECOMPUTE_CONCURRENCY = 4
+
     def __init__(self) -> None:
         self._tdee_service = TdeeCalculationService()
         self._locks: dict[str, asyncio.Lock] = {}
@@ -110,11 +159,92 @@ class DailyContextPrecomputeService:
             logger.debug(
                 "Pre-computing notification context for %s on %s", tz_name, today
             )
-            count = await self._precompute_db(tz_name, today)
+            count, _ = await self._precompute_db(tz_name, today)
             if count > 0:
                 _precomputed_today.add((today.isoformat(), tz_name))
             logger.debug("Pre-compute complete for %s: %d users", tz_name, count)
 
+    async def precompute_timezones(
+        self,
+        targets: Iterable[tuple[str, date]],
+        concurrency: int | None = None,
+    ) -> PrecomputeSummary:
+        """Precompute many ``(tz_name, local_today)`` shards concurrently.
+
+        At most ``concurrency`` shards run at once. Each shard is claimed with a
+        transaction-scoped advisory lock, so cron replicas started together
+        split the timezones between them instead of racing on the same rows;
+        a shard another replica holds is reported as ``claimed_elsewhere``.
+        One failing shard is logged and reported without cancelling the rest.
+        """
+        limit = max(1, concurrency or self.PRECOMPUTE_CONCURRENCY)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run_shard(tz_name: str, today: date) -> TimezonePrecomputeResult:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    with start_span(
+                        operation="cron.push.precompute.timezone",
+                        description=tz_name,
+                    ):
+                        result = await self._precompute_claimed(tz_name, today)
+                except Exception:
+                    logger.exception(
+                        "Pre-compute failed for %s on %s", tz_name, today
+                    )
+                    result = TimezonePrecomputeResult(tz_name=tz_name, status=FAILED)
+                elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+                return TimezonePrecomputeResult(
+                    tz_name=result.tz_name,
+                    status=result.status,
+                    users=result.users,
+                    rows_written=result.rows_written,
+                    elapsed_ms=elapsed_ms,
+                )
+
+        results = await asyncio.gather(
+            *(run_shard(tz_name, today) for tz_name, today in targets)
+        )
+        return PrecomputeSummary(results=list(results))
+
+    async def _precompute_claimed(
+        self, tz_name: str, today: date
+    ) -> TimezonePrecomputeResult:
+        """Run one shard while holding its advisory lock.
+
+        The lock is transaction-scoped so it is safe behind PgBouncer in
+        transaction mode, and it is held until after the work UoW commits: a
+        replica that claims the shard later sees the committed rows through the
+        DB sentinel and skips it.
+        """
+        if (today.isoformat(), tz_name) in _precomputed_today:
+            return TimezonePrecomputeResult(tz_name=tz_name, status=ALREADY_PRECOMPUTED)
+
+        async with AsyncUnitOfWork() as claim_uow:
+            claim = await claim_uow.session.execute(
+                text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"),
+                {"key": f"push_precompute:{self.sentinel_key(today, tz_name)}"},
+            )
+            if not claim.scalar():
+                logger.debug("Pre-compute shard %s on %s claimed elsewhere", tz_name, today)
+                return TimezonePrecomputeResult(tz_name=tz_name, status=CLAIMED_ELSEWHERE)
+
+            if await self.is_precomputed(today, tz_name):
+                return TimezonePrecomputeResult(
+                    tz_name=tz_name, status=ALREADY_PRECOMPUTED
+                )
+
+            users, rows_written = await self._precompute_db(tz_name, today)
+            if users > 0:
+                _precomputed_today.add((today.isoformat(), tz_name))
+            return TimezonePrecomputeResult(
+                tz_name=tz_name,
+                status=PRECOMPUTED,
+                users=users,
+                rows_written=rows_written,
+            )
+
     async def reschedule_user_notifications(self, user_id: str) -> int:
         """Reschedule notifications for a single user after preferences update.
 
@@ -469,10 +599,10 @@ class DailyContextPrecomputeService:
     # Async DB work
     # ------------------------------------------------------------------
 
-    async def _precompute_db(self, tz_name: str, today: date) -> int:
+    async def _precompute_db(self, tz_name: str, today: date) -> tuple[int, int]:
         """
         All DB work: 9 SQL queries + 1 bulk INSERT.
-        Returns count of users processed.
+        Returns (users processed, notification rows inserted).
         Only processes users with at least one active FCM token.
         """
         async with AsyncUnitOfWork() as uow:
@@ -506,7 +636,7 @@ class DailyContextPrecomputeService:
             pref_rows = pref_result.fetchall()
 
             if not pref_rows:
-                return 0
+                return 0, 0
 
             user_ids = [row.user_id for row in pref_rows]
 
@@ -790,15 +920,23 @@ class DailyContextPrecomputeService:
                 tz_name=tz_name,
             )
 
-            if notif_rows:
-                stmt = pg_insert(NotificationORM).values(notif_rows)
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=["user_id", "notification_type", "scheduled_date"],
-                )
-                await session.execute(stmt)
-                await session.flush()
+            rows_written = await self._insert_notification_rows(session, notif_rows)
 
-            return len(pref_rows)
+            return len(pref_rows), rows_written
+
+    @staticmethod
+    async def _insert_notification_rows(session, notif_rows: list[dict]) -> int:
+        """Bulk INSERT pre-built rows; returns how many were actually inserted."""
+        if not notif_rows:
+            return 0
+        stmt = pg_insert(NotificationORM).values(notif_rows)
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=["user_id", "notification_type", "scheduled_date"],
+        )
+        insert_result = await session.execute(stmt)
+        await session.flush()
+        # rowcount excludes rows skipped by ON CONFLICT DO NOTHING.
+        return max(insert_result.rowcount, 0)
 
     # ------------------------------------------------------------------
     # Notification row builder
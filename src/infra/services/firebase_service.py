@@ -145,6 +145,32 @@ class FirebaseService:
         message_data["type"] = notification_type
         return self._send_to_tokens(tokens, title, body, message_data)
 
+    async def send_multicast_async(
+        self,
+        tokens: list[str],
+        title: str,
+        body: str,
+        notification_type: str = "scheduled",
+        data: dict[str, str] | None = None,
+    ) -> dict:
+        """Non-blocking ``send_multicast``: one HTTP/2 client, no worker threads.
+
+        ``send_each_for_multicast`` fans each call out over a thread pool sized to
+        the batch (up to 500 threads) and blocks its caller until all finish.
+        """
+        if not firebase_admin._apps:
+            return {"success": False, "reason": "firebase_not_initialized"}
+
+        message_data = dict(data or {})
+        message_data["type"] = notification_type
+        try:
+            message = self._build_multicast_message(tokens, title, body, message_data)
+            response = await messaging.send_each_for_multicast_async(message)
+            return self._summarize_multicast_response(tokens, response)
+        except Exception as e:
+            logger.error(f"Error sending multicast message: {e}")
+            return {"success": False, "reason": "send_error", "error": str(e)}
+
     def _send_to_tokens(
         self, tokens: list[str], title: str, body: str, data: dict[str, str]
     ) -> dict[str, Any]:
@@ -154,58 +180,65 @@ class FirebaseService:
         into APNs alert fields for iOS background notifications.
         """
         try:
-            display_title, display_body = _validate_display_text(title, body)
-
-            # Ensure all data values are strings; inject title/body for mobile.
-            string_data = {k: str(v) for k, v in data.items()} if data else {}
-            string_data["title"] = display_title
-            string_data["body"] = display_body
-
-            # Create multicast message with no top-level notification field.
-            message = messaging.MulticastMessage(
-                data=string_data,
-                tokens=tokens,
-                android=build_android_config(),
-                apns=build_apns_config(title=display_title, body=display_body),
-            )
+            message = self._build_multicast_message(tokens, title, body, data)
 
             # Send the message
             response = messaging.send_each_for_multicast(message)
-
-            logger.info(
-                "Notification sent: %s successful, %s failed",
-                response.success_count,
-                response.failure_count,
-            )
-
-            # Handle failed tokens
-            failed_tokens = []
-            if response.failure_count > 0:
-                for idx, result in enumerate(response.responses):
-                    if not result.success:
-                        error_code = "unknown_error"
-                        if result.exception:
-                            # Extract error code from exception
-                            error_code = getattr(result.exception, "code", None)
-                            if error_code is None:
-                                error_code = type(result.exception).__name__
-
-                        failed_tokens.append(
-                            {"token": tokens[idx], "error": error_code}
-                        )
-                        logger.warning(f"Failed to send to token {idx}: {error_code}")
-
-            return {
-                "success": True,
-                "sent": response.success_count,
-                "failed": response.failure_count,
-                "failed_tokens": failed_tokens,
-            }
+            return self._summarize_multicast_response(tokens, response)
 
         except Exception as e:
             logger.error(f"Error sending multicast message: {e}")
             return {"success": False, "reason": "send_error", "error": str(e)}
 
+    @staticmethod
+    def _build_multicast_message(
+        tokens: list[str], title: str, body: str, data: dict[str, str]
+    ) -> messaging.MulticastMessage:
+        display_title, display_body = _validate_display_text(title, body)
+
+        # Ensure all data values are strings; inject title/body for mobile.
+        string_data = {k: str(v) for k, v in data.items()} if data else {}
+        string_data["title"] = display_title
+        string_data["body"] = display_body
+
+        # Create multicast message with no top-level notification field.
+        return messaging.MulticastMessage(
+            data=string_data,
+            tokens=tokens,
+            android=build_android_config(),
+            apns=build_apns_config(title=display_title, body=display_body),
+        )
+
+    @staticmethod
+    def _summarize_multicast_response(tokens: list[str], response) -> dict[str, Any]:
+        logger.info(
+            "Notification sent: %s successful, %s failed",
+            response.success_count,
+            response.failure_count,
+        )
+
+        # Handle failed tokens
+        failed_tokens = []
+        if response.failure_count > 0:
+            for idx, result in enumerate(response.responses):
+                if not result.success:
+                    error_code = "unknown_error"
+                    if result.exception:
+                        # Extract error code from exception
+                        error_code = getattr(result.exception, "code", None)
+                        if error_code is None:
+                            error_code = type(result.exception).__name__
+
+                    failed_tokens.append({"token": tokens[idx], "error": error_code})
+                    logger.warning(f"Failed to send to token {idx}: {error_code}")
+
+        return {
+            "success": True,
+            "sent": response.success_count,
+            "failed": response.failure_count,
+            "failed_tokens": failed_tokens,
+        }
+
     def send_to_topic(
         self, topic: str, title: str, body: str, data: dict[str, str] | None = None
     ) -> dict[str, Any]:
@@ -0,0 +1,221 @@
+"""In-process Firebase ID token verification with a verified-token cache.
+
+``firebase_auth.verify_id_token`` is synchronous: every call costs a thread
+hop, an RSA verify and, on key rotation, a blocking certificate fetch. This
+verifier keeps Google's signing certificates in memory (refreshed in the
+background before their ``Cache-Control`` max-age runs out) and checks RS256
+signatures on the event loop. Verified claims are cached under the token's
+SHA-256 until the token's own ``exp``, so repeat requests with the same bearer
+skip verification entirely.
+
+Claim checks mirror the Firebase Admin SDK (kid/alg header, aud, iss, sub,
+iat, exp) and failures raise the SDK's own exception types, so callers handle
+errors exactly as before. Unknown ``kid`` values, missing keys or an auth
+emulator fall back to the SDK in a worker thread. Revocation is not checked
+here; ``verify_firebase_token_revocation_checked`` still calls the SDK with
+``check_revoked=True``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import logging
+import re
+import time
+from typing import Any
+
+import httpx
+import jwt
+from cachetools import TLRUCache
+from cryptography.x509 import load_pem_x509_certificate
+from firebase_admin import auth as firebase_auth
+
+logger = logging.getLogger(__name__)
+
+ID_TOKEN_CERT_URL = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/"
+    "securetoken@system.gserviceaccount.com"
+)
+ID_TOKEN_ISSUER_PREFIX = "https://securetoken.google.com/"
+
+_DEFAULT_KEY_MAX_AGE_SECONDS = 3600
+_MIN_REFRESH_DELAY_SECONDS = 60
+_REFRESH_LEAD_SECONDS = 300
+_REFRESH_RETRY_SECONDS = 30
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class GooglePublicKeySet:
+    """Google's Firebase ID token signing keys, refreshed off the request path."""
+
+    def __init__(self, cert_url: str = ID_TOKEN_CERT_URL, timeout: float = 10.0):
+        self.cert_url = cert_url
+        self.timeout = timeout
+        self._keys: dict[str, Any] = {}
+        self._expires_at = 0.0
+        self._refresh_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._on_demand: asyncio.Task | None = None
+
+    def get(self, kid: str) -> Any | None:
+        return self._keys.get(kid)
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._keys)
+
+    def load(self, certificates: dict[str, str], max_age: int) -> None:
+        self._keys = {
+            kid: load_pem_x509_certificate(pem.encode("utf-8")).public_key()
+            for kid, pem in certificates.items()
+        }
+        self._expires_at = time.time() + max_age
+
+    async def refresh(self) -> None:
+        """Fetch the current key set; concurrent callers share one fetch."""
+        async with self._refresh_lock:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(self.cert_url)
+                response.raise_for_status()
+            match = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+            max_age = int(match.group(1)) if match else _DEFAULT_KEY_MAX_AGE_SECONDS
+            self.load(response.json(), max_age)
+            logger.info("Loaded %d Firebase token signing keys", len(self._keys))
+
+    def request_refresh(self) -> None:
+        """Refresh soon without blocking the caller (e.g. after an unknown kid)."""
+        if self._refresh_lock.locked() or (
+            self._on_demand is not None and not self._on_demand.done()
+        ):
+            return
+        self._on_demand = asyncio.create_task(
+            self._refresh_quietly(), name="auth:firebase-keys-refresh"
+        )
+
+    async def start(self) -> None:
+        """Prefetch once, then keep refreshing in the background.
+
+        A failed prefetch is not fatal: tokens fall back to the SDK until the
+        refresher succeeds.
+        """
+        if self._task is not None and not self._task.done():
+            return
+        refreshed = await self._refresh_quietly()
+        self._task = asyncio.create_task(
+            self._run(refreshed), name="auth:firebase-keys-refresher"
+        )
+
+    async def stop(self) -> None:
+        tasks = [t for t in (self._task, self._on_demand) if t is not None]
+        self._task = self._on_demand = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, refreshed: bool) -> None:
+        while True:
+            if refreshed:
+                delay = max(
+                    _MIN_REFRESH_DELAY_SECONDS,
+                    self._expires_at - time.time() - _REFRESH_LEAD_SECONDS,
+                )
+            else:
+                delay = _REFRESH_RETRY_SECONDS
+            await asyncio.sleep(delay)
+            refreshed = await self._refresh_quietly()
+
+    async def _refresh_quietly(self) -> bool:
+        try:
+            await self.refresh()
+            return True
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001 - keep the last good key set
+            logger.warning(
+                "Firebase signing key refresh failed: %s", type(exc).__name__
+            )
+            return False
+
+
+class FirebaseIdTokenVerifier:
+    """Verify Firebase ID tokens locally and cache verified claims until ``exp``."""
+
+    def __init__(
+        self,
+        project_id: str,
+        key_set: GooglePublicKeySet,
+        max_cached_tokens: int = 20_000,
+        clock_skew_seconds: int = 0,
+    ):
+        self.project_id = project_id
+        self.issuer = ID_TOKEN_ISSUER_PREFIX + project_id
+        self.key_set = key_set
+        self.clock_skew_seconds = clock_skew_seconds
+        self._verified: TLRUCache[str, tuple[float, dict]] = TLRUCache(
+            maxsize=max_cached_tokens,
+            ttu=lambda _key, value, _now: value[0],
+            timer=time.time,
+        )
+        self.stats = {"cache_hits": 0, "local_verifications": 0, "sdk_fallbacks": 0}
+
+    async def verify(self, token: str) -> dict:
+        token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached = self._verified.get(token_hash)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            return copy.deepcopy(cached[1])
+
+        claims = self._verify_locally(token)
+        if claims is None:
+            self.stats["sdk_fallbacks"] += 1
+            claims = await asyncio.to_thread(firebase_auth.verify_id_token, token)
+        else:
+            self.stats["local_verifications"] += 1
+
+        expires_at = float(claims.get("exp", 0)) + self.clock_skew_seconds
+        if expires_at > time.time():
+            self._verified[token_hash] = (expires_at, copy.deepcopy(claims))
+        return claims
+
+    def _verify_locally(self, token: str) -> dict | None:
+        """Return verified claims, or None when the SDK must decide."""
+        if not self.key_set.loaded:
+            return None
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.InvalidTokenError as exc:
+            raise firebase_auth.InvalidIdTokenError(str(exc), cause=exc) from exc
+
+        kid = header.get("kid")
+        if header.get("alg") != "RS256" or not kid:
+            # Custom and legacy tokens get the SDK's specific error messages.
+            return None
+        key = self.key_set.get(kid)
+        if key is None:
+            self.key_set.request_refresh()
+            return None
+
+        try:
+            claims = jwt.decode(
+                token,
+                key=key,
+                algorithms=["RS256"],
+                audience=self.project_id,
+                issuer=self.issuer,
+                leeway=self.clock_skew_seconds,
+                options={"require": ["exp", "iat", "aud", "iss", "sub"]},
+            )
+        except jwt.ExpiredSignatureError as exc:
+            raise firebase_auth.ExpiredIdTokenError(str(exc), cause=exc) from exc
+        except jwt.InvalidTokenError as exc:
+            raise firebase_auth.InvalidIdTokenError(str(exc), cause=exc) from exc
+
+        subject = claims.get("sub")
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise firebase_auth.InvalidIdTokenError(
+                'Firebase ID token has an invalid "sub" (subject) claim.'
+            )
+        claims["uid"] = subject
+        return claims
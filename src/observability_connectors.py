@@ -46,6 +46,8 @@ SAFE_CONTEXT_KEYS = frozenset(
         "rejection_reason",  # bounded reason for expected-but-reviewable rejects
         "translation_outcome",
         "batch_size_bucket",
+        "item_count_bucket",  # parse-text items per request: "1", "2-3", "4-6", "7+"
+        "tier",  # translation memory lookup tier: "redis", "postgres", "miss"
     }
 )
 
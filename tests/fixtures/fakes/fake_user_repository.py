@@ -1,7 +1,11 @@
 from typing import List, Optional
 from uuid import UUID
 
-from src.domain.model.user import UserDomainModel, UserProfileDomainModel
+from src.domain.model.user import (
+    UserContext,
+    UserDomainModel,
+    UserProfileDomainModel,
+)
 from src.domain.ports.user_repository_port import UserRepositoryPort
 
 
@@ -56,6 +60,20 @@ class FakeUserRepository(UserRepositoryPort):
     async def get_profile(self, user_id: UUID) -> Optional[UserProfileDomainModel]:
         return self.profiles.get(user_id)
 
+    async def get_user_context(self, user_id: UUID) -> UserContext | None:
+        user = self.users.get(user_id)
+        if user is None or not user.is_active:
+            return None
+        profile = self.profiles.get(user_id)
+        return UserContext(
+            user_id=str(user_id),
+            timezone=user.timezone or "UTC",
+            language=getattr(user, "language_code", None) or "en",
+            profile_target_revision=(
+                profile.profile_target_revision if profile else None
+            ),
+        )
+
     async def update_profile(
         self, profile: UserProfileDomainModel
     ) -> UserProfileDomainModel:
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+MIGRATION = Path("migrations/versions/20261016000002_add_daily_nutrition_rollups.py")
+
+
+def test_daily_nutrition_rollups_migration_is_additive_on_current_head():
+    text = MIGRATION.read_text()
+
+    assert 'revision: str = "20261016000002"' in text
+    assert 'down_revision: str | None = "20261016000001"' in text
+    assert '"daily_nutrition_rollups"' in text
+    assert 'sa.Column("local_date", sa.Date(), primary_key=True)' in text
+    assert 'sa.ForeignKey("users.id", ondelete="CASCADE")' in text
+    assert (
+        'sa.Column("version", sa.Integer(), nullable=False, server_default="0")' in text
+    )
+    assert 'op.drop_table("daily_nutrition_rollups")' in text
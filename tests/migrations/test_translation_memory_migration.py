@@ -0,0 +1,13 @@
+from pathlib import Path
+
+MIGRATION = Path("migrations/versions/20261016000003_add_translation_memory.py")
+
+
+def test_translation_memory_migration_is_additive_on_current_head():
+    text = MIGRATION.read_text()
+
+    assert 'revision: str = "20261016000003"' in text
+    assert 'down_revision: str | None = "20261016000002"' in text
+    assert '"translation_memory"' in text
+    assert 'sa.Column("segment_key", sa.String(length=64), primary_key=True)' in text
+    assert 'op.drop_table("translation_memory")' in text
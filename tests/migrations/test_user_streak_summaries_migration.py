@@ -0,0 +1,16 @@
+from pathlib import Path
+
+MIGRATION = Path("migrations/versions/20261016000001_add_user_streak_summaries.py")
+
+
+def test_user_streak_summaries_migration_is_additive_on_current_head():
+    text = MIGRATION.read_text()
+
+    assert 'revision: str = "20261016000001"' in text
+    assert 'down_revision: str | None = "20260820000002"' in text
+    assert '"user_streak_summaries"' in text
+    assert 'sa.ForeignKey("users.id", ondelete="CASCADE")' in text
+    assert (
+        'sa.Column("version", sa.Integer(), nullable=False, server_default="0")' in text
+    )
+    assert 'op.drop_table("user_streak_summaries")' in text
@@ -0,0 +1,17 @@
+from types import SimpleNamespace
+
+from src.api.base_dependencies import get_async_uow_factory
+from src.api.dependencies.user_context import get_user_context_loader
+from src.infra.database.uow_async import AsyncUnitOfWork
+
+
+def test_user_context_loader_uses_the_async_uow_factory():
+    request = SimpleNamespace(headers={"X-Timezone": "Asia/Ho_Chi_Minh"})
+
+    loader = get_user_context_loader(
+        request, user_id="u1", uow_factory=get_async_uow_factory()
+    )
+
+    assert get_async_uow_factory() is AsyncUnitOfWork
+    assert loader._uow_factory is AsyncUnitOfWork
+    assert loader.header_timezone == "Asia/Ho_Chi_Minh"
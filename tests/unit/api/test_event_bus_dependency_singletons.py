@@ -241,6 +241,8 @@ def test_configured_event_bus_wires_meal_analyze_validation(monkeypatch):
         AI_MEAL_ANALYZE_FATSECRET_VALIDATION_ENABLED = True
         AI_MEAL_ANALYZE_EXTERNAL_PROVIDER_TIMEOUT_SECONDS = 7.0
         AI_MEAL_ANALYZE_GRAPH_VERSION = "test-v2"
+        AI_MEAL_ANALYZE_CONCURRENT_UPLOAD_ENABLED = True
+        AI_MEAL_ANALYZE_RESULT_CACHE_ENABLED = True
 
     import src.infra.config.settings as settings_mod
 
@@ -325,7 +327,13 @@ def test_configured_event_bus_wires_meal_analyze_validation(monkeypatch):
     scan_handler = bus.handlers[mod.ScanByUrlCommand]
 
     assert upload_handler.meal_analyze_graph_enabled is True
+    assert upload_handler.meal_analyze_concurrent_upload is True
     assert scan_handler.meal_analyze_graph_enabled is True
+    assert upload_handler.meal_vision_result_cache is not None
+    assert (
+        upload_handler.meal_vision_result_cache
+        is scan_handler.meal_vision_result_cache
+    )
     workflow = upload_handler.meal_analyze_workflow
     assert workflow is scan_handler.meal_analyze_workflow
     assert workflow._fatsecret_validation_enabled is True
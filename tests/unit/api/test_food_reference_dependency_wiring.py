@@ -113,6 +113,8 @@ def test_text_translation_singleton_uses_openai_adapter(monkeypatch):
 
     monkeypatch.setattr(deps, "_text_translation_service", None)
     monkeypatch.setattr(deps.settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(deps.settings, "TRANSLATION_MEMORY_ENABLED", False)
+    monkeypatch.setattr(deps.settings, "TRANSLATION_BATCH_WINDOW_MS", 0)
 
     service = deps.get_text_translation_service()
 
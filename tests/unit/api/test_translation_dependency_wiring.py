@@ -20,6 +20,7 @@ def test_neutral_translation_getter_is_process_scoped(monkeypatch):
 
     monkeypatch.setattr(deps, "_text_translation_service", None)
     monkeypatch.setattr(deps.settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(deps.settings, "TRANSLATION_MEMORY_ENABLED", False)
 
     import src.infra.adapters.openai_translation_adapter as adapter_module
     import src.infra.services.ai.providers.openai_provider as provider_module
@@ -32,3 +33,43 @@ def test_neutral_translation_getter_is_process_scoped(monkeypatch):
 
     assert first is second
     assert first is not None
+
+
+def test_neutral_translation_getter_stacks_memory_over_micro_batcher(monkeypatch):
+    import src.api.base_dependencies as deps
+    from src.infra.adapters.translation_batcher_adapter import (
+        TranslationBatcherAdapter,
+    )
+    from src.infra.adapters.translation_memory_adapter import (
+        TranslationMemoryAdapter,
+    )
+
+    class _Provider:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    class _Adapter:
+        prompt_version = "prompt-v1:model:digest"
+
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    monkeypatch.setattr(deps, "_text_translation_service", None)
+    monkeypatch.setattr(deps.settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(deps.settings, "TRANSLATION_MEMORY_ENABLED", True)
+    monkeypatch.setattr(deps.settings, "TRANSLATION_BATCH_WINDOW_MS", 5.0)
+
+    import src.infra.adapters.openai_translation_adapter as adapter_module
+    import src.infra.services.ai.providers.openai_provider as provider_module
+
+    monkeypatch.setattr(provider_module, "OpenAIProvider", _Provider)
+    monkeypatch.setattr(adapter_module, "OpenAITranslationAdapter", _Adapter)
+
+    service = deps.get_text_translation_service()
+
+    memory = service._port
+    assert isinstance(memory, TranslationMemoryAdapter)
+    assert isinstance(memory._inner, TranslationBatcherAdapter)
+    assert memory._inner._window_seconds == 0.005
+    assert isinstance(memory._inner._inner, _Adapter)
+    assert memory._prompt_version == "prompt-v1:model:digest"
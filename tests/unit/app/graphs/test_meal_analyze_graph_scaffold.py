@@ -1,5 +1,6 @@
 """Tests for the default-off meal analysis graph scaffold."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -20,6 +21,7 @@ from src.app.graphs.meal_analyze.nodes import (
     schedule_value_insights,
 )
 from src.app.graphs.meal_analyze.runtime import AcquiredImage, MealAnalyzeRuntime
+from src.app.services.meal_vision_result_cache import MealVisionResultCache
 from src.domain.exceptions.ai_exceptions import MealResponseLocalizationError
 from src.domain.model.meal import MealStatus
 from src.domain.model.meal.meal_response_localization import (
@@ -780,10 +782,12 @@ async def test_acquire_image_upload_saves_bytes_in_runtime_not_state():
         "image/jpeg",
         "image-123",
     )
+    assert state_update.pop("upload_duration_ms") >= 0
     assert state_update == {
         "image_id": "image-123",
         "content_kind": "meal_image",
         "image_size_bytes": len(b"upload-bytes"),
+        "upload_mode": "sequential",
     }
     assert runtime.acquired_image is not None
     assert runtime.acquired_image.image_url.startswith("https://")
@@ -868,3 +872,250 @@ async def test_acquire_image_food_label_prefers_crop_without_compression():
     assert runtime.acquired_image.analysis_bytes == b"crop-label-bytes"
     assert "image_url" not in state_update
     assert "image_bytes" not in state_update
+
+
+def _chicken_rice_vision_result():
+    return {
+        "structured_data": {
+            "is_food": True,
+            "dish_name": "Chicken rice",
+            "confidence": 0.91,
+            "foods": [
+                {
+                    "name": "Chicken rice",
+                    "quantity_g": 300,
+                    "confidence": 0.91,
+                    "macros": {
+                        "protein_g": 28,
+                        "carbs_g": 52,
+                        "fat_g": 8,
+                        "fiber_g": 2,
+                        "sugar_g": 1,
+                    },
+                }
+            ],
+        }
+    }
+
+
+def _concurrent_upload_runtime(image_store, vision_service, uow):
+    return MealAnalyzeRuntime(
+        command=UploadMealImageImmediatelyCommand(
+            user_id="00000000-0000-0000-0000-000000000001",
+            file_contents=b"upload-bytes",
+            content_type="image/jpeg",
+        ),
+        image_store=image_store,
+        vision_service=vision_service,
+        gpt_parser=VisionResponseParser(),
+        uow=uow,
+        image_id_factory=lambda: "1325c7ca-e012-4df3-b0b4-55bfaeb55eb0",
+        concurrent_upload=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_upload_overlaps_vision_and_joins_before_persist():
+    vision_started = asyncio.Event()
+    image_url = (
+        "https://res.cloudinary.com/demo/image/upload/mealtrack/"
+        "1325c7ca-e012-4df3-b0b4-55bfaeb55eb0.jpg"
+    )
+
+    async def save_async(*_args):
+        # Completes only once vision is already running.
+        await vision_started.wait()
+        return image_url
+
+    async def analyze(*_args, **_kwargs):
+        vision_started.set()
+        return _chicken_rice_vision_result()
+
+    image_store = AsyncMock()
+    image_store.save_async = AsyncMock(side_effect=save_async)
+    vision_service = AsyncMock()
+    vision_service.analyze = AsyncMock(side_effect=analyze)
+    uow = _FakeGraphUow()
+    runtime = _concurrent_upload_runtime(image_store, vision_service, uow)
+
+    result = await run_meal_analyze_graph_async(
+        {"scan_mode": "meal_scan", "user_id": runtime.command.user_id},
+        runtime,
+    )
+
+    assert result["upload_mode"] == "concurrent"
+    assert result["upload_duration_ms"] >= 0
+    assert result["vision_duration_ms"] >= 0
+    assert result["result"].image.url == image_url
+    uow.meals.save.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_slow_upload_does_not_hold_back_parse_or_vision_timing():
+    image_url = (
+        "https://res.cloudinary.com/demo/image/upload/mealtrack/"
+        "1325c7ca-e012-4df3-b0b4-55bfaeb55eb0.jpg"
+    )
+    parsed_before_upload_finished = []
+
+    async def save_async(*_args):
+        # A slow upload that keeps going until parse has run (or ~1 s).
+        for _ in range(200):
+            if runtime.nutrition is not None:
+                break
+            await asyncio.sleep(0.005)
+        await asyncio.sleep(0.05)
+        parsed_before_upload_finished.append(runtime.nutrition is not None)
+        return image_url
+
+    image_store = AsyncMock()
+    image_store.save_async = AsyncMock(side_effect=save_async)
+    vision_service = AsyncMock()
+    vision_service.analyze = AsyncMock(return_value=_chicken_rice_vision_result())
+    uow = _FakeGraphUow()
+    runtime = _concurrent_upload_runtime(image_store, vision_service, uow)
+
+    result = await run_meal_analyze_graph_async(
+        {"scan_mode": "meal_scan", "user_id": runtime.command.user_id},
+        runtime,
+    )
+
+    assert parsed_before_upload_finished == [True]
+    assert result["vision_duration_ms"] < result["upload_duration_ms"]
+    assert result["result"].image.url == image_url
+    uow.meals.save.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_upload_failure_cancels_vision_and_skips_persist():
+    vision_cancelled = asyncio.Event()
+
+    async def analyze(*_args, **_kwargs):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            vision_cancelled.set()
+            raise
+
+    image_store = AsyncMock()
+    image_store.save_async = AsyncMock(side_effect=ConnectionError("cloudinary down"))
+    vision_service = AsyncMock()
+    vision_service.analyze = AsyncMock(side_effect=analyze)
+    uow = _FakeGraphUow()
+    runtime = _concurrent_upload_runtime(image_store, vision_service, uow)
+
+    with pytest.raises(ConnectionError):
+        await run_meal_analyze_graph_async(
+            {"scan_mode": "meal_scan", "user_id": runtime.command.user_id},
+            runtime,
+        )
+
+    assert vision_cancelled.is_set()
+    uow.meals.save.assert_not_awaited()
+
+
+class _DictCache:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl_seconds):
+        self.data[key] = value
+
+
+def _cached_upload_runtime(vision_service, result_cache):
+    image_store = AsyncMock()
+    image_store.save_async = AsyncMock(
+        return_value=(
+            "https://res.cloudinary.com/demo/image/upload/mealtrack/"
+            "1325c7ca-e012-4df3-b0b4-55bfaeb55eb0.jpg"
+        )
+    )
+    return MealAnalyzeRuntime(
+        command=UploadMealImageImmediatelyCommand(
+            user_id="00000000-0000-0000-0000-000000000001",
+            file_contents=b"upload-bytes",
+            content_type="image/jpeg",
+        ),
+        image_store=image_store,
+        vision_service=vision_service,
+        gpt_parser=VisionResponseParser(),
+        uow=_FakeGraphUow(),
+        image_id_factory=lambda: "1325c7ca-e012-4df3-b0b4-55bfaeb55eb0",
+        vision_result_cache=result_cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_rescan_of_same_photo_reuses_cached_vision_result():
+    vision_service = AsyncMock()
+    vision_service.analyze = AsyncMock(return_value=_chicken_rice_vision_result())
+    result_cache = MealVisionResultCache(_DictCache())
+
+    for _ in range(2):
+        runtime = _cached_upload_runtime(vision_service, result_cache)
+        result = await run_meal_analyze_graph_async(
+            {"scan_mode": "meal_scan", "user_id": runtime.command.user_id},
+            runtime,
+        )
+        assert result["result"].nutrition.calories > 0
+        runtime.uow.meals.save.assert_awaited_once()
+
+    vision_service.analyze.assert_awaited_once()
+    assert runtime.vision_result_from_provider is False
+
+
+@pytest.mark.asyncio
+async def test_rejected_vision_result_is_not_cached():
+    vision_service = AsyncMock()
+    vision_service.analyze = AsyncMock(
+        return_value={"structured_data": {"is_food": False, "foods": []}}
+    )
+    cache = _DictCache()
+    result_cache = MealVisionResultCache(cache)
+
+    runtime = _cached_upload_runtime(vision_service, result_cache)
+    with pytest.raises(ValidationException):
+        await run_meal_analyze_graph_async(
+            {"scan_mode": "meal_scan", "user_id": runtime.command.user_id},
+            runtime,
+        )
+
+    assert cache.data == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_scans_store_the_vision_result_once():
+    release = asyncio.Event()
+
+    async def analyze(*args, **kwargs):
+        await release.wait()
+        return _chicken_rice_vision_result()
+
+    vision_service = AsyncMock()
+    vision_service.analyze = AsyncMock(side_effect=analyze)
+    cache = _DictCache()
+    cache.set = AsyncMock(wraps=cache.set)
+    result_cache = MealVisionResultCache(cache)
+    runtimes = [_cached_upload_runtime(vision_service, result_cache) for _ in range(2)]
+
+    scans = [
+        asyncio.ensure_future(
+            run_meal_analyze_graph_async(
+                {"scan_mode": "meal_scan", "user_id": runtime.command.user_id},
+                runtime,
+            )
+        )
+        for runtime in runtimes
+    ]
+    while vision_service.analyze.await_count == 0:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+    release.set()
+    await asyncio.gather(*scans)
+
+    vision_service.analyze.assert_awaited_once()
+    assert sorted(r.vision_result_from_provider for r in runtimes) == [False, True]
+    cache.set.assert_awaited_once()
@@ -129,6 +129,8 @@ class _Snapshot:
         self.snapshot = SimpleNamespace(
             meals=tuple(meals),
             ingredient_statistics=SimpleNamespace(idf=lambda _food_id: 1.0),
+            scoring_index=None,
+            search_index=None,
         )
 
     async def get_snapshot(self, _uow):
@@ -158,10 +160,14 @@ class _Scoring:
             ingredient_fit=1.0 if matched else 0.0,
         )
 
+    def score_many(self, meals, *, scoring_index, **kwargs):
+        assert scoring_index is None
+        return [self.score(meal, **kwargs) for meal in meals]
+
 
 class _Diversity:
-    def rerank_shortlist(self, ranked_pool, **_kwargs):
-        return ranked_pool
+    def select_shortlist(self, ranked_pool, **_kwargs):
+        return ranked_pool[:1], ranked_pool[1:]
 
 
 def _service(meals, history=None):
@@ -0,0 +1,100 @@
+import random
+from decimal import Decimal
+
+from src.app.services.catalog_meal_browse_ranking import filter_meals, rank_popular
+from src.app.services.catalog_meal_search_index import CatalogMealSearchIndex
+from src.domain.model.meal_recommendation import CatalogMeal
+
+NAMES = ("Phở Bò", "PHỞ  gà", "Bún chả", "Cơm tấm", "Bánh mì", "Ｇỏi cuốn", "Straße")
+CUISINES = ("vietnamese", "Vietnamese ", "thai", "German", "")
+MEAL_TYPES = ("breakfast", "lunch", "dinner")
+QUERIES = (
+    None,
+    "",
+    "p",
+    "ph",
+    "phở",
+    " PHỞ ",
+    "bò",
+    "ở g",
+    "gỏi",
+    "ss",
+    "strasse",
+    "viet",
+    "nam",
+    "xyz",
+    "cơm tấm",
+)
+
+
+def test_indexed_filter_matches_full_scan():
+    rng = random.Random(20261016)
+    meals = tuple(_random_meal(rng, index) for index in range(300))
+    index = CatalogMealSearchIndex.build(meals)
+
+    for query in QUERIES:
+        for cuisine in (None, "", "VIETNAMESE", "thai", "french"):
+            for meal_type in (None, *MEAL_TYPES, "snack"):
+                expected = filter_meals(meals, query, cuisine, meal_type)
+                indexed = filter_meals(
+                    meals, query, cuisine, meal_type, search_index=index
+                )
+                assert indexed == expected, (query, cuisine, meal_type)
+
+
+def test_index_for_another_meal_tuple_is_ignored():
+    meals = (_meal("a", "Phở", "vietnamese"),)
+    index = CatalogMealSearchIndex.build(meals)
+    other = (_meal("b", "Bún", "vietnamese"),)
+
+    assert filter_meals(other, "bún", None, None, search_index=index) == list(other)
+
+
+def test_rank_popular_uses_prenormalized_names():
+    meals = (
+        _meal("b", "bún chả", "vietnamese", popularity_rank=1),
+        _meal("a", "BÁNH mì", "vietnamese", popularity_rank=1),
+        _meal("c", "Cơm", "vietnamese", popularity_rank=0),
+    )
+    index = CatalogMealSearchIndex.build(meals)
+
+    ranked = rank_popular(list(meals), popularity_configured=True, search_index=index)
+
+    assert [meal.id for meal in ranked] == ["c", "a", "b"]
+    assert ranked == rank_popular(list(meals), popularity_configured=True)
+
+
+def _random_meal(rng: random.Random, index: int) -> CatalogMeal:
+    return _meal(
+        f"meal-{index:03d}",
+        rng.choice(NAMES) + rng.choice(("", " đặc biệt", f" {index}")),
+        rng.choice(CUISINES),
+        meal_types=tuple(t for t in MEAL_TYPES if rng.random() < 0.5),
+        protein_g=str(rng.choice((0, 10, 25))),
+    )
+
+
+def _meal(
+    meal_id: str,
+    name: str,
+    cuisine: str,
+    *,
+    meal_types: tuple[str, ...] = MEAL_TYPES,
+    protein_g: str = "20",
+    popularity_rank: int | None = None,
+) -> CatalogMeal:
+    return CatalogMeal(
+        id=meal_id,
+        catalog_key=f"key-{meal_id}",
+        content_hash=f"{meal_id:0<64}"[:64],
+        name=name,
+        cuisine=cuisine,
+        description=None,
+        image_url=None,
+        protein_g=Decimal(protein_g),
+        carbs_g=Decimal("0"),
+        fat_g=Decimal("0"),
+        fiber_g=Decimal("0"),
+        meal_types=meal_types,
+        popularity_rank=popularity_rank,
+    )
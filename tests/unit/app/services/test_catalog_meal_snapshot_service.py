@@ -131,6 +131,8 @@ async def test_snapshot_extends_ttl_when_revision_is_unchanged():
 
     assert second.meals == first.meals
     assert second.expires_at > first.expires_at
+    assert second.search_index is first.search_index
+    assert second.search_index.meals is second.meals
     assert catalog.load_calls == 1
 
 
@@ -0,0 +1,146 @@
+"""Unit tests for the meal vision result cache."""
+
+import asyncio
+
+import pytest
+
+from src.app.services.meal_vision_result_cache import MealVisionResultCache
+
+
+class _DictCache:
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl_seconds):
+        self.data[key] = value
+        self.ttls[key] = ttl_seconds
+
+
+class _BrokenCache:
+    async def get(self, key):
+        raise ConnectionError("redis down")
+
+    async def set(self, key, value, ttl_seconds):
+        raise ConnectionError("redis down")
+
+
+def test_key_separates_bytes_strategy_language_and_context():
+    key_for = MealVisionResultCache.key_for
+    base, ttl = key_for(b"photo", strategy="standard", language="en")
+
+    assert base.startswith("meal:vision:")
+    assert ttl > 0
+    assert key_for(b"photo", strategy="standard", language="en")[0] == base
+    assert {
+        key_for(b"other", strategy="standard", language="en")[0],
+        key_for(b"photo", strategy="user_context", language="en")[0],
+        key_for(b"photo", strategy="standard", language="vi")[0],
+        key_for(b"photo", strategy="standard", language="en", context="rice")[0],
+    }.isdisjoint({base})
+
+
+@pytest.mark.asyncio
+async def test_stored_result_is_served_without_calling_the_provider():
+    cache = _DictCache()
+    results = MealVisionResultCache(cache)
+    key, ttl = results.key_for(b"photo", strategy="standard", language="en")
+    await results.store(key, ttl, {"structured_data": {"is_food": True}})
+
+    async def analyze():
+        raise AssertionError("provider must not be called on a hit")
+
+    result, from_provider = await results.get_or_analyze(key, analyze)
+
+    assert result == {"structured_data": {"is_food": True}}
+    assert from_provider is False
+    assert cache.ttls[key] == ttl
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_scans_share_one_provider_call():
+    results = MealVisionResultCache(_DictCache())
+    release = asyncio.Event()
+    calls = 0
+
+    async def analyze():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"structured_data": {"is_food": True}}
+
+    first = asyncio.ensure_future(results.get_or_analyze("k", analyze))
+    second = asyncio.ensure_future(results.get_or_analyze("k", analyze))
+    await asyncio.sleep(0)
+    release.set()
+
+    # Only the leader ran the provider, so only it may store the result.
+    assert await first == ({"structured_data": {"is_food": True}}, True)
+    assert await second == ({"structured_data": {"is_food": True}}, False)
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_followers_share_the_leader_error_then_retry_fresh():
+    results = MealVisionResultCache(None)
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise TimeoutError("provider timeout")
+
+    first = asyncio.ensure_future(results.get_or_analyze("k", failing))
+    second = asyncio.ensure_future(results.get_or_analyze("k", failing))
+    await asyncio.sleep(0)
+    release.set()
+
+    for task in (first, second):
+        with pytest.raises(TimeoutError):
+            await task
+
+    async def succeeding():
+        return {"ok": True}
+
+    assert await results.get_or_analyze("k", succeeding) == ({"ok": True}, True)
+
+
+@pytest.mark.asyncio
+async def test_disabled_or_failing_cache_still_calls_the_provider():
+    async def analyze():
+        return {"ok": True}
+
+    disabled = MealVisionResultCache(_DictCache(), store_results=False)
+    await disabled.store("k", 60, {"stale": True})
+    broken = MealVisionResultCache(_BrokenCache())
+    await broken.store("k", 60, {"stale": True})
+
+    assert await disabled.get_or_analyze("k", analyze) == ({"ok": True}, True)
+    assert await broken.get_or_analyze("k", analyze) == ({"ok": True}, True)
+
+
+@pytest.mark.asyncio
+async def test_lookup_outcomes_are_tagged_as_result(monkeypatch):
+    from src.app.services import meal_vision_result_cache as module
+
+    recorded = []
+    monkeypatch.setattr(
+        module,
+        "increment_metric",
+        lambda name, attributes=None: recorded.append((name, attributes)),
+    )
+    results = MealVisionResultCache(_DictCache())
+
+    async def analyze():
+        return {"ok": True}
+
+    await results.get_or_analyze("k", analyze)
+    await results.store("k", 60, {"ok": True})
+    await results.get_or_analyze("k", analyze)
+
+    assert recorded == [
+        ("meal_analyze.vision_cache.lookup", {"result": "miss"}),
+        ("meal_analyze.vision_cache.lookup", {"result": "hit"}),
+    ]
@@ -0,0 +1,154 @@
+"""Unit tests for stale-while-revalidate dashboard reads."""
+
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.app.handlers.query_handlers.get_nutrition_bulk_query_handler import (
+    GetNutritionBulkQueryHandler,
+)
+from src.app.queries.nutrition import GetNutritionBulkQuery
+from src.app.services.stale_while_revalidate import StaleWhileRevalidate
+from src.domain.cache.cache_keys import CacheKeys
+
+
+class _DictCache:
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl_seconds):
+        self.data[key] = value
+        self.ttls[key] = ttl_seconds
+
+    async def invalidate(self, key):
+        return self.data.pop(key, None) is not None
+
+
+class _InlineTasks:
+    def __init__(self):
+        self.tasks = []
+
+    def spawn(self, name, coro):
+        task = asyncio.ensure_future(coro)
+        self.tasks.append(task)
+        return task
+
+    async def drain(self):
+        await asyncio.gather(*self.tasks)
+
+
+@pytest.fixture
+def cache():
+    return _DictCache()
+
+
+@pytest.fixture
+def tasks():
+    return _InlineTasks()
+
+
+@pytest.fixture
+def swr(cache, tasks):
+    return StaleWhileRevalidate(cache, tasks, stale_seconds=600)
+
+
+async def _expire(cache, key):
+    cache.data[key]["fresh_until"] = 0
+
+
+@pytest.mark.asyncio
+async def test_write_keeps_entry_for_soft_plus_stale_window(swr, cache):
+    await swr.write("k", {"a": 1}, 300)
+
+    assert cache.ttls["k"] == 900
+    entry = await swr.read("k")
+    assert entry.value == {"a": 1}
+    assert entry.stale is False
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_refreshed_once_in_background(swr, cache, tasks):
+    await swr.write("k", {"v": 1}, 300)
+    await _expire(cache, "k")
+    compute = AsyncMock(return_value={"v": 2})
+
+    assert (await swr.read("k")).stale is True
+    swr.schedule_refresh("k", 300, compute)
+    swr.schedule_refresh("k", 300, compute)
+    await tasks.drain()
+
+    compute.assert_awaited_once()
+    entry = await swr.read("k")
+    assert entry.value == {"v": 2}
+    assert entry.stale is False
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_dropped_when_write_purged_entry(swr, cache, tasks):
+    await swr.write("k", {"v": 1}, 300)
+    await _expire(cache, "k")
+
+    async def compute():
+        await cache.invalidate("k")  # a meal write lands mid-refresh
+        return {"v": "pre-write"}
+
+    swr.schedule_refresh("k", 300, compute)
+    await tasks.drain()
+
+    assert await swr.read("k") is None
+
+
+@pytest.mark.asyncio
+async def test_plain_legacy_entries_read_as_stale(swr, cache):
+    cache.data["k"] = {"target_revision": 1}
+    entry = await swr.read("k")
+    assert entry.value == {"target_revision": 1}
+    assert entry.stale is True
+
+
+@pytest.mark.asyncio
+async def test_bulk_serves_stale_entry_on_current_revision(swr, cache, tasks):
+    handler = GetNutritionBulkQueryHandler(
+        cache_service=MagicMock(), stale_while_revalidate=swr
+    )
+    handler._get_user_targets = AsyncMock(
+        return_value=(2000, {}, 1700, 2, MagicMock(), False)
+    )
+    handler._compute = AsyncMock(return_value={"target_revision": 2, "fresh": True})
+    query = GetNutritionBulkQuery(
+        user_id="u1", start_date=date(2026, 4, 1), end_date=date(2026, 4, 2)
+    )
+    first = await handler.handle(query)
+    key = next(iter(cache.data))
+    await _expire(cache, key)
+    handler._compute.return_value = {"target_revision": 2, "fresh": "refreshed"}
+
+    assert await handler.handle(query) == first
+    await tasks.drain()
+    assert (await swr.read(key)).value["fresh"] == "refreshed"
+
+
+@pytest.mark.asyncio
+async def test_bulk_never_serves_stale_entry_from_old_revision(swr, cache, tasks):
+    handler = GetNutritionBulkQueryHandler(
+        cache_service=MagicMock(), stale_while_revalidate=swr
+    )
+    handler._get_user_targets = AsyncMock(
+        return_value=(2000, {}, 1700, 3, MagicMock(), False)
+    )
+    handler._compute = AsyncMock(return_value={"target_revision": 3})
+    query = GetNutritionBulkQuery(
+        user_id="u1", start_date=date(2026, 4, 1), end_date=date(2026, 4, 2)
+    )
+    key, _ = CacheKeys.nutrition_bulk("u1", query.start_date, query.end_date)
+    await swr.write(key, {"target_revision": 2}, 300)
+    await _expire(cache, key)
+
+    assert await handler.handle(query) == {"target_revision": 3}
+    assert tasks.tasks == []
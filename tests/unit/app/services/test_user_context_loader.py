@@ -0,0 +1,141 @@
+"""Unit tests for the request-scoped UserContext loader."""
+
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.app.handlers.query_handlers.get_nutrition_bulk_query_handler import (
+    GetNutritionBulkQueryHandler,
+)
+from src.app.handlers.query_handlers.get_streak_query_handler import (
+    GetStreakQueryHandler,
+)
+from src.app.handlers.query_handlers.get_user_tdee_query_handler import (
+    GetUserTdeeQueryHandler,
+)
+from src.app.queries.meal import GetStreakQuery
+from src.app.queries.nutrition import GetNutritionBulkQuery
+from src.app.queries.tdee import GetUserTdeeQuery
+from src.app.services.user_context_loader import UserContextLoader
+from src.domain.model.meal import StreakSummary
+from src.domain.model.user import UserContext
+
+
+def _uow_factory(users):
+    uow = MagicMock()
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(return_value=False)
+    uow.users = users
+    return MagicMock(return_value=uow)
+
+
+def _stored(timezone="Asia/Ho_Chi_Minh", revision=4):
+    return UserContext(
+        user_id="u1", timezone=timezone, language="vi", profile_target_revision=revision
+    )
+
+
+@pytest.mark.asyncio
+async def test_context_is_read_once_per_request():
+    users = MagicMock(get_user_context=AsyncMock(return_value=_stored()))
+    factory = _uow_factory(users)
+    loader = UserContextLoader("u1", factory, header_timezone="Europe/Paris")
+
+    results = await asyncio.gather(loader.load(), loader.load())
+    again = await loader.load()
+
+    factory.assert_called_once()
+    users.get_user_context.assert_awaited_once_with("u1")
+    assert results[0] == results[1] == again
+    assert again.timezone == "Asia/Ho_Chi_Minh"
+    assert again.language == "vi"
+    assert again.profile_target_revision == 4
+
+
+@pytest.mark.asyncio
+async def test_stored_utc_falls_back_to_valid_header_timezone():
+    users = MagicMock(get_user_context=AsyncMock(return_value=_stored("UTC")))
+    loader = UserContextLoader(
+        "u1", _uow_factory(users), header_timezone="Europe/Paris"
+    )
+
+    assert (await loader.load()).timezone == "Europe/Paris"
+
+
+@pytest.mark.asyncio
+async def test_missing_user_or_failed_lookup_degrades_to_header_timezone():
+    missing = MagicMock(get_user_context=AsyncMock(return_value=None))
+    failing = MagicMock(get_user_context=AsyncMock(side_effect=RuntimeError("db")))
+
+    for users in (missing, failing):
+        loader = UserContextLoader(
+            "u1", _uow_factory(users), header_timezone="Europe/Paris"
+        )
+        context = await loader.load()
+        assert context == UserContext(user_id="u1", timezone="Europe/Paris")
+
+
+@pytest.mark.asyncio
+async def test_streak_uses_loaded_timezone_instead_of_resolving_again():
+    loader = MagicMock(load=AsyncMock(return_value=_stored()))
+    uow = _uow_factory(MagicMock())()
+    uow.streak_summaries.get = AsyncMock(return_value=None)
+    uow.meals.rebuild_streak_summary = AsyncMock(
+        return_value=StreakSummary(user_id="u1", timezone="Asia/Ho_Chi_Minh")
+    )
+
+    with (
+        patch(
+            "src.app.handlers.query_handlers.get_streak_query_handler.AsyncUnitOfWork",
+            return_value=uow,
+        ),
+        patch(
+            "src.app.handlers.query_handlers.get_streak_query_handler."
+            "resolve_user_timezone_async"
+        ) as resolve,
+    ):
+        await GetStreakQueryHandler().handle(
+            GetStreakQuery(user_id="u1", user_context=loader)
+        )
+
+    resolve.assert_not_called()
+    uow.meals.rebuild_streak_summary.assert_awaited_once_with("u1", "Asia/Ho_Chi_Minh")
+
+
+@pytest.mark.asyncio
+async def test_bulk_cache_hit_fences_on_context_revision_without_tdee_lookup():
+    cached = {"target_revision": 4, "dates": {}}
+    cache = MagicMock(get_json=AsyncMock(return_value=cached))
+    handler = GetNutritionBulkQueryHandler(cache_service=cache)
+    handler._get_user_targets = AsyncMock()
+    loader = MagicMock(load=AsyncMock(return_value=_stored(revision=4)))
+
+    result = await handler.handle(
+        GetNutritionBulkQuery(
+            user_id="u1",
+            start_date=date(2026, 4, 1),
+            end_date=date(2026, 4, 2),
+            user_context=loader,
+        )
+    )
+
+    assert result == cached
+    handler._get_user_targets.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_tdee_skips_revision_lookup_when_caller_knows_it():
+    cached = {"profile_target_revision": 4, "target_calories": 2000}
+    handler = GetUserTdeeQueryHandler(
+        cache_service=MagicMock(get_json=AsyncMock(return_value=cached))
+    )
+    handler._current_profile_revision = AsyncMock()
+
+    result = await handler.handle(
+        GetUserTdeeQuery(user_id="u1", profile_target_revision=4)
+    )
+
+    assert result == cached
+    handler._current_profile_revision.assert_not_awaited()
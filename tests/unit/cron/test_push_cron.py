@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.infra.services.daily_context_precompute_service import PrecomputeSummary
+
 
 def _mock_async_engine(timezones=None):
     engine = MagicMock()
@@ -39,7 +41,9 @@ async def test_push_cron_happy_path_runs_all_phases():
     ):
         # Precompute service
         mock_precompute = AsyncMock()
-        mock_precompute.precompute_for_timezone = AsyncMock()
+        mock_precompute.precompute_timezones = AsyncMock(
+            return_value=PrecomputeSummary()
+        )
         mock_precompute_cls.return_value = mock_precompute
 
         # Trial push service
@@ -58,7 +62,12 @@ async def test_push_cron_happy_path_runs_all_phases():
         await run()
 
         # All phases were invoked
-        assert mock_precompute.precompute_for_timezone.call_count == 2
+        mock_precompute.precompute_timezones.assert_awaited_once()
+        targets = list(mock_precompute.precompute_timezones.await_args.args[0])
+        assert [tz_name for tz_name, _today in targets] == [
+            "Asia/Ho_Chi_Minh",
+            "UTC",
+        ]
         mock_trial.check_and_schedule_pushes.assert_awaited_once()
         mock_svc._send_due_notifications.assert_called_once()
         mock_svc.cleanup_expired_notifications.assert_awaited_once()
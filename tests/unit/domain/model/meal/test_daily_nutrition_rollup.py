@@ -0,0 +1,113 @@
+"""DailyNutritionRollup must reproduce the per-reader meal sums."""
+
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+
+from src.domain.model.hydration import HydrationEntry
+from src.domain.model.meal import DailyNutritionRollup, MealStatus
+
+DAY = date(2026, 10, 16)
+
+
+def _meal(meal_id, status, *, protein=0.0, carbs=0.0, fat=0.0, fiber=0.0, **extra):
+    fields = {
+        "meal_id": meal_id,
+        "status": status,
+        "created_at": datetime(2026, 10, 16, 12, tzinfo=UTC),
+        "meal_type": None,
+        "quantity": None,
+        "source": "scanner",
+        "food_label_metadata": None,
+        "nutrition": SimpleNamespace(
+            macros=SimpleNamespace(protein=protein, carbs=carbs, fat=fat, fiber=fiber),
+            nutrition_override=None,
+            food_items=[],
+        ),
+    }
+    fields.update(extra)
+    return SimpleNamespace(**fields)
+
+
+def _entry(credited_ml, *, protein=0.0, legacy_meal_id=None, logged_at=None):
+    return HydrationEntry(
+        user_id="u1",
+        drink_name_snapshot="Milk",
+        volume_ml=credited_ml,
+        credited_ml=credited_ml,
+        protein_g=protein,
+        legacy_meal_id=legacy_meal_id,
+        logged_at=logged_at or datetime(2026, 10, 16, 9, tzinfo=UTC),
+    )
+
+
+def test_dashboard_and_budget_totals_count_different_meals():
+    rollup = DailyNutritionRollup.from_day(
+        "u1",
+        DAY,
+        "UTC",
+        meals=[
+            _meal("ready", MealStatus.READY, protein=30, carbs=50, fat=10, fiber=5),
+            _meal("enriching", MealStatus.ENRICHING, protein=10),
+            _meal("processing", MealStatus.PROCESSING, nutrition=None),
+            _meal("gone", MealStatus.INACTIVE, protein=99),
+        ],
+        movement_kcal=120.0,
+    )
+
+    assert rollup.meal_count == 3
+    assert (rollup.protein, rollup.carbs, rollup.fat, rollup.fiber) == (40, 50, 10, 5)
+    assert (rollup.ready_protein, rollup.ready_carbs, rollup.ready_fat) == (30, 50, 10)
+    assert rollup.ready_calories < rollup.calories
+    assert rollup.net_calories == rollup.calories - 120.0
+
+
+def test_hydration_entries_mirrored_by_a_legacy_meal_count_once():
+    legacy = _meal("legacy", MealStatus.READY, meal_type="hydration", quantity=250)
+    rollup = DailyNutritionRollup.from_day(
+        "u1",
+        DAY,
+        "UTC",
+        meals=[legacy],
+        hydration_entries=[
+            _entry(250, protein=8, legacy_meal_id="legacy"),
+            _entry(300, protein=2),
+        ],
+    )
+
+    assert rollup.entry_count == 2
+    assert rollup.hydration_entry_count == 1
+    assert rollup.protein == 2
+    assert rollup.hydration_ml == 550
+
+
+def test_hydration_ml_falls_back_to_legacy_meals_without_entries():
+    legacy = _meal("legacy", MealStatus.READY, meal_type="hydration", quantity=400)
+
+    rollup = DailyNutritionRollup.from_day("u1", DAY, "UTC", meals=[legacy])
+
+    assert rollup.hydration_ml == 400
+
+
+def test_build_range_buckets_by_local_day_and_keeps_empty_days():
+    # 18:00 UTC on the 15th is the 16th in Ho Chi Minh City.
+    late = _meal(
+        "late",
+        MealStatus.READY,
+        protein=10,
+        created_at=datetime(2026, 10, 15, 18, tzinfo=UTC),
+    )
+
+    rollups = DailyNutritionRollup.build_range(
+        "u1",
+        "Asia/Ho_Chi_Minh",
+        date(2026, 10, 15),
+        DAY,
+        meals=[late],
+        movements=[(datetime(2026, 10, 14, 20, tzinfo=UTC), 50.0)],
+    )
+
+    assert list(rollups) == [date(2026, 10, 15), DAY]
+    assert rollups[date(2026, 10, 15)].movement_kcal == 50.0
+    assert rollups[date(2026, 10, 15)].meal_count == 0
+    assert rollups[DAY].ready_protein == 10
+    assert rollups[DAY].timezone == "Asia/Ho_Chi_Minh"
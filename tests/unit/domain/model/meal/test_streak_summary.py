@@ -0,0 +1,121 @@
+"""Incremental StreakSummary maintenance must match a full rebuild."""
+
+import random
+from datetime import date, timedelta
+
+from src.domain.model.meal import StreakSummary
+
+TODAY = date(2026, 10, 16)
+
+
+def _rebuild(dates, scan_count=0):
+    return StreakSummary.from_logged_dates("u1", "UTC", dates, scan_count)
+
+
+def _in_window(dates, window):
+    if window is None:
+        return []
+    start, end = window
+    return [d for d in dates if start <= d <= end]
+
+
+def _previous_run(summary, dates, day):
+    earlier = [d for d in dates if d < day]
+    if not earlier:
+        return []
+    latest = max(earlier)
+    start = latest - timedelta(days=summary.best_run_length)
+    return [d for d in earlier if d >= start]
+
+
+def _add(summary, dates, day):
+    dates.add(day)
+    window = summary.scan_window_for_added_day(day)
+    return summary.with_added_day(day, _in_window(dates, window))
+
+
+def _remove(summary, dates, day):
+    dates.discard(day)
+    previous = (
+        _previous_run(summary, dates, day) if summary.empties_current_run(day) else []
+    )
+    updated = summary.with_removed_day(day, previous)
+    return _rebuild(dates) if updated is None else updated
+
+
+def test_full_rebuild_tracks_current_and_best_runs():
+    days = [TODAY - timedelta(days=n) for n in (0, 1, 2, 10, 11, 12, 13, 30)]
+
+    summary = _rebuild(days, scan_count=4)
+
+    assert summary.last_logged_date == TODAY
+    assert summary.current_run_start == TODAY - timedelta(days=2)
+    assert summary.best_run_length == 4
+    assert summary.best_run_end == TODAY - timedelta(days=10)
+    assert summary.to_response(summary.current_streak(TODAY)) == {
+        "current_streak": 3,
+        "best_streak": 4,
+        "last_logged_date": TODAY.isoformat(),
+        "scan_count": 4,
+    }
+
+
+def test_current_streak_survives_until_the_day_ends():
+    summary = _rebuild([TODAY - timedelta(days=2), TODAY - timedelta(days=1)])
+
+    assert summary.current_streak(TODAY) == 2
+    assert summary.current_streak(TODAY + timedelta(days=1)) == 0
+    assert _rebuild([]).current_streak(TODAY) == 0
+
+
+def test_future_dated_meal_defers_to_a_window_scan():
+    summary = _rebuild([TODAY, TODAY + timedelta(days=2)])
+
+    assert summary.current_streak(TODAY) is None
+
+
+def test_backdated_day_bridging_into_current_run_extends_it():
+    dates = {TODAY, TODAY - timedelta(days=1), TODAY - timedelta(days=3)}
+    summary = _rebuild(dates)
+
+    summary = _add(summary, dates, TODAY - timedelta(days=2))
+
+    assert summary.current_run_start == TODAY - timedelta(days=3)
+    assert summary.current_streak(TODAY) == 4
+    assert summary == _rebuild(dates)
+
+
+def test_deleting_from_the_best_run_asks_for_a_rebuild():
+    dates = [TODAY - timedelta(days=n) for n in (0, 5, 6, 7)]
+
+    assert _rebuild(dates).with_removed_day(TODAY - timedelta(days=6)) is None
+
+
+def test_deleting_a_lone_current_day_falls_back_to_the_previous_run():
+    dates = {TODAY, TODAY - timedelta(days=9), TODAY - timedelta(days=10)}
+    dates |= {TODAY - timedelta(days=n) for n in (20, 21, 22)}
+    summary = _rebuild(dates)
+
+    summary = _remove(summary, dates, TODAY)
+
+    assert summary.last_logged_date == TODAY - timedelta(days=9)
+    assert summary.current_run_start == TODAY - timedelta(days=10)
+    assert summary == _rebuild(dates)
+
+
+def test_random_adds_and_removes_match_full_rebuild():
+    rng = random.Random(20261016)
+    for _ in range(200):
+        dates: set[date] = set()
+        summary = _rebuild(dates)
+        for _ in range(40):
+            day = TODAY - timedelta(days=rng.randrange(60))
+            if day in dates and rng.random() < 0.5:
+                summary = _remove(summary, dates, day)
+            else:
+                summary = _add(summary, dates, day)
+            expected = _rebuild(dates)
+            assert summary.last_logged_date == expected.last_logged_date
+            assert summary.current_run_start == expected.current_run_start
+            assert summary.best_run_length == expected.best_run_length
+            assert summary.best_run_end == expected.best_run_end
@@ -0,0 +1,180 @@
+import random
+from decimal import Decimal
+
+from src.domain.model.meal_recommendation import CatalogMeal, CatalogMealIngredient
+from src.domain.services.meal_recommendation.catalog_ingredient_statistics_service import (
+    CatalogIngredientStatisticsService,
+)
+from src.domain.services.meal_recommendation.catalog_scoring_index import (
+    CatalogScoringIndex,
+)
+from src.domain.services.meal_recommendation.ingredient_affinity_service import (
+    IngredientAffinityProfile,
+)
+from src.domain.services.meal_recommendation.recipe_scoring_service import (
+    RecipeScoringService,
+)
+from src.domain.services.meal_recommendation.three_day_plan_optimizer import (
+    ThreeDayPlanOptimizer,
+)
+
+MEAL_TYPES = ("breakfast", "lunch", "dinner")
+
+
+def test_indexed_rank_matches_per_meal_rank_exactly():
+    rng = random.Random(20261016)
+    meals = [_random_meal(rng, index) for index in range(400)]
+    statistics = CatalogIngredientStatisticsService().build(meals)
+    index = CatalogScoringIndex.build(meals, statistics)
+    scoring = RecipeScoringService()
+
+    for _ in range(25):
+        affinity = _random_affinity(rng)
+        for meal_type in MEAL_TYPES:
+            kwargs = {
+                "meal_type": meal_type,
+                "target_calories": rng.randint(250, 900),
+                "affinity": affinity,
+                "excluded_catalog_meal_ids": {f"meal-{rng.randrange(400)}"},
+                "ingredient_statistics": statistics,
+            }
+
+            expected = scoring.rank(meals, **kwargs)
+            indexed = scoring.rank(meals, scoring_index=index, **kwargs)
+
+            assert indexed == expected
+
+
+def test_precomputed_ingredient_fits_match_and_are_shared_across_meal_types(
+    monkeypatch,
+):
+    rng = random.Random(20261017)
+    meals = [_random_meal(rng, index) for index in range(200)]
+    statistics = CatalogIngredientStatisticsService().build(meals)
+    index = CatalogScoringIndex.build(meals, statistics)
+    scoring = RecipeScoringService()
+    affinity = _random_affinity(rng)
+    fits = index.ingredient_fit(affinity)
+
+    for meal_type in MEAL_TYPES:
+        kwargs = {
+            "meal_type": meal_type,
+            "target_calories": 500,
+            "affinity": affinity,
+            "ingredient_statistics": statistics,
+            "scoring_index": index,
+        }
+        assert scoring.rank(meals, ingredient_fits=fits, **kwargs) == scoring.rank(
+            meals, **kwargs
+        )
+
+    calls = []
+    original = CatalogScoringIndex.ingredient_fit
+
+    def counting_fit(self, profile):
+        calls.append(profile)
+        return original(self, profile)
+
+    monkeypatch.setattr(CatalogScoringIndex, "ingredient_fit", counting_fit)
+    ThreeDayPlanOptimizer().build_plan(
+        meals,
+        daily_calories=2000,
+        affinity=affinity,
+        ingredient_statistics=statistics,
+        scoring_index=index,
+    )
+
+    assert calls == [affinity]
+
+
+def test_score_many_falls_back_when_index_does_not_cover_the_input():
+    meals = [_meal("a", (1, 2), "20"), _meal("b", (2, 3), "30")]
+    statistics = CatalogIngredientStatisticsService().build(meals)
+    index = CatalogScoringIndex.build(meals[:1], statistics)
+    rebuilt_statistics = CatalogIngredientStatisticsService().build(meals)
+    scoring = RecipeScoringService()
+    affinity = IngredientAffinityProfile(weights={2: 0.6, 3: 0.4}, confidence=0.8)
+    expected = [
+        scoring.score(
+            meal,
+            target_calories=500,
+            affinity=affinity,
+            ingredient_statistics=statistics,
+        )
+        for meal in meals
+    ]
+
+    assert index.rows_for(meals) is None
+    assert (
+        scoring.score_many(
+            meals,
+            target_calories=500,
+            affinity=affinity,
+            ingredient_statistics=statistics,
+            scoring_index=index,
+        )
+        == expected
+    )
+    # Statistics from another build are not trusted even when equal in value.
+    full_index = CatalogScoringIndex.build(meals, rebuilt_statistics)
+    assert (
+        scoring.score_many(
+            meals,
+            target_calories=500,
+            affinity=affinity,
+            ingredient_statistics=statistics,
+            scoring_index=full_index,
+        )
+        == expected
+    )
+
+
+def _random_affinity(rng: random.Random) -> IngredientAffinityProfile:
+    food_ids = rng.sample(range(1, 90), rng.randint(0, 12))
+    raw = {food_id: rng.random() for food_id in food_ids}
+    total = sum(raw.values()) or 1.0
+    return IngredientAffinityProfile(
+        weights={food_id: value / total for food_id, value in raw.items()},
+        confidence=rng.random(),
+    )
+
+
+def _random_meal(rng: random.Random, index: int) -> CatalogMeal:
+    food_ids = tuple(rng.randint(-2, 80) for _ in range(rng.randint(0, 8)))
+    meal = _meal(f"meal-{index}", food_ids, str(rng.randint(0, 60)))
+    return CatalogMeal(
+        **{
+            **meal.__dict__,
+            "meal_types": tuple(
+                meal_type for meal_type in MEAL_TYPES if rng.random() < 0.5
+            ),
+        }
+    )
+
+
+def _meal(
+    meal_id: str, food_reference_ids: tuple[int, ...], protein_g: str
+) -> CatalogMeal:
+    return CatalogMeal(
+        id=meal_id,
+        catalog_key=f"key-{meal_id}",
+        content_hash=f"{meal_id:0<64}"[:64],
+        name=f"Meal {meal_id}",
+        cuisine="vietnamese",
+        description=None,
+        image_url=None,
+        protein_g=Decimal(protein_g),
+        carbs_g=Decimal("40"),
+        fat_g=Decimal("10"),
+        fiber_g=Decimal("5"),
+        meal_types=MEAL_TYPES,
+        ingredients=tuple(
+            CatalogMealIngredient(
+                food_reference_id=food_reference_id,
+                display_name="Ingredient",
+                quantity=Decimal("100"),
+                unit="g",
+            )
+            for food_reference_id in food_reference_ids
+        ),
+    )
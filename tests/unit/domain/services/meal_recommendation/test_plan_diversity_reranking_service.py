@@ -1,11 +1,16 @@
+import random
 from decimal import Decimal
 
 from src.domain.model.meal_recommendation import CatalogMeal, CatalogMealIngredient
 from src.domain.services.meal_recommendation.catalog_ingredient_statistics_service import (
     CatalogIngredientStatisticsService,
 )
+from src.domain.services.meal_recommendation.catalog_scoring_index import (
+    CatalogScoringIndex,
+)
 from src.domain.services.meal_recommendation.plan_diversity_reranking_service import (
     SHORTLIST_LIMIT,
+    DiversityOverlapCache,
     PlanDiversityRerankingService,
 )
 from src.domain.services.meal_recommendation.recipe_scoring_service import RecipeScore
@@ -69,6 +74,78 @@ def test_contextual_rerank_caps_work_to_top_30_candidates():
     assert {item.catalog_meal.id for item in result}.isdisjoint({"meal-30", "meal-31"})
 
 
+def test_incremental_selection_matches_repeated_rerank():
+    rng = random.Random(20261016)
+    meals = [
+        _meal(f"meal-{index:03d}", tuple(rng.randint(0, 40) for _ in range(5)))
+        for index in range(200)
+    ]
+    stats = CatalogIngredientStatisticsService().build(meals)
+    index = CatalogScoringIndex.build(meals, stats)
+    service = PlanDiversityRerankingService()
+    ranked = sorted(
+        (
+            RecipeScore(
+                meal,
+                score=0.0,
+                calorie_fit=rng.random(),
+                ingredient_fit=rng.random(),
+                calorie_weight=0.7,
+                ingredient_weight=0.2,
+                diversity_weight=0.1,
+            )
+            for meal in meals
+        ),
+        key=lambda item: (
+            -item.contextual_score(diversity_fit=0.0),
+            item.catalog_meal.id,
+        ),
+    )
+
+    expected: list[RecipeScore] = []
+    remaining = ranked[:]
+    while remaining and len(expected) < SHORTLIST_LIMIT:
+        winner = service.rerank_shortlist(
+            remaining,
+            comparison_meals=tuple(item.catalog_meal for item in expected),
+            ingredient_statistics=stats,
+        )[0]
+        expected.append(winner)
+        remaining = [
+            item for item in remaining if item.catalog_meal.id != winner.catalog_meal.id
+        ]
+
+    selected, rest = service.select_shortlist(
+        ranked,
+        ingredient_statistics=stats,
+        overlaps=DiversityOverlapCache(stats, index),
+    )
+
+    assert selected == expected
+    assert rest == remaining
+
+
+def test_cached_overlaps_are_skipped_for_injected_diversity_fit():
+    meals = [_meal("a", (1,)), _meal("b", (1, 2)), _meal("c", (3,))]
+    stats = CatalogIngredientStatisticsService().build(meals)
+    compared = []
+
+    def diversity_fit(candidate, comparison_meals, statistics):
+        compared.append((candidate.id, tuple(meal.id for meal in comparison_meals)))
+        return 0.5
+
+    service = PlanDiversityRerankingService(diversity_fit=diversity_fit)
+    ranked = [RecipeScore(meal, 1.0) for meal in meals]
+
+    selected, rest = service.select_shortlist(
+        ranked, ingredient_statistics=stats, limit=2
+    )
+
+    assert [item.catalog_meal.id for item in selected] == ["a", "b"]
+    assert [item.catalog_meal.id for item in rest] == ["c"]
+    assert ("b", ("a",)) in compared
+
+
 def _meal(meal_id: str, food_reference_ids: tuple[int, ...]) -> CatalogMeal:
     return CatalogMeal(
         id=meal_id,
@@ -74,3 +74,59 @@ async def test_lookup_caches_result_in_redis_on_miss():
     call_args = redis_mock.set.call_args
     assert "nutrition:" in call_args[0][0]  # Key contains prefix
     assert call_args.kwargs["ttl"] == 86400  # TTL is 24 hours
+
+
+@pytest.mark.asyncio
+async def test_meal_lookup_uses_one_mget_and_one_pipelined_write_back(monkeypatch):
+    """A meal costs two Redis round trips however many ingredients miss."""
+    import src.domain.services.meal_suggestion.nutrition_lookup_service as module
+
+    metrics = []
+    monkeypatch.setattr(
+        module,
+        "increment_metric",
+        lambda name, value, **kwargs: metrics.append((value, kwargs["attributes"])),
+    )
+    cached = json.dumps(
+        {"protein": 31.0, "carbs": 0.0, "fat": 3.6, "source_tier": "T1_food_reference"}
+    )
+    redis_mock = MagicMock()
+    redis_mock.mget = AsyncMock(return_value=[cached, None, None])
+    redis_mock.mset_with_ttl = AsyncMock(return_value=True)
+    redis_mock.get = AsyncMock()
+    redis_mock.set = AsyncMock()
+    repo_mock = MagicMock()
+    repo_mock.find_batch_by_normalized_names = AsyncMock(
+        return_value={
+            "rice": {"id": 2, "protein_100g": 2.7, "carbs_100g": 28.0, "fat_100g": 0.3},
+            "egg": {"id": 3, "protein_100g": 13.0, "carbs_100g": 1.1, "fat_100g": 11.0},
+        }
+    )
+    svc = NutritionLookupService(
+        food_ref_repo=repo_mock,
+        ingredient_nutrition_resolver=MagicMock(),
+        generation_service=MagicMock(),
+        redis_client=redis_mock,
+    )
+
+    meal = await svc.calculate_meal_macros(
+        [
+            {"name": "chicken breast", "amount": 100, "unit": "g"},
+            {"name": "rice", "amount": 150, "unit": "g"},
+            {"name": "egg", "amount": 50, "unit": "g"},
+        ]
+    )
+
+    assert meal.t1_count == 3
+    redis_mock.mget.assert_awaited_once_with(
+        ["nutrition:chicken breast", "nutrition:rice", "nutrition:egg"]
+    )
+    payloads, ttl = redis_mock.mset_with_ttl.await_args.args
+    assert sorted(payloads) == ["nutrition:egg", "nutrition:rice"]
+    assert ttl == 86400
+    redis_mock.get.assert_not_awaited()
+    redis_mock.set.assert_not_awaited()
+    assert svc.get_cache_metrics()["redis_hits"] == 1
+    assert svc.get_cache_metrics()["redis_misses"] == 2
+    assert (2, {"source": "redis", "result": "miss"}) in metrics
+    assert metrics.count((1, {"source": "t1_food_reference", "result": "hit"})) == 2
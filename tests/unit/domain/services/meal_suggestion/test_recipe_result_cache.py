@@ -0,0 +1,214 @@
+"""
+Unit tests: cross-session recipe cache in front of the recipe model.
+
+Verifies:
+  - keys ignore meal-name case, ingredient order and targets within one band
+  - keys change with allergies and calorie band
+  - a cached recipe skips the model but is still rescaled to the session target
+  - a cached recipe that no longer scales falls back to the model
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.model.meal_suggestion import SuggestionSession
+from src.domain.ports.cache_port import CachePort
+from src.domain.services.meal_suggestion.macro_validation_service import (
+    MacroValidationService,
+)
+from src.domain.services.meal_suggestion.nutrition_lookup_service import (
+    IngredientMacros,
+    MealMacros,
+    NutritionLookupService,
+)
+from src.domain.services.meal_suggestion.parallel_recipe_generator import (
+    ParallelRecipeGenerator,
+)
+from src.domain.services.meal_suggestion.recipe_result_cache import (
+    RecipeResultCache,
+)
+
+
+class _MemoryCache(CachePort):
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl_seconds):
+        self.values[key] = value
+
+    async def invalidate(self, key):
+        return self.values.pop(key, None) is not None
+
+    async def invalidate_pattern(self, pattern):
+        return 0
+
+
+def _session(**overrides) -> SuggestionSession:
+    values = {
+        "id": "session_1",
+        "user_id": "user_1",
+        "meal_type": "lunch",
+        "meal_portion_type": "main",
+        "target_calories": 610,
+        "ingredients": ["chicken breast", "rice"],
+        "cooking_time_minutes": 30,
+        "allergies": ["peanut"],
+        "cooking_equipment": ["stove"],
+        **overrides,
+    }
+    return SuggestionSession(**values)
+
+
+def _meal_macros() -> MealMacros:
+    ingredient = IngredientMacros(
+        name="chicken breast",
+        quantity_g=150.0,
+        calories=300.0,
+        protein=45.0,
+        carbs=0.0,
+        fat=6.0,
+        fiber=0.0,
+        sugar=0.0,
+        source_tier="T1_food_reference",
+        food_reference_id=700,
+    )
+    return MealMacros(
+        calories=600.0,
+        protein=45.0,
+        carbs=40.0,
+        fat=6.0,
+        fiber=0.0,
+        sugar=0.0,
+        ingredients=[ingredient],
+        t1_count=1,
+        t2_count=0,
+        t3_count=0,
+    )
+
+
+def _raw_response() -> dict:
+    return {
+        "ingredients": [{"name": "chicken breast", "amount": 150.0, "unit": "g"}],
+        "recipe_steps": [
+            {"step": 1, "instruction": "Grill the chicken.", "duration_minutes": 15}
+        ],
+        "prep_time_minutes": 20,
+        "cuisine_type": "Asian",
+    }
+
+
+def _generator(cache: CachePort):
+    generation = MagicMock()
+    generation.generate_meal_plan_async = AsyncMock(return_value=_raw_response())
+    nutrition_lookup = AsyncMock(spec=NutritionLookupService)
+    nutrition_lookup.calculate_meal_macros.return_value = _meal_macros()
+    nutrition_lookup.scale_to_target = MagicMock(return_value=_meal_macros())
+    generator = ParallelRecipeGenerator(
+        generation_service=generation,
+        translation_service=None,
+        macro_validator=MacroValidationService(),
+        nutrition_lookup=nutrition_lookup,
+        meal_names_schema_class=dict,
+        discovery_meals_schema_class=dict,
+        recipe_cache=RecipeResultCache(cache),
+    )
+    return generator, generation, nutrition_lookup
+
+
+async def _generate(generator, session, meal_name="Chicken Rice"):
+    return await generator._generate_with_retry(
+        "prompt", meal_name, 0, "system", session
+    )
+
+
+def test_recipe_key_is_stable_across_banded_targets_and_input_order():
+    base, _ = RecipeResultCache.key_for("Chicken Rice", _session())
+
+    same, _ = RecipeResultCache.key_for(
+        "  chicken   rice ",
+        _session(target_calories=580, ingredients=["rice", "chicken breast"]),
+    )
+    other_band, _ = RecipeResultCache.key_for(
+        "Chicken Rice", _session(target_calories=700)
+    )
+    other_allergy, _ = RecipeResultCache.key_for(
+        "Chicken Rice", _session(allergies=["shellfish"])
+    )
+
+    assert same == base
+    assert other_band != base
+    assert other_allergy != base
+
+
+@pytest.mark.asyncio
+async def test_cached_recipe_skips_model_and_is_rescaled_to_each_session():
+    cache = _MemoryCache()
+    generator, generation, nutrition_lookup = _generator(cache)
+
+    first = await _generate(generator, _session())
+    second = await _generate(
+        generator, _session(id="session_2", user_id="user_2", target_calories=590)
+    )
+
+    assert generation.generate_meal_plan_async.await_count == 1
+    assert first is not None and second is not None
+    assert second.session_id == "session_2"
+    assert second.meal_name == "Chicken Rice"
+    stored = next(iter(cache.values.values()))
+    assert stored["ingredients"][0]["amount"] == 150.0
+    targets = [call.args[1] for call in nutrition_lookup.scale_to_target.call_args_list]
+    assert targets == [610, 590]
+
+
+@pytest.mark.asyncio
+async def test_cached_recipe_that_no_longer_scales_falls_back_to_the_model():
+    cache = _MemoryCache()
+    generator, generation, nutrition_lookup = _generator(cache)
+    session = _session()
+    key, _ = RecipeResultCache.key_for("Chicken Rice", session)
+    cache.values[key] = _raw_response()
+    nutrition_lookup.scale_to_target.side_effect = [None, _meal_macros()]
+
+    result = await _generate(generator, session)
+
+    assert result is not None
+    assert generation.generate_meal_plan_async.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_failures_do_not_block_generation():
+    cache = _MemoryCache()
+    cache.get = AsyncMock(side_effect=RuntimeError("redis down"))
+    cache.set = AsyncMock(side_effect=RuntimeError("redis down"))
+    generator, generation, _ = _generator(cache)
+
+    result = await _generate(generator, _session())
+
+    assert result is not None
+    generation.generate_meal_plan_async.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_lookup_outcomes_are_tagged_as_result(monkeypatch):
+    from src.domain.services.meal_suggestion import recipe_result_cache as module
+
+    recorded = []
+    monkeypatch.setattr(
+        module,
+        "increment_metric",
+        lambda name, attributes=None: recorded.append((name, attributes)),
+    )
+    cache = _MemoryCache()
+    recipes = RecipeResultCache(cache)
+    cache.values["k"] = {"ingredients": [{"name": "rice"}]}
+
+    assert await recipes.get("missing") is None
+    assert await recipes.get("k") is not None
+    assert recorded == [
+        ("meal_suggestion.recipe_cache.lookup", {"result": "miss"}),
+        ("meal_suggestion.recipe_cache.lookup", {"result": "hit"}),
+    ]
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from src.domain.model.meal import MealStatus
+from src.domain.model.meal import DailyNutritionRollup, MealStatus
 from src.domain.model.weekly import WeeklyMacroBudget
 from src.domain.services.weekly_budget_service import WeeklyBudgetService
 
@@ -80,6 +80,9 @@ class FakeMeal:
     created_at: datetime | None = None
     source: str = "scan"
     food_label_metadata: object = None
+    meal_id: str = "meal-1"
+    meal_type: str | None = None
+    quantity: int | None = None
 
 
 @dataclass
@@ -117,6 +120,7 @@ class FakeUoWAsync:
     def __init__(self, meals=None, daily_counts=None, cheat_days=None):
         self.meals = FakeMealRepoAsync(meals or [], daily_counts or {})
         self.cheat_days = FakeCheatDayRepoAsync(cheat_days or [])
+        self.daily_nutrition_rollups = None
 
 
 def _make_budget(
@@ -157,6 +161,7 @@ class TestCalculateWeeklyConsumedAsync:
     async def test_returns_zero_totals_when_no_meals(self):
         """Should return zero totals when no meals found."""
         mock_uow = Mock()
+        mock_uow.daily_nutrition_rollups = None
         mock_uow.meals.find_by_date_range = AsyncMock(return_value=[])
 
         result = await WeeklyBudgetService.calculate_weekly_consumed_async(
@@ -197,6 +202,7 @@ class TestCalculateWeeklyConsumedAsync:
         processing_meal.created_at = None
 
         mock_uow = Mock()
+        mock_uow.daily_nutrition_rollups = None
         mock_uow.meals.find_by_date_range = AsyncMock(
             return_value=[ready_meal, processing_meal]
         )
@@ -222,6 +228,7 @@ class TestCalculateWeeklyConsumedAsync:
             created_at=datetime(2026, 3, 9, 12, tzinfo=UTC),
         )
         mock_uow = Mock()
+        mock_uow.daily_nutrition_rollups = None
         mock_uow.meals.find_by_date_range = AsyncMock(return_value=[meal])
         mock_uow.movement_entries = _FakeMovementEntries(
             [(datetime(2026, 3, 9, 18, tzinfo=UTC), 200.0, True)]
@@ -249,6 +256,7 @@ class TestCalculateWeeklyConsumedAsync:
             created_at=datetime(2026, 3, 9, 12, tzinfo=UTC),
         )
         mock_uow = Mock()
+        mock_uow.daily_nutrition_rollups = None
         mock_uow.meals.find_by_date_range = AsyncMock(return_value=[meal])
         mock_uow.movement_entries = _FakeMovementEntries(
             [
@@ -464,6 +472,7 @@ class TestGetEffectiveAdjustedDailyAsync:
             remaining_fat: float = 490
 
         mock_uow = Mock()
+        mock_uow.daily_nutrition_rollups = None
         mock_uow.cheat_days.find_by_user_and_date_range = AsyncMock(return_value=[])
         mock_uow.meals.get_daily_meal_counts = AsyncMock(return_value={})
         mock_uow.meals.find_by_date_range = AsyncMock(return_value=[])
@@ -499,6 +508,7 @@ class TestGetEffectiveAdjustedDailyAsync:
         )
 
         mock_uow = Mock()
+        mock_uow.daily_nutrition_rollups = None
         mock_uow.cheat_days.find_by_user_and_date_range = AsyncMock(return_value=[])
         mock_uow.meals.get_daily_meal_counts = AsyncMock(
             return_value={date(2026, 3, 9): 1}
@@ -901,3 +911,116 @@ class TestGetEffectiveAdjustedDailyAsync:
         assert leftover_split < floor
         assert result.adjusted.calories == pytest.approx(floor, abs=1)
         assert result.adjusted.protein == _BASE_P
+
+
+class FakeRollupRepoAsync:
+    """Rollup repository fake built from the same meals as FakeMealRepoAsync."""
+
+    def __init__(self, meals: list[FakeMeal]):
+        self._meals = meals
+        self.calls = []
+
+    async def get_range(self, user_id, start, end, user_timezone):
+        self.calls.append((start, end, user_timezone))
+        return DailyNutritionRollup.build_range(
+            user_id, user_timezone, start, end, meals=self._meals
+        )
+
+
+class TestRollupReads:
+    """Weekly reads from daily nutrition rollups match the meal-scan path."""
+
+    @pytest.mark.asyncio
+    async def test_effective_adjusted_daily_matches_meal_scan(self):
+        week_start = date(2026, 3, 23)
+        thursday = date(2026, 3, 26)
+        meals = [
+            FakeMeal(
+                status=status,
+                nutrition=FakeNutrition(
+                    calories=calories,
+                    macros=FakeNutritionMacros(protein=p, carbs=c, fat=f),
+                ),
+                created_at=created_at,
+                meal_id=f"meal-{index}",
+            )
+            for index, (status, calories, p, c, f, created_at) in enumerate(
+                [
+                    (MealStatus.READY, 0, 70, 250, 70, datetime(2026, 3, 23, 8, tzinfo=UTC)),
+                    (MealStatus.READY, 0, 100, 500, 150, datetime(2026, 3, 24, 12, tzinfo=UTC)),
+                    (MealStatus.ENRICHING, 0, 30, 40, 10, datetime(2026, 3, 25, 12, tzinfo=UTC)),
+                    (MealStatus.READY, 0, 20, 30, 5, datetime(2026, 3, 26, 7, tzinfo=UTC)),
+                ]
+            )
+        ]
+        daily_counts = {
+            date(2026, 3, 23): 1,
+            date(2026, 3, 24): 1,
+            date(2026, 3, 25): 1,
+        }
+        budget = _make_budget(week_start)
+        scan_uow = FakeUoWAsync(meals=meals, daily_counts=daily_counts)
+        rollup_uow = FakeUoWAsync()
+        rollup_uow.daily_nutrition_rollups = FakeRollupRepoAsync(meals)
+
+        kwargs = {
+            "user_id": "user-1",
+            "week_start": week_start,
+            "target_date": thursday,
+            "weekly_budget": budget,
+            "base_daily_cal": _BASE_CAL,
+            "base_daily_protein": _BASE_P,
+            "base_daily_carbs": _BASE_C,
+            "base_daily_fat": _BASE_F,
+            "bmr": _BMR,
+            "user_timezone": "UTC",
+            "cheat_dates": [date(2026, 3, 24)],
+        }
+        expected = await WeeklyBudgetService.get_effective_adjusted_daily_async(
+            uow=scan_uow, **kwargs
+        )
+        actual = await WeeklyBudgetService.get_effective_adjusted_daily_async(
+            uow=rollup_uow, **kwargs
+        )
+
+        assert actual == expected
+        assert rollup_uow.daily_nutrition_rollups.calls == [
+            (week_start, date(2026, 3, 29), "UTC")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_weekly_consumed_reads_one_range_and_honours_exclusions(self):
+        meals = [
+            FakeMeal(
+                nutrition=FakeNutrition(
+                    macros=FakeNutritionMacros(protein=10, carbs=20, fat=5)
+                ),
+                created_at=datetime(2026, 3, day, 12, tzinfo=UTC),
+                meal_id=f"meal-{day}",
+            )
+            for day in (23, 24, 25)
+        ]
+        uow = FakeUoWAsync()
+        uow.daily_nutrition_rollups = FakeRollupRepoAsync(meals)
+
+        result = await WeeklyBudgetService.calculate_weekly_consumed_async(
+            uow,
+            "user-1",
+            date(2026, 3, 23),
+            end_date=date(2026, 3, 24),
+            exclude_dates=[date(2026, 3, 23)],
+            user_timezone="UTC",
+        )
+        before_week = await WeeklyBudgetService.calculate_weekly_consumed_async(
+            uow,
+            "user-1",
+            date(2026, 3, 23),
+            end_date=date(2026, 3, 22),
+            user_timezone="UTC",
+        )
+
+        assert result == {"calories": 165.0, "protein": 10, "carbs": 20, "fat": 5}
+        assert before_week == {"calories": 0.0, "protein": 0.0, "carbs": 0.0, "fat": 0.0}
+        assert uow.daily_nutrition_rollups.calls == [
+            (date(2026, 3, 23), date(2026, 3, 24), "UTC")
+        ]
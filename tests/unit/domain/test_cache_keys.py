@@ -32,6 +32,11 @@ class TestCacheKeysNewMethods:
         assert key == "user:user-123:notification_prefs"
         assert ttl == CacheKeys.TTL_1_DAY
 
+    def test_fatsecret_token_key_format(self):
+        key, ttl = CacheKeys.fatsecret_token("abc123")
+        assert key == "provider:fatsecret:token:abc123"
+        assert ttl == CacheKeys.TTL_1_DAY
+
     def test_keys_are_distinct_per_user(self):
         key_a, _ = CacheKeys.user_streak("user-a")
         key_b, _ = CacheKeys.user_streak("user-b")
@@ -46,3 +51,25 @@ class TestCacheKeysNewMethods:
         key_a, _ = CacheKeys.daily_activities("user-1", date(2026, 4, 14), "en")
         key_b, _ = CacheKeys.daily_activities("user-1", date(2026, 4, 14), "vi")
         assert key_a != key_b
+
+
+class TestCacheKeysGenerationTags:
+    def test_tagged_family_parses_user_read_model_keys(self):
+        key, _ = CacheKeys.nutrition_bulk("u1", date(2026, 6, 1), date(2026, 6, 7))
+        assert CacheKeys.tagged_family(key) == ("u1", "nutrition_bulk")
+        assert CacheKeys.tagged_family("user:u1:macros:*") == ("u1", "macros")
+
+    def test_tagged_family_ignores_untagged_and_wildcard_keys(self):
+        assert CacheKeys.tagged_family(CacheKeys.user_profile("u1")[0]) is None
+        assert CacheKeys.tagged_family(CacheKeys.pattern_for_user("u1")) is None
+        assert CacheKeys.tagged_family("user:*:macros:2026-06-01") is None
+
+    def test_generation_key_is_outside_user_scan_pattern(self):
+        key, ttl = CacheKeys.user_generation("u1", "macros")
+        assert not key.startswith("user:u1:")
+        assert ttl > CacheKeys.TTL_1_DAY
+
+    def test_with_generation_appends_suffix(self):
+        assert CacheKeys.with_generation("user:u1:macros:2026-06-01", 7) == (
+            "user:u1:macros:2026-06-01:g7"
+        )
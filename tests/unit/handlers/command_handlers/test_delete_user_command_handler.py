@@ -50,6 +50,16 @@ class AsyncSqliteUserRepository:
         return self._repo.delete(*args, **kwargs)
 
 
+class RecordingDerivedStore:
+    """Async test double for per-user derived tables dropped on delete."""
+
+    def __init__(self):
+        self.deleted_for = []
+
+    async def delete_for_user(self, user_id):
+        self.deleted_for.append(user_id)
+
+
 class DummyUnitOfWork:
     """
     Lightweight UnitOfWork for tests that:
@@ -62,6 +72,8 @@ class DummyUnitOfWork:
         self.session = AsyncSqliteBulkSession(session)
         self._raw_session = session
         self.users = AsyncSqliteUserRepository(session)
+        self.streak_summaries = RecordingDerivedStore()
+        self.daily_nutrition_rollups = RecordingDerivedStore()
 
     def __enter__(self):
         return self
@@ -365,10 +377,11 @@ class TestDeleteUserCommandHandlerIntegration:
 
         handler = DeleteUserCommandHandler()
         command = DeleteUserCommand(firebase_uid=user.firebase_uid)
+        uow = DummyUnitOfWork(db_session)
 
         with patch(
             "src.app.handlers.command_handlers.delete_user_command_handler.AsyncUnitOfWork",
-            MagicMock(return_value=DummyUnitOfWork(db_session)),
+            MagicMock(return_value=uow),
         ):
             with patch(
                 "src.app.handlers.command_handlers.delete_user_command_handler.FirebaseAuthService.delete_firebase_user"
@@ -386,6 +399,8 @@ class TestDeleteUserCommandHandlerIntegration:
                 assert db_user.is_active is False
                 assert "deleted_" in db_user.email
                 assert db_user.password_hash == "DELETED"
+                assert uow.streak_summaries.deleted_for == [str(user.id)]
+                assert uow.daily_nutrition_rollups.deleted_for == [str(user.id)]
 
     @pytest.mark.asyncio
     async def test_multiple_users_deletion_isolation(self, db_session):
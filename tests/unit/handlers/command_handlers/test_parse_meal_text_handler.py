@@ -338,6 +338,20 @@ class _FakeFoodReferenceAdoptRepository:
         )
         return self._adopt_return
 
+    async def adopt_provider_foods(self, adoptions, locale):
+        return {
+            adoption.identity: await self.adopt_provider_food(
+                adoption.namespace,
+                adoption.food_id,
+                adoption.english_name,
+                adoption.per_100g,
+                adoption.servings,
+                locale,
+                adoption.locale_name,
+            )
+            for adoption in adoptions
+        }
+
     async def find_by_locale_names(self, language, names):
         return {}
 
@@ -1692,3 +1706,149 @@ def test_canonicalize_reference_quantity_maps_gram_alias_to_g():
     assert grams == pytest.approx(100)
     assert item["unit"] == "g"
     assert item["english_unit"] == "g"
+
+
+def _slow_cascade(delays, unmatched=()):
+    async def _cascade_lookup(item, *, budget, local_reference=None):
+        await asyncio.sleep(delays[item["name"]])
+        if item["name"] in unmatched:
+            return None
+        return {**item, "data_source": "fatsecret"}
+
+    return _cascade_lookup
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookup_keeps_input_order_and_unmatched_terms(monkeypatch):
+    import src.app.handlers.command_handlers.parse_meal_text_handler as module
+
+    metrics = []
+    monkeypatch.setattr(
+        module,
+        "distribution_metric",
+        lambda name, value, **kwargs: metrics.append((name, kwargs["attributes"])),
+    )
+    handler = ParseMealTextHandler(
+        meal_generation_service=_FakeMealGenerationService(),
+        concurrent_lookup=True,
+    )
+    delays = {"rice": 0.2, "egg": 0.05, "fish sauce": 0.1, "pork": 0.15}
+    monkeypatch.setattr(
+        handler, "_cascade_lookup", _slow_cascade(delays, unmatched={"fish sauce"})
+    )
+    items = [{"name": name} for name in delays]
+
+    started = time.perf_counter()
+    enhanced, unmatched = await handler._resolve_items(
+        items,
+        budget=_ParseTextRequestBudget(deadline=time.monotonic() + 5),
+        local_references={},
+    )
+
+    assert time.perf_counter() - started < 0.4
+    assert [item["name"] for item in enhanced] == ["rice", "egg", "pork"]
+    assert unmatched == ["fish sauce"]
+    item_metrics = [a for n, a in metrics if n == "parse_text.item_lookup.duration_ms"]
+    assert sorted(a["result"] for a in item_metrics) == [
+        "matched",
+        "matched",
+        "matched",
+        "unmatched",
+    ]
+    assert metrics[-1] == (
+        "parse_text.lookup.duration_ms",
+        {
+            "operation": "parse_text.lookup",
+            "phase": "concurrent",
+            "item_count_bucket": "4-6",
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_single_item_lookup_is_labelled_with_the_sequential_phase(monkeypatch):
+    import src.app.handlers.command_handlers.parse_meal_text_handler as module
+
+    metrics = []
+    monkeypatch.setattr(
+        module,
+        "distribution_metric",
+        lambda name, value, **kwargs: metrics.append((name, kwargs["attributes"])),
+    )
+    handler = ParseMealTextHandler(meal_generation_service=_FakeMealGenerationService())
+    monkeypatch.setattr(handler, "_cascade_lookup", _slow_cascade({"rice": 0}))
+
+    await handler._resolve_items(
+        [{"name": "rice"}],
+        budget=_ParseTextRequestBudget(deadline=time.monotonic() + 5),
+        local_references={},
+    )
+
+    assert metrics[-1] == (
+        "parse_text.lookup.duration_ms",
+        {
+            "operation": "parse_text.lookup",
+            "phase": "sequential",
+            "item_count_bucket": "1",
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_sequential_lookup_mode_resolves_items_one_at_a_time(monkeypatch):
+    handler = ParseMealTextHandler(
+        meal_generation_service=_FakeMealGenerationService(),
+        concurrent_lookup=False,
+    )
+    in_flight = 0
+    peak = 0
+
+    async def _cascade_lookup(item, *, budget, local_reference=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return item
+
+    monkeypatch.setattr(handler, "_cascade_lookup", _cascade_lookup)
+
+    enhanced, unmatched = await handler._resolve_items(
+        [{"name": "a"}, {"name": "b"}, {"name": "c"}],
+        budget=_ParseTextRequestBudget(deadline=time.monotonic() + 5),
+        local_references={},
+    )
+
+    assert peak == 1
+    assert [item["name"] for item in enhanced] == ["a", "b", "c"]
+    assert unmatched == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookup_cancels_siblings_when_one_item_fails(monkeypatch):
+    handler = ParseMealTextHandler(
+        meal_generation_service=_FakeMealGenerationService(),
+        concurrent_lookup=True,
+    )
+    cancelled = []
+
+    async def _cascade_lookup(item, *, budget, local_reference=None):
+        if item["name"] == "bad":
+            raise RuntimeError("bad item")
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(item["name"])
+            raise
+
+    monkeypatch.setattr(handler, "_cascade_lookup", _cascade_lookup)
+
+    with pytest.raises(RuntimeError, match="bad item"):
+        await handler._resolve_items(
+            [{"name": "slow"}, {"name": "bad"}],
+            budget=_ParseTextRequestBudget(deadline=time.monotonic() + 5),
+            local_references={},
+        )
+    await asyncio.sleep(0)
+
+    assert cancelled == ["slow"]
@@ -1,6 +1,6 @@
 """Tests for GetDailyBreakdownQueryHandler latency-oriented behavior."""
 
-from datetime import date, datetime, timezone
+from datetime import date
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -9,21 +9,20 @@ from src.app.handlers.query_handlers.get_daily_breakdown_query_handler import (
     GetDailyBreakdownQueryHandler,
 )
 from src.app.queries.meal.get_daily_breakdown_query import GetDailyBreakdownQuery
-from src.domain.model.meal import Meal, MealStatus
-from src.domain.model.nutrition import Nutrition
-from src.domain.model.nutrition.macros import Macros
-
-
-def _meal(created_at: datetime, protein: float) -> Meal:
-    return Meal(
-        meal_id="11111111-1111-1111-1111-111111111111",
-        user_id="22222222-2222-2222-2222-222222222222",
-        status=MealStatus.READY,
-        created_at=created_at,
-        image=None,
-        dish_name="Test meal",
-        nutrition=Nutrition(macros=Macros(protein=protein, carbs=10.0, fat=5.0)),
-        ready_at=created_at,
+from src.domain.model.meal import MealStatus
+from src.domain.model.meal_projection import DailyMacroTotals
+
+
+def _totals(day: date, protein: float, status=MealStatus.READY) -> DailyMacroTotals:
+    return DailyMacroTotals(
+        local_date=day,
+        status=status,
+        meal_count=1,
+        calories=protein * 4 + 90.0,
+        protein=protein,
+        carbs=10.0,
+        fat=5.0,
+        fiber=0.0,
     )
 
 
@@ -42,12 +41,14 @@ async def test_uses_single_range_query_for_week():
     mock_uow = AsyncMock()
     mock_uow.__aenter__ = AsyncMock(return_value=mock_uow)
     mock_uow.__aexit__ = AsyncMock(return_value=False)
-    mock_uow.meals.find_by_date_range = AsyncMock(
+    mock_uow.meals.sum_macros_by_local_date = AsyncMock(
         return_value=[
-            _meal(datetime(2026, 4, 13, 12, 0, tzinfo=timezone.utc), protein=20.0),
-            _meal(datetime(2026, 4, 15, 12, 0, tzinfo=timezone.utc), protein=30.0),
+            _totals(date(2026, 4, 13), protein=20.0),
+            _totals(date(2026, 4, 15), protein=30.0),
+            _totals(date(2026, 4, 15), protein=0.0, status=MealStatus.PROCESSING),
         ]
     )
+    mock_uow.meals.find_by_date_range = AsyncMock()
     mock_uow.meals.find_by_date = AsyncMock()
 
     with (
@@ -67,12 +68,15 @@ async def test_uses_single_range_query_for_week():
     ):
         result = await handler.handle(query)
 
-    mock_uow.meals.find_by_date_range.assert_awaited_once()
+    mock_uow.meals.sum_macros_by_local_date.assert_awaited_once()
+    mock_uow.meals.find_by_date_range.assert_not_awaited()
     mock_uow.meals.find_by_date.assert_not_awaited()
     assert result["week_start"] == "2026-04-13"
     assert len(result["days"]) == 7
     assert result["days"][0]["protein_consumed"] == 20.0
+    assert result["days"][0]["calories_consumed"] == 170.0
     assert result["days"][2]["protein_consumed"] == 30.0
+    assert result["days"][2]["meal_count"] == 2
 
 
 @pytest.mark.asyncio
@@ -91,7 +95,7 @@ async def test_returns_cached_week_without_querying_meals():
     mock_uow = AsyncMock()
     mock_uow.__aenter__ = AsyncMock(return_value=mock_uow)
     mock_uow.__aexit__ = AsyncMock(return_value=False)
-    mock_uow.meals.find_by_date_range = AsyncMock()
+    mock_uow.meals.sum_macros_by_local_date = AsyncMock()
 
     with (
         patch(
@@ -106,7 +110,7 @@ async def test_returns_cached_week_without_querying_meals():
         result = await handler.handle(query)
 
     assert result == cached
-    mock_uow.meals.find_by_date_range.assert_not_awaited()
+    mock_uow.meals.sum_macros_by_local_date.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -1,16 +1,20 @@
+from datetime import date
+
 from src.app.handlers.query_handlers.get_nutrition_bulk_query_handler import (
     GetNutritionBulkQueryHandler,
 )
+from src.domain.model.meal import DailyNutritionRollup
 
 
 def test_bulk_date_summary_uses_net_calories_after_movement():
     handler = GetNutritionBulkQueryHandler()
 
     result = handler._build_date_summary(
-        meals=[],
+        DailyNutritionRollup(
+            "user-1", date(2026, 5, 31), "UTC", movement_kcal=300.0
+        ),
         target_calories=2000,
         target_macros={"protein": 100, "carbs": 200, "fat": 70},
-        movement_kcal=300.0,
     )
 
     assert result["totals"]["consumed"]["calories"] == -300.0
@@ -41,6 +41,7 @@ async def test_bulk_serializes_keto_calories_from_rounded_policy_grams():
     uow = MagicMock()
     uow.__aenter__ = AsyncMock(return_value=uow)
     uow.__aexit__ = AsyncMock(return_value=False)
+    uow.daily_nutrition_rollups = None
     uow.meals.find_by_date_range = AsyncMock(return_value=[])
     uow.hydration_entries.find_by_date_range = AsyncMock(return_value=[])
     uow.movement_entries.fetch_included_kcal_for_range = AsyncMock(return_value=[])
@@ -84,3 +85,24 @@ async def test_bulk_serializes_keto_calories_from_rounded_policy_grams():
         + summary["adjusted_daily_carbs"] * 4
         + summary["adjusted_daily_fat"] * 9
     )
+
+
+@pytest.mark.asyncio
+async def test_bulk_falls_back_to_sources_when_the_rollup_read_fails():
+    query = GetNutritionBulkQuery(
+        user_id="u1", start_date=date(2026, 4, 1), end_date=date(2026, 4, 2)
+    )
+    uow = MagicMock()
+    uow.daily_nutrition_rollups.get_range = AsyncMock(
+        side_effect=RuntimeError("hydration unavailable")
+    )
+    uow.meals.find_by_date_range = AsyncMock(return_value=[])
+    uow.hydration_entries.find_by_date_range = AsyncMock(
+        side_effect=RuntimeError("hydration unavailable")
+    )
+    uow.movement_entries.fetch_included_kcal_for_range = AsyncMock(return_value=[])
+
+    rollups = await GetNutritionBulkQueryHandler()._load_rollups(uow, query, "UTC")
+
+    assert sorted(rollups) == [date(2026, 4, 1), date(2026, 4, 2)]
+    uow.meals.find_by_date_range.assert_awaited_once()
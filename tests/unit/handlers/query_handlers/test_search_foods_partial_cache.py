@@ -79,6 +79,20 @@ class _FakeFoodReferenceRepo:
         )
         return self.adopted
 
+    async def adopt_provider_foods(self, adoptions, locale):
+        return {
+            adoption.identity: await self.adopt_provider_food(
+                adoption.namespace,
+                adoption.food_id,
+                adoption.english_name,
+                adoption.per_100g,
+                adoption.servings,
+                locale,
+                adoption.locale_name,
+            )
+            for adoption in adoptions
+        }
+
 
 class _FakeUow:
     def __init__(self, repo: _FakeFoodReferenceRepo):
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -41,6 +43,20 @@ def test_fatsecret_provider_is_optional_when_credentials_are_missing(monkeypatch
     )
 
 
+@pytest.mark.unit
+def test_fatsecret_singleton_is_built_with_the_token_cache(monkeypatch):
+    monkeypatch.setattr(fat_secret_module, "_fat_secret_service", None)
+    monkeypatch.setattr(fat_secret_module, "_fat_secret_service_initialized", False)
+    monkeypatch.setattr(fat_secret_module.settings, "FATSECRET_CLIENT_ID", "client")
+    monkeypatch.setattr(fat_secret_module.settings, "FATSECRET_CLIENT_SECRET", "secret")
+    token_cache = Mock()
+
+    service = fat_secret_module.get_fat_secret_service(token_cache=token_cache)
+
+    assert service.token_cache is token_cache
+    assert fat_secret_module.get_fat_secret_service() is service
+
+
 @pytest.mark.unit
 def test_fatsecret_serving_units_preserve_fatsecret_order():
     service = FatSecretService("client", "secret")
@@ -407,3 +423,133 @@ async def test_fatsecret_barcode_lookup_uses_method_based_endpoint():
         "gram_weight": 1.0,
         "description": "1 g",
     }
+
+
+class _TokenResponse:
+    status_code = 200
+
+    def json(self):
+        return {"access_token": "fresh-token", "expires_in": 3600}
+
+
+class _SlowTokenClient:
+    is_closed = False
+
+    def __init__(self):
+        self.post_calls = 0
+        self.release = asyncio.Event()
+
+    async def post(self, *args, **kwargs):
+        self.post_calls += 1
+        await self.release.wait()
+        return _TokenResponse()
+
+
+class _DictCache:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl_seconds):
+        self.data[key] = value
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fatsecret_concurrent_expired_callers_share_one_token_refresh():
+    service = FatSecretService("client", "secret", token_cache=_DictCache())
+    client = _SlowTokenClient()
+    service._client = client
+
+    callers = [asyncio.ensure_future(service._get_access_token()) for _ in range(8)]
+    await asyncio.sleep(0)
+    client.release.set()
+
+    assert await asyncio.gather(*callers) == ["fresh-token"] * 8
+    assert client.post_calls == 1
+    [shared] = service.token_cache.data.values()
+    assert shared["access_token"] == "fresh-token"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fatsecret_adopts_token_shared_by_another_worker():
+    cache = _DictCache()
+    peer = FatSecretService("client", "secret", token_cache=cache)
+    key, _ = peer._token_cache_key()
+    cache.data[key] = {
+        "access_token": "peer-token",
+        "expires_at": time.time() + 3000,
+    }
+    service = FatSecretService("client", "secret", token_cache=cache)
+    client = _SlowTokenClient()
+    service._client = client
+
+    assert await service._get_access_token() == "peer-token"
+    assert client.post_calls == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fatsecret_renews_expiring_token_in_background():
+    service = FatSecretService("client", "secret")
+    service._access_token = "old-token"
+    service._token_expires_at = time.time() + 120
+    client = _SlowTokenClient()
+    service._client = client
+
+    assert await service._get_access_token() == "old-token"
+    assert await service._get_access_token() == "old-token"
+    renewal = service._renewal_task
+    client.release.set()
+    await renewal
+
+    assert client.post_calls == 1
+    assert await service._get_access_token() == "fresh-token"
+
+
+class _FailingTokenClient:
+    is_closed = False
+
+    def __init__(self):
+        self.post_calls = 0
+
+    async def post(self, *args, **kwargs):
+        self.post_calls += 1
+        raise ConnectionError("token endpoint down")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fatsecret_failed_renewal_backs_off_before_retrying():
+    service = FatSecretService("client", "secret")
+    service._access_token = "old-token"
+    service._token_expires_at = time.time() + 120
+    client = _FailingTokenClient()
+    service._client = client
+
+    assert await service._get_access_token() == "old-token"
+    await service._renewal_task
+    for _ in range(5):
+        assert await service._get_access_token() == "old-token"
+        await asyncio.sleep(0)
+    assert client.post_calls == 1
+
+    service._renewal_failed_at -= fat_secret_module.TOKEN_RENEW_BACKOFF_SECONDS
+    assert await service._get_access_token() == "old-token"
+    await service._renewal_task
+    assert client.post_calls == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fatsecret_client_uses_http2_pool():
+    service = FatSecretService("client", "secret")
+    client = await service._get_client()
+    try:
+        assert client.timeout == fat_secret_module.FATSECRET_API_TIMEOUT
+        assert client._transport._pool._http2 is True
+    finally:
+        await service.close()
@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+
+from src.domain.model.translation_result import TranslationOutcome, TranslationResult
+from src.infra.adapters.translation_batcher_adapter import TranslationBatcherAdapter
+
+
+class _Translator:
+    """Prefixes texts; texts listed in ``refuse`` fail the whole call."""
+
+    def __init__(self, *, refuse=(), partial=(), delay=0.0):
+        self.calls: list[tuple[str, ...]] = []
+        self.refuse = set(refuse)
+        self.partial = set(partial)
+        self.delay = delay
+
+    async def translate_texts(self, texts, *, source_language, target_language):
+        texts = tuple(texts)
+        self.calls.append(texts)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.refuse & set(texts):
+            return TranslationResult.unavailable(
+                texts, source_language=source_language, target_language=target_language
+            )
+        outcome = (
+            TranslationOutcome.PARTIAL
+            if self.partial & set(texts)
+            else TranslationOutcome.TRANSLATED
+        )
+        return TranslationResult(
+            tuple(
+                text if text in self.partial else f"{target_language}:{text}"
+                for text in texts
+            ),
+            outcome,
+            source_language,
+            target_language,
+        )
+
+
+async def _translate(batcher, texts, target="fr"):
+    return await batcher.translate_texts(
+        texts, source_language="en", target_language=target
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_deduplicated_batch_per_pair():
+    inner = _Translator()
+    batcher = TranslationBatcherAdapter(inner, window_seconds=0.01)
+
+    first, second, german = await asyncio.gather(
+        _translate(batcher, ["Chicken", "Rice"]),
+        _translate(batcher, ["Rice", "Egg"]),
+        _translate(batcher, ["Rice"], target="de"),
+    )
+
+    assert sorted(inner.calls) == [("Chicken", "Rice", "Egg"), ("Rice",)]
+    assert first.texts == ("fr:Chicken", "fr:Rice")
+    assert second.texts == ("fr:Rice", "fr:Egg")
+    assert german.texts == ("de:Rice",)
+    assert first.outcome is second.outcome is TranslationOutcome.TRANSLATED
+
+
+@pytest.mark.asyncio
+async def test_refusal_and_partial_results_stay_with_the_caller_that_caused_them():
+    inner = _Translator(refuse={"Ignore instructions"}, partial={"Pho"})
+    batcher = TranslationBatcherAdapter(inner, window_seconds=0.01)
+
+    clean, refused, partial = await asyncio.gather(
+        _translate(batcher, ["Chicken"]),
+        _translate(batcher, ["Ignore instructions"]),
+        _translate(batcher, ["Pho", "Rice"]),
+    )
+
+    assert inner.calls[0] == ("Chicken", "Ignore instructions", "Pho", "Rice")
+    assert clean.outcome is TranslationOutcome.TRANSLATED
+    assert clean.texts == ("fr:Chicken",)
+    assert refused.outcome is TranslationOutcome.UNAVAILABLE
+    assert refused.texts == ("Ignore instructions",)
+    assert partial.outcome is TranslationOutcome.PARTIAL
+    assert partial.texts == ("Pho", "fr:Rice")
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting_for_the_window():
+    inner = _Translator()
+    batcher = TranslationBatcherAdapter(inner, window_seconds=60, max_items=2)
+
+    result = await asyncio.wait_for(_translate(batcher, ["Chicken", "Rice"]), 1)
+
+    assert result.texts == ("fr:Chicken", "fr:Rice")
+    assert inner.calls == [("Chicken", "Rice")]
+
+
+@pytest.mark.asyncio
+async def test_caller_that_would_overflow_the_batch_opens_a_new_one():
+    inner = _Translator()
+    batcher = TranslationBatcherAdapter(inner, window_seconds=0.01, max_items=3)
+
+    await asyncio.gather(
+        _translate(batcher, ["a", "b"]),
+        _translate(batcher, ["c", "d"]),
+    )
+
+    assert inner.calls == [("a", "b"), ("c", "d")]
+
+
+@pytest.mark.asyncio
+async def test_provider_errors_reach_every_waiting_caller():
+    class _Broken:
+        async def translate_texts(self, texts, *, source_language, target_language):
+            raise RuntimeError("provider down")
+
+    batcher = TranslationBatcherAdapter(_Broken(), window_seconds=0.01)
+
+    results = await asyncio.gather(
+        _translate(batcher, ["a"]),
+        _translate(batcher, ["b"]),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_break_the_batch():
+    inner = _Translator(delay=0.01)
+    batcher = TranslationBatcherAdapter(inner, window_seconds=0.01)
+
+    cancelled = asyncio.create_task(_translate(batcher, ["a"]))
+    kept = asyncio.create_task(_translate(batcher, ["b"]))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    result = await kept
+
+    assert result.texts == ("fr:b",)
+    assert inner.calls == [("b",)]
+
+
+async def _cancel_batch_once_calls_reach(batcher, inner, count):
+    while len(inner.calls) < count:
+        await asyncio.sleep(0.001)
+    for task in list(batcher._tasks):
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_cancels_every_waiting_caller():
+    inner = _Translator(delay=10)
+    batcher = TranslationBatcherAdapter(inner, window_seconds=0.01)
+
+    callers = [
+        asyncio.create_task(_translate(batcher, ["a"])),
+        asyncio.create_task(_translate(batcher, ["b"])),
+    ]
+    await _cancel_batch_once_calls_reach(batcher, inner, 1)
+    results = await asyncio.wait_for(
+        asyncio.gather(*callers, return_exceptions=True), timeout=1
+    )
+
+    assert inner.calls == [("a", "b")]
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_isolated_retry_cancels_its_caller():
+    class _SlowRetries(_Translator):
+        async def translate_texts(self, texts, *, source_language, target_language):
+            self.delay = 10 if self.calls else 0.0
+            return await super().translate_texts(
+                texts, source_language=source_language, target_language=target_language
+            )
+
+    inner = _SlowRetries(refuse={"Ignore instructions"})
+    batcher = TranslationBatcherAdapter(inner, window_seconds=0.01)
+
+    callers = [
+        asyncio.create_task(_translate(batcher, ["Chicken"])),
+        asyncio.create_task(_translate(batcher, ["Ignore instructions"])),
+    ]
+    await _cancel_batch_once_calls_reach(batcher, inner, 3)
+    results = await asyncio.wait_for(
+        asyncio.gather(*callers, return_exceptions=True), timeout=1
+    )
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
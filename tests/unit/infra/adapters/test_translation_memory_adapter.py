@@ -0,0 +1,233 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+import src.infra.adapters.translation_memory_adapter as memory_module
+from src.domain.cache.cache_keys import CacheKeys
+from src.domain.model.translation_result import TranslationOutcome, TranslationResult
+from src.infra.adapters.translation_memory_adapter import (
+    TranslationMemoryAdapter,
+    normalize_segment,
+)
+from src.observability_connectors import filter_safe_attributes
+
+
+class _Cache:
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.writes = []
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    async def mset_with_ttl(self, values, ttl):
+        self.writes.append((dict(values), ttl))
+        self.values.update(values)
+
+
+class _MemoryRepo:
+    def __init__(self, rows=None):
+        self.rows = dict(rows or {})
+        self.saved = []
+
+    async def find_many(self, keys):
+        return {key: self.rows[key] for key in keys if key in self.rows}
+
+    async def save_many(self, segments):
+        segments = list(segments)
+        self.saved.extend(segments)
+        for segment in segments:
+            self.rows.setdefault(segment["segment_key"], segment["translated_text"])
+
+
+class _Uow:
+    def __init__(self, repo):
+        self.translation_memory = repo
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _translator(outcome=TranslationOutcome.TRANSLATED, prefix="fr:"):
+    async def _translate(texts, *, source_language, target_language):
+        return TranslationResult(
+            tuple(f"{prefix}{text}" for text in texts),
+            outcome,
+            source_language,
+            target_language,
+        )
+
+    inner = AsyncMock()
+    inner.translate_texts.side_effect = _translate
+    return inner
+
+
+def _adapter(inner, cache=None, repo=None):
+    repo = repo if repo is not None else _MemoryRepo()
+    return TranslationMemoryAdapter(
+        inner,
+        prompt_version="prompt-v1:model:abc",
+        cache=cache,
+        uow_factory=lambda: _Uow(repo),
+    )
+
+
+def _cache_key(adapter, text):
+    return CacheKeys.translation_memory(adapter.key_for(text, "en", "fr"))[0]
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        memory_module,
+        "increment_metric",
+        lambda name, value=1.0, *, unit=None, attributes=None: calls.append(
+            (name, value, unit, attributes)
+        ),
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_memory_hits_skip_the_model(metrics):
+    inner = _translator()
+    cache = _Cache()
+    adapter = _adapter(inner, cache=cache)
+    cache.values[_cache_key(adapter, "Chicken")] = "Poulet"
+    cache.values[_cache_key(adapter, "Rice")] = "Riz"
+
+    result = await adapter.translate_texts(
+        ["Chicken", "Rice", "Chicken"], source_language="en", target_language="fr"
+    )
+
+    assert result.texts == ("Poulet", "Riz", "Poulet")
+    assert result.outcome is TranslationOutcome.TRANSLATED
+    inner.translate_texts.assert_not_awaited()
+    assert (
+        "ai.translation.memory.segments",
+        2,
+        None,
+        {"tier": "redis", "language": "fr"},
+    ) in metrics
+    saved = [
+        call for call in metrics if call[0] == "ai.translation.memory.tokens_saved"
+    ]
+    assert saved and saved[0][1] > 0 and saved[0][2] == "token"
+
+
+@pytest.mark.asyncio
+async def test_only_misses_reach_the_model_and_are_remembered(metrics):
+    inner = _translator()
+    cache = _Cache()
+    repo = _MemoryRepo()
+    adapter = _adapter(inner, cache=cache, repo=repo)
+    cache.values[_cache_key(adapter, "Chicken")] = "Poulet"
+
+    result = await adapter.translate_texts(
+        ["Chicken", "Rice", "", "Rice"], source_language="en", target_language="fr"
+    )
+
+    assert result.texts == ("Poulet", "fr:Rice", "", "fr:Rice")
+    assert result.outcome is TranslationOutcome.TRANSLATED
+    sent = inner.translate_texts.await_args.args[0]
+    assert sent == ["Rice"]
+    assert [row["source_text"] for row in repo.saved] == ["Rice"]
+    assert repo.saved[0]["prompt_version"] == "prompt-v1:model:abc"
+    assert cache.values[_cache_key(adapter, "Rice")] == "fr:Rice"
+
+
+@pytest.mark.asyncio
+async def test_postgres_hits_backfill_redis(metrics):
+    inner = _translator()
+    cache = _Cache()
+    adapter = _adapter(inner, cache=cache)
+    repo = _MemoryRepo({adapter.key_for("Rice", "en", "fr"): "Riz"})
+    adapter = _adapter(inner, cache=cache, repo=repo)
+
+    result = await adapter.translate_texts(
+        ["Rice"], source_language="en", target_language="fr"
+    )
+
+    assert result.texts == ("Riz",)
+    inner.translate_texts.assert_not_awaited()
+    assert cache.values[_cache_key(adapter, "Rice")] == "Riz"
+    assert (
+        "ai.translation.memory.segments",
+        1,
+        None,
+        {"tier": "postgres", "language": "fr"},
+    ) in metrics
+    assert filter_safe_attributes({"tier": "postgres", "language": "fr"}) == {
+        "tier": "postgres",
+        "language": "fr",
+    }
+
+
+@pytest.mark.asyncio
+async def test_uncacheable_results_are_not_remembered(metrics):
+    inner = _translator(TranslationOutcome.PARTIAL)
+    cache = _Cache()
+    repo = _MemoryRepo()
+    adapter = _adapter(inner, cache=cache, repo=repo)
+
+    result = await adapter.translate_texts(
+        ["Rice"], source_language="en", target_language="fr"
+    )
+
+    assert result.outcome is TranslationOutcome.PARTIAL
+    assert repo.saved == []
+    assert cache.writes == []
+
+
+@pytest.mark.asyncio
+async def test_unavailable_model_with_memory_hits_is_partial(metrics):
+    inner = _translator(TranslationOutcome.UNAVAILABLE, prefix="")
+    cache = _Cache()
+    adapter = _adapter(inner, cache=cache)
+    cache.values[_cache_key(adapter, "Chicken")] = "Poulet"
+
+    result = await adapter.translate_texts(
+        ["Chicken", "Rice"], source_language="en", target_language="fr"
+    )
+
+    assert result.texts == ("Poulet", "Rice")
+    assert result.outcome is TranslationOutcome.PARTIAL
+
+
+@pytest.mark.asyncio
+async def test_store_failures_fall_back_to_the_model(metrics):
+    inner = _translator()
+    cache = AsyncMock()
+    cache.mget.side_effect = RuntimeError("redis down")
+
+    def _broken_uow():
+        raise RuntimeError("database down")
+
+    adapter = TranslationMemoryAdapter(
+        inner, prompt_version="v1", cache=cache, uow_factory=_broken_uow
+    )
+
+    result = await adapter.translate_texts(
+        ["Rice"], source_language="en", target_language="fr"
+    )
+
+    assert result.texts == ("fr:Rice",)
+    assert result.outcome is TranslationOutcome.TRANSLATED
+
+
+def test_segment_keys_ignore_whitespace_but_not_case_or_prompt_version():
+    inner = _translator()
+    adapter = _adapter(inner)
+    other = TranslationMemoryAdapter(inner, prompt_version="prompt-v2", cache=None)
+
+    assert normalize_segment("  Fried\n rice ") == "Fried rice"
+    assert adapter.key_for("Fried  rice", "en", "fr") == adapter.key_for(
+        "Fried rice", "en", "fr"
+    )
+    assert adapter.key_for("Rice", "en", "fr") != adapter.key_for("rice", "en", "fr")
+    assert adapter.key_for("Rice", "en", "fr") != other.key_for("Rice", "en", "fr")
+    assert adapter.key_for("Rice", "en", "fr") != adapter.key_for("Rice", "en", "de")
@@ -8,7 +8,8 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from src.infra.cache.cache_service import CacheService, _json_serializer
+from src.infra.cache.cache_service import CacheService
+from src.infra.cache.codec import json_serializer
 
 # ---------- Serializer ----------
 
@@ -16,13 +17,13 @@ from src.infra.cache.cache_service import CacheService, _json_serializer
 def test_serializer_naive_datetime_appends_z():
     """Naive datetimes are assumed UTC; legacy 'Z' suffix preserved."""
     dt = datetime(2026, 4, 13, 10, 12, 43)
-    assert _json_serializer(dt) == "2026-04-13T10:12:43Z"
+    assert json_serializer(dt) == "2026-04-13T10:12:43Z"
 
 
 def test_serializer_tz_aware_datetime_no_double_z():
     """tz-aware datetimes must NOT get a trailing 'Z' (caused +00:00Z bug)."""
     dt = datetime(2026, 4, 13, 10, 12, 43, 247633, tzinfo=timezone.utc)
-    out = _json_serializer(dt)
+    out = json_serializer(dt)
     assert out == "2026-04-13T10:12:43.247633+00:00"
     assert not out.endswith("Z")
 
@@ -86,3 +87,93 @@ async def test_set_json_writes_clean_offset(service):
     payload = args[1]
     assert "+00:00" in payload
     assert "+00:00Z" not in payload
+
+
+# ---------- Generation-tagged keys ----------
+
+
+@pytest.fixture
+def tagged_service():
+    redis = AsyncMock()
+    redis.read_counter = AsyncMock(return_value=3)
+    redis.incr_with_expiry = AsyncMock(return_value=4)
+    return CacheService(redis_client=redis, enabled=True, tagged_keys=True)
+
+
+@pytest.mark.asyncio
+async def test_tagged_get_json_folds_generation_into_key(tagged_service):
+    tagged_service.redis.get = AsyncMock(return_value='{"a": 1}')
+    result = await tagged_service.get_json("user:u1:nutrition_bulk:2026-06-01:2026-06-07")
+    assert result == {"a": 1}
+    tagged_service.redis.read_counter.assert_awaited_once_with(
+        "gen:user:u1:nutrition_bulk", 604_800
+    )
+    tagged_service.redis.get.assert_awaited_once_with(
+        "user:u1:nutrition_bulk:2026-06-01:2026-06-07:g3"
+    )
+
+
+@pytest.mark.asyncio
+async def test_tagged_pattern_invalidation_is_single_incr(tagged_service):
+    tagged_service.redis.delete_pattern = AsyncMock(return_value=0)
+    assert await tagged_service.invalidate_pattern("user:u1:nutrition_bulk:*") == 1
+    tagged_service.redis.incr_with_expiry.assert_awaited_once_with(
+        "gen:user:u1:nutrition_bulk", 604_800, refresh=True
+    )
+    tagged_service.redis.delete_pattern.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_tagged_mode_keeps_untagged_keys_and_user_wide_scan(tagged_service):
+    tagged_service.redis.get = AsyncMock(return_value=None)
+    tagged_service.redis.delete_pattern = AsyncMock(return_value=2)
+    await tagged_service.get_json("user:profile:u1")
+    assert await tagged_service.invalidate_pattern("user:u1:*") == 2
+    tagged_service.redis.get.assert_awaited_once_with("user:profile:u1")
+    tagged_service.redis.read_counter.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_tagged_mode_bypasses_cache_when_generation_unavailable(tagged_service):
+    tagged_service.redis.read_counter = AsyncMock(return_value=None)
+    tagged_service.redis.get = AsyncMock(return_value='{"stale": true}')
+    tagged_service.redis.set = AsyncMock(return_value=True)
+    assert await tagged_service.get_json("user:u1:macros:2026-06-02") is None
+    assert await tagged_service.set_json("user:u1:macros:2026-06-02", {"a": 1}) is False
+    tagged_service.redis.get.assert_not_called()
+    tagged_service.redis.set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_tagged_get_or_set_writes_under_generation_read_before_factory(
+    tagged_service,
+):
+    tagged_service.redis.get = AsyncMock(return_value=None)
+    tagged_service.redis.set = AsyncMock(return_value=True)
+
+    async def factory():
+        # A concurrent write bumps the generation while the value is computed.
+        tagged_service.redis.read_counter.return_value = 4
+        return {"a": 1}
+
+    await tagged_service.get_or_set("user:u1:macros:2026-06-02", factory, ttl=60)
+    args, _ = tagged_service.redis.set.call_args
+    assert args[0] == "user:u1:macros:2026-06-02:g3"
+
+
+@pytest.mark.asyncio
+async def test_mget_reads_misses_in_one_redis_call_and_keeps_order(service):
+    service.redis.mget = AsyncMock(return_value=['{"a": 1}', None, "not-json"])
+
+    assert await service.mget(["k1", "k2", "k3"]) == [{"a": 1}, None, None]
+    service.redis.mget.assert_awaited_once_with(["k1", "k2", "k3"])
+
+
+@pytest.mark.asyncio
+async def test_mset_with_ttl_encodes_every_value_in_one_call(service):
+    service.redis.mset_with_ttl = AsyncMock(return_value=True)
+
+    assert await service.mset_with_ttl({"k1": {"a": 1}, "k2": [2]}, ttl=30)
+    service.redis.mset_with_ttl.assert_awaited_once_with(
+        {"k1": '{"a": 1}', "k2": "[2]"}, 30
+    )
@@ -0,0 +1,126 @@
+"""
+Unit tests for versioned cache payload codecs.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import BaseModel
+
+from src.infra.cache.cache_service import CacheService
+from src.infra.cache.codec import (
+    TAG_JSON,
+    TAG_JSON_ZLIB,
+    CacheDecodeError,
+    LegacyJsonCodec,
+    TaggedJsonCodec,
+)
+
+
+class _Item(BaseModel):
+    name: str
+    at: datetime
+
+
+def test_small_payload_is_tagged_plain_json():
+    codec = TaggedJsonCodec(compress_min_bytes=4096)
+    encoded = codec.encode({"a": 1, "b": [1, 2]})
+    assert encoded[0] == TAG_JSON
+    assert codec.decode(encoded) == {"a": 1, "b": [1, 2]}
+
+
+def test_large_payload_is_compressed_and_round_trips():
+    codec = TaggedJsonCodec(compress_min_bytes=64)
+    value = {
+        "dates": {f"2026-06-{day:02d}": {"calories": 2000.0} for day in range(1, 29)}
+    }
+    encoded = codec.encode(value)
+    assert encoded[0] == TAG_JSON_ZLIB
+    assert len(encoded) < len(LegacyJsonCodec().encode(value))
+    assert codec.decode(encoded) == value
+
+
+def test_zero_threshold_disables_compression():
+    codec = TaggedJsonCodec(compress_min_bytes=0)
+    assert codec.encode({"x": "y" * 10_000})[0] == TAG_JSON
+
+
+def test_datetimes_match_legacy_serialization():
+    value = {
+        "naive": datetime(2026, 4, 13, 10, 12, 43),
+        "aware": datetime(2026, 4, 13, 10, 12, 43, tzinfo=UTC),
+    }
+    decoded = TaggedJsonCodec().decode(TaggedJsonCodec().encode(value))
+    assert decoded == LegacyJsonCodec().decode(LegacyJsonCodec().encode(value))
+    assert decoded == {
+        "naive": "2026-04-13T10:12:43Z",
+        "aware": "2026-04-13T10:12:43+00:00",
+    }
+
+
+def test_top_level_model_uses_model_dump_json():
+    item = _Item(name="A", at=datetime(2026, 4, 13, tzinfo=UTC))
+    decoded = TaggedJsonCodec().decode(TaggedJsonCodec().encode(item))
+    assert decoded["name"] == "A"
+    assert _Item.model_validate(decoded) == item
+
+
+def test_untagged_entries_use_legacy_path_with_repair():
+    codec = TaggedJsonCodec()
+    assert codec.decode('{"t": "2026-04-13T10:12:43+00:00Z"}') == {
+        "t": "2026-04-13T10:12:43+00:00"
+    }
+
+
+def test_repair_regex_does_not_touch_tagged_payloads():
+    codec = TaggedJsonCodec()
+    # A literal user string that looks like the legacy bug must survive.
+    value = {"note": "+05:00Z"}
+    assert codec.decode(codec.encode(value)) == value
+
+
+@pytest.mark.parametrize("raw", ["not-json", TAG_JSON + "{", TAG_JSON_ZLIB + "@@@", ""])
+def test_corrupt_payloads_raise_decode_error(raw):
+    with pytest.raises(CacheDecodeError):
+        TaggedJsonCodec().decode(raw)
+
+
+@pytest.mark.asyncio
+async def test_cache_service_round_trips_with_versioned_codec():
+    stored = {}
+    redis = AsyncMock()
+
+    async def _set(key, value, ttl):
+        stored[key] = value
+        return True
+
+    redis.set = AsyncMock(side_effect=_set)
+    redis.get = AsyncMock(side_effect=lambda key: stored.get(key))
+    service = CacheService(
+        redis_client=redis, codec=TaggedJsonCodec(compress_min_bytes=32)
+    )
+
+    value = {"rows": list(range(50))}
+    assert await service.set_json("food:search:x", value) is True
+    assert stored["food:search:x"][0] == TAG_JSON_ZLIB
+    assert await service.get_json("food:search:x") == value
+
+
+@pytest.mark.asyncio
+async def test_cache_service_treats_corrupt_payload_as_miss():
+    redis = AsyncMock()
+    redis.get = AsyncMock(return_value=TAG_JSON + "{broken")
+    service = CacheService(redis_client=redis, codec=TaggedJsonCodec())
+    assert await service.get_json("food:search:x") is None
+
+
+def test_create_selects_the_codec_from_flags():
+    redis = AsyncMock()
+
+    versioned = CacheService.create(redis, versioned_codec=True, compress_min_bytes=128)
+    legacy = CacheService.create(redis)
+
+    assert isinstance(versioned.codec, TaggedJsonCodec)
+    assert versioned.codec.compress_min_bytes == 128
+    assert isinstance(legacy.codec, LegacyJsonCodec)
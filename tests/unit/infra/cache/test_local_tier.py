@@ -0,0 +1,156 @@
+"""
+Unit tests for the in-process L1 cache tier and its CacheService integration.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infra.cache.cache_service import CacheService
+from src.infra.cache.local_tier import (
+    LOCAL_INVALIDATION_CHANNEL,
+    LocalCacheTier,
+    invalidation_message,
+)
+from src.infra.cache.metrics import CacheMonitor
+
+FAMILIES = {"user:profile:": (10, 30), "food:details:": (10, 300)}
+
+
+@pytest.fixture
+def tier():
+    return LocalCacheTier(FAMILIES)
+
+
+@pytest.fixture
+def service(tier):
+    redis = AsyncMock()
+    redis.get = AsyncMock(return_value='{"name": "A"}')
+    redis.set = AsyncMock(return_value=True)
+    redis.delete = AsyncMock(return_value=True)
+    redis.delete_pattern = AsyncMock(return_value=1)
+    redis.publish = AsyncMock(return_value=True)
+    return CacheService(
+        redis_client=redis, monitor=CacheMonitor(), enabled=True, local_tier=tier
+    )
+
+
+# ---------- Tier ----------
+
+
+def test_tier_only_handles_configured_families(tier):
+    tier.put("user:profile:u1", "{}")
+    tier.put("user:u1:macros:2026-06-01", "{}")
+    assert tier.get("user:profile:u1") == "{}"
+    assert tier.handles("user:u1:macros:2026-06-01") is False
+    assert tier.get("user:u1:macros:2026-06-01") is None
+
+
+def test_tier_may_match_only_overlapping_patterns(tier):
+    assert tier.may_match("user:profile:*") is True
+    assert tier.may_match("user:*") is True
+    assert tier.may_match("user:u1:nutrition_bulk:*") is False
+
+
+def test_tier_ignores_own_and_malformed_messages(tier):
+    tier.put("user:profile:u1", "{}")
+    tier.apply_message(invalidation_message("key", "user:profile:u1", "me"), "me")
+    tier.apply_message("not-json", "me")
+    assert tier.get("user:profile:u1") == "{}"
+
+    tier.apply_message(invalidation_message("key", "user:profile:u1", "peer"), "me")
+    assert tier.get("user:profile:u1") is None
+
+
+def test_tier_applies_peer_pattern_messages(tier):
+    tier.put("food:details:1", "{}")
+    tier.put("food:details:2", "{}")
+    tier.apply_message(invalidation_message("pattern", "food:details:*", "peer"), "me")
+    assert tier.get("food:details:1") is None
+    assert tier.get("food:details:2") is None
+
+
+# ---------- CacheService integration ----------
+
+
+@pytest.mark.asyncio
+async def test_second_read_is_served_locally_without_redis(service):
+    assert await service.get_json("user:profile:u1") == {"name": "A"}
+    assert await service.get_json("user:profile:u1") == {"name": "A"}
+    service.redis.get.assert_awaited_once()
+
+    snapshot = service.monitor.snapshot()
+    assert snapshot["tiers"]["local"]["hits"] == 1
+    assert snapshot["tiers"]["redis"]["hits"] == 1
+    assert snapshot["redis_round_trips_saved"] == 1
+    assert snapshot["hits"] == 2
+    assert snapshot["misses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_local_hits_never_share_mutable_values(service):
+    first = await service.get_json("user:profile:u1")
+    first["name"] = "mutated"
+    assert await service.get_json("user:profile:u1") == {"name": "A"}
+
+
+@pytest.mark.asyncio
+async def test_untiered_keys_always_go_to_redis(service):
+    await service.get_json("user:u1:macros:2026-06-01")
+    await service.get_json("user:u1:macros:2026-06-01")
+    assert service.redis.get.await_count == 2
+    service.redis.publish.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_evicts_locally_and_publishes(service, tier):
+    await service.get_json("user:profile:u1")
+    await service.invalidate("user:profile:u1")
+
+    assert tier.get("user:profile:u1") is None
+    channel, message = service.redis.publish.call_args.args
+    assert channel == LOCAL_INVALIDATION_CHANNEL
+    assert '"op": "key"' in message and service.instance_id in message
+
+
+@pytest.mark.asyncio
+async def test_invalidate_pattern_publishes_only_when_it_can_match(service):
+    await service.invalidate_pattern("user:u1:nutrition_bulk:*")
+    service.redis.publish.assert_not_called()
+
+    await service.invalidate_pattern("food:details:*")
+    service.redis.publish.assert_awaited_once()
+
+
+# ---------- Factory ----------
+
+
+def test_create_builds_the_tier_only_for_an_enabled_service():
+    redis = AsyncMock()
+
+    tiered = CacheService.create(redis, local_tier_enabled=True, enabled=True)
+    disabled = CacheService.create(redis, local_tier_enabled=True, enabled=False)
+    untiered = CacheService.create(redis, local_tier_enabled=False)
+
+    assert tiered.local_tier is not None
+    assert tiered.local_tier.handles("user:profile:u1")
+    assert disabled.local_tier is None
+    assert untiered.local_tier is None
+
+
+@pytest.mark.asyncio
+async def test_local_invalidation_listener_runs_only_with_a_tier():
+    redis = AsyncMock()
+    tiered = CacheService.create(redis, local_tier_enabled=True)
+    untiered = CacheService.create(redis)
+
+    tiered.start_local_invalidation()
+    untiered.start_local_invalidation()
+    subscriber = tiered._local_subscriber
+
+    assert subscriber is not None and subscriber._task is not None
+    assert untiered._local_subscriber is None
+    await tiered.stop_local_invalidation()
+    await untiered.stop_local_invalidation()
+    assert tiered._local_subscriber is None
+    assert subscriber._task is None
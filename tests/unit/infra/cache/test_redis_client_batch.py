@@ -0,0 +1,79 @@
+"""RedisClient batch primitives: MGET, pipelined SETEX and counters."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import RedisError
+
+from src.infra.cache.redis_client import RedisClient
+
+
+def _client(raw_client):
+    client = RedisClient(redis_url="redis://localhost:6379")
+    client.connect = AsyncMock()
+    client.client = raw_client
+    return client
+
+
+@pytest.mark.asyncio
+async def test_mget_reads_all_keys_in_one_call():
+    raw = MagicMock()
+    raw.mget = AsyncMock(return_value=["a", None])
+
+    assert await _client(raw).mget(["k1", "k2"]) == ["a", None]
+    raw.mget.assert_awaited_once_with(["k1", "k2"])
+
+
+@pytest.mark.asyncio
+async def test_mget_falls_back_to_all_misses_when_redis_errors():
+    raw = MagicMock()
+    raw.mget = AsyncMock(side_effect=RedisError("down"))
+
+    assert await _client(raw).mget(["k1", "k2"]) == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_mset_with_ttl_pipelines_setex_without_transaction():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True, True])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    raw = MagicMock()
+    raw.pipeline = MagicMock(return_value=pipe)
+
+    stored = await _client(raw).mset_with_ttl({"k1": "v1", "k2": "v2"}, 60)
+
+    assert stored is True
+    raw.pipeline.assert_called_once_with(transaction=False)
+    assert [c.args for c in pipe.setex.call_args_list] == [
+        ("k1", 60, "v1"),
+        ("k2", 60, "v2"),
+    ]
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_incr_with_expiry_sets_ttl_on_first_increment_only():
+    raw = MagicMock()
+    raw.incr = AsyncMock(side_effect=[1, 2])
+    raw.expire = AsyncMock()
+    client = _client(raw)
+
+    assert await client.incr_with_expiry("k", 60) == 1
+    assert await client.incr_with_expiry("k", 60) == 2
+    raw.expire.assert_awaited_once_with("k", 60)
+
+
+@pytest.mark.asyncio
+async def test_incr_with_expiry_refresh_touches_ttl_in_one_transaction():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[5, True])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    raw = MagicMock()
+    raw.pipeline = MagicMock(return_value=pipe)
+
+    assert await _client(raw).incr_with_expiry("k", 60, refresh=True) == 5
+    raw.pipeline.assert_called_once_with(transaction=True)
+    pipe.incr.assert_called_once_with("k")
+    pipe.expire.assert_called_once_with("k", 60)
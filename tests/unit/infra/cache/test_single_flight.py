@@ -0,0 +1,174 @@
+"""
+Unit tests for single-flight coalescing of cache misses.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infra.cache.cache_service import CacheService
+from src.infra.cache.decorators import cached
+from src.infra.cache.metrics import CacheMonitor
+from src.infra.cache.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_computation():
+    monitor = CacheMonitor()
+    flight = SingleFlight(monitor)
+    calls = 0
+    release = asyncio.Event()
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"v": calls}
+
+    tasks = [asyncio.create_task(flight.run("k", factory)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert results == [{"v": 1}] * 5
+    assert monitor.snapshot()["single_flight"] == {
+        "leaders": 1,
+        "coalesced_local": 4,
+        "coalesced_remote": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_leader_error_is_shared_with_waiters():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def factory():
+        await release.wait()
+        raise ValueError("boom")
+
+    tasks = [asyncio.create_task(flight.run("k", factory)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_waiter_recomputes_when_leader_is_cancelled():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(10)
+
+    async def fast():
+        return "fresh"
+
+    leader = asyncio.create_task(flight.run("k", slow))
+    await started.wait()
+    waiter = asyncio.create_task(flight.run("k", fast))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await waiter == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_forget_starts_fresh_flight_after_invalidation():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def stale():
+        await release.wait()
+        return "stale"
+
+    async def fresh():
+        return "fresh"
+
+    first = asyncio.create_task(flight.run("user:u1:macros:d", stale))
+    await asyncio.sleep(0)
+    flight.forget_pattern("user:u1:macros:*")
+    assert await flight.run("user:u1:macros:d", fresh) == "fresh"
+    release.set()
+    assert await first == "stale"
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_coalesces_concurrent_misses():
+    redis = AsyncMock()
+    redis.get = AsyncMock(return_value=None)
+    redis.set = AsyncMock(return_value=True)
+    service = CacheService(redis_client=redis, monitor=CacheMonitor())
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"v": 1}
+
+    results = await asyncio.gather(
+        *(
+            service.get_or_set("user:u1:weekly_budget_v4:w", factory, 60)
+            for _ in range(3)
+        )
+    )
+    assert calls == 1
+    assert results == [{"v": 1}] * 3
+    redis.set.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_waits_for_peer_process_fill():
+    redis = AsyncMock()
+    redis.get = AsyncMock(side_effect=[None, None, '{"v": "peer"}'])
+    redis.set_if_not_exists = AsyncMock(return_value=False)
+    monitor = CacheMonitor()
+    service = CacheService(redis_client=redis, monitor=monitor, fill_lock_ttl=1)
+    factory = AsyncMock(return_value={"v": "local"})
+
+    assert await service.get_or_set("k", factory, 60) == {"v": "peer"}
+    factory.assert_not_awaited()
+    assert monitor.snapshot()["single_flight"]["coalesced_remote"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_releases_fill_lock_after_computing():
+    redis = AsyncMock()
+    redis.get = AsyncMock(return_value=None)
+    redis.set = AsyncMock(return_value=True)
+    redis.delete = AsyncMock(return_value=True)
+    redis.set_if_not_exists = AsyncMock(return_value=True)
+    service = CacheService(redis_client=redis, fill_lock_ttl=5)
+
+    assert await service.get_or_set("k", AsyncMock(return_value=[1]), 60) == [1]
+    redis.set_if_not_exists.assert_awaited_once_with(
+        "lock:fill:k", service.instance_id, 5
+    )
+    redis.delete.assert_awaited_once_with("lock:fill:k")
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_coalesces_concurrent_misses():
+    cache_service = AsyncMock()
+    cache_service.get_json = AsyncMock(return_value=None)
+    cache_service.set_json = AsyncMock(return_value=True)
+
+    class Service:
+        def __init__(self):
+            self.cache_service = cache_service
+            self.calls = 0
+
+        @cached(key_func=lambda self, user_id: f"sf:{user_id}", ttl=60)
+        async def load(self, user_id: str) -> dict:
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return {"id": user_id}
+
+    service = Service()
+    results = await asyncio.gather(*(service.load("u1") for _ in range(4)))
+    assert service.calls == 1
+    assert results == [{"id": "u1"}] * 4
@@ -1,9 +1,12 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.dml import Insert
 from sqlalchemy.sql.selectable import Select
 
+from src.domain.ports.food_reference_repository_port import ProviderFoodAdoption
 from src.domain.services.nutrition_integrity_policy import NutritionIntegrityError
 from src.infra.repositories.food_reference_adopt import FoodReferenceAdoptRepository
 
@@ -15,6 +18,9 @@ class _Scalars:
     def first(self):
         return self._rows[0] if self._rows else None
 
+    def all(self):
+        return list(self._rows)
+
 
 class _Result:
     def __init__(self, rows=None):
@@ -153,7 +159,9 @@ async def test_adopt_new_fatsecret_food_sets_identity_name_normalized():
 
 @pytest.mark.asyncio
 async def test_adopt_same_id_twice_reuses_row_and_freezes_verified_density():
-    existing = _existing_row(verified=True, protein_100g=26.0, carbs_100g=0.0, fat_100g=15.0)
+    existing = _existing_row(
+        verified=True, protein_100g=26.0, carbs_100g=0.0, fat_100g=15.0
+    )
     session = _AdoptSession(existing=existing)
     repo = FoodReferenceAdoptRepository(session)
 
@@ -341,3 +349,138 @@ async def test_adopt_english_does_not_write_name_vi():
         )
 
     assert existing.name_vi is None
+
+
+class _BulkAdoptSession:
+    """Fake session for the batch path: one INSERT, then one identity SELECT.
+
+    ``rows`` are the identity rows the SELECT sees after the insert, i.e.
+    pre-existing rows plus whatever the INSERT (or a concurrent adopter) wrote.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.inserts = []
+        self.selects = []
+        self.select_count = 0
+        self.flush_count = 0
+
+    async def execute(self, statement):
+        if isinstance(statement, Insert):
+            self.inserts.append(statement.compile(dialect=postgresql.dialect()))
+            return _Result()
+        self.select_count += 1
+        self.selects.append(str(statement.compile(dialect=postgresql.dialect())))
+        return _Result(self.rows)
+
+    async def flush(self):
+        self.flush_count += 1
+
+
+def _adoption(food_id, *, protein=26.0, name="Beef", locale_name="Beef"):
+    return ProviderFoodAdoption(
+        namespace="fatsecret",
+        food_id=food_id,
+        english_name=name,
+        per_100g={"protein_100g": protein, "carbs_100g": 0.0, "fat_100g": 15.0},
+        servings=[{"name": "g", "grams": 1.0}],
+        locale_name=locale_name,
+    )
+
+
+@pytest.mark.asyncio
+async def test_adopt_provider_foods_writes_one_insert_and_one_select_for_the_batch():
+    existing = _existing_row(food_id=7, verified=True, source_food_id="33890")
+    inserted = _existing_row(food_id=8, source_food_id="40001", name="fatsecret:40001")
+    session = _BulkAdoptSession([existing, inserted])
+    repo = FoodReferenceAdoptRepository(session)
+
+    with _patched_materialize() as materialize:
+        result = await repo.adopt_provider_foods(
+            [_adoption("33890"), _adoption("40001", name="Pork"), _adoption("33890")],
+            "en",
+        )
+
+    assert len(session.inserts) == 1
+    assert "ON CONFLICT DO NOTHING" in str(session.inserts[0])
+    assert {
+        value
+        for key, value in session.inserts[0].params.items()
+        if key.startswith("source_food_id")
+    } == {"33890", "40001"}
+    assert session.select_count == 1
+    assert {identity: row["id"] for identity, row in result.items()} == {
+        ("fatsecret", "33890"): 7,
+        ("fatsecret", "40001"): 8,
+    }
+    assert inserted.name == "Pork"
+    assert materialize.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_adopt_provider_foods_writes_identities_in_sorted_order():
+    rows = [
+        _existing_row(food_id=9, source_food_id="40002"),
+        _existing_row(food_id=7, source_food_id="33890"),
+        _existing_row(food_id=8, source_food_id="40001"),
+    ]
+    session = _BulkAdoptSession(rows)
+    repo = FoodReferenceAdoptRepository(session)
+
+    with _patched_materialize() as materialize:
+        result = await repo.adopt_provider_foods(
+            [_adoption("40002"), _adoption("33890"), _adoption("40001")], "en"
+        )
+
+    inserted = [
+        value
+        for key, value in sorted(
+            session.inserts[0].params.items(), key=lambda item: item[0]
+        )
+        if key.startswith("source_food_id")
+    ]
+    assert sorted(inserted) == inserted == ["33890", "40001", "40002"]
+    assert (
+        "ORDER BY food_reference.source_namespace, food_reference.source_food_id"
+        in (session.selects[0])
+    )
+    assert [call.args[0].id for call in materialize.await_args_list] == [7, 8, 9]
+    assert list(result) == [
+        ("fatsecret", "33890"),
+        ("fatsecret", "40001"),
+        ("fatsecret", "40002"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_adopt_provider_foods_skips_policy_failures_without_failing_batch():
+    valid = _existing_row(food_id=8, source_food_id="40001")
+    untouched = _existing_row(food_id=9, source_food_id="40002", protein_100g=20.0)
+    session = _BulkAdoptSession([valid, untouched])
+    repo = FoodReferenceAdoptRepository(session)
+
+    with _patched_materialize():
+        result = await repo.adopt_provider_foods(
+            [_adoption("40001"), _adoption("40002", protein=100.0)], "en"
+        )
+
+    assert list(result) == [("fatsecret", "40001")]
+    assert {
+        value
+        for key, value in session.inserts[0].params.items()
+        if key.startswith("source_food_id")
+    } == {"40001"}
+    assert untouched.protein_100g == pytest.approx(20.0)
+    assert untouched.is_verified is False
+
+
+@pytest.mark.asyncio
+async def test_adopt_provider_foods_with_nothing_adoptable_touches_no_rows():
+    session = _BulkAdoptSession([])
+    repo = FoodReferenceAdoptRepository(session)
+
+    result = await repo.adopt_provider_foods([_adoption("")], "en")
+
+    assert result == {}
+    assert session.inserts == []
+    assert session.select_count == 0
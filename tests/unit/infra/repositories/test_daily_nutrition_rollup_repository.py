@@ -0,0 +1,173 @@
+"""Read-through and invalidation for AsyncDailyNutritionRollupRepository."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.model.meal import DailyNutritionRollup
+from src.infra.repositories.daily_nutrition_rollup_repository_async import (
+    STALE_TIMEZONE,
+    AsyncDailyNutritionRollupRepository,
+)
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return list(self._rows)
+
+
+class _FakeSession:
+    def __init__(self, versions=None):
+        self.statements = []
+        self.savepoints = 0
+        self._versions = versions or {}
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _Result(self._versions.items())
+
+    def begin_nested(self):
+        self.savepoints += 1
+        return _Savepoint()
+
+
+class _Savepoint:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _params(statement) -> dict:
+    return statement.compile(dialect=postgresql.dialect()).params
+
+
+def _repo(stored, versions=None):
+    session = _FakeSession(versions)
+    repo = AsyncDailyNutritionRollupRepository(
+        session,
+        meals=AsyncMock(find_macro_rows_by_date_range=AsyncMock(return_value=[])),
+        hydration_entries=AsyncMock(find_by_date_range=AsyncMock(return_value=[])),
+        movement_entries=AsyncMock(
+            fetch_included_kcal_for_range=AsyncMock(
+                return_value=[(datetime(2026, 10, 14, 12, tzinfo=UTC), 80.0)]
+            )
+        ),
+    )
+    repo.find_range = AsyncMock(return_value=stored)
+    return repo, session
+
+
+@pytest.mark.asyncio
+async def test_stored_range_is_returned_without_touching_sources():
+    stored = {
+        day: DailyNutritionRollup("u1", day, "UTC", calories=100.0)
+        for day in (date(2026, 10, 14), date(2026, 10, 15))
+    }
+    repo, session = _repo(stored)
+
+    rollups = await repo.get_range("u1", date(2026, 10, 14), date(2026, 10, 15), "UTC")
+
+    assert rollups == stored
+    assert session.statements == []
+    repo._meals.find_macro_rows_by_date_range.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_missing_and_stale_days_are_rebuilt_with_a_version_guard_and_no_lock():
+    stored = {
+        date(2026, 10, 13): DailyNutritionRollup("u1", date(2026, 10, 13), "UTC"),
+        date(2026, 10, 14): DailyNutritionRollup(
+            "u1", date(2026, 10, 14), "Asia/Ho_Chi_Minh", calories=999.0
+        ),
+    }
+    repo, session = _repo(stored, versions={date(2026, 10, 14): 3})
+
+    rollups = await repo.get_range("u1", date(2026, 10, 13), date(2026, 10, 15), "UTC")
+
+    assert sorted(rollups) == [
+        date(2026, 10, 13),
+        date(2026, 10, 14),
+        date(2026, 10, 15),
+    ]
+    assert rollups[date(2026, 10, 14)].movement_kcal == 80.0
+    assert rollups[date(2026, 10, 14)].calories == 0.0
+    repo._meals.find_macro_rows_by_date_range.assert_awaited_once()
+    assert repo._meals.find_macro_rows_by_date_range.await_args.args[1:] == (
+        date(2026, 10, 14),
+        date(2026, 10, 15),
+    )
+    assert session.savepoints == 1
+    versions_sql, upsert_sql = (_sql(statement) for statement in session.statements)
+    assert "FOR UPDATE" not in versions_sql + upsert_sql
+    assert "FROM users" not in versions_sql + upsert_sql
+    assert "ON CONFLICT (user_id, local_date) DO UPDATE" in upsert_sql
+    assert upsert_sql.endswith(
+        "WHERE daily_nutrition_rollups.version = excluded.version - %(version_1)s"
+    )
+    params = _params(session.statements[1])
+    # Day 14 was read at version 3 and day 15 had no row.
+    assert (params["local_date_m0"], params["version_m0"]) == (date(2026, 10, 14), 4)
+    assert (params["local_date_m1"], params["version_m1"]) == (date(2026, 10, 15), 1)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_marks_days_stale_in_each_row_timezone_without_locking():
+    session = _FakeSession()
+    repo = AsyncDailyNutritionRollupRepository(session)
+    logged_at = datetime(2026, 10, 15, 18, tzinfo=UTC)
+
+    await repo.invalidate("u1", logged_at, logged_at, None)
+
+    (upsert_sql,) = (_sql(statement) for statement in session.statements)
+    assert "FOR KEY SHARE" not in upsert_sql
+    assert "DELETE" not in upsert_sql
+    assert (
+        "ON CONFLICT (user_id, local_date) DO UPDATE SET timezone = CASE" in upsert_sql
+    )
+    assert (
+        "daily_nutrition_rollups.local_date IN (date(timezone("
+        "daily_nutrition_rollups.timezone"
+    ) in upsert_sql
+    assert upsert_sql.count("timezone(") == 1
+    assert "version = (daily_nutrition_rollups.version + %(version_1)s)" in upsert_sql
+    params = _params(session.statements[0])
+    # 18:00 UTC falls on the 15th west of UTC+6 and on the 16th east of it.
+    assert [params["local_date_m0"], params["local_date_m1"]] == [
+        date(2026, 10, 15),
+        date(2026, 10, 16),
+    ]
+    assert params["timezone_m0"] == params["timezone_m1"] == STALE_TIMEZONE
+
+
+@pytest.mark.asyncio
+async def test_invalidate_ignores_missing_times():
+    session = _FakeSession()
+    repo = AsyncDailyNutritionRollupRepository(session)
+
+    await repo.invalidate("u1", None)
+
+    assert session.statements == []
+
+
+@pytest.mark.asyncio
+async def test_delete_for_user_drops_every_row_of_the_user():
+    session = _FakeSession()
+
+    await AsyncDailyNutritionRollupRepository(session).delete_for_user("u1")
+
+    (delete_sql,) = (_sql(statement) for statement in session.statements)
+    assert delete_sql == (
+        "DELETE FROM daily_nutrition_rollups "
+        "WHERE daily_nutrition_rollups.user_id = %(user_id_1)s"
+    )
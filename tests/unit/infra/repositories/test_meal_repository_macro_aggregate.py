@@ -0,0 +1,224 @@
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.model.meal import MealStatus
+from src.domain.model.meal_projection import DailyMacroTotals
+from src.domain.model.nutrition import Nutrition
+from src.domain.model.nutrition.macros import Macros
+from src.domain.model.nutrition.nutrition import NutritionOverride
+from src.infra.database.models.enums import MealStatusEnum
+from src.infra.repositories.meal_repository_async import AsyncMealRepository
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _Session:
+    def __init__(self, rows):
+        self.execute = AsyncMock(return_value=_Result(rows))
+
+
+def _sql(session) -> str:
+    statement = session.execute.await_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _override_meal(meal_id, created_at, calories):
+    return SimpleNamespace(
+        meal_id=meal_id,
+        created_at=created_at,
+        status=MealStatus.READY,
+        nutrition=Nutrition(
+            macros=Macros(protein=1.0, carbs=1.0, fat=1.0),
+            nutrition_override=NutritionOverride(
+                calories=calories, protein=1.0, carbs=1.0, fat=1.0
+            ),
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_sum_macros_groups_by_local_date_and_status_in_sql():
+    session = _Session(
+        rows=[
+            (
+                date(2026, 10, 14),
+                MealStatusEnum.READY,
+                2,
+                [300.0, 310.5],
+                40.0,
+                60.0,
+                20.0,
+                5.0,
+                0,
+            ),
+            (date(2026, 10, 14), MealStatusEnum.PROCESSING, 1, None, 0, 0, 0, 0, 0),
+        ]
+    )
+    repo = AsyncMealRepository(session)
+    repo._find_meals_needing_effective_calories = AsyncMock()
+
+    totals = await repo.sum_macros_by_local_date(
+        "user-1",
+        date(2026, 10, 12),
+        date(2026, 10, 18),
+        user_timezone="Asia/Ho_Chi_Minh",
+        exclude_dates={date(2026, 10, 13)},
+    )
+
+    sql = _sql(session)
+    assert "GROUP BY date(timezone(" in sql
+    assert "meal.status" in sql.split("GROUP BY")[1]
+    assert "NOT IN" in sql
+    assert "LEFT OUTER JOIN nutrition" in sql
+    assert totals == [
+        DailyMacroTotals(
+            date(2026, 10, 14), MealStatus.PROCESSING, 1, 0.0, 0.0, 0.0, 0.0, 0.0
+        ),
+        DailyMacroTotals(
+            date(2026, 10, 14), MealStatus.READY, 2, 610.5, 40.0, 60.0, 20.0, 5.0
+        ),
+    ]
+    repo._find_meals_needing_effective_calories.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sum_macros_rounds_each_meal_like_the_domain():
+    # 1.0p, 0.0c, 0.25f gives 6.25 kcal: the domain rounds the half to even
+    # (6.2); SQL numeric rounding would give 6.3 and drift the day total.
+    raw = Macros.raw_total_calories(protein=1.0, carbs=0.0, fat=0.25)
+    session = _Session(
+        rows=[
+            (
+                date(2026, 10, 14),
+                MealStatusEnum.READY,
+                3,
+                [raw, raw, 12.25],
+                2.0,
+                0.0,
+                0.5,
+                0.0,
+                0,
+            )
+        ]
+    )
+    repo = AsyncMealRepository(session)
+
+    totals = await repo.sum_macros_by_local_date(
+        "user-1", date(2026, 10, 14), date(2026, 10, 14), user_timezone="UTC"
+    )
+
+    sql = _sql(session)
+    assert "array_agg(" in sql
+    assert "round(" not in sql
+    domain = Macros(protein=1.0, carbs=0.0, fat=0.25).total_calories
+    assert domain == 6.2
+    assert totals[0].calories == pytest.approx(domain * 2 + 12.2)
+
+
+@pytest.mark.asyncio
+async def test_sum_macros_adds_effective_calories_of_override_meals():
+    session = _Session(
+        rows=[
+            (
+                date(2026, 10, 14),
+                MealStatusEnum.READY,
+                2,
+                [300.0],
+                30.0,
+                30.0,
+                10.0,
+                0.0,
+                1,
+            )
+        ]
+    )
+    repo = AsyncMealRepository(session)
+    repo._find_meals_needing_effective_calories = AsyncMock(
+        return_value=[
+            _override_meal("m1", datetime(2026, 10, 14, 9, tzinfo=UTC), 450.0)
+        ]
+    )
+
+    totals = await repo.sum_macros_by_local_date(
+        "user-1", date(2026, 10, 14), date(2026, 10, 14), user_timezone="UTC"
+    )
+
+    assert totals[0].calories == 750.0
+    repo._find_meals_needing_effective_calories.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_macro_rows_skip_hydration_except_for_override_meals():
+    created_at = datetime(2026, 10, 14, 9, tzinfo=UTC)
+    session = _Session(
+        rows=[
+            (
+                "plain",
+                created_at,
+                MealStatusEnum.READY,
+                None,
+                None,
+                1,
+                30.0,
+                50.0,
+                10.0,
+                5.0,
+                False,
+            ),
+            (
+                "edited",
+                created_at,
+                MealStatusEnum.READY,
+                None,
+                None,
+                2,
+                1.0,
+                1.0,
+                1.0,
+                0.0,
+                True,
+            ),
+            (
+                "pending",
+                created_at,
+                MealStatusEnum.PROCESSING,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                False,
+            ),
+        ]
+    )
+    repo = AsyncMealRepository(session)
+    repo._find_meals_needing_effective_calories = AsyncMock(
+        return_value=[_override_meal("edited", created_at, 450.0)]
+    )
+
+    rows = await repo.find_macro_rows_by_date_range(
+        "user-1", date(2026, 10, 14), date(2026, 10, 14), user_timezone="UTC"
+    )
+
+    sql = _sql(session)
+    assert "JOIN food_item" not in sql
+    assert "mealimage" not in sql
+    plain, edited, pending = rows
+    assert plain.calories == 400.0
+    assert plain.macros.protein == 30.0
+    assert edited.calories == 450.0
+    assert pending.has_nutrition is False
+    assert pending.macros is None
+    assert pending.status is MealStatus.PROCESSING
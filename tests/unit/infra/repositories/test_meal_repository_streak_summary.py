@@ -0,0 +1,139 @@
+"""Streak summary maintenance hooks on AsyncMealRepository."""
+
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.model.meal import StreakSummary
+from src.infra.repositories.meal_repository_async import AsyncMealRepository
+from src.infra.repositories.streak_summary_repository_async import (
+    STALE_TIMEZONE,
+    AsyncStreakSummaryRepository,
+)
+
+TODAY = date(2026, 10, 16)
+
+
+def _repo(summary):
+    repo = AsyncMealRepository(session=MagicMock())
+    repo._streaks = MagicMock(
+        get=AsyncMock(return_value=summary),
+        save=AsyncMock(),
+        mark_stale=AsyncMock(),
+        find_version=AsyncMock(return_value=2),
+    )
+    repo.get_dates_with_meals = AsyncMock(return_value=[])
+    return repo
+
+
+def _summary(*days_ago, timezone="Asia/Ho_Chi_Minh", scan_count=0):
+    return StreakSummary.from_logged_dates(
+        "u1",
+        timezone,
+        [TODAY - timedelta(days=n) for n in days_ago],
+        scan_count=scan_count,
+    )
+
+
+@pytest.mark.asyncio
+async def test_logged_meal_extends_run_in_the_summary_timezone():
+    repo = _repo(_summary(1, 2))
+    # 18:00 UTC on the 15th is already the 16th in Ho Chi Minh City.
+    created_at = datetime(2026, 10, 15, 18, 0, tzinfo=UTC)
+
+    await repo._record_streak_day_added("u1", created_at, "scanner")
+
+    saved = repo._streaks.save.await_args.args[0]
+    assert saved.last_logged_date == TODAY
+    assert saved.current_streak(TODAY) == 3
+    assert saved.scan_count == 1
+    repo.get_dates_with_meals.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_logged_meal_without_summary_is_left_for_the_next_read():
+    repo = _repo(None)
+
+    await repo._record_streak_day_added("u1", datetime.now(UTC), "manual")
+
+    repo._streaks.save.assert_not_awaited()
+    repo._streaks.mark_stale.assert_awaited_once_with("u1")
+
+
+@pytest.mark.asyncio
+async def test_logged_meal_on_a_stale_summary_keeps_it_stale():
+    repo = _repo(_summary(1, timezone=STALE_TIMEZONE))
+
+    await repo._record_streak_day_added("u1", datetime.now(UTC), "scanner")
+
+    repo._streaks.save.assert_not_awaited()
+    repo._streaks.mark_stale.assert_awaited_once_with("u1")
+
+
+@pytest.mark.asyncio
+async def test_removed_day_still_logged_by_another_meal_keeps_the_run():
+    repo = _repo(_summary(0, 1, 2, 10, 11, 12, 13, timezone="UTC"))
+    repo.get_dates_with_meals = AsyncMock(return_value=[TODAY])
+
+    await repo._record_streak_day_removed(
+        "u1", datetime(2026, 10, 16, 9, 0, tzinfo=UTC)
+    )
+
+    repo._streaks.save.assert_not_awaited()
+    repo._streaks.mark_stale.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_removal_breaking_the_best_run_marks_summary_stale():
+    repo = _repo(_summary(0, 1, 2, timezone="UTC"))
+
+    await repo._record_streak_day_removed(
+        "u1", datetime(2026, 10, 15, 9, 0, tzinfo=UTC)
+    )
+
+    repo._streaks.mark_stale.assert_awaited_once_with("u1")
+    repo._streaks.save.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_stores_only_over_the_version_read_before_the_scan():
+    repo = _repo(None)
+    repo.get_dates_with_meals = AsyncMock(return_value=[TODAY])
+    repo.count_by_source = AsyncMock(return_value=1)
+
+    summary = await repo.rebuild_streak_summary("u1", "UTC")
+
+    assert summary.last_logged_date == TODAY
+    repo._streaks.save.assert_awaited_once_with(summary, version=2)
+
+
+@pytest.mark.asyncio
+async def test_guarded_save_upserts_without_locking_the_user():
+    session = MagicMock(execute=AsyncMock())
+
+    await AsyncStreakSummaryRepository(session).save(
+        _summary(0, timezone="UTC"), version=2
+    )
+
+    statement = session.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "FROM users" not in sql
+    assert "ON CONFLICT (user_id) DO UPDATE" in sql
+    assert "WHERE user_streak_summaries.version = %(" in sql
+    params = statement.compile(dialect=postgresql.dialect()).params
+    assert params["version"] == 3
+
+
+@pytest.mark.asyncio
+async def test_mark_stale_upserts_so_it_waits_on_an_uncommitted_rebuild():
+    session = MagicMock(execute=AsyncMock())
+
+    await AsyncStreakSummaryRepository(session).mark_stale("u1")
+
+    statement = session.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "DELETE" not in sql
+    assert "ON CONFLICT (user_id) DO UPDATE SET timezone" in sql
+    assert "version = (user_streak_summaries.version + %(" in sql
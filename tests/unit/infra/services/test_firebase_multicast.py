@@ -5,7 +5,9 @@ These tests cover the public surface: delegation and uninitialized-firebase
 guards.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 
 class TestSendMulticast:
@@ -39,3 +41,62 @@ class TestSendMulticast:
             result = svc.send_multicast(tokens=["tok"], title="t", body="b")
 
         assert result == {"success": False, "reason": "firebase_not_initialized"}
+
+
+class TestSendMulticastAsync:
+    @pytest.mark.asyncio
+    async def test_sends_through_async_sdk_and_reports_failed_tokens(self):
+        from src.infra.services.firebase_service import FirebaseService
+
+        svc = FirebaseService.__new__(FirebaseService)
+        response = MagicMock(
+            success_count=1,
+            failure_count=1,
+            responses=[
+                MagicMock(success=True),
+                MagicMock(success=False, exception=MagicMock(code="UNREGISTERED")),
+            ],
+        )
+
+        with (
+            patch("src.infra.services.firebase_service.firebase_admin") as mock_admin,
+            patch(
+                "src.infra.services.firebase_service.messaging."
+                "send_each_for_multicast_async",
+                AsyncMock(return_value=response),
+            ) as mock_send,
+        ):
+            mock_admin._apps = {"default": object()}
+            result = await svc.send_multicast_async(
+                tokens=["tok1", "tok2"],
+                title="Lunch time!",
+                body="800 cal left",
+                notification_type="meal_reminder_lunch",
+                data={"notification_count": "2"},
+            )
+
+        message = mock_send.await_args.args[0]
+        assert message.tokens == ["tok1", "tok2"]
+        assert message.data["type"] == "meal_reminder_lunch"
+        assert message.data["notification_count"] == "2"
+        assert result["success"] is True
+        assert result["failed_tokens"] == [{"token": "tok2", "error": "UNREGISTERED"}]
+
+    @pytest.mark.asyncio
+    async def test_sdk_error_is_reported_as_send_error(self):
+        from src.infra.services.firebase_service import FirebaseService
+
+        svc = FirebaseService.__new__(FirebaseService)
+        with (
+            patch("src.infra.services.firebase_service.firebase_admin") as mock_admin,
+            patch(
+                "src.infra.services.firebase_service.messaging."
+                "send_each_for_multicast_async",
+                AsyncMock(side_effect=RuntimeError("boom")),
+            ),
+        ):
+            mock_admin._apps = {"default": object()}
+            result = await svc.send_multicast_async(tokens=["t"], title="t", body="b")
+
+        assert result["success"] is False
+        assert result["reason"] == "send_error"
@@ -0,0 +1,153 @@
+"""Unit tests for in-process Firebase ID token verification and caching."""
+
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import jwt
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from firebase_admin import auth as firebase_auth
+
+from src.infra.services.firebase_token_verifier import (
+    FirebaseIdTokenVerifier,
+    GooglePublicKeySet,
+)
+
+PROJECT = "mealtrack-test"
+
+
+def _self_signed_cert(key) -> str:
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken")])
+    now = datetime.now(UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(1)
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    return cert.public_bytes(serialization.Encoding.PEM).decode()
+
+
+@pytest.fixture(scope="module")
+def signing_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def verifier(signing_key):
+    key_set = GooglePublicKeySet()
+    key_set.load({"kid-1": _self_signed_cert(signing_key)}, max_age=3600)
+    return FirebaseIdTokenVerifier(PROJECT, key_set)
+
+
+def _token(signing_key, kid="kid-1", **overrides):
+    now = int(time.time())
+    claims = {
+        "iss": f"https://securetoken.google.com/{PROJECT}",
+        "aud": PROJECT,
+        "sub": "firebase-uid-1",
+        "iat": now - 10,
+        "exp": now + 3600,
+        "email": "a@example.com",
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, signing_key, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.mark.asyncio
+async def test_valid_token_is_verified_locally_then_served_from_cache(
+    verifier, signing_key
+):
+    token = _token(signing_key)
+    with patch.object(firebase_auth, "verify_id_token") as sdk:
+        first = await verifier.verify(token)
+        second = await verifier.verify(token)
+
+    sdk.assert_not_called()
+    assert first["uid"] == "firebase-uid-1"
+    assert second == first
+    assert verifier.stats == {
+        "cache_hits": 1,
+        "local_verifications": 1,
+        "sdk_fallbacks": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_cached_claims_are_not_shared_mutable_state(verifier, signing_key):
+    token = _token(signing_key)
+    (await verifier.verify(token))["uid"] = "tampered"
+    assert (await verifier.verify(token))["uid"] == "firebase-uid-1"
+
+
+@pytest.mark.asyncio
+async def test_expired_token_raises_sdk_expired_error(verifier, signing_key):
+    token = _token(signing_key, iat=int(time.time()) - 7200, exp=int(time.time()) - 60)
+    with pytest.raises(firebase_auth.ExpiredIdTokenError):
+        await verifier.verify(token)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"aud": "other-project"},
+        {"iss": "https://securetoken.google.com/other-project"},
+        {"sub": ""},
+        {"iat": int(time.time()) + 600},
+    ],
+)
+@pytest.mark.asyncio
+async def test_bad_claims_raise_invalid_token(verifier, signing_key, overrides):
+    with pytest.raises(firebase_auth.InvalidIdTokenError):
+        await verifier.verify(_token(signing_key, **overrides))
+
+
+@pytest.mark.asyncio
+async def test_foreign_signature_is_rejected(verifier):
+    other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    with pytest.raises(firebase_auth.InvalidIdTokenError):
+        await verifier.verify(_token(other_key))
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_falls_back_to_sdk_and_requests_refresh(
+    verifier, signing_key
+):
+    token = _token(signing_key, kid="rotated")
+    claims = {"uid": "firebase-uid-1", "sub": "firebase-uid-1", "exp": time.time() + 60}
+    with (
+        patch.object(firebase_auth, "verify_id_token", return_value=claims) as sdk,
+        patch.object(verifier.key_set, "request_refresh") as refresh,
+    ):
+        assert await verifier.verify(token) == claims
+
+    sdk.assert_called_once_with(token)
+    refresh.assert_called_once()
+    assert verifier.stats["sdk_fallbacks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_without_keys_everything_goes_through_sdk(signing_key):
+    verifier = FirebaseIdTokenVerifier(PROJECT, GooglePublicKeySet())
+    claims = {"uid": "u", "sub": "u", "exp": time.time() + 60}
+    with patch.object(firebase_auth, "verify_id_token", return_value=claims) as sdk:
+        await verifier.verify(_token(signing_key))
+    sdk.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_entry_is_bounded_by_token_exp(verifier, signing_key):
+    exp = int(time.time()) + 90
+    token = _token(signing_key, exp=exp)
+    await verifier.verify(token)
+
+    ((expires_at, _),) = verifier._verified.values()
+    assert expires_at == exp
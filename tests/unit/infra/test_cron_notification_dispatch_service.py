@@ -22,7 +22,7 @@ async def test_send_loop_marks_notifications_sent():
     mock_notif.user_id = "user-1"
 
     mock_firebase = MagicMock()
-    mock_firebase.send_multicast = MagicMock(
+    mock_firebase.send_multicast_async = AsyncMock(
         return_value={"success": True, "failed_tokens": []}
     )
 
@@ -50,13 +50,13 @@ async def test_send_loop_marks_notifications_sent():
         now = datetime(2026, 4, 22, 5, 0, 0, tzinfo=UTC)
         await svc._send_due_notifications(now)
 
-    mock_firebase.send_multicast.assert_called_once()
+    mock_firebase.send_multicast_async.assert_called_once()
     assert mock_notif.status == "processing"
-    assert mock_firebase.send_multicast.call_args.kwargs["data"] == {
+    assert mock_firebase.send_multicast_async.call_args.kwargs["data"] == {
         "notification_ids": "notif-id-1",
         "notification_count": "1",
     }
-    call_kwargs = mock_firebase.send_multicast.call_args.kwargs
+    call_kwargs = mock_firebase.send_multicast_async.call_args.kwargs
     assert "1400" in call_kwargs.get("body", ""), (
         f"Expected remaining=1400 in body, got: {call_kwargs.get('body')}"
     )
@@ -81,7 +81,7 @@ async def test_unpaid_user_receives_subscription_hook_copy_for_existing_reminder
     mock_notif.user_id = "unpaid-user"
 
     mock_firebase = MagicMock()
-    mock_firebase.send_multicast = MagicMock(
+    mock_firebase.send_multicast_async = AsyncMock(
         return_value={"success": True, "failed_tokens": []}
     )
 
@@ -97,7 +97,7 @@ async def test_unpaid_user_receives_subscription_hook_copy_for_existing_reminder
     ):
         await svc._send_due_notifications(datetime(2026, 5, 17, tzinfo=UTC))
 
-    call_kwargs = mock_firebase.send_multicast.call_args.kwargs
+    call_kwargs = mock_firebase.send_multicast_async.call_args.kwargs
     assert call_kwargs["notification_type"] == "daily_summary"
     assert "Subscribe" in call_kwargs["body"]
     assert "calorie" not in call_kwargs["body"].lower()
@@ -137,7 +137,7 @@ async def test_wholesale_fcm_failure_requeues_instead_of_marking_sent():
     mock_notif.user_id = "user-1"
 
     mock_firebase = MagicMock()
-    mock_firebase.send_multicast = MagicMock(
+    mock_firebase.send_multicast_async = AsyncMock(
         return_value={"success": False, "reason": "send_error"}
     )
 
@@ -153,7 +153,7 @@ async def test_wholesale_fcm_failure_requeues_instead_of_marking_sent():
     ):
         await svc._send_due_notifications(datetime(2026, 5, 17, tzinfo=UTC))
 
-    mock_firebase.send_multicast.assert_called_once()
+    mock_firebase.send_multicast_async.assert_called_once()
     sent_ids, failed_ids, retry_ids = svc._mark_notifications.call_args.args
     assert "trial-notif-1" not in sent_ids, "must not mark sent on FCM failure"
     assert "trial-notif-1" in retry_ids, "must requeue for retry on FCM failure"
@@ -302,7 +302,7 @@ async def test_send_due_normalizes_trial_fcm_type():
 
     svc = CronNotificationDispatchService.__new__(CronNotificationDispatchService)
     svc._firebase = MagicMock()
-    svc._firebase.send_multicast = MagicMock(
+    svc._firebase.send_multicast_async = AsyncMock(
         return_value={"success": True, "failed_tokens": []}
     )
     svc._recover_stale_processing = AsyncMock()
@@ -317,7 +317,7 @@ async def test_send_due_normalizes_trial_fcm_type():
     ):
         await svc._send_due_notifications(datetime(2026, 5, 17, tzinfo=UTC))
 
-    call_kwargs = svc._firebase.send_multicast.call_args.kwargs
+    call_kwargs = svc._firebase.send_multicast_async.call_args.kwargs
     assert call_kwargs["notification_type"] == "trial_expiry"
 
 
@@ -330,7 +330,7 @@ async def test_send_due_trial_skips_redis_lookup(caplog):
 
     svc = CronNotificationDispatchService.__new__(CronNotificationDispatchService)
     svc._firebase = MagicMock()
-    svc._firebase.send_multicast = MagicMock(
+    svc._firebase.send_multicast_async = AsyncMock(
         return_value={"success": True, "failed_tokens": []}
     )
     svc._recover_stale_processing = AsyncMock()
@@ -404,7 +404,7 @@ async def test_hydration_reminder_skipped_when_above_threshold():
     mock_notif.user_id = "user-h1"
 
     mock_firebase = MagicMock()
-    mock_firebase.send_multicast = MagicMock(
+    mock_firebase.send_multicast_async = AsyncMock(
         return_value={"success": True, "failed_tokens": []}
     )
 
@@ -429,7 +429,7 @@ async def test_hydration_reminder_skipped_when_above_threshold():
         await svc._send_due_notifications(now)
 
     # FCM not called because threshold met
-    mock_firebase.send_multicast.assert_not_called()
+    mock_firebase.send_multicast_async.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -453,7 +453,7 @@ async def test_hydration_reminder_sent_when_below_threshold():
     mock_notif.user_id = "user-h2"
 
     mock_firebase = MagicMock()
-    mock_firebase.send_multicast = MagicMock(
+    mock_firebase.send_multicast_async = AsyncMock(
         return_value={"success": True, "failed_tokens": []}
     )
 
@@ -477,7 +477,7 @@ async def test_hydration_reminder_sent_when_below_threshold():
         now = datetime(2026, 5, 23, 11, 0, 0, tzinfo=UTC)
         await svc._send_due_notifications(now)
 
-    mock_firebase.send_multicast.assert_called_once()
+    mock_firebase.send_multicast_async.assert_called_once()
 
 
 def test_build_notification_rows_skips_hydration_when_disabled():
@@ -508,3 +508,135 @@ def test_build_notification_rows_skips_hydration_when_disabled():
     types = [r["notification_type"] for r in rows]
     assert "hydration_reminder_afternoon" not in types
     assert "hydration_reminder_evening" not in types
+
+
+def _dispatch_service(send, *, concurrency=8, mark_batch_rows=1000):
+    from src.infra.services.cron_notification_dispatch_service import (
+        CronNotificationDispatchService,
+    )
+
+    firebase = MagicMock()
+    firebase.send_multicast_async = send
+    svc = CronNotificationDispatchService(
+        firebase, dispatch_concurrency=concurrency, mark_batch_rows=mark_batch_rows
+    )
+    svc._recover_stale_processing = AsyncMock()
+    svc._mark_notifications = AsyncMock()
+    svc._deactivate_tokens = AsyncMock()
+    return svc
+
+
+def _trial_rows(count: int, tokens_per_row: int = 1):
+    rows = []
+    for index in range(count):
+        row = _make_trial_notif("trial_expiry_2d" if index % 2 else "trial_expiry_1d")
+        row.id = f"n{index}"
+        row.user_id = f"u{index}"
+        row.context = {
+            **row.context,
+            "fcm_tokens": [f"tok{index}-{t}" for t in range(tokens_per_row)],
+            "language_code": ["en", "vi"][index // 2 % 2],
+        }
+        rows.append(row)
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_groups_are_sent_concurrently_up_to_the_limit():
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def send(**_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"success": True, "failed_tokens": []}
+
+    svc = _dispatch_service(AsyncMock(side_effect=send), concurrency=2)
+    # 4 rows → 4 (type, language) groups, one multicast call each
+    svc._claim_due_notifications = AsyncMock(return_value=_trial_rows(4))
+
+    with patch(
+        "src.infra.services.cron_notification_dispatch_service._fetch_regular_notification_user_ids",
+        AsyncMock(return_value=set()),
+    ):
+        await svc._send_due_notifications(datetime(2026, 5, 17, tzinfo=UTC))
+
+    assert svc._firebase.send_multicast_async.await_count == 4
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_rows_are_marked_in_bulk_as_groups_finish():
+    svc = _dispatch_service(
+        AsyncMock(return_value={"success": True, "failed_tokens": []}),
+        mark_batch_rows=2,
+    )
+    svc._claim_due_notifications = AsyncMock(return_value=_trial_rows(4))
+
+    with patch(
+        "src.infra.services.cron_notification_dispatch_service._fetch_regular_notification_user_ids",
+        AsyncMock(return_value=set()),
+    ):
+        await svc._send_due_notifications(datetime(2026, 5, 17, tzinfo=UTC))
+
+    marked = [call.args[0] for call in svc._mark_notifications.await_args_list]
+    assert len(marked) > 1
+    assert sorted(row_id for batch in marked for row_id in batch) == sorted(
+        f"n{index}" for index in range(4)
+    )
+
+
+@pytest.mark.asyncio
+async def test_chunk_failure_requeues_only_its_group_and_bad_tokens_deactivate():
+    async def send(*, tokens, **_kwargs):
+        if tokens[0].startswith("tok0-"):
+            raise RuntimeError("connection reset")
+        return {
+            "success": True,
+            "failed_tokens": [{"token": tokens[0], "error": "UNREGISTERED"}],
+        }
+
+    svc = _dispatch_service(AsyncMock(side_effect=send))
+    svc._claim_due_notifications = AsyncMock(return_value=_trial_rows(2))
+
+    with patch(
+        "src.infra.services.cron_notification_dispatch_service._fetch_regular_notification_user_ids",
+        AsyncMock(return_value=set()),
+    ):
+        await svc._send_due_notifications(datetime(2026, 5, 17, tzinfo=UTC))
+
+    sent_ids, failed_ids, retry_ids = svc._mark_notifications.await_args.args
+    assert sent_ids == ["n1"]
+    assert retry_ids == ["n0"]
+    svc._deactivate_tokens.assert_awaited_once_with(["tok1-0"])
+
+
+@pytest.mark.asyncio
+async def test_large_group_is_split_into_500_token_chunks():
+    svc = _dispatch_service(
+        AsyncMock(return_value={"success": True, "failed_tokens": []})
+    )
+    rows = _trial_rows(3, tokens_per_row=400)
+    for row in rows:
+        row.notification_type = "trial_expiry_2d"
+        row.context["language_code"] = "en"
+    svc._claim_due_notifications = AsyncMock(return_value=rows)
+
+    with patch(
+        "src.infra.services.cron_notification_dispatch_service._fetch_regular_notification_user_ids",
+        AsyncMock(return_value=set()),
+    ):
+        await svc._send_due_notifications(datetime(2026, 5, 17, tzinfo=UTC))
+
+    chunk_sizes = sorted(
+        len(call.kwargs["tokens"])
+        for call in svc._firebase.send_multicast_async.await_args_list
+    )
+    assert chunk_sizes == [200, 500, 500]
+    sent_ids, _, _ = svc._mark_notifications.await_args.args
+    assert sorted(sent_ids) == ["n0", "n1", "n2"]
@@ -42,7 +42,7 @@ async def test_runs_and_adds_to_sentinel_set():
     svc = DailyContextPrecomputeService()
     today = date(2026, 4, 22)
 
-    with patch.object(svc, "_precompute_db", AsyncMock(return_value=5)), patch.object(
+    with patch.object(svc, "_precompute_db", AsyncMock(return_value=(5, 10))), patch.object(
         svc, "_check_db_sentinel", AsyncMock(return_value=False)
     ):
         await svc.precompute_for_timezone("Asia/Ho_Chi_Minh", today)
@@ -61,7 +61,7 @@ async def test_zero_users_does_not_set_sentinel():
     svc = DailyContextPrecomputeService()
     today = date(2026, 4, 22)
 
-    with patch.object(svc, "_precompute_db", AsyncMock(return_value=0)), patch.object(
+    with patch.object(svc, "_precompute_db", AsyncMock(return_value=(0, 0))), patch.object(
         svc, "_check_db_sentinel", AsyncMock(return_value=False)
     ):
         await svc.precompute_for_timezone("Asia/Ho_Chi_Minh", today)
@@ -86,6 +86,128 @@ async def test_db_sentinel_fallback_skips_precompute():
         mock_precompute.assert_not_awaited()
 
 
+def _claim_uow(claimed: bool):
+    uow = MagicMock()
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(return_value=False)
+    uow.session.execute = AsyncMock(return_value=MagicMock(scalar=lambda: claimed))
+    return uow
+
+
+@pytest.mark.asyncio
+async def test_precompute_timezones_bounds_concurrency_and_summarizes_rows():
+    """Shards run concurrently up to the limit and report users and rows written."""
+    import asyncio
+
+    from src.infra.services.daily_context_precompute_service import (
+        DailyContextPrecomputeService,
+    )
+
+    svc = DailyContextPrecomputeService()
+    today = date(2026, 4, 22)
+    active = 0
+    peak = 0
+
+    async def fake_precompute_db(tz_name, day):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return 3, 6
+
+    timezones = [f"Etc/GMT+{offset}" for offset in range(6)]
+    with patch(
+        "src.infra.services.daily_context_precompute_service.AsyncUnitOfWork",
+        side_effect=lambda: _claim_uow(True),
+    ), patch.object(svc, "_precompute_db", side_effect=fake_precompute_db), patch.object(
+        svc, "_check_db_sentinel", AsyncMock(return_value=False)
+    ):
+        summary = await svc.precompute_timezones(
+            [(tz_name, today) for tz_name in timezones], concurrency=2
+        )
+
+    assert peak == 2
+    attributes = summary.as_attributes()
+    assert attributes["precomputed"] == 6
+    assert attributes["users"] == 18
+    assert attributes["rows_written"] == 36
+    assert [r.tz_name for r in summary.results] == timezones
+
+
+@pytest.mark.asyncio
+async def test_precompute_timezones_skips_shards_claimed_by_another_replica():
+    """A shard whose advisory lock is held elsewhere is not precomputed here."""
+    from src.infra.services.daily_context_precompute_service import (
+        CLAIMED_ELSEWHERE,
+        DailyContextPrecomputeService,
+    )
+
+    svc = DailyContextPrecomputeService()
+
+    with patch(
+        "src.infra.services.daily_context_precompute_service.AsyncUnitOfWork",
+        side_effect=lambda: _claim_uow(False),
+    ), patch.object(svc, "_precompute_db", new_callable=AsyncMock) as mock_precompute:
+        summary = await svc.precompute_timezones([("UTC", date(2026, 4, 22))])
+
+    mock_precompute.assert_not_awaited()
+    assert summary.results[0].status == CLAIMED_ELSEWHERE
+
+
+@pytest.mark.asyncio
+async def test_precompute_timezones_reports_failed_shard_without_stopping_others():
+    from src.infra.services.daily_context_precompute_service import (
+        FAILED,
+        PRECOMPUTED,
+        DailyContextPrecomputeService,
+    )
+
+    svc = DailyContextPrecomputeService()
+
+    async def fake_precompute_db(tz_name, _day):
+        if tz_name == "Broken/Zone":
+            raise RuntimeError("db")
+        return 1, 2
+
+    with patch(
+        "src.infra.services.daily_context_precompute_service.AsyncUnitOfWork",
+        side_effect=lambda: _claim_uow(True),
+    ), patch.object(svc, "_precompute_db", side_effect=fake_precompute_db), patch.object(
+        svc, "_check_db_sentinel", AsyncMock(return_value=False)
+    ):
+        summary = await svc.precompute_timezones(
+            [("Broken/Zone", date(2026, 4, 22)), ("UTC", date(2026, 4, 22))]
+        )
+
+    assert [r.status for r in summary.results] == [FAILED, PRECOMPUTED]
+    assert summary.as_attributes()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_insert_notification_rows_returns_inserted_rowcount():
+    from src.infra.services.daily_context_precompute_service import (
+        DailyContextPrecomputeService,
+    )
+
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=4))
+    session.flush = AsyncMock()
+    rows = [
+        {
+            "user_id": f"user-{index}",
+            "notification_type": "meal_reminder_lunch",
+            "scheduled_date": date(2026, 4, 22),
+        }
+        for index in range(6)
+    ]
+    insert = DailyContextPrecomputeService._insert_notification_rows
+
+    assert await insert(session, rows) == 4
+    assert await insert(session, []) == 0
+    session.execute.assert_awaited_once()
+
+
 def test_sentinel_key_format():
     from src.infra.services.daily_context_precompute_service import (
         DailyContextPrecomputeService,
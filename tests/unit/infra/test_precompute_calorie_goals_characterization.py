@@ -29,6 +29,7 @@ TZ_NAME = "Asia/Ho_Chi_Minh"
 class _FakeResult:
     def __init__(self, rows):
         self._rows = rows
+        self.rowcount = len(rows)
 
     def fetchall(self):
         return self._rows
@@ -133,7 +134,7 @@ async def test_precompute_db_locks_calorie_goals_for_mixed_user_batch():
     """Locks calorie_goals dict for: custom-macro fallback, weekly-budget path,
     stale target_revision (skipped), and missing profile (skipped).
 
-    Also locks the CURRENT return-value semantics: `_precompute_db` returns the
+    Also locks the CURRENT return-value semantics: `_precompute_db` reports the
     count of pref rows fetched, NOT the count of users who received a goal.
     """
     user_custom = "user-custom-macros"
@@ -249,7 +250,7 @@ async def test_precompute_db_locks_calorie_goals_for_mixed_user_batch():
             side_effect=_fake_build_notification_rows,
         ),
     ):
-        processed_count = await svc._precompute_db(TZ_NAME, TODAY)
+        processed_count, rows_written = await svc._precompute_db(TZ_NAME, TODAY)
 
     # Custom-macro fallback: round(100*4 + 200*4 + 50*9) = round(400+800+450)
     # Weekly-budget path: policy-unchanged adjusted.calories (STANDARD preset, not custom)
@@ -266,6 +267,8 @@ async def test_precompute_db_locks_calorie_goals_for_mixed_user_batch():
     # CURRENT behavior: return value is len(pref_rows), regardless of per-user
     # skips (stale revision / missing profile). Not "count of users with a goal".
     assert processed_count == len(pref_rows) == 4
+    # No notification rows were built, so nothing was inserted.
+    assert rows_written == 0
 
 
 @pytest.mark.asyncio
@@ -279,7 +282,7 @@ async def test_precompute_db_returns_zero_when_no_eligible_users():
         "src.infra.services.daily_context_precompute_service.AsyncUnitOfWork",
         lambda: fake_uow,
     ):
-        processed_count = await svc._precompute_db(TZ_NAME, TODAY)
+        processed_count, rows_written = await svc._precompute_db(TZ_NAME, TODAY)
 
-    assert processed_count == 0
+    assert (processed_count, rows_written) == (0, 0)
     assert session.executed_count == 1
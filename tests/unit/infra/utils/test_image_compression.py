@@ -1,11 +1,19 @@
 """Unit tests for the image_compression utility."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 import pytest
 from PIL import Image
 
-from src.domain.utils.image_compression import compress_image, _MAX_DIM, _MAX_BYTES
+from src.domain.utils.image_compression import (
+    _MAX_BYTES,
+    _MAX_DIM,
+    compress_image,
+    compress_image_async,
+    is_analysis_rendition,
+)
 
 
 def _make_jpeg(width: int, height: int) -> bytes:
@@ -50,3 +58,50 @@ class TestCompressImage:
         corrupt = b"not an image at all"
         result = compress_image(corrupt)
         assert result is corrupt  # unchanged fallback
+
+    def test_rendition_is_tagged_and_not_recompressed(self):
+        rendition = compress_image(_make_jpeg(4000, 3000))
+
+        assert is_analysis_rendition(rendition)
+        assert _image_size(rendition) == (768, 576)
+        assert compress_image(rendition) is rendition
+
+    def test_untouched_original_is_not_a_rendition(self):
+        assert not is_analysis_rendition(_make_jpeg(400, 300))
+
+
+class TestCompressImageAsync:
+    @pytest.mark.asyncio
+    async def test_compresses_off_the_event_loop_thread(self):
+        calls = []
+
+        def compress(data: bytes) -> bytes:
+            calls.append(threading.current_thread())
+            return compress_image(data)
+
+        result = await compress_image_async(_make_jpeg(2000, 1500), compress)
+
+        assert is_analysis_rendition(result)
+        assert calls and calls[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_runs_on_the_executor_passed_in(self):
+        names = []
+
+        def compress(data: bytes) -> bytes:
+            names.append(threading.current_thread().name)
+            return compress_image(data)
+
+        with ThreadPoolExecutor(1, thread_name_prefix="preprocess-test") as pool:
+            await compress_image_async(_make_jpeg(2000, 1500), compress, pool)
+
+        assert names and names[0].startswith("preprocess-test")
+
+    @pytest.mark.asyncio
+    async def test_rendition_skips_the_pool(self):
+        rendition = compress_image(_make_jpeg(2000, 1500))
+
+        def compress(data: bytes) -> bytes:
+            raise AssertionError("renditions must not be recompressed")
+
+        assert await compress_image_async(rendition, compress) is rendition